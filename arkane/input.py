@@ -44,6 +44,7 @@ from rmgpy.kinetics.arrhenius import Arrhenius
 from rmgpy.kinetics.model import PDepKineticsModel, TunnelingModel
 from rmgpy.kinetics.tunneling import Wigner, Eckart
 from rmgpy.molecule import Molecule
+from rmgpy.pdep.cache import microcanonical_rate_cache
 from rmgpy.pdep.collision import SingleExponentialDown
 from rmgpy.pdep.configuration import Configuration
 from rmgpy.pdep.network import Network
@@ -467,10 +468,14 @@ def thermo(label, thermoClass):
 
 def pressureDependence(label, Tmin=None, Tmax=None, Tcount=0, Tlist=None, Pmin=None, Pmax=None, Pcount=0, Plist=None,
                        maximumGrainSize=None, minimumGrainCount=0, method=None, interpolationModel=None,
-                       activeKRotor=True, activeJRotor=True, rmgmode=False, sensitivity_conditions=None):
+                       activeKRotor=True, activeJRotor=True, rmgmode=False, sensitivity_conditions=None, procnum=1,
+                       microcanonicalRateCacheDirectory=None):
     """Generate a pressure dependent job"""
     global job_list, network_dict
 
+    if microcanonicalRateCacheDirectory is not None:
+        microcanonical_rate_cache.directory = microcanonicalRateCacheDirectory
+
     if isinstance(interpolationModel, str):
         interpolationModel = (interpolationModel,)
 
@@ -483,7 +488,7 @@ def pressureDependence(label, Tmin=None, Tmax=None, Tcount=0, Tlist=None, Pmin=N
                                 maximumGrainSize=maximumGrainSize, minimumGrainCount=minimumGrainCount,
                                 method=method, interpolationModel=interpolationModel,
                                 activeKRotor=activeKRotor, activeJRotor=activeJRotor,
-                                rmgmode=rmgmode, sensitivity_conditions=sensitivity_conditions)
+                                rmgmode=rmgmode, sensitivity_conditions=sensitivity_conditions, procnum=procnum)
     job_list.append(job)
 
 
@@ -247,10 +247,11 @@ class KineticsJob(object):
             else:
                 keq_unit_converter = 1
 
+            K_eqs = keq_unit_converter * reaction.get_equilibrium_constants(np.array(t_list, np.float64))  # SI units
             for n, T in enumerate(t_list):
                 k = ks[n]
                 k0 = k0s[n]
-                K_eq = keq_unit_converter * reaction.get_equilibrium_constant(T)  # returns SI units
+                K_eq = K_eqs[n]
                 k0_rev = k0 / K_eq
                 k_rev = k / K_eq
                 k0_revs.append(k0_rev)
@@ -36,6 +36,7 @@ reaction network.
 import logging
 import math
 import os.path
+from multiprocessing import Pool
 
 import numpy as np
 
@@ -76,6 +77,7 @@ class PressureDependenceJob(object):
     `activeKRotor`          A flag indicating whether to treat the K-rotor as active or adiabatic
     `activeJRotor`          A flag indicating whether to treat the J-rotor as active or adiabatic
     `rmgmode`               A flag that toggles "RMG mode", described below
+    `procnum`               The number of processes used to compute the :math:`k(T,P)` values at different temperatures
     ----------------------- ----------------------------------------------------
     `network`               The unimolecular reaction network
     `Tlist`                 An array of temperatures at which to compute :math:`k(T,P)` values
@@ -106,7 +108,7 @@ class PressureDependenceJob(object):
                  Pmin=None, Pmax=None, Pcount=0, Plist=None,
                  maximumGrainSize=None, minimumGrainCount=0,
                  method=None, interpolationModel=None, maximumAtoms=None,
-                 activeKRotor=True, activeJRotor=True, rmgmode=False, sensitivity_conditions=None):
+                 activeKRotor=True, activeJRotor=True, rmgmode=False, sensitivity_conditions=None, procnum=1):
         self.network = network
 
         self.Tmin = Tmin
@@ -144,6 +146,7 @@ class PressureDependenceJob(object):
         self.active_k_rotor = activeKRotor
         self.active_j_rotor = activeJRotor
         self.rmgmode = rmgmode
+        self.procnum = procnum
 
         if sensitivity_conditions is not None:
             if not isinstance(sensitivity_conditions[0], list):
@@ -242,6 +245,7 @@ class PressureDependenceJob(object):
             activeKRotor=self.active_k_rotor,
             activeJRotor=self.active_j_rotor,
             rmgmode=self.rmgmode,
+            procnum=self.procnum,
         )
 
     def execute(self, output_file, plot, file_format='pdf', print_summary=True):
@@ -269,7 +273,12 @@ class PressureDependenceJob(object):
 
         self.initialize()
 
-        self.K = self.network.calculate_rate_coefficients(self.Tlist.value_si, self.Plist.value_si, self.method)
+        if self.procnum > 1:
+            with Pool(processes=self.procnum) as pool:
+                self.K = self.network.calculate_rate_coefficients(self.Tlist.value_si, self.Plist.value_si,
+                                                                  self.method, pool=pool)
+        else:
+            self.K = self.network.calculate_rate_coefficients(self.Tlist.value_si, self.Plist.value_si, self.method)
 
         self.fit_interpolation_models()
 
@@ -578,9 +587,8 @@ class PressureDependenceJob(object):
 
                 K2 = np.zeros((Tcount, Pcount))
                 if reaction.kinetics is not None:
-                    for t in range(Tcount):
-                        for p in range(Pcount):
-                            K2[t, p] = reaction.kinetics.get_rate_coefficient(Tlist[t], Plist[p])
+                    for p in range(Pcount):
+                        K2[:, p] = reaction.kinetics.get_rate_coefficients(Tlist, np.full_like(Tlist, Plist[p]))
 
                 K = self.K[:, :, prod, reac].copy()
                 order = len(reaction.reactants)
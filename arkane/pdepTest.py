@@ -36,14 +36,17 @@ import os
 import shutil
 import unittest
 
+import numpy as np
 from nose.plugins.attrib import attr
 
+import rmgpy
 from rmgpy import settings
 from rmgpy.chemkin import read_reactions_block
 from rmgpy.kinetics.chebyshev import Chebyshev
 from rmgpy.species import Species
 
 from arkane.main import Arkane
+from arkane.pdep import PressureDependenceJob
 
 ################################################################################
 
@@ -135,6 +138,33 @@ class ArkaneTest(unittest.TestCase):
             if 'pdep_sa' not in f:
                 os.remove(os.path.join(settings['test_data.directory'], 'arkane', 'tst1', f))
 
+
+
+@attr('functional')
+class TestChemicallySignificantEigenvalues(unittest.TestCase):
+    """
+    Contains unit tests of the sparse path of the chemically-significant
+    eigenvalues method on the networks of the Arkane examples
+    """
+
+    def test_sparse_path_matches_dense_path(self):
+        """
+        Test that the k(T,P) values computed from the slowest eigenmodes of the
+        sparse master equation matrix agree with those from the dense matrix.
+        """
+        directory = os.path.join(os.path.dirname(os.path.dirname(rmgpy.__file__)), 'examples', 'arkane', 'networks')
+        for name in ['n-butanol', 'acetyl+O2']:
+            job_list = Arkane().load_input_file(os.path.join(directory, name, 'input.py'))
+            job = [job for job in job_list if isinstance(job, PressureDependenceJob)][0]
+            job.initialize()
+            for T, P in [(700.0, 1e6), (1000.0, 1e5)]:
+                job.network.set_conditions(T, P)
+                K_dense = job.network.apply_chemically_significant_eigenvalues_method(sparse=False)[0].copy()
+                K_sparse = job.network.apply_chemically_significant_eigenvalues_method(sparse=True)[0].copy()
+                self.assertTrue(np.any(K_dense > 0), '{0} at {1:g} K, {2:g} Pa'.format(name, T, P))
+                self.assertTrue(np.allclose(K_sparse, K_dense, rtol=1e-3, atol=1e-8 * np.abs(K_dense).max()),
+                                '{0} at {1:g} K, {2:g} Pa'.format(name, T, P))
+
 ################################################################################
 
 
@@ -176,14 +176,13 @@ class ThermoJob(object):
             f.write('#    Temperature Heat cap.   Enthalpy    Entropy     Free energy\n')
             f.write('#    (K)         (cal/mol*K) (kcal/mol)  (cal/mol*K) (kcal/mol)\n')
             f.write('#    =========== =========== =========== =========== ===========\n')
-            for T in [300, 400, 500, 600, 800, 1000, 1500, 2000, 2400]:
-                try:
-                    Cp = species.get_thermo_data().get_heat_capacity(T) / 4.184
-                    H = species.get_thermo_data().get_enthalpy(T) / 4184.
-                    S = species.get_thermo_data().get_entropy(T) / 4.184
-                    G = species.get_thermo_data().get_free_energy(T) / 4184.
-                    f.write('#    {0:11g} {1:11.3f} {2:11.3f} {3:11.3f} {4:11.3f}\n'.format(T, Cp, H, S, G))
-                except ValueError:
+            Tlist = np.array([300, 400, 500, 600, 800, 1000, 1500, 2000, 2400], np.float64)
+            valid, Cplist, Hlist, Slist, Glist = _evaluate_thermo(species.get_thermo_data(), Tlist)
+            for i, T in enumerate(Tlist):
+                if valid[i]:
+                    f.write('#    {0:11g} {1:11.3f} {2:11.3f} {3:11.3f} {4:11.3f}\n'.format(
+                        T, Cplist[i] / 4.184, Hlist[i] / 4184., Slist[i] / 4.184, Glist[i] / 4184.))
+                else:
                     logging.debug("Valid thermo for {0} is outside range for temperature {1}".format(species, T))
             f.write('#    =========== =========== =========== =========== ===========\n')
 
@@ -261,29 +260,31 @@ class ThermoJob(object):
 
         Tlist = np.arange(10.0, 2501.0, 10.0)
         Cplist = np.zeros_like(Tlist)
-        Cplist1 = np.zeros_like(Tlist)
         Hlist = np.zeros_like(Tlist)
-        Hlist1 = np.zeros_like(Tlist)
         Slist = np.zeros_like(Tlist)
-        Slist1 = np.zeros_like(Tlist)
         Glist = np.zeros_like(Tlist)
-        Glist1 = np.zeros_like(Tlist)
 
+        # The statmech model of the conformer is only evaluated at one temperature at a time
         conformer = self.species.conformer
-        thermo = self.species.get_thermo_data()
+        valid = np.zeros(Tlist.shape, bool)
         for i in range(Tlist.shape[0]):
             try:
                 Cplist[i] = conformer.get_heat_capacity(Tlist[i])
                 Slist[i] = conformer.get_entropy(Tlist[i])
                 Hlist[i] = (conformer.get_enthalpy(Tlist[i]) + conformer.E0.value_si) * 0.001
                 Glist[i] = Hlist[i] - Tlist[i] * Slist[i] * 0.001
-                Cplist1[i] = thermo.get_heat_capacity(Tlist[i])
-                Slist1[i] = thermo.get_entropy(Tlist[i])
-                Hlist1[i] = thermo.get_enthalpy(Tlist[i]) * 0.001
-                Glist1[i] = thermo.get_free_energy(Tlist[i]) * 0.001
+                valid[i] = True
             except (ValueError, AttributeError):
                 continue
 
+        thermo_valid, Cplist1, Hlist1, Slist1, Glist1 = _evaluate_thermo(self.species.get_thermo_data(), Tlist)
+        Hlist1 *= 0.001
+        Glist1 *= 0.001
+        # Leave out the temperatures at which either model could not be evaluated
+        valid &= thermo_valid
+        for values in [Cplist, Hlist, Slist, Glist, Cplist1, Hlist1, Slist1, Glist1]:
+            values[~valid] = 0.0
+
         fig = plt.figure(figsize=(10, 8))
         fig.suptitle('{0}'.format(self.species.label))
         plt.subplot(2, 2, 1)
@@ -317,3 +318,28 @@ class ThermoJob(object):
         filename = ''.join(c for c in self.species.label if c in valid_chars) + '.pdf'
         plt.savefig(os.path.join(plot_path, filename))
         plt.close()
+
+
+def _evaluate_thermo(thermo, Tlist):
+    """
+    Evaluate the `thermo` model at the temperatures `Tlist` in K. Returns a
+    boolean array marking the temperatures at which the model is valid, and
+    arrays of the heat capacities in J/mol*K, enthalpies in J/mol, entropies
+    in J/mol*K and Gibbs free energies in J/mol, which are zero wherever the
+    model is not valid.
+    """
+    try:
+        return (np.ones(Tlist.shape, bool), thermo.get_heat_capacities(Tlist), thermo.get_enthalpies(Tlist),
+                thermo.get_entropies(Tlist), thermo.get_free_energies(Tlist))
+    except ValueError:
+        # Some of the temperatures are out of range, so find them one at a time
+        valid = np.zeros(Tlist.shape, bool)
+        values = np.zeros((4, Tlist.shape[0]))
+        for i, T in enumerate(Tlist):
+            try:
+                values[:, i] = (thermo.get_heat_capacity(T), thermo.get_enthalpy(T), thermo.get_entropy(T),
+                                thermo.get_free_energy(T))
+            except ValueError:
+                continue
+            valid[i] = True
+        return valid, values[0], values[1], values[2], values[3]
@@ -1946,20 +1946,134 @@ def mark_duplicate_reaction(test_reaction, reaction_list):
                     reaction2.duplicate = True
 
 
-def mark_duplicate_reactions(reactions):
+def mark_duplicate_reactions(reactions, duplicate_index=None):
     """
     For a given list of `reactions`, mark all of the duplicate reactions as
     understood by Chemkin.
-    
-    This is pretty slow (quadratic in size of reactions list) so only call it if you're really worried
-    you may have undetected duplicate reactions.
+
+    The reactions are indexed by their reactants and products, so each reaction
+    is only compared to the few that could be its duplicates. Reactions of
+    other objects than :class:`Species`, e.g. :class:`Molecule` objects, are
+    compared to all of the reactions, as in :func:`mark_duplicate_reaction`.
+    If an existing
+    :class:`DuplicateReactionIndex` is given as `duplicate_index`, e.g. that of
+    the reaction model, it is used to look up the candidates instead, and only
+    the reactions that are not in it are indexed. The given index is not
+    modified, and only the `reactions` themselves are compared.
     """
-    for index1 in range(len(reactions)):
-        reaction1 = reactions[index1]
-        remaining_list = reactions[index1 + 1:]
+    if duplicate_index is None:
+        indices = [DuplicateReactionIndex(reactions)]
+    else:
+        indices = [duplicate_index,
+                   DuplicateReactionIndex([reaction for reaction in reactions if reaction not in duplicate_index])]
+    positions = {id(reaction): index for index, reaction in enumerate(reactions)}
+    for index1, reaction1 in enumerate(reactions):
+        remaining_list = [reaction2 for index in indices for reaction2 in index.get_candidates(reaction1)
+                          if positions.get(id(reaction2), -1) > index1]
+        remaining_list.sort(key=lambda reaction2: positions[id(reaction2)])
         mark_duplicate_reaction(reaction1, remaining_list)
 
 
+def get_duplicate_key(reaction):
+    """
+    Return a key identifying the reactants, products, and specific collider of
+    `reaction`, which is shared by every reaction that could be its Chemkin
+    duplicate. The key does not depend on the direction of the reaction.
+
+    As :class:`Species` objects are compared by identity, the key is made of
+    their ``id()``. Other objects, e.g. :class:`Molecule` objects, which are
+    compared by isomorphism, cannot be identified this way, so ``None`` is
+    returned for a reaction of any object that is not a :class:`Species`.
+    """
+    participants = reaction.reactants + reaction.products
+    if reaction.specific_collider is not None:
+        participants = participants + [reaction.specific_collider]
+    if not all([isinstance(participant, Species) for participant in participants]):
+        return None
+    reactants = frozenset([id(reactant) for reactant in reaction.reactants])
+    products = frozenset([id(product) for product in reaction.products])
+    collider = id(reaction.specific_collider) if reaction.specific_collider is not None else None
+    return frozenset([reactants, products]), collider
+
+
+class DuplicateReactionIndex(object):
+    """
+    An index of reactions by their reactants, products, and specific collider,
+    used to find the reactions that could be Chemkin duplicates of a reaction
+    without comparing it to every other reaction. Species are compared by
+    identity, as in :func:`mark_duplicate_reaction`. The reactions of other
+    objects than species, whose key is ``None``, could be duplicates of any
+    reaction, so they are returned as candidates for every reaction, and every
+    reaction is a candidate for them. The attributes are:
+
+    =================== ========================================================
+    Attribute           Description
+    =================== ========================================================
+    `reactions`         A dictionary of lists of reactions indexed by :func:`get_duplicate_key`
+    =================== ========================================================
+
+    """
+
+    def __init__(self, reactions=None):
+        self.reactions = {}
+        for reaction in reactions or []:
+            self.add(reaction)
+
+    def __len__(self):
+        return sum([len(bucket) for bucket in self.reactions.values()])
+
+    def __contains__(self, reaction):
+        return any([other is reaction for other in self.reactions.get(get_duplicate_key(reaction), [])])
+
+    def add(self, reaction):
+        """
+        Add `reaction` to the index.
+        """
+        self.reactions.setdefault(get_duplicate_key(reaction), []).append(reaction)
+
+    def remove(self, reaction):
+        """
+        Remove `reaction` from the index, if present.
+        """
+        key = get_duplicate_key(reaction)
+        bucket = self.reactions.get(key, [])
+        for index, other in enumerate(bucket):
+            if other is reaction:
+                del bucket[index]
+                if not bucket:
+                    del self.reactions[key]
+                break
+
+    def get_candidates(self, reaction):
+        """
+        Return a list of the indexed reactions, other than `reaction` itself,
+        that have the same reactants and products as `reaction` in either
+        direction, and the same specific collider, together with any indexed
+        reactions of objects other than species. If `reaction` itself is not
+        a reaction of species, all of the indexed reactions are returned.
+        """
+        key = get_duplicate_key(reaction)
+        if key is None:
+            candidates = [other for bucket in self.reactions.values() for other in bucket]
+        else:
+            candidates = self.reactions.get(key, []) + self.reactions.get(None, [])
+        return [other for other in candidates if other is not reaction]
+
+    def mark_duplicates(self, reaction, exclude=None):
+        """
+        Mark `reaction` and any of the indexed reactions that are its Chemkin
+        duplicates using :func:`mark_duplicate_reaction`, and add `reaction`
+        to the index if it is not already there. Indexed reactions whose
+        ``id()`` is in the set `exclude` are not compared.
+        """
+        candidates = self.get_candidates(reaction)
+        if exclude:
+            candidates = [other for other in candidates if id(other) not in exclude]
+        mark_duplicate_reaction(reaction, candidates)
+        if reaction not in self:
+            self.add(reaction)
+
+
 def save_species_dictionary(path, species, old_style=False):
     """
     Save the given list of `species` as adjacency lists in a text file `path` 
@@ -2045,16 +2159,18 @@ def save_transport_file(path, species):
                 ))
 
 
-def save_chemkin_file(path, species, reactions, verbose=True, check_for_duplicates=True):
+def save_chemkin_file(path, species, reactions, verbose=True, check_for_duplicates=True, duplicate_index=None):
     """
     Save a Chemkin input file to `path` on disk containing the provided lists
     of `species` and `reactions`.
     If check_for_duplicates is False then we don't check for unlabeled duplicate reactions,
     thus saving time (eg. if you are sure you've already labeled them as duplicate).
+    If a :class:`DuplicateReactionIndex` is given as `duplicate_index`, e.g. that of the
+    reaction model, it is used to find the duplicates without being modified.
     """
     # Check for duplicate
     if check_for_duplicates:
-        mark_duplicate_reactions(reactions)
+        mark_duplicate_reactions(reactions, duplicate_index=duplicate_index)
 
     f = open(path, 'w')
 
@@ -2103,16 +2219,18 @@ def save_chemkin_file(path, species, reactions, verbose=True, check_for_duplicat
 
 
 def save_chemkin_surface_file(path, species, reactions, verbose=True, check_for_duplicates=True,
-                              surface_site_density=None):
+                              surface_site_density=None, duplicate_index=None):
     """
     Save a Chemkin *surface* input file to `path` on disk containing the provided lists
     of `species` and `reactions`.
     If check_for_duplicates is False then we don't check for unlabeled duplicate reactions,
     thus saving time (eg. if you are sure you've already labeled them as duplicate).
+    If a :class:`DuplicateReactionIndex` is given as `duplicate_index`, e.g. that of the
+    reaction model, it is used to find the duplicates without being modified.
     """
     # Check for duplicate
     if check_for_duplicates:
-        mark_duplicate_reactions(reactions)
+        mark_duplicate_reactions(reactions, duplicate_index=duplicate_index)
 
     f = open(path, 'w')
 
@@ -2202,12 +2320,14 @@ def save_java_kinetics_library(path, species, reactions):
 
 
 def save_chemkin(reaction_model, path, verbose_path, dictionary_path=None, transport_path=None, 
-                 save_edge_species=False):
+                 save_edge_species=False, duplicate_index=None):
     """
     Save a Chemkin file for the current model as well as any desired output
     species and reactions to `path`. If `save_edge_species` is True, then 
     a chemkin file and dictionary file for the core AND edge species and reactions
     will be saved.  It also saves verbose versions of each file.
+    If a :class:`DuplicateReactionIndex` is given as `duplicate_index`, the
+    saved reactions are marked as duplicates using it before they are written.
     """
     if save_edge_species:
         species_list = reaction_model.core.species + reaction_model.edge.species
@@ -2216,6 +2336,9 @@ def save_chemkin(reaction_model, path, verbose_path, dictionary_path=None, trans
         species_list = reaction_model.core.species + reaction_model.output_species_list
         rxn_list = reaction_model.core.reactions + reaction_model.output_reaction_list
 
+    if duplicate_index is not None:
+        mark_duplicate_reactions(rxn_list, duplicate_index=duplicate_index)
+
     if any([s.contains_surface_site() for s in reaction_model.core.species]):
         # it's a surface model
         root, ext = os.path.splitext(path)
@@ -2281,7 +2404,8 @@ def save_chemkin_files(rmg):
                  latest_chemkin_verbose_path,
                  latest_dictionary_path,
                  latest_transport_path,
-                 save_edge_species=False)
+                 save_edge_species=False,
+                 duplicate_index=rmg.reaction_model.duplicate_index)
 
     if is_surface_model:
         paths = []
@@ -2308,7 +2432,7 @@ def save_chemkin_files(rmg):
         latest_dictionary_path = os.path.join(rmg.output_directory, 'chemkin', 'species_edge_dictionary.txt')
         latest_transport_path = None
         save_chemkin(rmg.reaction_model, this_chemkin_path, latest_chemkin_verbose_path, latest_dictionary_path,
-                     latest_transport_path, rmg.save_edge_species)
+                     latest_transport_path, rmg.save_edge_species, duplicate_index=rmg.reaction_model.duplicate_index)
 
         if is_surface_model:
             paths = []
@@ -32,14 +32,15 @@ import unittest
 from unittest import mock
 
 import rmgpy
-from rmgpy.chemkin import get_species_identifier, load_chemkin_file, load_transport_file, mark_duplicate_reactions, \
-    read_kinetics_entry, read_reaction_comments, read_thermo_entry, save_chemkin_file, save_species_dictionary, \
+from rmgpy.chemkin import DuplicateReactionIndex, get_species_identifier, load_chemkin_file, load_transport_file, \
+    mark_duplicate_reactions, read_kinetics_entry, read_reaction_comments, read_thermo_entry, save_chemkin_file, save_species_dictionary, \
     save_transport_file, write_thermo_entry
 from rmgpy.chemkin import _remove_line_breaks, _process_duplicate_reactions
 from rmgpy.data.kinetics import LibraryReaction
 from rmgpy.exceptions import ChemkinError
 from rmgpy.kinetics.arrhenius import Arrhenius, MultiArrhenius
 from rmgpy.kinetics.chebyshev import Chebyshev
+from rmgpy.molecule import Molecule
 from rmgpy.reaction import Reaction
 from rmgpy.species import Species
 from rmgpy.thermo import NASA, NASAPolynomial
@@ -428,6 +429,85 @@ class ChemkinTest(unittest.TestCase):
 
         self.assertEqual(duplicate_flags, expected_flags)
 
+    def test_duplicate_reaction_index(self):
+        """Test that the duplicate reaction index finds duplicates in either direction."""
+        s1 = Species().from_smiles('CC')
+        s2 = Species().from_smiles('[CH3]')
+        s3 = Species().from_smiles('[OH]')
+        s4 = Species().from_smiles('C[CH2]')
+        s5 = Species().from_smiles('O')
+
+        rxn1 = Reaction(reactants=[s1, s3], products=[s4, s5], kinetics=Arrhenius())
+        rxn2 = Reaction(reactants=[s1], products=[s2, s2], kinetics=Arrhenius())
+        index = DuplicateReactionIndex([rxn1, rxn2])
+        self.assertEqual(len(index), 2)
+        self.assertIn(rxn1, index)
+
+        # the reverse of rxn1
+        rxn3 = Reaction(reactants=[s5, s4], products=[s3, s1], kinetics=Arrhenius())
+        self.assertEqual(index.get_candidates(rxn3), [rxn1])
+        index.mark_duplicates(rxn3)
+        self.assertTrue(rxn1.duplicate)
+        self.assertTrue(rxn3.duplicate)
+        self.assertFalse(rxn2.duplicate)
+        self.assertIn(rxn3, index)
+
+        # excluded reactions are not compared
+        rxn4 = Reaction(reactants=[s1], products=[s2, s2], kinetics=Arrhenius())
+        index.mark_duplicates(rxn4, exclude={id(rxn2)})
+        self.assertFalse(rxn2.duplicate)
+        self.assertFalse(rxn4.duplicate)
+
+        index.remove(rxn1)
+        self.assertNotIn(rxn1, index)
+        self.assertEqual(index.get_candidates(rxn3), [])
+        self.assertEqual(len(index), 3)
+
+    def test_mark_duplicate_reactions_with_index(self):
+        """Test that marking duplicates with an existing index gives the same flags and leaves the index unchanged."""
+        s1 = Species().from_smiles('CC')
+        s2 = Species().from_smiles('[CH3]')
+        s3 = Species().from_smiles('[OH]')
+        s4 = Species().from_smiles('C[CH2]')
+        s5 = Species().from_smiles('O')
+
+        rxn1 = Reaction(reactants=[s1], products=[s2, s2], kinetics=Arrhenius())
+        rxn2 = Reaction(reactants=[s1, s3], products=[s4, s5], kinetics=Arrhenius())
+        rxn3 = Reaction(reactants=[s1], products=[s2, s2], kinetics=Arrhenius())
+        rxn4 = Reaction(reactants=[s5, s4], products=[s3, s1], kinetics=Arrhenius())
+        # rxn5 is in the index but not saved, so it must not mark rxn2
+        rxn5 = Reaction(reactants=[s1, s3], products=[s4, s5], kinetics=Arrhenius())
+        index = DuplicateReactionIndex([rxn1, rxn2, rxn5])
+
+        mark_duplicate_reactions([rxn1, rxn2, rxn3], duplicate_index=index)
+        self.assertEqual([rxn.duplicate for rxn in [rxn1, rxn2, rxn3, rxn5]], [True, False, True, False])
+        self.assertEqual(len(index), 3)
+        self.assertNotIn(rxn3, index)
+
+        mark_duplicate_reactions([rxn2, rxn4], duplicate_index=index)
+        self.assertTrue(rxn2.duplicate)
+        self.assertTrue(rxn4.duplicate)
+        self.assertFalse(rxn5.duplicate)
+        self.assertEqual(len(index), 3)
+
+    def test_mark_duplicate_molecule_reactions(self):
+        """Test that reactions of molecules are marked as duplicates if their molecules are isomorphic."""
+        rxn1 = Reaction(reactants=[Molecule(smiles='CC')],
+                        products=[Molecule(smiles='[CH3]'), Molecule(smiles='[CH3]')], kinetics=Arrhenius())
+        rxn2 = Reaction(reactants=[Molecule(smiles='[CH3]'), Molecule(smiles='[CH3]')],
+                        products=[Molecule(smiles='CC')], kinetics=Arrhenius())
+        rxn3 = Reaction(reactants=[Molecule(smiles='CC')],
+                        products=[Molecule(smiles='C[CH2]'), Molecule(smiles='[H]')], kinetics=Arrhenius())
+        mark_duplicate_reactions([rxn1, rxn2, rxn3])
+        self.assertEqual([rxn.duplicate for rxn in [rxn1, rxn2, rxn3]], [True, True, False])
+
+        # Reactions of molecules are candidates for reactions of species and vice versa
+        s1 = Species().from_smiles('CC')
+        rxn4 = Reaction(reactants=[s1], products=[Species().from_smiles('[CH3]')], kinetics=Arrhenius())
+        index = DuplicateReactionIndex([rxn3, rxn4])
+        self.assertEqual(index.get_candidates(rxn4), [rxn3])
+        self.assertEqual(index.get_candidates(rxn3), [rxn4])
+
 
 class TestThermoReadWrite(unittest.TestCase):
 
@@ -42,7 +42,8 @@ from collections import OrderedDict
 from rmgpy.data.reference import Reference, Article, Book, Thesis
 from rmgpy.exceptions import DatabaseError, InvalidAdjacencyListError
 from rmgpy.kinetics.uncertainties import RateUncertainty
-from rmgpy.molecule import Molecule, Group
+from rmgpy.molecule import ATOMTYPES, Atom, Molecule, Group
+from rmgpy.molecule.util import get_graph_hash
 
 
 ################################################################################
@@ -128,6 +129,51 @@ class Entry(object):
 
 ################################################################################
 
+class EntryDict(OrderedDict):
+    """
+    An ordered dictionary of the entries of a :class:`Database`, which counts
+    the modifications made to it in `version`, so that indices built from the
+    entries can tell when they are stale.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.version = 0
+        super(EntryDict, self).__init__(*args, **kwargs)
+
+    def __setitem__(self, key, value):
+        super(EntryDict, self).__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super(EntryDict, self).__delitem__(key)
+        self.version += 1
+
+    def pop(self, *args):
+        self.version += 1
+        return super(EntryDict, self).pop(*args)
+
+    def popitem(self, last=True):
+        self.version += 1
+        return super(EntryDict, self).popitem(last=last)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        super(EntryDict, self).update(*args, **kwargs)
+        self.version += 1
+
+    def clear(self):
+        super(EntryDict, self).clear()
+        self.version += 1
+
+    def move_to_end(self, key, last=True):
+        super(EntryDict, self).move_to_end(key, last=last)
+        self.version += 1
+
+
 class Database(object):
     """
     An RMG-style database, consisting of a dictionary of entries (associating
@@ -147,6 +193,22 @@ class Database(object):
     database rapidly becomes untenable, and is against the spirit of
     extensibility behind the database development.
 
+    The results of :meth:`descend_tree` for molecules are cached with the local
+    environment of the labeled atoms up to the largest distance spanned by any
+    group in the tree, since nothing beyond that distance can affect the
+    match. A cached node is only used for an exactly equivalent environment,
+    as found by :func:`environments_match`. The environments are indexed by a
+    hash, which a few different environments may share. The least recently
+    used indices are discarded once `descent_cache_size` of them are stored.
+    Set `use_descent_cache` to
+    ``False`` to bypass the cache, e.g. while the tree is being edited.
+
+    Before a group in the tree is matched to a molecule by subgraph
+    isomorphism, the number of neighbors and bond orders of its labeled atoms
+    are compared to those of the molecule, so that most groups that cannot
+    match are skipped cheaply. These checks are compiled from the groups
+    when first needed. Set `use_descent_filter` to ``False`` to disable them.
+
     You must derive from this class and implement the :meth:`load_entry`,
     :meth:`save_entry`, :meth:`process_old_library_entry`, and
     :meth:`generate_old_library_entry` methods in order to load and save from the
@@ -159,6 +221,8 @@ class Database(object):
     local_context['Book'] = Book
     local_context['Thesis'] = Thesis
 
+    max_environments_per_key = 4
+
     def __init__(self,
                  entries=None,
                  top=None,
@@ -168,7 +232,7 @@ class Database(object):
                  short_desc='',
                  long_desc='',
                  ):
-        self.entries = OrderedDict(entries or {})
+        self.entries = entries or {}
         self.top = top or []
         self.label = label
         self.name = name
@@ -176,6 +240,35 @@ class Database(object):
         self.short_desc = short_desc
         self.long_desc = long_desc
 
+        self.use_descent_cache = True
+        self.descent_cache_size = 20000
+        self.descent_cache = OrderedDict()
+        self._descent_radii = {}
+        self.use_descent_filter = True
+        self._descent_filters = {}
+        self._structure_index = None
+
+    @property
+    def entries(self):
+        """The dictionary of entries, as an :class:`EntryDict`."""
+        return self._entries
+
+    @entries.setter
+    def entries(self, entries):
+        self._entries = entries if isinstance(entries, EntryDict) else EntryDict(entries)
+        self._structure_index = None
+
+    def __getstate__(self):
+        """
+        Return the state of the database for pickling, without the
+        :meth:`descend_tree` cache and the structure index, since their keys
+        are hashes that are only valid in the current process.
+        """
+        state = self.__dict__.copy()
+        state['descent_cache'] = OrderedDict()
+        state['_structure_index'] = None
+        return state
+
     def load(self, path, local_context=None, global_context=None):
         """
         Load an RMG-style database from the file at location `path` on disk.
@@ -189,6 +282,8 @@ class Database(object):
         # Clear any previously-loaded data
         self.entries = OrderedDict()
         self.top = []
+        self.clear_descent_cache()
+        self._structure_index = None
 
         # Set up global and local context
         if global_context is None: global_context = {}
@@ -226,6 +321,39 @@ class Database(object):
         # Return the loaded database (to allow for Database().load() syntax)
         return self
 
+    def index_structures(self):
+        """
+        Index the entries of this database by the formula and molecular graph
+        hash of their items, as given by :func:`get_structure_key`, for use by
+        :meth:`get_entries_by_structure`. This is done automatically whenever
+        entries are added, removed or replaced, but must be repeated if the
+        item of an existing entry is replaced.
+        """
+        index = {}
+        for entry in self.entries.values():
+            key = get_structure_key(entry.item)
+            if key is None:
+                # Not a molecule or species, so every entry must be searched
+                index = None
+                break
+            index.setdefault(key, []).append(entry)
+        self._structure_index = (self.entries.version, index)
+
+    def get_entries_by_structure(self, structure):
+        """
+        Return a list of the entries whose item may be isomorphic to
+        `structure`, a :class:`Molecule` or :class:`Species` object, in the
+        order of :attr:`entries`. Every entry that is isomorphic to any
+        resonance structure of `structure` is included, but the others are
+        not necessarily excluded, so the isomorphism must still be checked.
+        """
+        if self._structure_index is None or self._structure_index[0] != self.entries.version:
+            self.index_structures()
+        index = self._structure_index[1]
+        if index is None:
+            return list(self.entries.values())
+        return index.get(get_structure_key(structure), [])
+
     def get_entries_to_save(self):
         """
         Return a sorted list of the entries in this database that should be
@@ -461,6 +589,7 @@ class Database(object):
 
         if len(self.entries) == 0:
             raise DatabaseError("Load the dictionary before you load the tree.")
+        self.clear_descent_cache()
 
         # should match '  L3 : foo_bar '  and 'L3:foo_bar'
         parser = re.compile('^\s*L(?P<level>\d+)\s*:\s*(?P<label>\S+)')
@@ -1002,10 +1131,37 @@ class Database(object):
         structure.  This is used in kinetics groups to find the correct reaction template, but
         not generally used in other GAVs due to species generally not being prelabeled.
         """
-
+        if not self.use_descent_cache or not isinstance(structure, Molecule):
+            return self._descend_tree(structure, atoms, root, strict)
+
+        radius = self._get_descent_radius(root, atoms)
+        if radius is None:
+            return self._descend_tree(structure, atoms, root, strict)
+
+        environment_key, environment = get_environment(atoms, radius)
+        key = (root.label if root is not None else None, strict, structure.multiplicity, environment_key)
+        bucket = self.descent_cache.get(key, [])
+        for cached_environment, node in bucket:
+            if environments_match(cached_environment, environment):
+                self.descent_cache.move_to_end(key)
+                return node
+        node = self._descend_tree(structure, atoms, root, strict)
+        self.descent_cache[key] = (bucket + [(environment, node)])[-self.max_environments_per_key:]
+        self.descent_cache.move_to_end(key)
+        if len(self.descent_cache) > self.descent_cache_size:
+            self.descent_cache.popitem(last=False)
+        return node
+
+    def _descend_tree(self, structure, atoms, root=None, strict=False):
+        """
+        Descend the tree as described in :meth:`descend_tree`, without using
+        the cache.
+        """
+        use_filter = self.use_descent_filter and isinstance(structure, Molecule)
         if root is None:
             for root in self.top:
-                if self.match_node_to_structure(root, structure, atoms, strict):
+                if ((not use_filter or self._filter_node(root, atoms))
+                        and self.match_node_to_structure(root, structure, atoms, strict)):
                     break  # We've found a matching root
             else:  # didn't break - matched no top nodes
                 return None
@@ -1014,11 +1170,12 @@ class Database(object):
 
         next_node = []
         for child in root.children:
-            if self.match_node_to_structure(child, structure, atoms, strict):
+            if ((not use_filter or self._filter_node(child, atoms))
+                    and self.match_node_to_structure(child, structure, atoms, strict)):
                 next_node.append(child)
 
         if len(next_node) == 1:
-            return self.descend_tree(structure, atoms, next_node[0], strict)
+            return self._descend_tree(structure, atoms, next_node[0], strict)
         elif len(next_node) == 0:
             if len(root.children) > 0 and root.children[-1].label.startswith('Others-'):
                 return root.children[-1]
@@ -1028,7 +1185,143 @@ class Database(object):
             # logging.warning('For {0}, a node {1} with overlapping children {2} was encountered '
             #                 'in tree with top level nodes {3}. Assuming the first match is the '
             #                 'better one.'.format(structure, root, next, self.top))
-            return self.descend_tree(structure, atoms, next_node[0], strict)
+            return self._descend_tree(structure, atoms, next_node[0], strict)
+
+    def clear_descent_cache(self):
+        """
+        Empty the cache of :meth:`descend_tree` results. This must be called
+        whenever the groups or the tree of this database are modified.
+        """
+        self.descent_cache.clear()
+        self._descent_radii = {}
+        self._descent_filters = {}
+
+    def _get_descent_filter(self, node):
+        """
+        Return the checks used by :meth:`_filter_node` for `node`, as a tuple
+        of the set of labels in the group and a list of
+        ``(label, neighbors, heavy neighbors, bond orders)`` tuples giving the
+        number of neighbors, neighbors that cannot be hydrogen, and a list of
+        ``(order, count)`` bonds of a single order of each labeled atom in the
+        group. Returns ``None`` if `node` is not a group.
+        """
+        try:
+            return self._descent_filters[node]
+        except KeyError:
+            pass
+        group = node.item
+        if isinstance(group, Group):
+            hydrogen = ATOMTYPES['H']
+            centers = group.get_all_labeled_atoms()
+            checks = []
+            for label, center in centers.items():
+                if isinstance(center, list):
+                    continue
+                heavy = 0
+                orders = {}
+                for neighbor, bond in center.edges.items():
+                    if neighbor.atomtype and not any([hydrogen.is_specific_case_of(a) for a in neighbor.atomtype]):
+                        heavy += 1
+                    order = bond.get_order_num()
+                    if len(order) == 1:
+                        orders[order[0]] = orders.get(order[0], 0) + 1
+                checks.append((label, len(center.edges), heavy, list(orders.items())))
+            descent_filter = (frozenset(centers), checks)
+        else:
+            descent_filter = None
+        self._descent_filters[node] = descent_filter
+        return descent_filter
+
+    def _filter_node(self, node, atoms):
+        """
+        Return ``False`` if the group at `node` cannot match the molecule with
+        the labeled `atoms`, because a labeled atom in the group has more
+        neighbors, heavy neighbors, or bonds of some order than the atom with
+        the same label in the molecule. Returns ``True`` otherwise, in which case
+        :meth:`match_node_to_structure` must be used to find out if it matches.
+        """
+        descent_filter = self._get_descent_filter(node)
+        if descent_filter is None:
+            return True
+        labels, checks = descent_filter
+        for label, num_neighbors, num_heavy, orders in checks:
+            atom = atoms.get(label)
+            if not isinstance(atom, Atom):
+                continue
+            # Labeled atoms that are not in the group are ignored when matching
+            edges = [(neighbor, bond) for neighbor, bond in atom.edges.items()
+                     if not neighbor.label or neighbor.label in labels]
+            if len(edges) < num_neighbors:
+                return False
+            if num_heavy and len([neighbor for neighbor, bond in edges if not neighbor.is_hydrogen()]) < num_heavy:
+                return False
+            for order, count in orders:
+                if len([bond for neighbor, bond in edges if bond.is_order(order)]) < count:
+                    return False
+        return True
+
+    def _get_descent_radius(self, root, atoms):
+        """
+        Return the largest distance from the atoms labeled with the keys of
+        `atoms` to any other atom of a group at or below `root` (or in the
+        whole tree if `root` is ``None``), which bounds the part of a structure
+        that :meth:`descend_tree` can see. Returns ``None`` if the descent cannot
+        be cached, i.e. if some group has atoms which are not connected to
+        any of these labeled atoms, or if `atoms` does not map labels to atoms.
+        """
+        if not all([isinstance(atom, Atom) for atom in atoms.values()]):
+            return None
+        labels = frozenset(atoms.keys())
+        key = (root.label if root is not None else None, labels)
+        try:
+            return self._descent_radii[key]
+        except KeyError:
+            pass
+
+        radius = 0
+        nodes = list(self.top) if root is None else [root]
+        visited = set()
+        while nodes and radius is not None:
+            node = nodes.pop()
+            if isinstance(node, str):
+                node = self.entries[node]
+            if node in visited:
+                continue
+            visited.add(node)
+            nodes.extend(node.children)
+            group = node.item
+            if isinstance(group, LogicNode):
+                # Logic nodes are matched using their component nodes
+                components = list(group.components)
+                while components:
+                    component = components.pop()
+                    if isinstance(component, LogicNode):
+                        components.extend(component.components)
+                    else:
+                        nodes.append(component)
+                continue
+            elif not isinstance(group, Group):
+                radius = None
+                break
+            shell = [atom for atom in group.atoms if atom.label in labels]
+            distances = dict.fromkeys(shell, 0)
+            distance = 0
+            while shell:
+                distance += 1
+                next_shell = []
+                for atom in shell:
+                    for neighbor in atom.edges:
+                        if neighbor not in distances:
+                            distances[neighbor] = distance
+                            next_shell.append(neighbor)
+                shell = next_shell
+            if len(distances) < len(group.atoms):
+                radius = None
+            else:
+                radius = max(radius, distance - 1)
+
+        self._descent_radii[key] = radius
+        return radius
 
     def are_siblings(self, node, node_other):
         """
@@ -1054,6 +1347,7 @@ class Database(object):
             raise ValueError("Cannot remove top node: {0} from {1} because it is a LogicOr".format(group_to_remove, self))
         # Remove from entryToRemove from entries
         self.entries.pop(group_to_remove.label)
+        self.clear_descent_cache()
 
         # If there is a parent, then the group exists in a tree and we should edit relatives
         parent_r = group_to_remove.parent
@@ -1178,6 +1472,113 @@ class LogicAnd(LogicNode):
         return True != self.invert
 
 
+def get_structure_key(structure):
+    """
+    Return a ``(formula, graph hash)`` tuple identifying the :class:`Molecule`
+    or :class:`Species` object `structure`, or ``None`` if `structure` is
+    neither. Isomorphic molecules and all resonance structures of a species
+    have the same key, but different molecules may also share a key.
+    """
+    if isinstance(structure, Molecule):
+        molecule = structure
+    elif getattr(structure, 'molecule', None):
+        molecule = structure.molecule[0]
+    else:
+        return None
+    return molecule.get_formula(), get_graph_hash(molecule)
+
+
+def get_environment(atoms, radius):
+    """
+    Return a ``(key, environment)`` tuple describing the labeled atoms in the
+    dictionary `atoms` and their environment within `radius` bonds in a
+    molecule. Two labeled molecules have equivalent environments, as found by
+    :func:`environments_match`, if they match the same groups reaching no
+    further than `radius` bonds from the labeled atoms.
+
+    The atom attributes include the distance to the labeled atoms and the atom
+    types of the atoms at the boundary, which depend on the bonds beyond it.
+    The `environment` holds the attributes of each atom, its invariant after
+    refining them by its neighbors (Weisfeiler-Lehman), as in
+    :func:`rmgpy.molecule.util.get_graph_hash`, and the orders of its bonds to
+    the other atoms of the environment, by index. The `key` is the sorted list
+    of invariants. As the refinement cannot tell all inequivalent environments
+    apart, e.g. ring systems with the same degrees and distances, and the
+    invariants are hashed, different environments may share a key.
+    """
+    centers = {}
+    for label, atom in atoms.items():
+        centers.setdefault(atom, []).append(label)
+    distances = dict.fromkeys(centers, 0)
+    order = list(centers)
+    shell = list(centers)
+    for distance in range(1, radius + 1):
+        next_shell = []
+        for atom in shell:
+            for neighbor in atom.edges:
+                if neighbor not in distances:
+                    distances[neighbor] = distance
+                    next_shell.append(neighbor)
+        order.extend(next_shell)
+        shell = next_shell
+
+    attributes = [(distances[atom], tuple(sorted(centers.get(atom, []))), atom.label, atom.element.symbol,
+                   atom.element.isotope, atom.atomtype.label if atom.atomtype is not None else None,
+                   atom.radical_electrons, atom.lone_pairs, atom.charge,
+                   str(sorted(atom.props.items())) if atom.props else None) for atom in order]
+    indices = {atom: i for i, atom in enumerate(order)}
+    bonds = [tuple(sorted([(indices[neighbor], bond.order) for neighbor, bond in atom.edges.items()
+                           if neighbor in indices]))
+             for atom in order]
+    invariants = [hash(attribute) for attribute in attributes]
+    for _ in range(2 * radius):
+        invariants = [hash((invariant, tuple(sorted([(bond_order, invariants[j]) for j, bond_order in bonds[i]]))))
+                      for i, invariant in enumerate(invariants)]
+    return tuple(sorted(invariants)), (tuple(attributes), tuple(invariants), tuple(bonds))
+
+
+def environments_match(environment1, environment2):
+    """
+    Return ``True`` if the environments `environment1` and `environment2`
+    returned by :func:`get_environment` are equivalent, i.e. if there is a
+    one-to-one mapping of their atoms preserving the atom attributes and the
+    bonds, or ``False`` if not. The atoms are mapped in the order of
+    `environment1`, in which each atom but the labeled ones is bonded to an
+    earlier atom, and only to atoms of `environment2` with the same invariant.
+    """
+    attributes1, invariants1, bonds1 = environment1
+    attributes2, invariants2, bonds2 = environment2
+    if sorted(invariants1) != sorted(invariants2):
+        return False
+    n = len(attributes1)
+    candidates = {}
+    for j in range(n):
+        candidates.setdefault((invariants2[j], attributes2[j], len(bonds2[j])), []).append(j)
+    candidates = [candidates.get((invariants1[i], attributes1[i], len(bonds1[i])), []) for i in range(n)]
+    bonds2 = [dict(bonds) for bonds in bonds2]
+    mapping = [-1] * n
+    inverse = [-1] * n
+
+    def extend(i):
+        if i == n:
+            return True
+        earlier = [(mapping[k], bond_order) for k, bond_order in bonds1[i] if k < i]
+        for j in candidates[i]:
+            if inverse[j] >= 0:
+                continue
+            # The bonds to the atoms mapped so far must correspond in both directions
+            if (any([bonds2[j].get(k) != bond_order for k, bond_order in earlier])
+                    or sum([1 for k in bonds2[j] if inverse[k] >= 0]) != len(earlier)):
+                continue
+            mapping[i], inverse[j] = j, i
+            if extend(i + 1):
+                return True
+            mapping[i], inverse[j] = -1, -1
+        return False
+
+    return extend(0)
+
+
 def make_logic_node(string):
     """
     Creates and returns a node in the tree which is a logic node.
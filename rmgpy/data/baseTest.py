@@ -29,8 +29,9 @@
 
 import unittest
 
-from rmgpy.data.base import Entry, Database, ForbiddenStructures
+from rmgpy.data.base import Entry, Database, ForbiddenStructures, environments_match, get_environment
 from rmgpy.molecule import Group, Molecule
+from rmgpy.species import Species
 
 
 ################################################################################
@@ -112,6 +113,116 @@ class TestBaseDatabase(unittest.TestCase):
         self.assertTrue(self.database.match_node_to_node(entry1, entry1))
         self.assertFalse(self.database.match_node_to_node(entry1, entry2))
 
+    def test_descend_tree_cache(self):
+        """
+        Test that cached tree descents give the same nodes as uncached ones.
+        """
+        root = Entry(label='C', item=Group().from_adjacency_list("1 *1 C u0"))
+        alcohol = Entry(label='C-O', item=Group().from_adjacency_list(
+            """
+            1 *1 C u0 {2,S}
+            2    O u0 {1,S}
+            """))
+        beta_alcohol = Entry(label='C-C-O', item=Group().from_adjacency_list(
+            """
+            1 *1 C u0 {2,S}
+            2    C u0 {1,S} {3,S}
+            3    O u0 {2,S}
+            """))
+        for child in [alcohol, beta_alcohol]:
+            child.parent = root
+            root.children.append(child)
+            self.database.entries[child.label] = child
+        self.database.entries[root.label] = root
+        self.database.top = [root]
+
+        self.assertEqual(self.database._get_descent_radius(None, {'*': Molecule().from_smiles('C').atoms[0]}), 2)
+
+        expected = {'CCO': [beta_alcohol, alcohol, None], 'CCCO': [root, beta_alcohol, alcohol, None], 'CC': [root, root]}
+        for smiles, nodes in expected.items():
+            for use_cache in [False, True, True]:
+                self.database.use_descent_cache = use_cache
+                molecule = Molecule().from_smiles(smiles)
+                for atom, node in zip(molecule.atoms, nodes):
+                    if node is not None:
+                        self.assertIs(self.database.descend_tree(molecule, {'*': atom}), node)
+
+        # One result for each distinct environment: CH3 and CH2 of ethanol, CH3, CH2 and CH2 of propanol,
+        # and CH3 of ethane
+        self.assertEqual(len(self.database.descent_cache), 6)
+
+        # A result cached for a different environment with the same key, e.g. from a hash collision, is not used
+        molecule = Molecule().from_smiles('CCO')
+        atoms = {'*': molecule.atoms[0]}
+        environment_key, environment = get_environment(atoms, 2)
+        key = (None, False, molecule.multiplicity, environment_key)
+        self.assertEqual(len(self.database.descent_cache[key]), 1)
+        self.assertTrue(environments_match(self.database.descent_cache[key][0][0], environment))
+        propanol = Molecule().from_smiles('CCCO')
+        other_environment = get_environment({'*': propanol.atoms[0]}, 2)[1]
+        self.assertFalse(environments_match(other_environment, environment))
+        self.database.descent_cache[key] = [(other_environment, root)]
+        self.assertIs(self.database.descend_tree(molecule, atoms), beta_alcohol)
+        self.assertEqual([node for _, node in self.database.descent_cache[key]], [root, beta_alcohol])
+
+        self.database.remove_group(alcohol)
+        self.assertEqual(len(self.database.descent_cache), 0)
+
+    def test_filter_node(self):
+        """
+        Test that groups are only filtered out if they cannot match.
+        """
+        entry = Entry(label='Cs-CdO', item=Group().from_adjacency_list(
+            """
+            1 *1 C   u0 {2,S} {3,S}
+            2    R!H u0 {1,S}
+            3    C   u0 {1,S} {4,D}
+            4    O   u0 {3,D}
+            """))
+        for smiles, expected in [('C', False), ('CC', False), ('C(=C)=C', False), ('C(C)C', True), ('C(C)C=O', True)]:
+            molecule = Molecule().from_smiles(smiles)
+            atoms = {'*1': molecule.atoms[0]}
+            self.assertEqual(self.database._filter_node(entry, atoms), expected)
+            if not expected:
+                self.assertFalse(self.database.match_node_to_structure(entry, molecule, atoms))
+
+    def test_get_entries_by_structure(self):
+        """
+        Test that the entries that may be isomorphic to a structure are found.
+        """
+        for index, smiles in enumerate(['CCO', 'COC', 'C=C', 'C=C[CH2]']):
+            self.database.entries[smiles] = Entry(index=index, label=smiles, item=Molecule().from_smiles(smiles))
+
+        self.assertEqual([entry.label for entry in self.database.get_entries_by_structure(Molecule().from_smiles('OCC'))],
+                         ['CCO'])
+        self.assertEqual(self.database.get_entries_by_structure(Molecule().from_smiles('CC')), [])
+
+        # All resonance structures of a species have the same key
+        species = Species().from_smiles('[CH2]C=C')
+        species.generate_resonance_structures()
+        for molecule in species.molecule:
+            self.assertEqual([entry.label for entry in self.database.get_entries_by_structure(molecule)], ['C=C[CH2]'])
+
+        # The index is updated when entries are added
+        self.database.entries['CC'] = Entry(index=4, label='CC', item=Molecule().from_smiles('CC'))
+        self.assertEqual([entry.label for entry in self.database.get_entries_by_structure(Species().from_smiles('CC'))],
+                         ['CC'])
+
+        # The index is updated when an entry is replaced or removed, even though the number of entries is unchanged
+        self.database.entries['CC'] = Entry(index=4, label='CC', item=Molecule().from_smiles('CCC'))
+        self.assertEqual(self.database.get_entries_by_structure(Molecule().from_smiles('CC')), [])
+        self.assertEqual([entry.label for entry in self.database.get_entries_by_structure(Molecule().from_smiles('CCC'))],
+                         ['CC'])
+        del self.database.entries['COC']
+        self.database.entries['C=O'] = Entry(index=5, label='C=O', item=Molecule().from_smiles('C=O'))
+        self.assertEqual(self.database.get_entries_by_structure(Molecule().from_smiles('COC')), [])
+        self.assertEqual([entry.label for entry in self.database.get_entries_by_structure(Molecule().from_smiles('C=O'))],
+                         ['C=O'])
+
+        # Assigning a new dictionary of entries also resets the index
+        self.database.entries = {'CCO': self.database.entries['CCO']}
+        self.assertEqual(self.database.get_entries_by_structure(Molecule().from_smiles('C=O')), [])
+
 
 class TestForbiddenStructures(unittest.TestCase):
 
@@ -174,6 +174,24 @@ def generate_molecule_combos(input_species):
     return combos
 
 
+def get_reactant_size_key(reactants):
+    """
+    Return a ``(heavy_atoms, rings)`` tuple describing the combined size of the
+    given list or tuple of :class:`Molecule` objects (or lists of resonance
+    structures, in which case the first structure is used). This is used as a
+    key for estimating the cost of reaction generation. Rings are counted using
+    the cyclomatic number of each molecular graph, so no ring perception is needed.
+    """
+    heavy_atoms = 0
+    rings = 0
+    for molecule in reactants:
+        if isinstance(molecule, list):
+            molecule = molecule[0]
+        heavy_atoms += sum([1 for atom in molecule.atoms if not atom.is_hydrogen()])
+        rings += max(0, len(molecule.get_all_edges()) - len(molecule.atoms) + 1)
+    return heavy_atoms, rings
+
+
 def ensure_independent_atom_ids(input_species, resonance=True):
     """
     Given a list or tuple of :class:`Species` or :class:`Molecule` objects,
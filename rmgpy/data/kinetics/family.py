@@ -37,6 +37,7 @@ import multiprocessing as mp
 import os.path
 import random
 import re
+import time
 import warnings
 from collections import OrderedDict
 from copy import deepcopy
@@ -48,7 +49,7 @@ from rmgpy import settings
 from rmgpy.constraints import fails_species_constraints
 from rmgpy.data.base import Database, Entry, LogicNode, LogicOr, ForbiddenStructures, get_all_combinations
 from rmgpy.data.kinetics.common import save_entry, find_degenerate_reactions, generate_molecule_combos, \
-                                       ensure_independent_atom_ids
+                                       ensure_independent_atom_ids, get_reactant_size_key
 from rmgpy.data.kinetics.depository import KineticsDepository
 from rmgpy.data.kinetics.groups import KineticsGroups
 from rmgpy.data.kinetics.rules import KineticsRules
@@ -409,6 +410,12 @@ class KineticsFamily(Database):
     `groups`            :class:`KineticsGroups`         The set of kinetics group additivity values
     `rules`             :class:`KineticsRules`          The set of kinetics rate rules from RMG-Java
     `depositories`      ``list``                        A set of additional depositories used to store kinetics data from various sources
+    ------------------- ------------------------------- ------------------------
+    `generation_times`  ``dict``                        Reaction generation timings as ``[count, seconds]``, indexed by ``(heavy atoms, rings)`` of the reactants
+    `kinetics_cache`    ``OrderedDict``                 Least recently used cache of template kinetics, indexed by ``(template labels, method)``
+    `kinetics_cache_size` ``int``                       The maximum number of entries in `kinetics_cache`
+    `kinetics_cache_hits` ``int``                       The number of template kinetics found in `kinetics_cache`
+    `kinetics_cache_misses` ``int``                     The number of template kinetics estimated and added to `kinetics_cache`
     =================== =============================== ========================
 
     There are a few reaction families that are their own reverse (hydrogen
@@ -450,6 +457,15 @@ class KineticsFamily(Database):
         self.rules = None
         self.depositories = []
 
+        self.generation_times = {}
+
+        self.kinetics_cache = OrderedDict()
+        self.kinetics_cache_size = 10000
+        self.kinetics_cache_hits = 0
+        self.kinetics_cache_misses = 0
+        self._kinetics_cache_rules = None
+        self._kinetics_cache_groups = None
+
     def __repr__(self):
         return '<ReactionFamily "{0}">'.format(self.label)
 
@@ -512,6 +528,7 @@ class KineticsFamily(Database):
             entry.index = index + 1
 
         self.rules = KineticsRules(label='{0}/rules'.format(self.label))
+        self.clear_kinetics_cache()
         self.rules.name = self.rules.label
         try:
             self.rules.load_old(path, self.groups,
@@ -697,6 +714,7 @@ class KineticsFamily(Database):
                     self.reverse = '{0}_reverse'.format(self.label)
 
         self.rules = KineticsRules(label='{0}/rules'.format(self.label))
+        self.clear_kinetics_cache()
         logging.debug("Loading kinetics family rules from {0}".format(os.path.join(path, 'rules.py')))
         self.rules.load(os.path.join(path, 'rules.py'), local_context, global_context)
 
@@ -1103,6 +1121,7 @@ class KineticsFamily(Database):
         For each reaction involving real reactants and products in the training
         set, add a rate rule for that reaction.
         """
+        self.clear_kinetics_cache()
         try:
             depository = self.get_training_depository()
         except:
@@ -1282,7 +1301,7 @@ class KineticsFamily(Database):
         Fill in gaps in the kinetics rate rules by averaging child nodes
         recursively starting from the top level root template.
         """
-
+        self.clear_kinetics_cache()
         self.rules.fill_rules_by_averaging_up(self.get_root_template(), {}, verbose)
 
     def apply_recipe(self, reactant_structures, forward=True, unique=True):
@@ -1698,6 +1717,7 @@ class KineticsFamily(Database):
             Degenerate reactions are returned as separate reactions.
         """
         reaction_list = []
+        start_time = time.time()
 
         # Forward direction (the direction in which kinetics is defined)
         reaction_list.extend(
@@ -1708,8 +1728,26 @@ class KineticsFamily(Database):
             reaction_list.extend(
                 self._generate_reactions(reactants, products=products, forward=False, prod_resonance=prod_resonance))
 
+        self.record_generation_time(reactants, time.time() - start_time)
+
         return reaction_list
 
+    def record_generation_time(self, reactants, seconds):
+        """
+        Add the time spent generating reactions for the list of `reactants` to
+        :attr:`generation_times`. The timings are used by
+        :class:`rmgpy.rmg.scheduler.ReactionCostModel` to balance parallel
+        reaction generation.
+        """
+        key = get_reactant_size_key(reactants)
+        try:
+            timing = self.generation_times[key]
+        except KeyError:
+            self.generation_times[key] = [1, seconds]
+        else:
+            timing[0] += 1
+            timing[1] += seconds
+
     def add_reverse_attribute(self, rxn, react_non_reactive=True):
         """
         For rxn (with species' objects) from families with ownReverse, this method adds a `reverse`
@@ -2447,14 +2485,38 @@ class KineticsFamily(Database):
         then the entry is returned as the second element of the tuple.
         But if an average is used, or the 'group additivity' method, then the tuple
         returned is (kinetics, None).
+
+        The estimates before applying the degeneracy are cached in
+        :attr:`kinetics_cache` by template and method, and copies are returned.
         """
-        if method.lower() == 'group additivity':
-            return self.estimate_kinetics_using_group_additivity(template, degeneracy), None
-        elif method.lower() == 'rate rules':
-            return self.estimate_kinetics_using_rate_rules(template, degeneracy)  # This returns kinetics and entry data
-        else:
+        method = method.lower()
+        if method not in ('group additivity', 'rate rules'):
             raise ValueError('Invalid value "{0}" for method parameter; '
                              'should be "group additivity" or "rate rules".'.format(method))
+        key = (tuple([group.label for group in template]), method)
+        if self._kinetics_cache_rules is not self.rules or self._kinetics_cache_groups is not self.groups:
+            self.clear_kinetics_cache()
+        try:
+            kinetics, entry = self.kinetics_cache[key]
+        except KeyError:
+            self.kinetics_cache_misses += 1
+            if method == 'group additivity':
+                kinetics, entry = self._estimate_template_kinetics_using_group_additivity(template), None
+            else:
+                kinetics, entry = self.rules.estimate_template_kinetics(template)  # This returns kinetics and entry data
+            self.kinetics_cache[key] = (kinetics, entry)
+            if len(self.kinetics_cache) > self.kinetics_cache_size:
+                self.kinetics_cache.popitem(last=False)
+        else:
+            self.kinetics_cache_hits += 1
+            self.kinetics_cache.move_to_end(key)
+
+        if kinetics is None:
+            return None, entry
+        # The cached kinetics are shared, so only ever hand out copies
+        if method == 'group additivity':
+            return self.groups.apply_degeneracy(deepcopy(kinetics), degeneracy), entry
+        return self.rules.apply_degeneracy(deepcopy(kinetics), degeneracy), entry
 
     def get_kinetics_from_depository(self, depository, reaction, template, degeneracy):
         """
@@ -2570,6 +2632,13 @@ class KineticsFamily(Database):
         
         Returns just the kinetics, or None.
         """
+        return self.get_kinetics_for_template(template, degeneracy, method='group additivity')[0]
+
+    def _estimate_template_kinetics_using_group_additivity(self, template):
+        """
+        Determine the kinetics for the given `template` using group additivity,
+        before applying the reaction path degeneracy, or return None.
+        """
         warnings.warn("Group additivity is no longer supported and may be"
                       " removed in version 2.3.", DeprecationWarning)
         # Start with the generic kinetics of the top-level nodes
@@ -2585,7 +2654,7 @@ class KineticsFamily(Database):
             kinetics = kinetics[0]
 
         # Now add in more specific corrections if possible
-        return self.groups.estimate_kinetics_using_group_additivity(template, kinetics, degeneracy)
+        return self.groups.estimate_template_kinetics(template, kinetics)
 
     def estimate_kinetics_using_rate_rules(self, template, degeneracy=1):
         """
@@ -2596,9 +2665,25 @@ class KineticsFamily(Database):
         entry used to determine the kinetics only if it is an exact match,
         and is None if some averaging or use of a parent node took place.
         """
-        kinetics, entry = self.rules.estimate_kinetics(template, degeneracy)
+        return self.get_kinetics_for_template(template, degeneracy, method='rate rules')
+
+    def clear_kinetics_cache(self):
+        """
+        Empty :attr:`kinetics_cache`. This must be called whenever the rate
+        rules or the groups of this family are modified.
+        """
+        self.kinetics_cache.clear()
+        self._kinetics_cache_rules = self.rules
+        self._kinetics_cache_groups = self.groups
 
-        return kinetics, entry
+    def pop_kinetics_cache_stats(self):
+        """
+        Return the ``(hits, misses)`` counts of :attr:`kinetics_cache` since
+        the last call and reset them to zero.
+        """
+        stats = (self.kinetics_cache_hits, self.kinetics_cache_misses)
+        self.kinetics_cache_hits = self.kinetics_cache_misses = 0
+        return stats
 
     def get_reaction_template_labels(self, reaction):
         """
@@ -2798,6 +2883,8 @@ class KineticsFamily(Database):
         self.rules.entries[name] = []
         if entry.parent:
             entry.parent.children.append(entry)
+        self.groups.clear_descent_cache()
+        self.clear_kinetics_cache()
 
     def _split_reactions(self, rxns, newgrp):
         """
@@ -3246,6 +3333,7 @@ class KineticsFamily(Database):
                 parent.children.remove(entry)
                 del self.groups.entries[key]
                 parent.item.clear_reg_dims()
+        self.groups.clear_descent_cache()
 
     def make_tree_nodes(self, template_rxn_map=None, obj=None, T=1000.0, nprocs=0, depth=0, min_splitable_entry_num=2,
                         min_rxns_to_spawn=20):
@@ -3367,6 +3455,7 @@ class KineticsFamily(Database):
 
     def make_bm_rules_from_template_rxn_map(self, template_rxn_map, nprocs=1, Tref=1000.0, fmax=1.0e5):
 
+        self.clear_kinetics_cache()
         rule_keys = self.rules.entries.keys()
         for entry in self.groups.entries.values():
             if entry.label not in rule_keys:
@@ -3504,6 +3593,7 @@ class KineticsFamily(Database):
         for train_index, test_index in kf.split(rxns):
 
             self.rules.entries = {}  # clear rules each iteration
+            self.clear_kinetics_cache()
 
             self.add_rules_from_training(train_indices=train_index, thermo_database=tdb)
             self.fill_rules_by_averaging_up()
@@ -3672,6 +3762,7 @@ class KineticsFamily(Database):
                 regularization(self, child, template_rxn_map)
         else:
             regularization(self, self.get_root_template()[0], template_rxn_map)
+        self.groups.clear_descent_cache()
 
     def check_tree(self, entry=None):
         if entry is None:
@@ -3708,6 +3799,7 @@ class KineticsFamily(Database):
     def clean_tree_rules(self):
         self.rules.entries = OrderedDict()
         self.rules.entries['Root'] = []
+        self.clear_kinetics_cache()
 
     def clean_tree_groups(self):
         """
@@ -32,6 +32,7 @@ import logging
 import os.path
 import shutil
 import unittest
+from copy import deepcopy
 from unittest import mock
 
 import numpy as np
@@ -655,6 +656,72 @@ multiplicity 2
         out = family._generate_reactions(reactants=[spc], forward=True)
         self.assertEqual(out, [])
 
+    def test_kinetics_cache(self):
+        """
+        Test that rate rule estimates are cached by template and scaled by degeneracy
+        """
+        family = self.database.families['H_Abstraction']
+        template = family.retrieve_template(list(family.rules.entries.keys())[0].split(';'))
+        family.clear_kinetics_cache()
+        family.pop_kinetics_cache_stats()
+
+        kinetics1, entry1 = family.get_kinetics_for_template(template, degeneracy=1)
+        kinetics2, entry2 = family.get_kinetics_for_template(template, degeneracy=2)
+        self.assertEqual(family.pop_kinetics_cache_stats(), (1, 1))
+        self.assertEqual(len(family.kinetics_cache), 1)
+        self.assertIsNot(kinetics1, kinetics2)
+        self.assertIs(entry1, entry2)
+        self.assertAlmostEqual(kinetics2.A.value_si / kinetics1.A.value_si, 2.0)
+
+        # The cached estimate is identical to the uncached one
+        expected, expected_entry = family.rules.estimate_kinetics(template, 2)
+        self.assertAlmostEqual(kinetics2.A.value_si, expected.A.value_si)
+        self.assertEqual(kinetics2.comment, expected.comment)
+
+        # Replacing the rules invalidates the cache
+        rules = family.rules
+        family.rules = deepcopy(rules)
+        try:
+            family.get_kinetics_for_template(template)
+            self.assertEqual(family.pop_kinetics_cache_stats(), (0, 1))
+        finally:
+            family.rules = rules
+            family.clear_kinetics_cache()
+
+    def test_cache_group_additivity_kinetics(self):
+        """
+        Test that group additivity estimates are cached separately from rate rule estimates and handed out as copies
+        """
+        family = self.database.families['H_Abstraction']
+        template = family.retrieve_template(list(family.rules.entries.keys())[0].split(';'))
+        labels = tuple([group.label for group in template])
+        family.clear_kinetics_cache()
+
+        kinetics1 = family.get_kinetics_for_template(template, degeneracy=1, method='group additivity')[0]
+        family.pop_kinetics_cache_stats()
+        kinetics2, entry2 = family.get_kinetics_for_template(template, degeneracy=2, method='group additivity')
+        self.assertEqual(family.pop_kinetics_cache_stats(), (1, 0))
+        self.assertIsNone(entry2)
+        self.assertIsNot(kinetics1, kinetics2)
+        self.assertAlmostEqual(kinetics2.A.value_si / kinetics1.A.value_si, 2.0)
+
+        # The cached estimate is identical to the uncached one, and is not changed by modifying a copy
+        root_kinetics = family.rules.estimate_kinetics(family.get_root_template(), 1)[0]
+        expected = family.groups.estimate_kinetics_using_group_additivity(template, root_kinetics, 2)
+        self.assertAlmostEqual(kinetics2.A.value_si, expected.A.value_si)
+        self.assertEqual(kinetics2.comment, expected.comment)
+        kinetics2.A.value_si *= 10.0
+        kinetics2.comment += 'modified'
+        kinetics3 = family.estimate_kinetics_using_group_additivity(template, degeneracy=2)
+        self.assertAlmostEqual(kinetics3.A.value_si, expected.A.value_si)
+        self.assertEqual(kinetics3.comment, expected.comment)
+
+        # The rate rule estimate of the same template is a separate entry
+        family.get_kinetics_for_template(template, method='rate rules')
+        self.assertIn((labels, 'group additivity'), family.kinetics_cache)
+        self.assertIn((labels, 'rate rules'), family.kinetics_cache)
+        family.clear_kinetics_cache()
+
 
 class TestTreeGeneration(unittest.TestCase):
 
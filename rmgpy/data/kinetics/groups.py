@@ -206,6 +206,15 @@ class KineticsGroups(Database):
         
         Returns just the kinetics.
         """
+        kinetics = self.estimate_template_kinetics(template, reference_kinetics)
+        return self.apply_degeneracy(kinetics, degeneracy)
+
+    def estimate_template_kinetics(self, template, reference_kinetics):
+        """
+        Determine the kinetics for the given `template` using group additivity,
+        starting from the `reference_kinetics` of the top-level nodes, before
+        applying the reaction path degeneracy with :meth:`apply_degeneracy`.
+        """
         warnings.warn("Group additivity is no longer supported and may be"
                       " removed in version 2.3.", DeprecationWarning)
         # Start with the generic kinetics of the top-level nodes
@@ -227,8 +236,14 @@ class KineticsGroups(Database):
                 comment_line += "{0} (Top node)".format(entry.label)
             kinetics.comment += comment_line + '\n'
 
-        # Also include reaction-path degeneracy
+        return kinetics
 
+    def apply_degeneracy(self, kinetics, degeneracy=1):
+        """
+        Multiply the template `kinetics` returned by :meth:`estimate_template_kinetics`
+        by the reaction path `degeneracy` and finish the kinetics comment.
+        The `kinetics` object is modified and returned.
+        """
         kinetics.change_rate(degeneracy)
 
         kinetics.comment += "Multiplied by reaction path degeneracy {0}".format(degeneracy)
@@ -384,10 +399,9 @@ class KineticsGroups(Database):
             kdata = []
             for template, kinetics in training_set:
 
-                if isinstance(kinetics, (Arrhenius, KineticsData)):
-                    kd = [kinetics.get_rate_coefficient(T) for T in Tdata]
-                elif isinstance(kinetics, ArrheniusEP):
-                    kd = [kinetics.get_rate_coefficient(T, 0) for T in Tdata]
+                if isinstance(kinetics, (Arrhenius, KineticsData, ArrheniusEP)):
+                    # ArrheniusEP is evaluated with a heat of reaction of zero
+                    kd = kinetics.get_rate_coefficients(Tdata)
                 else:
                     raise TypeError('Unexpected kinetics model of type {0} for template '
                                     '{1}.'.format(kinetics.__class__, template))
@@ -488,10 +502,9 @@ class KineticsGroups(Database):
             kdata = []
             for template, kinetics in training_set:
 
-                if isinstance(kinetics, (Arrhenius, KineticsData)):
-                    kd = [kinetics.get_rate_coefficient(T) for T in Tdata]
-                elif isinstance(kinetics, ArrheniusEP):
-                    kd = [kinetics.get_rate_coefficient(T, 0) for T in Tdata]
+                if isinstance(kinetics, (Arrhenius, KineticsData, ArrheniusEP)):
+                    # ArrheniusEP is evaluated with a heat of reaction of zero
+                    kd = kinetics.get_rate_coefficients(Tdata)
                 else:
                     raise TypeError('Unexpected kinetics model of type {0} for template '
                                     '{1}.'.format(kinetics.__class__, template))
@@ -614,6 +614,19 @@ class KineticsRules(Database):
         entry used to determine the kinetics only if it is an exact match,
         and is None if some averaging or use of a parent node took place.
         """
+        kinetics, entry = self.estimate_template_kinetics(template)
+        return self.apply_degeneracy(kinetics, degeneracy), entry
+
+    def estimate_template_kinetics(self, template):
+        """
+        Determine the kinetics for the given `template` using rate rules,
+        before the reaction path degeneracy is applied. The result only
+        depends on the template, so it can be reused for every reaction with
+        that template by copying it and passing the copy to
+        :meth:`apply_degeneracy`.
+
+        Returns a tuple (kinetics, entry) as :meth:`estimate_kinetics`.
+        """
         entry = self.get_rule(template)
 
         original_leaves = get_template_label(template)
@@ -720,6 +733,15 @@ class KineticsRules(Database):
 
         kinetics.comment += ' for rate rule ' + original_leaves
         kinetics.comment += '\nEuclidian distance = {}'.format(min_norm)
+
+        return kinetics, (entry if 'Exact' in kinetics.comment else None)
+
+    def apply_degeneracy(self, kinetics, degeneracy=1):
+        """
+        Multiply the template `kinetics` returned by :meth:`estimate_template_kinetics`
+        by the reaction path `degeneracy` and finish the kinetics comment.
+        The `kinetics` object is modified and returned.
+        """
         kinetics.A.value_si *= degeneracy
         if degeneracy > 1:
             kinetics.comment += "\n"
@@ -728,7 +750,7 @@ class KineticsRules(Database):
         kinetics.comment += "\n"
         kinetics.comment += "family: {0}".format(self.label.replace('/rules', ''))
 
-        return kinetics, (entry if 'Exact' in kinetics.comment else None)
+        return kinetics
 
 
 def remove_identical_kinetics(k_list):
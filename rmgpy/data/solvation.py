@@ -545,6 +545,7 @@ class SolvationDatabase(object):
 
         self.libraries['solvent'].load(os.path.join(path, 'libraries', 'solvent.py'))
         self.libraries['solute'].load(os.path.join(path, 'libraries', 'solute.py'))
+        self.libraries['solute'].index_structures()
 
         self.load_groups(os.path.join(path, 'groups'))
 
@@ -729,7 +730,7 @@ class SolvationDatabase(object):
         ``None`` is returned. If no corresponding library is found, a
         :class:`DatabaseError` is raised.
         """
-        for label, entry in library.entries.items():
+        for entry in library.get_entries_by_structure(species):
             if species.is_isomorphic(entry.item) and entry.data is not None:
                 return deepcopy(entry.data), library, entry
         return None
@@ -890,6 +890,7 @@ class ThermoDatabase(object):
                         library = ThermoLibrary()
                         library.load(os.path.join(root, f), self.local_context, self.global_context)
                         library.label = os.path.splitext(f)[0]
+                        library.index_structures()
                         self.libraries[library.label] = library
                         self.library_order.append(library.label)
 
@@ -901,6 +902,7 @@ class ThermoDatabase(object):
                     library = ThermoLibrary()
                     library.load(os.path.join(path, f), self.local_context, self.global_context)
                     library.label = os.path.splitext(f)[0]
+                    library.index_structures()
                     self.libraries[library.label] = library
                     self.library_order.append(library.label)
                 else:
@@ -1528,7 +1530,7 @@ class ThermoDatabase(object):
         thermo_data = None
 
         # chatelak 11/15/14: modification to introduce liquid phase thermo libraries
-        library_list = deepcopy(self.library_order)  # copy the value to not affect initial object
+        library_list = self.library_order
 
         if rmgpy.rmg.main.solvent is not None:
             liq_libraries = []
@@ -1553,8 +1555,8 @@ class ThermoDatabase(object):
             # Remove liq_libraries from library_list if:
             #     called by training set (training_set=True) or if no thermo found in liqLibrairies
             # if no liquid library found this does nothing.
-            for libIter in liq_libraries:
-                library_list.remove(libIter)
+            if liq_libraries:
+                library_list = [label for label in library_list if label not in liq_libraries]
 
         # Condition to execute this part: gas phase simulation or training set or liquid phase simulation with:
         #     noliquid libraries found or no matching species found in liquid libraries
@@ -1636,12 +1638,12 @@ class ThermoDatabase(object):
         Returns: a list of tuples (thermo_data, depository, entry) without any Cp0 or CpInf data.
         """
         items = []
-        for entry in self.depository['stable'].entries.values():
+        for entry in self.depository['stable'].get_entries_by_structure(species):
             for molecule in species.molecule:
                 if molecule.is_isomorphic(entry.item):
                     items.append((deepcopy(entry.data), self.depository['stable'], entry))
                     break
-        for entry in self.depository['radical'].entries.values():
+        for entry in self.depository['radical'].get_entries_by_structure(species):
             for molecule in species.molecule:
                 if molecule.is_isomorphic(entry.item):
                     items.append((deepcopy(entry.data), self.depository['radical'], entry))
@@ -1660,7 +1662,7 @@ class ThermoDatabase(object):
         Returns a tuple: (ThermoData, library, entry)  or None.
         """
         match = None
-        for entry in library.entries.values():
+        for entry in library.get_entries_by_structure(species):
             for molecule in species.molecule:
                 if molecule.is_isomorphic(entry.item) and entry.data is not None:
                     thermo_data = deepcopy(entry.data)
@@ -281,6 +281,7 @@ class TransportDatabase(object):
                     library = TransportLibrary()
                     library.load(os.path.join(root, f), self.local_context, self.global_context)
                     library.label = os.path.splitext(f)[0]
+                    library.index_structures()
                     self.libraries[library.label] = library
                     self.library_order.append(library.label)
         if libraries is not None:
@@ -383,7 +384,7 @@ class TransportDatabase(object):
         ``None`` is returned. If no corresponding library is found, a
         :class:`DatabaseError` is raised.
         """
-        for entry in library.entries.values():
+        for entry in library.get_entries_by_structure(species):
             if species.is_isomorphic(entry.item) and entry.data is not None:
                 return deepcopy(entry.data), library, entry
         return None
@@ -334,6 +334,12 @@ class InvalidMicrocanonicalRateError(NetworkError):
         self.k_ratio = k_ratio
         self.Keq_ratio = Keq_ratio
 
+    def __reduce__(self):
+        """
+        A helper function used when pickling the error, e.g. to return it from a worker process.
+        """
+        return (InvalidMicrocanonicalRateError, (self.message, self.k_ratio, self.Keq_ratio))
+
     def badness(self):
         """
         How bad is the error?
@@ -41,6 +41,8 @@ cdef class Arrhenius(KineticsModel):
     
     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=?)
+
     cpdef change_t0(self, double T0)
 
     cpdef fit_to_data(self, np.ndarray Tlist, np.ndarray klist, str kunits, double T0=?, np.ndarray weights=?, bint three_params=?)
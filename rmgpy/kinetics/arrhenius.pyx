@@ -27,6 +27,7 @@
 #                                                                             #
 ###############################################################################
 
+cimport cython
 import numpy as np
 cimport numpy as np
 from libc.math cimport exp, sqrt, log10
@@ -134,6 +135,32 @@ cdef class Arrhenius(KineticsModel):
         T0 = self._T0.value_si
         return A * (T / T0) ** n * exp(-Ea / (constants.R * T))
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=None):
+        """
+        Return an array of the rate coefficients in the appropriate
+        combination of m^3, mol, and s at each of the temperatures `Tlist` in
+        K. The pressures `Plist` are ignored.
+        """
+        cdef double[:] T, k
+        cdef np.ndarray klist
+        cdef double A, n, Ea, T0, R
+        cdef Py_ssize_t i
+
+        T = np.ascontiguousarray(Tlist, np.float64).ravel()
+        klist = np.empty(T.shape[0], np.float64)
+        k = klist
+        A = self._A.value_si
+        n = self._n.value_si
+        Ea = self._Ea.value_si
+        T0 = self._T0.value_si
+        R = constants.R
+        with nogil:
+            for i in range(T.shape[0]):
+                k[i] = A * (T[i] / T0) ** n * exp(-Ea / (R * T[i]))
+        return klist
+
     cpdef change_t0(self, double T0):
         """
         Changes the reference temperature used in the exponent to `T0` in K,
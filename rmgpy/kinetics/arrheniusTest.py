@@ -131,6 +131,17 @@ class TestArrhenius(unittest.TestCase):
             kact = self.arrhenius.get_rate_coefficient(T)
             self.assertAlmostEqual(kexp, kact, delta=1e-4 * kexp)
 
+    def test_get_rate_coefficients(self):
+        """
+        Test that Arrhenius.get_rate_coefficients() matches get_rate_coefficient().
+        """
+        Tlist = np.array([200, 400, 600, 800, 1000, 1200, 1400, 1600, 1800, 2000])
+        klist = self.arrhenius.get_rate_coefficients(Tlist)
+        self.assertEqual(klist.shape, Tlist.shape)
+        for T, kact in zip(Tlist, klist):
+            kexp = self.arrhenius.get_rate_coefficient(T)
+            self.assertAlmostEqual(kexp, kact, delta=1e-12 * kexp)
+
     def test_change_t0(self):
         """
         Test the Arrhenius.change_t0() method.
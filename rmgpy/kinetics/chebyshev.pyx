@@ -29,6 +29,7 @@
 
 import logging
 
+cimport cython
 import numpy as np
 cimport numpy as np
 from libc.math cimport log10
@@ -174,6 +175,57 @@ cdef class Chebyshev(PDepKineticsModel):
                 k += coeffs[t, p] * self.chebyshev(t, Tred) * self.chebyshev(p, Pred)
         return 10.0 ** k
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=None):
+        """
+        Return an array of the rate coefficients in the appropriate
+        combination of m^3, mol, and s at each of the temperatures `Tlist` in
+        K and the corresponding pressures `Plist` in Pa by evaluating the
+        Chebyshev expression.
+        """
+        cdef double[:] T, P, k, phiT, phiP
+        cdef double[:, :] coeffs
+        cdef np.ndarray klist
+        cdef double Tmin, Tmax, logPmin, logPmax, Tred, Pred, value
+        cdef int degreeT, degreeP, t, p
+        cdef Py_ssize_t i
+
+        if Plist is None or np.any(Plist == 0):
+            raise ValueError('No pressure specified to pressure-dependent Chebyshev.get_rate_coefficients().')
+        T = np.ascontiguousarray(Tlist, np.float64).ravel()
+        P = np.ascontiguousarray(Plist, np.float64).ravel()
+        if P.shape[0] != T.shape[0]:
+            raise ValueError('Expected {0:d} pressures, got {1:d}.'.format(T.shape[0], P.shape[0]))
+
+        klist = np.empty(T.shape[0], np.float64)
+        k = klist
+        coeffs = np.ascontiguousarray(self._coeffs.value_si, np.float64)
+        degreeT = self.degreeT
+        degreeP = self.degreeP
+        phiT = np.ones(max(degreeT, 2), np.float64)
+        phiP = np.ones(max(degreeP, 2), np.float64)
+        Tmin = self._Tmin.value_si
+        Tmax = self._Tmax.value_si
+        logPmin = log10(self._Pmin.value_si)
+        logPmax = log10(self._Pmax.value_si)
+        with nogil:
+            for i in range(T.shape[0]):
+                Tred = (2.0 / T[i] - 1.0 / Tmin - 1.0 / Tmax) / (1.0 / Tmax - 1.0 / Tmin)
+                Pred = (2.0 * log10(P[i]) - logPmin - logPmax) / (logPmax - logPmin)
+                phiT[1] = Tred
+                for t in range(2, degreeT):
+                    phiT[t] = 2 * Tred * phiT[t - 1] - phiT[t - 2]
+                phiP[1] = Pred
+                for p in range(2, degreeP):
+                    phiP[p] = 2 * Pred * phiP[p - 1] - phiP[p - 2]
+                value = 0.0
+                for t in range(degreeT):
+                    for p in range(degreeP):
+                        value += coeffs[t, p] * phiT[t] * phiP[p]
+                k[i] = 10.0 ** value
+        return klist
+
     cpdef fit_to_data(self, np.ndarray Tlist, np.ndarray Plist, np.ndarray K,
                     str kunits, int degreeT, int degreeP, double Tmin, double Tmax, double Pmin, double Pmax):
         """
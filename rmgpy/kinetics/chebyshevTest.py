@@ -139,6 +139,18 @@ class TestChebyshev(unittest.TestCase):
                 Kact = self.chebyshev.get_rate_coefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact / Kexp[t, p], 1.0, 4, '{0} != {1} within 4 places'.format(Kexp[t, p], Kact))
 
+    def test_get_rate_coefficients(self):
+        """
+        Test that Chebyshev.get_rate_coefficients() matches get_rate_coefficient().
+        """
+        Tlist = np.array([300, 500, 1000, 1500, 300, 500, 1000, 1500])
+        Plist = np.array([1e4, 1e4, 1e5, 1e5, 1e6, 1e6, 1e6, 2e6])
+        Klist = self.chebyshev.get_rate_coefficients(Tlist, Plist)
+        for T, P, Kact in zip(Tlist, Plist, Klist):
+            Kexp = self.chebyshev.get_rate_coefficient(T, P)
+            self.assertAlmostEqual(Kact / Kexp, 1.0, 10)
+        self.assertRaises(ValueError, self.chebyshev.get_rate_coefficients, Tlist)
+
     def test_fit_to_data(self):
         """
         Test the Chebyshev.fit_to_data() method.
@@ -32,6 +32,9 @@ This module contains classes representing pressure-dependent kinetics models
 of "standard" falloff.
 """
 
+cimport cython
+import numpy as np
+cimport numpy as np
 from libc.math cimport exp, log, log10
 
 cimport rmgpy.constants as constants
@@ -39,6 +42,21 @@ import rmgpy.quantity as quantity
 
 ################################################################################
 
+cdef np.ndarray get_pressure_array(Py_ssize_t n, np.ndarray Plist):
+    """
+    Return the pressures `Plist` in Pa as a contiguous array of `n` values,
+    or an array of zeros if `Plist` is ``None``, as for the scalar methods.
+    """
+    cdef np.ndarray P
+    if Plist is None:
+        return np.zeros(n, np.float64)
+    P = np.ascontiguousarray(Plist, np.float64).ravel()
+    if P.shape[0] != n:
+        raise ValueError('Expected {0:d} pressures, got {1:d}.'.format(n, P.shape[0]))
+    return P
+
+################################################################################
+
 cdef class ThirdBody(PDepKineticsModel):
     """
     A kinetic model of a phenomenological rate coefficient :math:`k(T, P)`
@@ -100,6 +118,30 @@ cdef class ThirdBody(PDepKineticsModel):
 
         return k0 * C
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=None):
+        """
+        Return an array of the rate coefficients in units of m^3, mol, and s
+        at each of the temperatures `Tlist` in K and the corresponding
+        (effective) pressures `Plist` in Pa.
+        """
+        cdef double[:] T, P, k0, k
+        cdef np.ndarray Tarray, klist
+        cdef double R = constants.R
+        cdef Py_ssize_t i
+
+        Tarray = np.ascontiguousarray(Tlist, np.float64).ravel()
+        T = Tarray
+        P = get_pressure_array(T.shape[0], Plist)
+        k0 = self.arrheniusLow.get_rate_coefficients(Tarray)
+        klist = np.empty(T.shape[0], np.float64)
+        k = klist
+        with nogil:
+            for i in range(T.shape[0]):
+                k[i] = k0[i] * P[i] / R / T[i]
+        return klist
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:
         """
         Checks to see if kinetics matches that of other kinetics and returns ``True``
@@ -197,6 +239,32 @@ cdef class Lindemann(PDepKineticsModel):
 
         return kinf * (Pr / (1 + Pr))
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=None):
+        """
+        Return an array of the rate coefficients in units of m^3, mol, and s
+        at each of the temperatures `Tlist` in K and the corresponding
+        (effective) pressures `Plist` in Pa.
+        """
+        cdef double[:] T, P, k0, kinf, k
+        cdef np.ndarray Tarray, klist
+        cdef double R = constants.R, Pr
+        cdef Py_ssize_t i
+
+        Tarray = np.ascontiguousarray(Tlist, np.float64).ravel()
+        T = Tarray
+        P = get_pressure_array(T.shape[0], Plist)
+        k0 = self.arrheniusLow.get_rate_coefficients(Tarray)
+        kinf = self.arrheniusHigh.get_rate_coefficients(Tarray)
+        klist = np.empty(T.shape[0], np.float64)
+        k = klist
+        with nogil:
+            for i in range(T.shape[0]):
+                Pr = k0[i] * (P[i] / R / T[i]) / kinf[i]
+                k[i] = kinf[i] * (Pr / (1 + Pr))
+        return klist
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:
         """
         Checks to see if kinetics matches that of other kinetics and returns ``True``
@@ -351,6 +419,49 @@ cdef class Troe(PDepKineticsModel):
 
         return kinf * (Pr / (1 + Pr)) * F
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=None):
+        """
+        Return an array of the rate coefficients in units of m^3, mol, and s
+        at each of the temperatures `Tlist` in K and the corresponding
+        (effective) pressures `Plist` in Pa.
+        """
+        cdef double[:] T, P, k0, kinf, k
+        cdef np.ndarray Tarray, klist
+        cdef double R = constants.R, Pr
+        cdef double d, n, c, Fcent, F
+        cdef double alpha, T1, T2, T3
+        cdef Py_ssize_t i
+
+        Tarray = np.ascontiguousarray(Tlist, np.float64).ravel()
+        T = Tarray
+        P = get_pressure_array(T.shape[0], Plist)
+        k0 = self.arrheniusLow.get_rate_coefficients(Tarray)
+        kinf = self.arrheniusHigh.get_rate_coefficients(Tarray)
+        klist = np.empty(T.shape[0], np.float64)
+        k = klist
+
+        alpha = self.alpha
+        T1 = self._T1.value_si if self._T1 is not None else 0.0
+        T2 = self._T2.value_si if self._T2 is not None else 0.0
+        T3 = self._T3.value_si if self._T3 is not None else 0.0
+        d = 0.14
+
+        with nogil:
+            for i in range(T.shape[0]):
+                Pr = k0[i] * (P[i] / R / T[i]) / kinf[i]
+                if T1 == 0 and T3 == 0:
+                    F = 1.0
+                else:
+                    Fcent = (1 - alpha) * exp(-T[i] / T3) + alpha * exp(-T[i] / T1)
+                    if T2 != 0.0: Fcent += exp(-T2 / T[i])
+                    n = 0.75 - 1.27 * log10(Fcent)
+                    c = -0.4 - 0.67 * log10(Fcent)
+                    F = 10.0 ** (log10(Fcent) / (1 + ((log10(Pr) + c) / (n - d * (log10(Pr)))) ** 2))
+                k[i] = kinf[i] * (Pr / (1 + Pr)) * F
+        return klist
+
     cpdef bint is_identical_to(self, KineticsModel other_kinetics) except -2:
         """
         Checks to see if kinetics matches that of other kinetics and returns ``True``
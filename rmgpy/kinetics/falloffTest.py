@@ -211,6 +211,21 @@ class TestThirdBody(unittest.TestCase):
                 Kact = self.thirdBody.get_rate_coefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact, Kexp[t, p], delta=1e-4 * Kexp[t, p])
 
+    def test_get_rate_coefficients(self):
+        """
+        Test that the ThirdBody.get_rate_coefficients() method matches the
+        scalar method at each temperature and pressure.
+        """
+        Tlist = np.array([300, 500, 1000, 1500, 2000])
+        Plist = np.array([1e3, 1e4, 1e5, 1e6, 1e7])
+        Kact = self.thirdBody.get_rate_coefficients(Tlist, Plist)
+        self.assertEqual(Kact.shape, Tlist.shape)
+        for T, P, k in zip(Tlist, Plist, Kact):
+            Kexp = self.thirdBody.get_rate_coefficient(T, P)
+            self.assertAlmostEqual(k, Kexp, delta=1e-12 * Kexp)
+        with self.assertRaises(ValueError):
+            self.thirdBody.get_rate_coefficients(Tlist, Plist[:-1])
+
     def test_pickle(self):
         """
         Test that a ThirdBody object can be successfully pickled and
@@ -394,6 +409,21 @@ class TestLindemann(unittest.TestCase):
                 Kact = self.lindemann.get_rate_coefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact, Kexp[t, p], delta=1e-4 * Kexp[t, p])
 
+    def test_get_rate_coefficients(self):
+        """
+        Test that the Lindemann.get_rate_coefficients() method matches the
+        scalar method at each temperature and pressure.
+        """
+        Tlist = np.array([300, 500, 1000, 1500, 2000])
+        Plist = np.array([1e3, 1e4, 1e5, 1e6, 1e7])
+        Kact = self.lindemann.get_rate_coefficients(Tlist, Plist)
+        self.assertEqual(Kact.shape, Tlist.shape)
+        for T, P, k in zip(Tlist, Plist, Kact):
+            Kexp = self.lindemann.get_rate_coefficient(T, P)
+            self.assertAlmostEqual(k, Kexp, delta=1e-12 * Kexp)
+        with self.assertRaises(ValueError):
+            self.lindemann.get_rate_coefficients(Tlist, Plist[:-1])
+
     def test_pickle(self):
         """
         Test that a Lindemann object can be pickled and unpickled with no loss
@@ -625,6 +655,21 @@ class TestTroe(unittest.TestCase):
                 Kact = self.troe.get_rate_coefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact, Kexp[t, p], delta=1e-4 * Kexp[t, p])
 
+    def test_get_rate_coefficients(self):
+        """
+        Test that the Troe.get_rate_coefficients() method matches the
+        scalar method at each temperature and pressure.
+        """
+        Tlist = np.array([300, 500, 1000, 1500, 2000])
+        Plist = np.array([1e3, 1e4, 1e5, 1e6, 1e7])
+        Kact = self.troe.get_rate_coefficients(Tlist, Plist)
+        self.assertEqual(Kact.shape, Tlist.shape)
+        for T, P, k in zip(Tlist, Plist, Kact):
+            Kexp = self.troe.get_rate_coefficient(T, P)
+            self.assertAlmostEqual(k, Kexp, delta=1e-12 * Kexp)
+        with self.assertRaises(ValueError):
+            self.troe.get_rate_coefficients(Tlist, Plist[:-1])
+
     def test_pickle(self):
         """
         Test that a Troe object can be pickled and unpickled with no loss of
@@ -51,6 +51,8 @@ cdef class KineticsModel:
     cpdef bint is_temperature_valid(self, double T) except -2
 
     cpdef double get_rate_coefficient(self, double T, double P=?) except -1
+
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=?)
     
     cpdef to_html(self)
 
@@ -183,6 +183,31 @@ cdef class KineticsModel:
         raise NotImplementedError('Unexpected call to KineticsModel.get_rate_coefficient(); '
                                   'you should be using a class derived from KineticsModel.')
 
+    cpdef np.ndarray get_rate_coefficients(self, np.ndarray Tlist, np.ndarray Plist=None):
+        """
+        Return an array of the rate coefficients :math:`k(T)` in units of m^3,
+        mol, and s at each of the temperatures `Tlist` in K, and for
+        pressure-dependent models the corresponding pressures `Plist` in Pa.
+        Derived classes may overload this method with a faster version.
+        """
+        cdef double[:] T, P, k
+        cdef np.ndarray klist
+        cdef Py_ssize_t i
+
+        T = np.ascontiguousarray(Tlist, np.float64).ravel()
+        klist = np.empty(T.shape[0], np.float64)
+        k = klist
+        if Plist is None:
+            for i in range(T.shape[0]):
+                k[i] = self.get_rate_coefficient(T[i])
+        else:
+            P = np.ascontiguousarray(Plist, np.float64).ravel()
+            if P.shape[0] != T.shape[0]:
+                raise ValueError('Expected {0:d} pressures, got {1:d}.'.format(T.shape[0], P.shape[0]))
+            for i in range(T.shape[0]):
+                k[i] = self.get_rate_coefficient(T[i], P[i])
+        return klist
+
     cpdef to_html(self):
         """
         Return an HTML rendering.
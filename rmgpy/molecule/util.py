@@ -178,3 +178,28 @@ def swap(to_be_swapped, sample):
     new_partner = (to_be_swapped - sample).pop()
 
     return central, original, new_partner
+
+
+def get_graph_hash(molecule, iterations=3):
+    """
+    Return a hash of the connectivity of `molecule`, computed using
+    `iterations` rounds of the Weisfeiler-Lehman algorithm over the heavy atoms.
+    Each heavy atom is initially labeled by its element and number of hydrogens.
+    Bond orders, charges and electrons are ignored, so all resonance structures
+    of a species have the same hash, as do any two molecules that are isomorphic
+    with ``strict=False``. Different molecules may also share a hash, so a
+    match must still be confirmed by an isomorphism check.
+
+    The hash uses the built-in :func:`hash` function and is therefore only
+    comparable within the same process.
+    """
+    atoms = [atom for atom in molecule.atoms if not atom.is_hydrogen()] or molecule.atoms
+    labels = {}
+    for atom in atoms:
+        num_hydrogens = sum([1 for neighbor in atom.edges if neighbor.is_hydrogen()])
+        labels[atom] = hash((atom.element.symbol, atom.element.isotope, num_hydrogens))
+    for _ in range(iterations):
+        labels = {atom: hash((labels[atom], tuple(sorted([labels[neighbor] for neighbor in atom.edges
+                                                          if neighbor in labels]))))
+                  for atom in atoms}
+    return hash(tuple(sorted(labels.values())))
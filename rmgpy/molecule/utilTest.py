@@ -30,7 +30,8 @@
 import unittest
 from scipy.special import comb
 
-from rmgpy.molecule.util import get_element_count, agglomerate, generate_combo, partition, swap
+from rmgpy.molecule.molecule import Molecule
+from rmgpy.molecule.util import get_element_count, agglomerate, generate_combo, get_graph_hash, partition, swap
 
 
 class ElementCountTest(unittest.TestCase):
@@ -149,3 +150,24 @@ class SwapTest(unittest.TestCase):
         result = swap(to_be_swapped, sample)
         expected = (1, 3, 2)
         self.assertEquals(result, expected)
+
+
+class GraphHashTest(unittest.TestCase):
+
+    def test_resonance_structures(self):
+        """Test that resonance structures have the same graph hash"""
+        mol = Molecule().from_smiles('C=CC=C[CH2]')
+        hashes = set([get_graph_hash(structure) for structure in mol.generate_resonance_structures()])
+        self.assertEqual(len(hashes), 1)
+
+    def test_isomers(self):
+        """Test that structural isomers have different graph hashes"""
+        self.assertNotEqual(get_graph_hash(Molecule().from_smiles('CCC[CH2]')),
+                            get_graph_hash(Molecule().from_smiles('C[CH]CC')))
+        self.assertNotEqual(get_graph_hash(Molecule().from_smiles('CCCC')),
+                            get_graph_hash(Molecule().from_smiles('CC(C)C')))
+
+    def test_hydrogen(self):
+        """Test that molecules without heavy atoms can be hashed"""
+        self.assertNotEqual(get_graph_hash(Molecule().from_smiles('[H][H]')),
+                            get_graph_hash(Molecule().from_smiles('[H]')))
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+This module contains a cache of the microcanonical rate coefficients
+:math:`k(E)` computed by RRKM theory and the inverse Laplace transform method,
+which is shared by all of the networks in a process.
+"""
+
+import hashlib
+import logging
+import os
+import os.path
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+
+################################################################################
+
+
+class MicrocanonicalRateCache(object):
+    """
+    A content-addressed cache of microcanonical rate coefficients :math:`k(E)`.
+    Each entry is found by a key computed from the content of the inputs of the
+    calculation other than the energy grains and the density of states, i.e. the
+    method, the transition state and kinetics, the lowest energy grain and
+    grain size and the J values. The :math:`k(E)` values are computed grain by
+    grain from the lowest energy, so an entry computed on more energy grains
+    can be used for fewer grains as long as the density of states agrees on
+    those grains. The attributes are:
+
+    =================== ========================================================
+    Attribute           Description
+    =================== ========================================================
+    `max_size`          The maximum total size in bytes of the arrays kept in memory
+    `directory`         The directory to spill the entries evicted from memory to, or ``None`` to discard them
+    `entries`           A dictionary of lists of entries, keyed by content, from the least to the most recently used
+    `size`              The total size in bytes of the arrays in memory
+    `hits`              The number of lookups that found an entry
+    `misses`            The number of lookups that did not find an entry
+    `recorded_keys`     The set of keys looked up while recording, or ``None`` if not recording
+    `recorded_entries`  The list of entries stored while recording, or ``None`` if not recording
+    =================== ========================================================
+
+    Each entry is a tuple of the energy grains in J/mol, the density of states
+    and the :math:`k(E)` values. As the transition state does not determine the
+    density of states of the reactants, a key can hold a few entries with
+    different densities of states.
+
+    Each process has its own cache. A worker process can record the keys it
+    looks up and the entries it stores between :meth:`start_recording` and
+    :meth:`stop_recording`, and return them to the parent process, which adds
+    the entries to its cache with :meth:`add_entries` and sends those of the
+    recorded keys, as given by :meth:`get_entries`, with the next task.
+    """
+
+    max_entries_per_key = 4
+
+    def __init__(self, max_size=2 ** 28, directory=None):
+        self.max_size = max_size
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.recorded_keys = None
+        self.recorded_entries = None
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.entries.values())
+
+    @staticmethod
+    def get_key(*parts):
+        """
+        Return the content key of the calculation with inputs `parts`, which
+        must be picklable. The pickled objects are used rather than their
+        representations, which round floats to fewer significant digits.
+        """
+        return hashlib.sha1(pickle.dumps(parts, -1)).hexdigest()
+
+    def get(self, key, e_list, dens_states):
+        """
+        Return a copy of the cached :math:`k(E)` values for the content `key`
+        at the energies `e_list` in J/mol and density of states `dens_states`,
+        or ``None`` if there is no cached entry on the same or more grains with
+        the same density of states.
+        """
+        if self.recorded_keys is not None:
+            self.recorded_keys.add(key)
+        n_grains = len(e_list)
+        for cached_e_list, cached_dens_states, k in self._get_bucket(key):
+            if self._matches(cached_e_list, cached_dens_states, e_list, dens_states):
+                self.hits += 1
+                return k[:n_grains].copy()
+        self.misses += 1
+        return None
+
+    def put(self, key, e_list, dens_states, k):
+        """
+        Store the :math:`k(E)` values `k` for the content `key` at the energies
+        `e_list` in J/mol and density of states `dens_states`. Any entries for
+        the same key on fewer grains with the same density of states are
+        replaced, and the least recently used keys are evicted if the cache is
+        then too large.
+        """
+        bucket = [entry for entry in self._get_bucket(key)
+                  if not self._matches(e_list, dens_states, entry[0], entry[1])]
+        bucket.append((e_list.copy(), dens_states.copy(), k.copy()))
+        if self.recorded_entries is not None:
+            self.recorded_entries.append((key,) + bucket[-1])
+        del bucket[:-self.max_entries_per_key]
+        self._set_bucket(key, bucket)
+        self._evict()
+
+    def get_entries(self, keys):
+        """
+        Return a list of the ``(key, e_list, dens_states, k)`` entries cached
+        for each of the content `keys`, e.g. to send them to a worker process.
+        """
+        return [(key,) + entry for key in keys for entry in self._get_bucket(key)]
+
+    def add_entries(self, entries):
+        """
+        Store each of the ``(key, e_list, dens_states, k)`` `entries`, as
+        returned by :meth:`get_entries` or :meth:`stop_recording`.
+        """
+        for key, e_list, dens_states, k in entries:
+            self.put(key, e_list, dens_states, k)
+
+    def start_recording(self):
+        """
+        Start recording the keys looked up by :meth:`get` and the entries
+        stored by :meth:`put`, until :meth:`stop_recording` is called.
+        """
+        self.recorded_keys = set()
+        self.recorded_entries = []
+
+    def stop_recording(self):
+        """
+        Stop recording, and return the set of keys looked up and the list of
+        ``(key, e_list, dens_states, k)`` entries stored since
+        :meth:`start_recording` was called.
+        """
+        keys, entries = self.recorded_keys, self.recorded_entries
+        self.recorded_keys = None
+        self.recorded_entries = None
+        return keys, entries
+
+    def clear(self):
+        """
+        Remove all entries from memory and reset the counts of hits and misses.
+        Entries already spilled to disk are kept.
+        """
+        self.entries.clear()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _matches(cached_e_list, cached_dens_states, e_list, dens_states):
+        """
+        Return ``True`` if an entry at the energies `cached_e_list` and density
+        of states `cached_dens_states` can be used at the energies `e_list` and
+        density of states `dens_states`, or ``False`` if not.
+        """
+        n_grains = len(e_list)
+        return (len(cached_e_list) >= n_grains and cached_dens_states.shape[1:] == dens_states.shape[1:]
+                and np.allclose(cached_e_list[:n_grains], e_list, rtol=1e-10, atol=1e-6)
+                and np.array_equal(cached_dens_states[:n_grains], dens_states))
+
+    def _get_path(self, key):
+        """
+        Return the path of the file that the entries for `key` are spilled to.
+        """
+        return os.path.join(self.directory, key + '.pkl')
+
+    def _get_bucket(self, key):
+        """
+        Return the list of entries for `key` from memory, or else from disk,
+        marking it as the most recently used.
+        """
+        bucket = self.entries.get(key)
+        if bucket is not None:
+            self.entries.move_to_end(key)
+            return bucket
+        if self.directory is not None and os.path.exists(self._get_path(key)):
+            try:
+                with open(self._get_path(key), 'rb') as f:
+                    bucket = pickle.load(f)
+            except (IOError, EOFError, pickle.UnpicklingError):
+                logging.warning('Unable to read cached k(E) values from {0}.'.format(self._get_path(key)))
+                return []
+            self._set_bucket(key, bucket)
+            self._evict()
+            return bucket
+        return []
+
+    def _set_bucket(self, key, bucket):
+        """
+        Set the list of entries for `key` in memory, marking it as the most
+        recently used.
+        """
+        if key in self.entries:
+            self.size -= sum(array.nbytes for entry in self.entries.pop(key) for array in entry)
+        self.entries[key] = bucket
+        self.size += sum(array.nbytes for entry in bucket for array in entry)
+
+    def _evict(self):
+        """
+        Evict the least recently used keys until the arrays in memory fit in
+        `max_size`, keeping at least the most recently used key. The evicted
+        entries are written to `directory` if it is set. Each file is written
+        under a temporary name and then renamed, so that processes sharing the
+        directory never read a partial file.
+        """
+        while self.size > self.max_size and len(self.entries) > 1:
+            key, bucket = self.entries.popitem(last=False)
+            self.size -= sum(array.nbytes for entry in bucket for array in entry)
+            if self.directory is not None:
+                os.makedirs(self.directory, exist_ok=True)
+                path = self._get_path(key)
+                temp_path = '{0}.{1:d}.tmp'.format(path, os.getpid())
+                with open(temp_path, 'wb') as f:
+                    pickle.dump(bucket, f, -1)
+                os.replace(temp_path, path)
+
+
+# The cache used by :func:`rmgpy.pdep.reaction.calculate_microcanonical_rate_coefficient`
+# Set its `directory` attribute to spill evicted entries to disk
+microcanonical_rate_cache = MicrocanonicalRateCache()
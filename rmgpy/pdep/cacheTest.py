@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+This module contains unit tests of the :mod:`rmgpy.pdep.cache` module.
+"""
+
+import os.path
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from rmgpy.pdep.cache import MicrocanonicalRateCache
+
+################################################################################
+
+
+class TestMicrocanonicalRateCache(unittest.TestCase):
+    """
+    Contains unit tests of the MicrocanonicalRateCache class.
+    """
+
+    def setUp(self):
+        self.e_list = np.arange(0.0, 100000.0, 1000.0)
+        self.dens_states = np.zeros((len(self.e_list), 1))
+        self.dens_states[1:, 0] = (self.e_list[1:] / 1000.) ** 4
+        self.k = 1e8 * self.e_list[:, np.newaxis] / 100000.
+        self.key = MicrocanonicalRateCache.get_key('rrkm', 1.0, (0, 1))
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_get_key(self):
+        """
+        Test that the keys of equal inputs are equal, and those of inputs
+        that only differ beyond the printed precision are not.
+        """
+        self.assertEqual(MicrocanonicalRateCache.get_key('rrkm', 1.0, (0, 1)), self.key)
+        self.assertNotEqual(MicrocanonicalRateCache.get_key('rrkm', 1.0 + 1e-12, (0, 1)), self.key)
+        self.assertNotEqual(MicrocanonicalRateCache.get_key('ilt', 1.0, (0, 1)), self.key)
+
+    def test_reuse_on_fewer_grains(self):
+        """
+        Test that an entry is used on the same or fewer energy grains with the
+        same density of states, and not otherwise.
+        """
+        cache = MicrocanonicalRateCache()
+        cache.put(self.key, self.e_list, self.dens_states, self.k)
+
+        k = cache.get(self.key, self.e_list[:60], self.dens_states[:60])
+        self.assertTrue(np.array_equal(k, self.k[:60]))
+        k[:] = 0.0
+        self.assertTrue(np.array_equal(cache.get(self.key, self.e_list, self.dens_states), self.k))
+
+        self.assertIsNone(cache.get(self.key, self.e_list[:60] + 500.0, self.dens_states[:60]))
+        self.assertIsNone(cache.get(self.key, self.e_list[:60], 2 * self.dens_states[:60]))
+        self.assertIsNone(cache.get(MicrocanonicalRateCache.get_key('ilt'), self.e_list, self.dens_states))
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+
+        # An entry on more grains replaces the one it can be used for, but not one with another density of states
+        e_list = np.arange(0.0, 200000.0, 1000.0)
+        dens_states = np.zeros((len(e_list), 1))
+        dens_states[1:, 0] = (e_list[1:] / 1000.) ** 4
+        cache.put(self.key, self.e_list[:60], 2 * self.dens_states[:60], self.k[:60])
+        cache.put(self.key, e_list, dens_states, 1e8 * e_list[:, np.newaxis] / 100000.)
+        self.assertEqual(len(cache), 2)
+        self.assertTrue(np.array_equal(cache.get(self.key, self.e_list, self.dens_states), self.k))
+
+    def test_spill_to_disk(self):
+        """
+        Test that the least recently used entries are spilled to disk when the
+        cache is full, and read back when they are used again.
+        """
+        entry_size = self.e_list.nbytes + self.dens_states.nbytes + self.k.nbytes
+        cache = MicrocanonicalRateCache(max_size=2 * entry_size, directory=self.directory)
+        keys = [MicrocanonicalRateCache.get_key('rrkm', float(i)) for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, self.e_list, self.dens_states, (i + 1) * self.k)
+        self.assertEqual(list(cache.entries), keys[1:])
+        self.assertEqual(cache.size, 2 * entry_size)
+        self.assertTrue(os.path.exists(os.path.join(self.directory, keys[0] + '.pkl')))
+
+        self.assertTrue(np.array_equal(cache.get(keys[0], self.e_list, self.dens_states), self.k))
+        self.assertEqual(list(cache.entries), [keys[2], keys[0]])
+
+        # Without a directory, the evicted entries are discarded
+        cache = MicrocanonicalRateCache(max_size=entry_size)
+        for i, key in enumerate(keys):
+            cache.put(key, self.e_list, self.dens_states, (i + 1) * self.k)
+        self.assertEqual(list(cache.entries), keys[2:])
+        self.assertIsNone(cache.get(keys[0], self.e_list, self.dens_states))
+
+    def test_return_entries_to_parent(self):
+        """
+        Test that the keys looked up and the entries stored by a worker's cache
+        while recording can be added to the parent's cache and sent back.
+        """
+        parent = MicrocanonicalRateCache()
+        worker = MicrocanonicalRateCache()
+        other_key = MicrocanonicalRateCache.get_key('ilt', 1.0)
+        worker.put(other_key, self.e_list, self.dens_states, self.k)
+
+        worker.start_recording()
+        self.assertIsNone(worker.get(self.key, self.e_list, self.dens_states))
+        worker.put(self.key, self.e_list, self.dens_states, self.k)
+        keys, entries = worker.stop_recording()
+        self.assertEqual(keys, {self.key})
+        self.assertEqual(len(entries), 1)
+        self.assertIsNone(worker.recorded_keys)
+
+        parent.add_entries(entries)
+        self.assertTrue(np.array_equal(parent.get(self.key, self.e_list, self.dens_states), self.k))
+        self.assertEqual(len(parent.get_entries(keys)), 1)
+        self.assertEqual(parent.get_entries([other_key]), [])
+
+        # A new worker gets the entries sent with its next task
+        worker = MicrocanonicalRateCache()
+        worker.add_entries(parent.get_entries(keys))
+        self.assertTrue(np.array_equal(worker.get(self.key, self.e_list, self.dens_states), self.k))
+
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
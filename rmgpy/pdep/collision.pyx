@@ -42,6 +42,11 @@ cimport rmgpy.constants as constants
 import rmgpy.quantity as quantity
 from rmgpy.exceptions import CollisionError
 
+# The energy transferred in a collision, in units of the average energy transferred in a deactivating collision,
+# beyond which the single exponential down transfer probabilities are neglected; since exp(-40) is below double
+# precision, this does not change the normalized transfer probabilities
+ENERGY_TRANSFER_CUTOFF = 40.0
+
 ################################################################################
 
 
@@ -138,28 +143,54 @@ cdef class SingleExponentialDown(RMGObject):
         :math:`\\matrix{M}_\\mathrm{coll} / \\omega = \\matrix{P} - \\matrix{I}`
         corresponding to this collision model for a given set of energies
         `e_list` in J/mol, temperature `T` in K, and isomer density of states
-        `dens_states`.
+        `dens_states`. The matrix is assembled from the factors returned by
+        :meth:`generate_collision_matrix_factors`.
+        """
+        cdef np.ndarray[np.float64_t,ndim=2] p0, phi
+        cdef np.ndarray[np.float64_t,ndim=4] p
+
+        p0, phi = self.generate_collision_matrix_factors(T, dens_states, e_list, j_list)
+        p = np.empty((p0.shape[0], phi.shape[1], p0.shape[0], phi.shape[1]), np.float64)
+        p[:, :, :, :] = p0[:, np.newaxis, :, np.newaxis] * phi[:, :, np.newaxis, np.newaxis]
+        return p
+
+    def generate_collision_matrix_factors(self, double T,
+                                          np.ndarray[np.float64_t,ndim=2] dens_states,
+                                          np.ndarray[np.float64_t,ndim=1] e_list,
+                                          np.ndarray[np.int_t,ndim=1] j_list=None):
+        """
+        Generate and return the factors `p0` and `phi` of the collision matrix
+        for a given set of energies `e_list` in J/mol, temperature `T` in K,
+        and isomer density of states `dens_states`, such that the matrix
+        element for transfer from grain :math:`(u,v)` to grain :math:`(r,s)`
+        is ``p0[r,u] * phi[r,s]``. `p0` is the matrix of energy transfer
+        probabilities minus the identity matrix, and `phi` is the distribution
+        of the total angular momentum quantum numbers `j_list` after a
+        collision into each energy grain.
+
+        On evenly spaced energy grains the exponential factors depend only on
+        the number of grains transferred, so they are computed once for each
+        offset, and only the band of offsets for which the transfer
+        probabilities are significant compared to the largest one out of each
+        grain is filled.
         """
 
-        cdef double alpha, beta
+        cdef double alpha, beta, de
         cdef double c, left, right
-        cdef int n_grains, start, i, r, s, u, v
-        cdef np.ndarray[np.float64_t,ndim=1] rho
+        cdef int n_grains, n_j, start, peak, band, d, r, s
+        cdef bint uniform
+        cdef np.ndarray[np.float64_t,ndim=1] rho, down, up
         cdef np.ndarray[np.float64_t,ndim=2] phi, p0
-        cdef np.ndarray[np.float64_t,ndim=4] p
 
         n_grains = e_list.shape[0]
         n_j = j_list.shape[0] if j_list is not None else 1
-        p = np.zeros((n_grains, n_j, n_grains, n_j), np.float64)
         p0 = np.zeros((n_grains, n_grains), np.float64)
 
         alpha = 1.0 / self.get_alpha(T)
         beta = 1.0 / (constants.R * T)
         
         if n_j > 1:
-            rho = np.zeros(n_grains)
-            for r in range(n_grains):
-                rho[r] = np.sum((2 * j_list + 1) * dens_states[r, :])
+            rho = np.dot(dens_states, 2 * j_list + 1)
         else:
             rho = dens_states[:, 0]
         
@@ -167,13 +198,36 @@ cdef class SingleExponentialDown(RMGObject):
             if rho[start] > 0:
                 break
 
-        # Determine unnormalized entries in collisional transfer probability matrix
+        # Determine the width of the band of significant transfer probabilities, in grains
+        # The upward transfer probabilities out of a grain below the peak of the equilibrium distribution
+        # are largest near that peak, so the band must reach from the lowest grain to beyond the peak
+        de = e_list[1] - e_list[0] if n_grains > 1 else 0.0
+        uniform = n_grains > 1 and de > 0 and np.allclose(np.diff(e_list), de, rtol=1e-8, atol=0)
+        band = n_grains - start - 1
+        if uniform:
+            peak = start + np.argmax(rho[start:] * np.exp(-(e_list[start:] - e_list[start]) * beta))
+            if ENERGY_TRANSFER_CUTOFF / (alpha * de) + peak - start < band:
+                band = int(ENERGY_TRANSFER_CUTOFF / (alpha * de)) + peak - start
+            # On evenly spaced grains the exponential factors only depend on the number of grains transferred
+            down = np.empty(band + 1, np.float64)
+            up = np.empty(band + 1, np.float64)
+            for d in range(band + 1):
+                down[d] = exp(-d * de * alpha)
+                up[d] = exp(-d * de * (alpha + beta))
+
+        # Determine unnormalized entries in collisional transfer probability matrix within the band
         for r in range(start, n_grains):
-            for s in range(start, r + 1):
-                p0[s, r] = exp(-(e_list[r] - e_list[s]) * alpha)
-            for s in range(r+1,n_grains):
-                p0[s, r] = exp(-(e_list[s] - e_list[r]) * alpha) * rho[s] / rho[r] * exp(-(e_list[s] - e_list[r]) * beta)
-        
+            if uniform:
+                for s in range(max(start, r - band), r + 1):
+                    p0[s, r] = down[r - s]
+                for s in range(r + 1, min(n_grains, r + band + 1)):
+                    p0[s, r] = up[s - r] * rho[s] / rho[r]
+            else:
+                for s in range(start, r + 1):
+                    p0[s, r] = exp(-(e_list[r] - e_list[s]) * alpha)
+                for s in range(r + 1, n_grains):
+                    p0[s, r] = exp(-(e_list[s] - e_list[r]) * alpha) * rho[s] / rho[r] * exp(-(e_list[s] - e_list[r]) * beta)
+
         # Normalize using detailed balance
         # This method is much more robust, and corresponds to:
         #    [ 1 1 1 1 ...]
@@ -182,16 +236,16 @@ cdef class SingleExponentialDown(RMGObject):
         #    [ 1 2 3 4 ...]
         for r in range(start, n_grains):
             left, right = 0.0, 0.0
-            for s in range(start, r):
+            for s in range(max(start, r - band), r):
                 left += p0[s, r]
-            for s in range(r, n_grains):
+            for s in range(r, min(n_grains, r + band + 1)):
                 right += p0[s, r]
             c = (1 - left) / right
             # Check for normalization consistency (i.e. all numbers are positive)
             if c < 0:
                 raise CollisionError('Encountered negative normalization coefficient while normalizing '
                                      'collisional transfer probabilities matrix.')
-            for s in range(r + 1, n_grains):
+            for s in range(r + 1, min(n_grains, r + band + 1)):
                 p0[r, s] *= c
                 p0[s, r] *= c
             p0[r, r] = p0[r, r] * c - 1
@@ -213,24 +267,16 @@ cdef class SingleExponentialDown(RMGObject):
         #         p0[s,r] *= c
         #     p0[r,r] = p0[r,r] * c - 1
 
-        # If solving the 2D master equation, compute P(E,J,E',J') from P(E,E')
+        # If solving the 2D master equation, P(E,J,E',J') follows from P(E,E')
         # by assuming that the J distribution after the collision is independent
         # of that before the collision (the strong collision approximation in J)
         if n_j > 1:
             phi = np.zeros_like(dens_states)
-            for s in range(n_j):
-                phi[:,s] = (2 * j_list[s] + 1) * dens_states[:, s]
-            for r in range(start, n_grains):
-                phi[r,:] /= rho[r]
-            for r in range(start, n_grains):
-                for s in range(n_j):
-                    for u in range(start, n_grains):
-                        for v in range(n_j):
-                            p[r, s, u, v] = p0[r, u] * phi[r, s]
+            phi[start:, :] = (2 * j_list + 1) * dens_states[start:, :] / rho[start:, np.newaxis]
         else:
-            p[:,0,:,0] = p0
-            
-        return p
+            phi = np.ones((n_grains, 1), np.float64)
+
+        return p0, phi
 
     def calculate_collision_efficiency(self,
                                        double T,
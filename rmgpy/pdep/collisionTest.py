@@ -32,6 +32,9 @@ This module contains unit tests of the :mod:`rmgpy.pdep.collision` module.
 """
 import unittest
 
+import numpy as np
+
+import rmgpy.constants as constants
 from rmgpy.pdep.collision import SingleExponentialDown
 
 
@@ -80,6 +83,88 @@ class TestSingleExponentialDown(unittest.TestCase):
             dEdown = self.singleExponentialDown.get_alpha(T)
             self.assertAlmostEqual(dEdown0, dEdown, 6)
 
+    def get_reference_collision_matrix(self, T, e_list, rho, start):
+        """
+        Return the collision matrix at temperature `T` in K on the energy
+        grains `e_list` in J/mol for the density of states `rho`, which is zero
+        below grain `start`, by a direct evaluation of all of the transfer
+        probabilities.
+        """
+        n_grains = len(e_list)
+        alpha = 1.0 / self.singleExponentialDown.get_alpha(T)
+        beta = 1.0 / (constants.R * T)
+
+        # Unnormalized transfer probabilities from grain r (column) to grain s (row)
+        p0 = np.zeros((n_grains, n_grains))
+        for r in range(start, n_grains):
+            for s in range(start, n_grains):
+                if s <= r:
+                    p0[s, r] = np.exp(-(e_list[r] - e_list[s]) * alpha)
+                else:
+                    p0[s, r] = np.exp(-(e_list[s] - e_list[r]) * (alpha + beta)) * rho[s] / rho[r]
+        for r in range(start, n_grains):
+            c = (1 - np.sum(p0[start:r, r])) / np.sum(p0[r:, r])
+            p0[r, r + 1:] *= c
+            p0[r + 1:, r] *= c
+            p0[r, r] = p0[r, r] * c - 1
+        return p0
+
+    def test_generate_collision_matrix(self):
+        """
+        Test the SingleExponentialDown.generate_collision_matrix() method
+        against a direct evaluation of all of the transfer probabilities.
+        """
+        T = 1000.
+        e_list = np.arange(0.0, 300000.0, 500.0)
+        n_grains = len(e_list)
+        dens_states = np.zeros((n_grains, 2))
+        dens_states[2:, 0] = (e_list[2:] / 1000.) ** 8
+        dens_states[2:, 1] = 0.5 * (e_list[2:] / 1000.) ** 8
+        j_list = np.array([0, 1], np.int64)
+
+        p0 = self.get_reference_collision_matrix(T, e_list, dens_states[:, 0], 2)
+
+        p = self.singleExponentialDown.generate_collision_matrix(T, dens_states[:, :1], e_list)
+        self.assertEqual(p.shape, (n_grains, 1, n_grains, 1))
+        self.assertTrue(np.allclose(p[:, 0, :, 0], p0, rtol=1e-10, atol=1e-14))
+        self.assertTrue(np.allclose(np.sum(p[:, 0, :, 0], axis=0), 0.0, atol=1e-12))
+
+        # With J, the rotational state after a collision follows its equilibrium distribution in the final grain,
+        # and the total density of states is proportional to the one above, so the energy transfer is the same
+        p = self.singleExponentialDown.generate_collision_matrix(T, dens_states, e_list, j_list)
+        self.assertEqual(p.shape, (n_grains, 2, n_grains, 2))
+        phi = np.zeros((n_grains, 2))
+        phi[2:, :] = (2 * j_list + 1) * dens_states[2:, :] / np.dot(dens_states[2:, :], 2 * j_list + 1)[:, np.newaxis]
+        for s in range(2):
+            for v in range(2):
+                self.assertTrue(np.allclose(p[:, s, :, v], p0 * phi[:, s:s + 1], rtol=1e-10, atol=1e-14))
+
+        # The collision matrix is the product of its factors
+        p0_factor, phi_factor = self.singleExponentialDown.generate_collision_matrix_factors(T, dens_states, e_list,
+                                                                                             j_list)
+        self.assertTrue(np.allclose(p0_factor, p0, rtol=1e-10, atol=1e-14))
+        self.assertTrue(np.allclose(phi_factor, phi, rtol=1e-14, atol=0))
+
+    def test_generate_collision_matrix_band(self):
+        """
+        Test that the SingleExponentialDown.generate_collision_matrix() method
+        only fills the band of significant transfer probabilities when the
+        average energy transferred is small compared to the energy grid.
+        """
+        T = 300.
+        e_list = np.arange(0.0, 300000.0, 500.0)
+        n_grains = len(e_list)
+        dens_states = np.zeros((n_grains, 1))
+        dens_states[2:, 0] = (e_list[2:] / 1000.) ** 8
+        p0 = self.get_reference_collision_matrix(T, e_list, dens_states[:, 0], 2)
+
+        # The band is about 40 grains for the energy transfer and 40 grains up to the peak of the distribution
+        p = self.singleExponentialDown.generate_collision_matrix(T, dens_states, e_list)
+        self.assertTrue(np.allclose(p[:, 0, :, 0], p0, rtol=1e-10, atol=1e-14))
+        self.assertTrue(np.allclose(np.sum(p[:, 0, :, 0], axis=0), 0.0, atol=1e-12))
+        self.assertTrue(np.all(np.diagonal(p0, offset=200)[2:] > 0) and np.all(np.diagonal(p0, offset=-200)[2:] > 0))
+        self.assertTrue(np.all(np.triu(p[:, 0, :, 0], 200) == 0) and np.all(np.tril(p[:, 0, :, 0], -200) == 0))
+
     def test_pickle(self):
         """
         Test that a SingleExponentialDown object can be successfully pickled
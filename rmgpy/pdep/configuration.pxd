@@ -64,5 +64,8 @@ cdef class Configuration(object):
         
     cpdef np.ndarray generate_collision_matrix(self, double T, np.ndarray dens_states,
                                              np.ndarray e_list, np.ndarray j_list=?)
+
+    cpdef tuple generate_collision_matrix_factors(self, double T, np.ndarray dens_states,
+                                                  np.ndarray e_list, np.ndarray j_list=?)
     
     cpdef calculate_density_of_states(self, np.ndarray e_list, bint active_j_rotor=?, bint active_k_rotor=?, bint rmgmode=?)
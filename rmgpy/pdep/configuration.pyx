@@ -220,6 +220,20 @@ cdef class Configuration(object):
         assert self.species[0].energy_transfer_model is not None
         return self.species[0].energy_transfer_model.generate_collision_matrix(T, dens_states, e_list, j_list)
 
+    cpdef tuple generate_collision_matrix_factors(self, double T, np.ndarray dens_states, np.ndarray e_list,
+                                                  np.ndarray j_list=None):
+        """
+        Return the factors of the collisional energy transfer probabilities
+        matrix for the configuration at the given temperature `T` in K using
+        the given energies `e_list` in kJ/mol and total angular momentum
+        quantum numbers `j_list`, as generated by the energy transfer model.
+        The density of states of the configuration `dens_states` in mol/kJ is
+        also required.
+        """
+        assert self.is_unimolecular()
+        assert self.species[0].energy_transfer_model is not None
+        return self.species[0].energy_transfer_model.generate_collision_matrix_factors(T, dens_states, e_list, j_list)
+
     cpdef calculate_density_of_states(self, np.ndarray e_list, bint active_j_rotor=True, bint active_k_rotor=True,
                                       bint rmgmode=False):
         """
@@ -36,17 +36,30 @@ import logging
 import numpy as np
 cimport numpy as np
 import scipy.linalg
+import scipy.sparse
+import scipy.sparse.linalg
 from libc.math cimport exp, sqrt
 
 import rmgpy.constants as constants
 from rmgpy.exceptions import ChemicallySignificantEigenvaluesError
-from rmgpy.pdep.me import generate_full_me_matrix
+from rmgpy.pdep.me import generate_full_me_matrix, generate_sparse_me_matrix
+
+# The number of rows of the master equation matrix above which the sparse path is used by default
+SPARSE_MATRIX_SIZE = 2000
 
 ################################################################################
 
 
-def apply_chemically_significant_eigenvalues_method(network, list lumping_order=None):
-    """A method for applying the Chemically Significant Eigenvalues approach for solving the master equation."""
+def apply_chemically_significant_eigenvalues_method(network, list lumping_order=None, sparse=None):
+    """
+    A method for applying the Chemically Significant Eigenvalues approach for solving the master equation.
+
+    If `sparse` is ``True``, the master equation matrix is assembled in sparse
+    format, and only the slowest eigenmodes needed by the method are computed
+    using a shift-invert Krylov method. Otherwise the full dense matrix is
+    diagonalized. By default, the sparse path is used if the matrix has more
+    than ``SPARSE_MATRIX_SIZE`` rows.
+    """
     cdef np.ndarray[np.int_t,ndim=1] j_list
     cdef np.ndarray[np.int_t,ndim=3] indices
     cdef np.ndarray[np.float64_t,ndim=1] e_list, s_mat, s_mat_inv, omega0, omega, eq_ratios
@@ -76,10 +89,20 @@ def apply_chemically_significant_eigenvalues_method(network, list lumping_order=
     
     ym_b = 1.0e-6 * pressure / constants.R / temperature
     
+    if sparse is None:
+        sparse = n_isom * n_grains * n_j + n_reac > SPARSE_MATRIX_SIZE
+
     # Generate the full master equation matrix
-    me_mat, indices = generate_full_me_matrix(network, products=False)
-    n_rows = me_mat.shape[0]
-    me_mat[:, n_rows-n_reac:] *= ym_b
+    if sparse:
+        sparse_me_mat, indices = generate_sparse_me_matrix(network, products=False)
+        n_rows = sparse_me_mat.shape[0]
+        col_scale = np.ones(n_rows, np.float64)
+        col_scale[n_rows-n_reac:] = ym_b
+        sparse_me_mat = sparse_me_mat.dot(scipy.sparse.diags(col_scale))
+    else:
+        me_mat, indices = generate_full_me_matrix(network, products=False)
+        n_rows = me_mat.shape[0]
+        me_mat[:, n_rows-n_reac:] *= ym_b
     
     # Generate symmetrization matrix and its inverse
     s_mat = np.zeros(n_rows, np.float64)
@@ -97,32 +120,35 @@ def apply_chemically_significant_eigenvalues_method(network, list lumping_order=
         s_mat[index] = sqrt(eq_ratios[n + n_isom] / ym_b)
         s_mat_inv[index] = 1.0 / s_mat[index]
 
-    # Symmetrize master equation matrix: me_mat = s_mat * Msymm * s_mat_inv
-    # Since s_mat and s_mat_inv are diagonal we can do this very efficiently
-    for r in range(n_rows):
-        for s in range(n_rows):
-            me_mat[r, s] = s_mat_inv[r] * me_mat[r, s] * s_mat[s]
-
-    # DEBUG: Check that the matrix has been properly symmetrized
-    properly_symmetrized = True
-    for r in range(n_rows):
-        for s in range(r):
-            if me_mat[r, s] != 0:
-                if abs(me_mat[r, s] - me_mat[s,r]) > 0.01 * me_mat[r, s]:
-                    if me_mat[r, s] > 1e-200 or me_mat[s,r] > 1e-200:
-                        print(r, s, me_mat[r, s], me_mat[s,r])
-                        properly_symmetrized = False
-    if not properly_symmetrized:
-        raise ChemicallySignificantEigenvaluesError('Master equation matrix not properly symmetrized.')
+    if sparse:
+        omega0, eigen_vectors0 = _get_slowest_eigenmodes(sparse_me_mat, s_mat, s_mat_inv, n_chem + 1)
+    else:
+        # Symmetrize master equation matrix: me_mat = s_mat * Msymm * s_mat_inv
+        # Since s_mat and s_mat_inv are diagonal we can do this very efficiently
+        for r in range(n_rows):
+            for s in range(n_rows):
+                me_mat[r, s] = s_mat_inv[r] * me_mat[r, s] * s_mat[s]
 
-    # Get eigenvalues and eigenvectors
-    # We only need the slowest n_chem + 1 eigenmodes, so only compute those
-    try:
-        # omega0, eigen_vectors0 = scipy.linalg.eigh(me_mat, eigvals=(n_rows-n_chem-1,n_rows-1),
-        #                                            overwrite_a=True, overwrite_b=True)
-        omega0, eigen_vectors0 = scipy.linalg.eigh(me_mat, overwrite_a=True, overwrite_b=True)
-    except np.linalg.LinAlgError:
-        raise ChemicallySignificantEigenvaluesError('Eigenvalue calculation failed to converge.')
+        # DEBUG: Check that the matrix has been properly symmetrized
+        properly_symmetrized = True
+        for r in range(n_rows):
+            for s in range(r):
+                if me_mat[r, s] != 0:
+                    if abs(me_mat[r, s] - me_mat[s,r]) > 0.01 * me_mat[r, s]:
+                        if me_mat[r, s] > 1e-200 or me_mat[s,r] > 1e-200:
+                            print(r, s, me_mat[r, s], me_mat[s,r])
+                            properly_symmetrized = False
+        if not properly_symmetrized:
+            raise ChemicallySignificantEigenvaluesError('Master equation matrix not properly symmetrized.')
+
+        # Get eigenvalues and eigenvectors
+        # We only need the slowest n_chem + 1 eigenmodes, so only compute those
+        try:
+            # omega0, eigen_vectors0 = scipy.linalg.eigh(me_mat, eigvals=(n_rows-n_chem-1,n_rows-1),
+            #                                            overwrite_a=True, overwrite_b=True)
+            omega0, eigen_vectors0 = scipy.linalg.eigh(me_mat, overwrite_a=True, overwrite_b=True)
+        except np.linalg.LinAlgError:
+            raise ChemicallySignificantEigenvaluesError('Eigenvalue calculation failed to converge.')
 
     # We can't assume that eigh returns them in sorted order
     ind = omega0.argsort()
@@ -221,3 +247,42 @@ def apply_chemically_significant_eigenvalues_method(network, list lumping_order=
 
     # Return the matrix of k(T,P) values and the pseudo-steady population distributions
     return k, pa
+
+
+def _get_slowest_eigenmodes(me_mat, s_mat, s_mat_inv, int n_modes):
+    """
+    Return the `n_modes` eigenvalues closest to zero, i.e. of the slowest
+    eigenmodes, and the corresponding eigenvectors of the sparse master
+    equation matrix `me_mat` after symmetrizing it with the diagonal matrices
+    `s_mat` and `s_mat_inv`. As for the dense path, the symmetric matrix is
+    built from the lower triangle of the symmetrized matrix.
+    """
+    cdef int n_rows = me_mat.shape[0]
+    cdef double sigma
+
+    me_mat = scipy.sparse.diags(s_mat_inv).dot(me_mat).dot(scipy.sparse.diags(s_mat)).tocsr()
+
+    # Check that the matrix has been properly symmetrized, comparing each term in the lower triangle to its transpose
+    lower = scipy.sparse.tril(me_mat, k=-1).tocsr()
+    upper = scipy.sparse.triu(me_mat, k=1).T.tocsr()
+    violations = (abs(lower - upper) - 0.01 * lower).multiply(lower != 0).multiply(
+        abs(lower).maximum(abs(upper)) > 1e-200)
+    if (violations.data > 0).any():
+        raise ChemicallySignificantEigenvaluesError('Master equation matrix not properly symmetrized.')
+
+    me_mat = (lower + lower.T + scipy.sparse.diags(me_mat.diagonal())).tocsc()
+
+    if n_modes >= n_rows - 1:
+        # Too few rows for the Krylov method, which also would not pay off
+        try:
+            return scipy.linalg.eigh(me_mat.toarray(), overwrite_a=True)
+        except np.linalg.LinAlgError:
+            raise ChemicallySignificantEigenvaluesError('Eigenvalue calculation failed to converge.')
+
+    # All eigenvalues are negative or zero, so the shift-invert mode with a small positive shift finds
+    # the ones closest to zero while keeping the shifted matrix nonsingular if there is a zero eigenvalue
+    sigma = 100 * np.finfo(np.float64).eps * abs(me_mat.diagonal()).max()
+    try:
+        return scipy.sparse.linalg.eigsh(me_mat, k=n_modes, sigma=sigma, which='LM')
+    except (scipy.sparse.linalg.ArpackError, RuntimeError):
+        raise ChemicallySignificantEigenvaluesError('Eigenvalue calculation failed to converge.')
@@ -32,6 +32,7 @@ pressure-dependent reaction network.
 
 import numpy as np
 cimport numpy as np
+import scipy.sparse
 from libc.math cimport exp
 
 import rmgpy.constants as constants
@@ -93,10 +94,10 @@ cpdef generate_full_me_matrix(network, bint products=True):
         for r in range(n_grains):
             for s in range(n_j):
                 if indices[i, r, s] > -1:
-                    for u in range(r, n_grains):
-                        for v in range(s, n_j):
-                            me_mat[indices[i, r, s], indices[i,u,v]] = m_coll[i, r, s, u, v]
-                            me_mat[indices[i, u, v], indices[i,r,s]] = m_coll[i, u, v, r, s]
+                    for u in range(n_grains):
+                        for v in range(n_j):
+                            if indices[i, u, v] > -1:
+                                me_mat[indices[i, r, s], indices[i, u, v]] = m_coll[i, r, s, u, v]
     
     # Isomerization terms
     for i in range(n_isom):
@@ -106,7 +107,7 @@ cpdef generate_full_me_matrix(network, bint products=True):
                     for s in range(n_j):
                         u, v = indices[i, r, s], indices[j, r, s]
                         if u > -1 and v > -1:
-                            me_mat[u, v] = k_ij[j, i, r, s]
+                            me_mat[v, u] = k_ij[j, i, r, s]
                             me_mat[u, u] -= k_ij[j, i, r, s]
                             me_mat[u, v] = k_ij[i, j, r, s]
                             me_mat[v, v] -= k_ij[i, j, r, s]
@@ -122,7 +123,7 @@ cpdef generate_full_me_matrix(network, bint products=True):
                         if u > -1:
                             me_mat[u, u] -= g_nj[n, i, r, s]
                             if n < n_reac or products:
-                                me_mat[u, v] = g_nj[n, i, r, s]
+                                me_mat[v, u] = g_nj[n, i, r, s]
                             if n < n_reac:
                                 val = f_im[i, n, r, s] * dens_states[n + n_isom, r, s] \
                                       * (2 * j_list[s] + 1) * exp(-e_list[r] * beta)
@@ -130,3 +131,127 @@ cpdef generate_full_me_matrix(network, bint products=True):
                                 me_mat[v,v] -= val
 
     return me_mat, indices
+
+
+cpdef generate_sparse_me_matrix(network, bint products=True, double threshold=1e-12):
+    """
+    Generate the full master equation matrix for the network as a sparse
+    matrix in compressed sparse row format. The matrix has the same terms as
+    the one from :func:`generate_full_me_matrix`, except that the collisional
+    transfer rates between a pair of grains are dropped if their geometric mean
+    is smaller than `threshold` times that of the collisional loss rates of the
+    two grains. As the collisional transfer probabilities fall off
+    exponentially with the energy transferred, the matrix is banded within
+    each isomer. The collision terms are generated from the factors of the
+    collision matrices, so the dense collision matrices `network.Mcoll` are
+    never needed.
+    """
+
+    cdef np.ndarray[np.int_t,ndim=1] j_list
+    cdef np.ndarray[np.int_t,ndim=3] indices
+    cdef np.ndarray[np.float64_t,ndim=1] e_list
+    cdef np.ndarray[np.float64_t,ndim=1] coll_freq
+    cdef np.ndarray[np.float64_t,ndim=3] dens_states, p_coll, phi_coll
+    cdef np.ndarray[np.float64_t,ndim=4] k_ij, g_nj, f_im
+    cdef list rows, cols, values, coll_rows, coll_cols, coll_values
+    cdef double temperature, beta, val, threshold2
+    cdef int n_isom, n_reac, n_prod, n_grains, n_j, n_rows
+    cdef int i, j, n, r, s, u, v
+
+    temperature = network.T
+    e_list = network.e_list
+    j_list = network.j_list
+    dens_states = network.dens_states
+    coll_freq = network.coll_freq
+    p_coll = network.Pcoll
+    phi_coll = network.phi_coll
+    k_ij = network.Kij
+    f_im = network.Fim
+    g_nj = network.Gnj
+    n_isom = network.n_isom
+    n_reac = network.n_reac
+    n_prod = network.n_prod
+    n_grains = network.n_grains
+    n_j = network.n_j
+
+    beta = 1. / (constants.R * temperature)
+    threshold2 = threshold * threshold
+
+    # Construct accounting matrix
+    indices = -np.ones((n_isom,n_grains,n_j), np.int)
+    n_rows = 0
+    for r in range(n_grains):
+        for s in range(n_j):
+            for i in range(n_isom):
+                if dens_states[i, r, s] > 0:
+                    indices[i, r, s] = n_rows
+                    n_rows += 1
+    n_rows += n_reac
+    if products:
+        n_rows += n_prod
+
+    # Collect the nonzero terms in coordinate format, where repeated entries are summed
+    rows, cols, values = [], [], []
+
+    # Collision terms
+    # The transfer rate from grain (u, v) to grain (r, s) is coll_freq * p_coll[r, u] * phi_coll[r, s], so the
+    # threshold only depends on the energy grains, and the rates between all of their angular momentum grains
+    # are kept or dropped together
+    coll_rows, coll_cols, coll_values = [], [], []
+    for i in range(n_isom):
+        p0 = p_coll[i, :, :]
+        diagonal = np.diagonal(p0)
+        keep = (p0 * p0.T >= threshold2 * np.outer(diagonal, diagonal)) & ((p0 != 0) | (p0.T != 0))
+        np.fill_diagonal(keep, True)
+        grains_to, grains_from = np.nonzero(keep)
+        rows_block, cols_block = np.broadcast_arrays(indices[i, grains_to, :, np.newaxis],
+                                                     indices[i, grains_from, np.newaxis, :])
+        values_block = np.broadcast_to(coll_freq[i] * (p0[grains_to, grains_from, np.newaxis, np.newaxis]
+                                                       * phi_coll[i, grains_to, :, np.newaxis]), rows_block.shape)
+        valid = (rows_block > -1) & (cols_block > -1)
+        coll_rows.append(rows_block[valid])
+        coll_cols.append(cols_block[valid])
+        coll_values.append(values_block[valid])
+
+    # Isomerization terms
+    for i in range(n_isom):
+        for j in range(i):
+            if k_ij[i, j, n_grains - 1,0] > 0 or k_ij[j, i, n_grains - 1,0] > 0:
+                for r in range(n_grains):
+                    for s in range(n_j):
+                        u, v = indices[i, r, s], indices[j, r, s]
+                        if u > -1 and v > -1:
+                            rows.extend([v, u, u, v])
+                            cols.extend([u, u, v, v])
+                            values.extend([k_ij[j, i, r, s], -k_ij[j, i, r, s], k_ij[i, j, r, s], -k_ij[i, j, r, s]])
+
+    # Association/dissociation terms
+    for i in range(n_isom):
+        for n in range(n_reac + n_prod):
+            if g_nj[n, i, n_grains - 1,0] > 0:
+                for r in range(n_grains):
+                    for s in range(n_j):
+                        u = indices[i, r, s]
+                        v = n_rows - n_reac - n_prod + n if products else n_rows - n_reac + n
+                        if u > -1:
+                            rows.append(u)
+                            cols.append(u)
+                            values.append(-g_nj[n, i, r, s])
+                            if n < n_reac or products:
+                                rows.append(v)
+                                cols.append(u)
+                                values.append(g_nj[n, i, r, s])
+                            if n < n_reac:
+                                val = f_im[i, n, r, s] * dens_states[n + n_isom, r, s] \
+                                      * (2 * j_list[s] + 1) * exp(-e_list[r] * beta)
+                                rows.extend([u, v])
+                                cols.extend([v, v])
+                                values.extend([val, -val])
+
+    rows_array = np.concatenate(coll_rows + [np.array(rows, np.int)])
+    cols_array = np.concatenate(coll_cols + [np.array(cols, np.int)])
+    values_array = np.concatenate(coll_values + [np.array(values, np.float64)])
+    me_mat = scipy.sparse.coo_matrix((values_array, (rows_array, cols_array)), shape=(n_rows, n_rows)).tocsr()
+    me_mat.eliminate_zeros()
+
+    return me_mat, indices
@@ -33,11 +33,13 @@ pressure-dependent unimolecular reaction network
 """
 import logging
 import math
+import pickle
 
 import numpy as np
 
 import rmgpy.constants as constants
 from rmgpy.exceptions import NetworkError, InvalidMicrocanonicalRateError
+from rmgpy.pdep.cache import microcanonical_rate_cache
 from rmgpy.reaction import Reaction
 
 
@@ -78,6 +80,8 @@ class Network(object):
     `eq_ratios`             An array containing concentration of each isomer and reactant channel present at equilibrium
     `coll_freq`             An array of the frequency of collision between isomers and the bath gas
     `Mcoll`                 Matrix of first-order rate coefficients for collisional population transfer between grains for each isomer
+    `Pcoll`                 Collisional energy transfer probabilities between energy grains, minus the identity matrix, for each isomer
+    `phi_coll`              Distribution of the angular momentum grains after a collision into each energy grain for each isomer
     `dens_states`           3D np array of stable configurations, number of grains, and number of J
     ----------------------- ----------------------------------------------------
     `Kij`                   The microcanonical rates to go from isomer $j$ to isomer $i$. 4D array with indexes: i, j, energies, rotational energies
@@ -86,6 +90,9 @@ class Network(object):
     ----------------------- ----------------------------------------------------
     `K`                     2D Array of phenomenological rates at the specified T and P
     `p0`                    Pseudo-steady state population distributions
+    ----------------------- ----------------------------------------------------
+    `dens_states_cache`     The densities and sums of states of the configurations from earlier initializations, keyed by the species labels
+    `micro_rates_keys`      The keys in :data:`rmgpy.pdep.cache.microcanonical_rate_cache` of the k(E) values last used by worker processes
     ======================= ====================================================
     """
 
@@ -127,6 +134,13 @@ class Network(object):
         self.grain_count = grain_count
         self.E0 = E0
 
+        self.dens_states_cache = {}
+        self.micro_rates_keys = set()
+        self.Pcoll = None
+        self.phi_coll = None
+        self._Mcoll = None
+        self._collision_model_state = None
+
         self.valid = False
 
     def __repr__(self):
@@ -237,12 +251,30 @@ class Network(object):
         self.active_k_rotor = active_k_rotor
         self.rmgmode = rmgmode
 
+        self.prune_dens_states_cache()
         self.calculate_densities_of_states()
         logging.debug('Finished initialization for network {0}.'.format(self.label))
         logging.debug('The network now has values of {0}'.format(repr(self)))
 
-    def calculate_rate_coefficients(self, Tlist, Plist, method, error_check=True):
-
+    def calculate_rate_coefficients(self, Tlist, Plist, method, error_check=True, pool=None):
+        """
+        Return the phenomenological rate coefficients :math:`k(T,P)` at each
+        temperature in `Tlist` in K and pressure in `Plist` in Pa, computed
+        using the master equation reduction `method`, as an array indexed by
+        temperature, pressure, product and reactant configurations.
+
+        The pressures at each temperature share the quantities that depend
+        only on temperature, while the temperatures are independent of one
+        another. If a `pool` of worker processes is given, e.g. a
+        :class:`multiprocessing.pool.Pool` or the
+        :class:`~rmgpy.rmg.react.ReactionWorkerPool` of an RMG job, the
+        temperatures are therefore mapped to its workers, each of which
+        receives a copy of the network from :meth:`get_grid_snapshot`. In that
+        case the conditions and intermediate arrays of this network are left
+        as they were. The :math:`k(E)` values computed by the workers are added
+        to the cache of this process, and those used by the network are sent
+        to the workers again the next time.
+        """
         n_isom = len(self.isomers)
         n_reac = len(self.reactants)
         n_prod = len(self.products)
@@ -257,65 +289,109 @@ class Network(object):
         logging.info('Calculating phenomenological rate coefficients for {0}...'.format(rxn))
         K = np.zeros((len(Tlist), len(Plist), n_isom + n_reac + n_prod, n_isom + n_reac + n_prod), np.float64)
 
-        for t, T in enumerate(Tlist):
-            for p, P in enumerate(Plist):
-                self.set_conditions(T, P)
-
-                # Apply method
-                if method.lower() == 'modified strong collision':
-                    self.apply_modified_strong_collision_method()
-                elif method.lower() == 'reservoir state':
-                    self.apply_reservoir_state_method()
-                elif method.lower() == 'chemically-significant eigenvalues':
-                    self.apply_chemically_significant_eigenvalues_method()
-                else:
-                    raise NetworkError('Unknown method "{0}". Valid options are "modified strong collision", '
-                                       '"reservoir state", or "chemically-significant eigenvalues"'.format(method))
-
-                K[t, p, :, :] = self.K
+        if pool is not None and len(Tlist) > 1:
+            logging.info('Calculating the rate coefficients at {0:d} temperatures in parallel...'.format(len(Tlist)))
+            snapshot = self.get_grid_snapshot()
+            entries = microcanonical_rate_cache.get_entries(self.micro_rates_keys)
+            results = pool.map(_calculate_rate_coefficients_at_temperature,
+                               [(snapshot, T, Plist, method, error_check, entries) for T in Tlist], chunksize=1)
+            self.micro_rates_keys = set()
+            for t, (Kt, keys, new_entries) in enumerate(results):
+                K[t, :, :, :] = Kt
+                self.micro_rates_keys.update(keys)
+                microcanonical_rate_cache.add_entries(new_entries)
+        else:
+            for t, T in enumerate(Tlist):
+                K[t, :, :, :] = self.calculate_rate_coefficients_at_temperature(T, Plist, method, error_check)
 
-                # Check that the k(T,P) values satisfy macroscopic equilibrium
-                eq_ratios = self.eq_ratios
-                for i in range(n_isom + n_reac):
-                    for j in range(i):
-                        Keq0 = K[t, p, j, i] / K[t, p, i, j]
-                        Keq = eq_ratios[j] / eq_ratios[i]
-                        if Keq0 / Keq < 0.5 or Keq0 / Keq > 2.0:
-                            if i < n_isom:
-                                reactants = self.isomers[i]
-                            elif i < n_isom + n_reac:
-                                reactants = self.reactants[i - n_isom]
-                            else:
-                                reactants = self.products[i - n_isom - n_reac]
-                            if j < n_isom:
-                                products = self.isomers[j]
-                            elif j < n_isom + n_reac:
-                                products = self.reactants[j - n_isom]
-                            else:
-                                products = self.products[j - n_isom - n_reac]
-                            reaction = Reaction(reactants=reactants.species[:], products=products.species[:])
-                            logging.error('For net reaction {0!s}:'.format(reaction))
-                            logging.error('Expected Keq({1:g} K, {2:g} bar) = {0:11.3e}'.format(Keq, T, P * 1e-5))
-                            logging.error('  Actual Keq({1:g} K, {2:g} bar) = {0:11.3e}'.format(Keq0, T, P * 1e-5))
-                            raise NetworkError('Computed k(T,P) values for reaction {0!s} do not satisfy macroscopic '
-                                               'equilibrium.'.format(reaction))
-
-                # Reject if any rate coefficients are negative
-                if error_check:
-                    negative_rate = False
-                    for i in range(n_isom + n_reac + n_prod):
-                        for j in range(i):
-                            if (K[t, p, i, j] < 0 or K[t, p, j, i] < 0) and not negative_rate:
-                                negative_rate = True
-                                logging.error('Negative rate coefficient generated; rejecting result.')
-                                logging.info(K[t, p, 0:n_isom + n_reac + n_prod, 0:n_isom + n_reac])
-                                K[t, p, :, :] = 0 * K[t, p, :, :]
-                                self.K = 0 * self.K
         logging.debug('Finished calculating rate coefficients for network {0}.'.format(self.label))
         logging.debug('The network now has values of {0}'.format(repr(self)))
         logging.debug('Master equation matrix found for network {0} is {1}'.format(self.label, K))
         return K
 
+    def get_grid_snapshot(self):
+        """
+        Return a :class:`Network` holding only what
+        :meth:`calculate_rate_coefficients_at_temperature` needs from this
+        initialized network, i.e. the configurations with their densities of
+        states, the path reactions, the bath gas and the settings of the
+        initialization, to be sent to a worker process.
+        """
+        snapshot = Network(label=self.label, isomers=self.isomers, reactants=self.reactants, products=self.products,
+                           path_reactions=self.path_reactions, bath_gas=self.bath_gas)
+        for attribute in ['Tmin', 'Tmax', 'Pmin', 'Pmax', 'grain_size', 'grain_count', 'E0', 'active_j_rotor',
+                          'active_k_rotor', 'rmgmode']:
+            setattr(snapshot, attribute, getattr(self, attribute))
+        return snapshot
+
+    def calculate_rate_coefficients_at_temperature(self, T, Plist, method, error_check=True):
+        """
+        Return the phenomenological rate coefficients :math:`k(T,P)` at the
+        temperature `T` in K and each pressure in `Plist` in Pa, computed using
+        the master equation reduction `method`, as an array indexed by
+        pressure, product and reactant configurations.
+        """
+        n_isom = len(self.isomers)
+        n_reac = len(self.reactants)
+        n_prod = len(self.products)
+
+        K = np.zeros((len(Plist), n_isom + n_reac + n_prod, n_isom + n_reac + n_prod), np.float64)
+
+        for p, P in enumerate(Plist):
+            self.set_conditions(T, P)
+
+            # Apply method
+            if method.lower() == 'modified strong collision':
+                self.apply_modified_strong_collision_method()
+            elif method.lower() == 'reservoir state':
+                self.apply_reservoir_state_method()
+            elif method.lower() == 'chemically-significant eigenvalues':
+                self.apply_chemically_significant_eigenvalues_method()
+            else:
+                raise NetworkError('Unknown method "{0}". Valid options are "modified strong collision", '
+                                   '"reservoir state", or "chemically-significant eigenvalues"'.format(method))
+
+            K[p, :, :] = self.K
+
+            # Check that the k(T,P) values satisfy macroscopic equilibrium
+            eq_ratios = self.eq_ratios
+            for i in range(n_isom + n_reac):
+                for j in range(i):
+                    Keq0 = K[p, j, i] / K[p, i, j]
+                    Keq = eq_ratios[j] / eq_ratios[i]
+                    if Keq0 / Keq < 0.5 or Keq0 / Keq > 2.0:
+                        if i < n_isom:
+                            reactants = self.isomers[i]
+                        elif i < n_isom + n_reac:
+                            reactants = self.reactants[i - n_isom]
+                        else:
+                            reactants = self.products[i - n_isom - n_reac]
+                        if j < n_isom:
+                            products = self.isomers[j]
+                        elif j < n_isom + n_reac:
+                            products = self.reactants[j - n_isom]
+                        else:
+                            products = self.products[j - n_isom - n_reac]
+                        reaction = Reaction(reactants=reactants.species[:], products=products.species[:])
+                        logging.error('For net reaction {0!s}:'.format(reaction))
+                        logging.error('Expected Keq({1:g} K, {2:g} bar) = {0:11.3e}'.format(Keq, T, P * 1e-5))
+                        logging.error('  Actual Keq({1:g} K, {2:g} bar) = {0:11.3e}'.format(Keq0, T, P * 1e-5))
+                        raise NetworkError('Computed k(T,P) values for reaction {0!s} do not satisfy macroscopic '
+                                           'equilibrium.'.format(reaction))
+
+            # Reject if any rate coefficients are negative
+            if error_check:
+                negative_rate = False
+                for i in range(n_isom + n_reac + n_prod):
+                    for j in range(i):
+                        if (K[p, i, j] < 0 or K[p, j, i] < 0) and not negative_rate:
+                            negative_rate = True
+                            logging.error('Negative rate coefficient generated; rejecting result.')
+                            logging.info(K[p, 0:n_isom + n_reac + n_prod, 0:n_isom + n_reac])
+                            K[p, :, :] = 0 * K[p, :, :]
+                            self.K = 0 * self.K
+        return K
+
     def set_conditions(self, T, P, ymB=None):
         """
         Set the current network conditions to the temperature `T` in K and
@@ -534,15 +610,13 @@ class Network(object):
         # Densities of states for isomers
         for i in range(n_isom):
             logging.debug('Calculating density of states for isomer "{0}"'.format(self.isomers[i]))
-            self.isomers[i].calculate_density_of_states(e_list, active_k_rotor=self.active_k_rotor,
-                                                        active_j_rotor=self.active_j_rotor, rmgmode=self.rmgmode)
+            self.calculate_configuration_density_of_states(self.isomers[i], e_list)
 
         # Densities of states for reactant channels
         for n in range(n_reac):
             if self.reactants[n].has_statmech():
                 logging.debug('Calculating density of states for reactant channel "{0}"'.format(self.reactants[n]))
-                self.reactants[n].calculate_density_of_states(e_list, active_k_rotor=self.active_k_rotor,
-                                                              active_j_rotor=self.active_j_rotor, rmgmode=self.rmgmode)
+                self.calculate_configuration_density_of_states(self.reactants[n], e_list)
             else:
                 logging.warning(
                     'NOT calculating density of states for reactant channel "{0}". Missing Statmech.'.format(
@@ -553,8 +627,7 @@ class Network(object):
             for n in range(n_prod):
                 if self.products[n].has_statmech():
                     logging.debug('Calculating density of states for product channel "{0}"'.format(self.products[n]))
-                    self.products[n].calculate_density_of_states(e_list, active_k_rotor=self.active_k_rotor,
-                                                                 active_j_rotor=self.active_j_rotor, rmgmode=self.rmgmode)
+                    self.calculate_configuration_density_of_states(self.products[n], e_list)
                 else:
                     logging.warning(
                         'NOT calculating density of states for product channel "{0}" Missing Statmech.'.format(
@@ -573,6 +646,39 @@ class Network(object):
         #        pylab.semilogy(e_list*0.001, self.products[n].dens_states)
         # pylab.show()
 
+    def calculate_configuration_density_of_states(self, configuration, e_list):
+        """
+        Calculate the density and sum of states of the `configuration` at the
+        energies `e_list` in J/mol above its ground state. If they were already
+        computed for the same species, statmech data and settings by an earlier
+        initialization of the network, on the same grain size and up to at
+        least the same energy, they are taken from the cache instead.
+        """
+        key = tuple(spec.label for spec in configuration.species)
+        # The pickled conformers are compared rather than their representations, which round the values
+        signature = pickle.dumps((self.active_j_rotor, self.active_k_rotor, self.rmgmode,
+                                  [spec.conformer for spec in configuration.species]), -1)
+        n_grains = len(e_list)
+
+        # The densities of states are computed grain by grain from the lowest energy, so those computed
+        # up to a higher energy on the same grains are also valid up to a lower energy
+        cached = self.dens_states_cache.get(key)
+        if (cached is not None and cached[0] == signature and len(cached[1]) >= n_grains
+                and np.allclose(cached[1][:n_grains], e_list, rtol=1e-10, atol=1e-6)):
+            logging.debug('Using cached density of states for "{0}"'.format(configuration))
+            signature, cached_e_list, dens_states, sum_states = cached
+            configuration.e_list = e_list
+            configuration.active_j_rotor = self.active_j_rotor
+            configuration.active_k_rotor = self.active_k_rotor
+            configuration.dens_states = dens_states[:n_grains].copy()
+            configuration.sum_states = sum_states[:n_grains].copy() if sum_states is not None else None
+            return
+
+        configuration.calculate_density_of_states(e_list, active_k_rotor=self.active_k_rotor,
+                                                  active_j_rotor=self.active_j_rotor, rmgmode=self.rmgmode)
+        self.dens_states_cache[key] = (signature, e_list.copy(), configuration.dens_states.copy(),
+                                       configuration.sum_states.copy() if configuration.sum_states is not None else None)
+
     def map_densities_of_states(self):
         """
         Map the overall densities of states to the current energy grains.
@@ -824,6 +930,17 @@ class Network(object):
 
         return self.Kij, self.Gnj, self.Fim
 
+    def prune_dens_states_cache(self):
+        """
+        Remove the cached densities of states of the configurations that are
+        no longer in the network.
+        """
+        configurations = set(tuple(spec.label for spec in configuration.species)
+                             for configuration in self.isomers + self.reactants + self.products)
+        for key in list(self.dens_states_cache):
+            if key not in configurations:
+                del self.dens_states_cache[key]
+
     def calculate_equilibrium_ratios(self):
         """
         Return an array containing the fraction of each isomer and reactant
@@ -853,19 +970,67 @@ class Network(object):
         self.eq_ratios = eq_ratios
         return eq_ratios / np.sum(eq_ratios)
 
+    @property
+    def Mcoll(self):
+        """
+        The matrix of first-order rate coefficients for collisional population
+        transfer between grains for each isomer. It is only assembled from the
+        collision frequencies and the factors of the collision matrices when
+        first needed, as it has :math:`(N_\\mathrm{grains} N_J)^2` elements
+        for each isomer.
+        """
+        if self._Mcoll is None and self.Pcoll is not None:
+            n_isom, n_grains, n_j = self.phi_coll.shape
+            m_coll = np.zeros((n_isom, n_grains, n_j, n_grains, n_j), np.float64)
+            for i in range(n_isom):
+                m_coll[i, :, :, :, :] = self.coll_freq[i] * (self.Pcoll[i, :, np.newaxis, :, np.newaxis]
+                                                             * self.phi_coll[i, :, :, np.newaxis, np.newaxis])
+            self._Mcoll = m_coll
+        return self._Mcoll
+
+    @Mcoll.setter
+    def Mcoll(self, value):
+        self._Mcoll = value
+
     def calculate_collision_model(self):
         """
-        Calculate the matrix of first-order rate coefficients for collisional
-        population transfer between grains for each isomer, including the
-        corresponding collision frequencies.
+        Calculate the collision frequencies between each isomer and the bath
+        gas, and the factors of the collision matrices of each isomer, from
+        which the matrix of first-order rate coefficients for collisional
+        population transfer between grains `Mcoll` is assembled when needed.
+
+        The collision matrices only depend on the pressure via the collision
+        frequencies, so if only the pressure has changed since the last call,
+        with the same isomers and bath gas, the factors are kept and any
+        existing matrices are rescaled in place.
         """
         n_isom = len(self.isomers)
         n_grains = len(self.e_list)
         n_j = 1 if self.j_list is None else len(self.j_list)
 
+        state = (self.T, self.e_list, self.j_list, self.dens_states, list(self.isomers), list(self.bath_gas.items()))
+        previous_state = self._collision_model_state
+        if (previous_state is not None and previous_state[0] == state[0]
+                and all(new is old for new, old in zip(state[1:4], previous_state[1:4]))
+                and len(state[4]) == len(previous_state[4])
+                and all(new is old for new, old in zip(state[4], previous_state[4]))
+                and len(state[5]) == len(previous_state[5])
+                and all(new[0] is old[0] and new[1] == old[1] for new, old in zip(state[5], previous_state[5]))
+                and self.Pcoll is not None and self.phi_coll.shape == (n_isom, n_grains, n_j)
+                and np.all(self.coll_freq > 0)):
+            coll_freq = np.zeros(n_isom, np.float64)
+            for i, isomer in enumerate(self.isomers):
+                coll_freq[i] = isomer.calculate_collision_frequency(self.T, self.P, self.bath_gas)
+                if self._Mcoll is not None:
+                    self._Mcoll[i, :, :, :, :] *= coll_freq[i] / self.coll_freq[i]
+            self.coll_freq = coll_freq
+            return
+
+        self._collision_model_state = None
         try:
             coll_freq = np.zeros(n_isom, np.float64)
-            m_coll = np.zeros((n_isom, n_grains, n_j, n_grains, n_j), np.float64)
+            p_coll = np.zeros((n_isom, n_grains, n_grains), np.float64)
+            phi_coll = np.zeros((n_isom, n_grains, n_j), np.float64)
         except MemoryError:
             logging.warning('Collision matrix too large to manage')
             new_n_grains = int(n_grains / 2.0)
@@ -875,13 +1040,14 @@ class Network(object):
 
         for i, isomer in enumerate(self.isomers):
             coll_freq[i] = isomer.calculate_collision_frequency(self.T, self.P, self.bath_gas)
-            m_coll[i, :, :, :, :] = coll_freq[i] * isomer.generate_collision_matrix(self.T, self.dens_states[i, :, :],
-                                                                                    self.e_list, self.j_list)
+            p_coll[i, :, :], phi_coll[i, :, :] = isomer.generate_collision_matrix_factors(
+                self.T, self.dens_states[i, :, :], self.e_list, self.j_list)
 
         self.coll_freq = coll_freq
-        self.Mcoll = m_coll
-
-        return m_coll
+        self.Pcoll = p_coll
+        self.phi_coll = phi_coll
+        self._Mcoll = None
+        self._collision_model_state = state
 
     def apply_modified_strong_collision_method(self, efficiency_model='default'):
         """
@@ -903,24 +1069,31 @@ class Network(object):
         self.K, self.p0 = rs.apply_reservoir_state_method(self)
         return self.K, self.p0
 
-    def apply_chemically_significant_eigenvalues_method(self, lumping_order=None):
+    def apply_chemically_significant_eigenvalues_method(self, lumping_order=None, sparse=None):
         """
         Compute the phenomenological rate coefficients :math:`k(T,P)` at the
         current conditions using the chemically-significant eigenvalues method.
         If a `lumping_order` is provided, the algorithm will attempt to lump the
         configurations (given by index) in the order provided, and return a
-        reduced set of :math:`k(T,P)` values. 
+        reduced set of :math:`k(T,P)` values. If `sparse` is ``True``, the
+        master equation matrix is assembled in sparse format and only its
+        slowest eigenmodes are computed; by default this is done for large
+        matrices only.
         """
         import rmgpy.pdep.cse as cse
         logging.debug(
             'Applying chemically-significant eigenvalues method at {0:g} K, {1:g} Pa...'.format(self.T, self.P))
-        self.K, self.p0 = cse.apply_chemically_significant_eigenvalues_method(self, lumping_order)
+        self.K, self.p0 = cse.apply_chemically_significant_eigenvalues_method(self, lumping_order, sparse)
         return self.K, self.p0
 
     def generate_full_me_matrix(self, products=True):
         import rmgpy.pdep.me as me
         return me.generate_full_me_matrix(self, products=products)
 
+    def generate_sparse_me_matrix(self, products=True, threshold=1e-12):
+        import rmgpy.pdep.me as me
+        return me.generate_sparse_me_matrix(self, products=products, threshold=threshold)
+
     def solve_full_me(self, tlist, x0):
         """
         Directly solve the full master equation using a stiff ODE solver. Pass the
@@ -1105,3 +1278,21 @@ class Network(object):
             logging.log(level, '    {0!s:<48}'.format(rxn))
         logging.log(level, '========================================================================')
         logging.log(level, '')
+
+
+def _calculate_rate_coefficients_at_temperature(args):
+    """
+    Module-level function passed to the workers by
+    :meth:`Network.calculate_rate_coefficients`. Returns the :math:`k(T,P)`
+    values of a network snapshot at a temperature in K, and the keys looked
+    up in and the entries added to the :math:`k(E)` cache of the worker,
+    after adding the cached entries sent with the task.
+    """
+    network, T, Plist, method, error_check, entries = args
+    microcanonical_rate_cache.add_entries(entries)
+    microcanonical_rate_cache.start_recording()
+    try:
+        K = network.calculate_rate_coefficients_at_temperature(T, Plist, method, error_check)
+    finally:
+        keys, new_entries = microcanonical_rate_cache.stop_recording()
+    return K, keys, new_entries
@@ -32,7 +32,11 @@ This script contains unit tests of the :mod:`rmgpy.pdep.network` module.
 """
 
 import unittest
+from multiprocessing import Pool
 
+import numpy as np
+
+from rmgpy.pdep.cache import microcanonical_rate_cache
 from rmgpy.pdep.collision import SingleExponentialDown
 from rmgpy.pdep.configuration import Configuration
 from rmgpy.pdep.network import Network
@@ -266,6 +270,81 @@ class TestNetwork(unittest.TestCase):
         except:
             pass
 
+    def test_rescale_collision_model_with_pressure(self):
+        """
+        Test that the collision matrices rescaled to a new pressure match
+        those generated at that pressure.
+        """
+        self.network.initialize(Tmin=500.0, Tmax=1500.0, Pmin=1e4, Pmax=1e6, maximum_grain_size=2000.0,
+                                minimum_grain_count=0)
+        self.network.set_conditions(1000.0, 1e5)
+        state = self.network._collision_model_state
+        m_coll = self.network.Mcoll
+        self.assertIsNotNone(state)
+
+        # The matrices are rescaled in place rather than generated again
+        self.network.set_conditions(1000.0, 1e6)
+        self.assertIs(self.network._collision_model_state, state)
+        self.assertIs(self.network.Mcoll, m_coll)
+        m_coll = self.network.Mcoll.copy()
+        coll_freq = self.network.coll_freq.copy()
+
+        self.network._collision_model_state = None
+        self.network.calculate_collision_model()
+        self.assertTrue(np.allclose(self.network.coll_freq, coll_freq, rtol=1e-12, atol=0))
+        self.assertTrue(np.allclose(self.network.Mcoll, m_coll, rtol=1e-12, atol=0))
+
+        # The matrices are generated again if the bath gas changes
+        state = self.network._collision_model_state
+        argon = Species(label='Ar', molecular_weight=(39.95, "g/mol"),
+                        transport_data=TransportData(sigma=(3.33, "angstrom"), epsilon=(136.5, "K")))
+        self.network.bath_gas = {argon: 1.0}
+        self.network.calculate_collision_model()
+        self.assertIsNot(self.network._collision_model_state, state)
+
+    def test_generate_sparse_me_matrix(self):
+        """
+        Test that the sparse master equation matrix has the same terms as the
+        dense one, except for the negligible collisional transfer rates.
+        """
+        self.network.initialize(Tmin=500.0, Tmax=1500.0, Pmin=1e4, Pmax=1e6, maximum_grain_size=2000.0,
+                                minimum_grain_count=0)
+        self.network.set_conditions(1000.0, 1e5)
+        me_mat, indices = self.network.generate_full_me_matrix()
+
+        sparse_me_mat, sparse_indices = self.network.generate_sparse_me_matrix(threshold=0.0)
+        self.assertTrue(np.array_equal(sparse_indices, indices))
+        self.assertTrue(np.allclose(sparse_me_mat.toarray(), me_mat, rtol=1e-14, atol=0))
+
+        sparse_me_mat, sparse_indices = self.network.generate_sparse_me_matrix()
+        self.assertLess(sparse_me_mat.nnz, np.count_nonzero(me_mat))
+        self.assertTrue(np.allclose(sparse_me_mat.toarray(), me_mat, rtol=0, atol=1e-6 * np.abs(me_mat).max()))
+
+    def test_generate_sparse_me_matrix_with_angular_momentum(self):
+        """
+        Test that the sparse master equation matrix has the same terms as the
+        dense one with an adiabatic J-rotor, without generating the dense
+        collision matrices.
+        """
+        self.network.initialize(Tmin=500.0, Tmax=1500.0, Pmin=1e4, Pmax=1e6, maximum_grain_size=4000.0,
+                                minimum_grain_count=0, active_j_rotor=False)
+        self.network.set_conditions(1000.0, 1e5)
+        self.assertGreater(self.network.n_j, 1)
+
+        sparse_me_mat, sparse_indices = self.network.generate_sparse_me_matrix(threshold=0.0)
+        self.assertIsNone(self.network._Mcoll)
+
+        me_mat, indices = self.network.generate_full_me_matrix()
+        self.assertTrue(np.array_equal(sparse_indices, indices))
+        self.assertTrue(np.allclose(sparse_me_mat.toarray(), me_mat, rtol=1e-14, atol=0))
+        # Collisions and reactions conserve the population out of every grain
+        n_rows = np.count_nonzero(indices > -1)
+        self.assertTrue(np.allclose(np.sum(me_mat[:, :n_rows], axis=0), 0.0, atol=1e-10 * np.abs(me_mat).max()))
+
+        sparse_me_mat, sparse_indices = self.network.generate_sparse_me_matrix()
+        self.assertLess(sparse_me_mat.nnz, np.count_nonzero(me_mat))
+        self.assertTrue(np.allclose(sparse_me_mat.toarray(), me_mat, rtol=0, atol=1e-6 * np.abs(me_mat).max()))
+
     def test_get_all_species(self):
         """
         Ensures all species are in the get_species_list
@@ -276,6 +355,60 @@ class TestNetwork(unittest.TestCase):
         self.assertIn(self.H2O, species_list)
         self.assertIn(self.N2, species_list)
 
+    def test_calculate_rate_coefficients_in_parallel(self):
+        """
+        Test that the k(T,P) values computed by several processes are the same
+        as those computed by a single process.
+        """
+        Tlist = np.array([500.0, 1000.0, 1500.0])
+        Plist = np.array([1e4, 1e5, 1e6])
+        self.network.initialize(Tmin=500.0, Tmax=1500.0, Pmin=1e4, Pmax=1e6, maximum_grain_size=2000.0,
+                                minimum_grain_count=250)
+        K_serial = self.network.calculate_rate_coefficients(Tlist, Plist, 'modified strong collision')
+        with Pool(processes=2) as pool:
+            K_parallel = self.network.calculate_rate_coefficients(Tlist, Plist, 'modified strong collision', pool=pool)
+
+        self.assertEqual(K_parallel.shape, (3, 3, 2, 2))
+        self.assertTrue(np.all(K_serial[:, :, 1, 0] > 0))
+        self.assertTrue(np.allclose(K_parallel, K_serial, rtol=1e-12, atol=0))
+
+        # The k(E) values used by the workers are kept by this process
+        self.assertTrue(self.network.micro_rates_keys)
+        self.assertTrue(microcanonical_rate_cache.get_entries(self.network.micro_rates_keys))
+
+    def test_reuse_cached_densities_of_states(self):
+        """
+        Test that the densities of states of unchanged configurations are
+        reused when the network is initialized again with new configurations,
+        as in RMG, and that the k(E) values are then found in the shared cache.
+        """
+        Tlist = np.array([500.0, 1000.0])
+        Plist = np.array([1e4, 1e6])
+        self.network.initialize(Tmin=500.0, Tmax=1000.0, Pmin=1e4, Pmax=1e6, maximum_grain_size=2000.0,
+                                minimum_grain_count=0)
+        K0 = self.network.calculate_rate_coefficients(Tlist, Plist, 'modified strong collision')
+        dens_states_entry = self.network.dens_states_cache[('n-C4H10O',)]
+        self.assertEqual(len(self.network.dens_states_cache), 2)
+
+        self.network.isomers = [Configuration(self.nC4H10O)]
+        self.network.products = [Configuration(self.nC4H8, self.H2O)]
+        self.network.initialize(Tmin=500.0, Tmax=1000.0, Pmin=1e4, Pmax=1e6, maximum_grain_size=2000.0,
+                                minimum_grain_count=0)
+        hits = microcanonical_rate_cache.hits
+        K1 = self.network.calculate_rate_coefficients(Tlist, Plist, 'modified strong collision')
+        self.assertIs(self.network.dens_states_cache[('n-C4H10O',)], dens_states_entry)
+        self.assertGreater(microcanonical_rate_cache.hits, hits)
+        self.assertTrue(np.allclose(K1, K0, rtol=1e-12, atol=0))
+
+        # The k(E) values are recomputed if the transition state changes, while the densities of states
+        # are reused on the fewer energy grains needed for the lower transition state
+        self.TS.conformer.E0 = (-45.0, 'kJ/mol')
+        self.network.initialize(Tmin=500.0, Tmax=1000.0, Pmin=1e4, Pmax=1e6, maximum_grain_size=2000.0,
+                                minimum_grain_count=0)
+        K2 = self.network.calculate_rate_coefficients(Tlist, Plist, 'modified strong collision')
+        self.assertIs(self.network.dens_states_cache[('n-C4H10O',)], dens_states_entry)
+        self.assertTrue(np.all(K2[:, :, 1, 0] > K0[:, :, 1, 0]))
+
 
 ################################################################################
 
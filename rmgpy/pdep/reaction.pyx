@@ -44,6 +44,7 @@ from libc.math cimport abs, exp, sqrt, log
 cimport rmgpy.constants as constants
 from rmgpy.exceptions import PressureDependenceError
 from rmgpy.kinetics.arrhenius cimport Arrhenius
+from rmgpy.pdep.cache import microcanonical_rate_cache
 from rmgpy.statmech.schrodinger import convolve
 
 ################################################################################
@@ -79,6 +80,10 @@ def calculate_microcanonical_rate_coefficient(reaction,
     optional. The temperature is used if provided in the detailed balance
     expression to determine the reverse kinetics, and in certain cases in the
     inverse Laplace transform method.
+
+    The :math:`k(E)` values from either method are taken from
+    :data:`rmgpy.pdep.cache.microcanonical_rate_cache` if they were already
+    computed for the same transition state, kinetics and density of states.
     """        
     cdef int n_grains, n_j, r, s
     cdef np.ndarray[np.float64_t,ndim=2] kf, kr
@@ -107,11 +112,11 @@ def calculate_microcanonical_rate_coefficient(reaction,
         # transition state, so let's use the more accurate RRKM theory
         logging.debug('Calculating microcanonical rate coefficient using RRKM theory for %s...', reaction)
         if reactant_states_known and (reaction.is_isomerization() or reaction.is_dissociation()):
-            kf = apply_rrkm_theory(reaction.transition_state, e_list, j_list, reac_dens_states)
+            kf = _apply_rrkm_theory_cached(reaction.transition_state, e_list, j_list, reac_dens_states)
             kf *= c0_inv ** (len(reaction.reactants) - 1)
             forward = True
         elif product_states_known and reaction.is_association():
-            kr = apply_rrkm_theory(reaction.transition_state, e_list, j_list, prod_dens_states)
+            kr = _apply_rrkm_theory_cached(reaction.transition_state, e_list, j_list, prod_dens_states)
             kr *= c0_inv ** (len(reaction.products) - 1)        
             forward = False
         else:
@@ -124,11 +129,13 @@ def calculate_microcanonical_rate_coefficient(reaction,
         logging.debug('Calculating microcanonical rate coefficient using ILT method for %s...', reaction)
         if reactant_states_known:
             kinetics = reaction.kinetics if reaction.network_kinetics is None else reaction.network_kinetics
-            kf = apply_inverse_laplace_transform_method(reaction.transition_state, kinetics, e_list, j_list, reac_dens_states, T)
+            kf = _apply_inverse_laplace_transform_method_cached(reaction.transition_state, kinetics, e_list, j_list,
+                                                                reac_dens_states, T)
             forward = True
         elif product_states_known:
             kinetics = reaction.generate_reverse_rate_coefficient(network_kinetics=True)
-            kr = apply_inverse_laplace_transform_method(reaction.transition_state, kinetics, e_list, j_list, prod_dens_states, T)
+            kr = _apply_inverse_laplace_transform_method_cached(reaction.transition_state, kinetics, e_list, j_list,
+                                                                prod_dens_states, T)
             forward = False
         else:
             raise PressureDependenceError('Unable to compute k(E) values via ILT method for path reaction '
@@ -174,6 +181,36 @@ def calculate_microcanonical_rate_coefficient(reaction,
 
     return kf, kr
 
+def _apply_rrkm_theory_cached(transition_state, e_list, j_list, dens_states):
+    """
+    Return the result of :func:`apply_rrkm_theory`, taking it from the cache of
+    :math:`k(E)` values if possible.
+    """
+    key = microcanonical_rate_cache.get_key('rrkm', transition_state.conformer, transition_state.tunneling,
+                                            e_list[0], e_list[1] - e_list[0], tuple(j_list.tolist()))
+    k = microcanonical_rate_cache.get(key, e_list, dens_states)
+    if k is None:
+        k = apply_rrkm_theory(transition_state, e_list, j_list, dens_states)
+        microcanonical_rate_cache.put(key, e_list, dens_states, k)
+    return k
+
+def _apply_inverse_laplace_transform_method_cached(transition_state, kinetics, e_list, j_list, dens_states, T):
+    """
+    Return the result of :func:`apply_inverse_laplace_transform_method`,
+    taking it from the cache of :math:`k(E)` values if possible.
+    """
+    if not isinstance(kinetics, Arrhenius):
+        return apply_inverse_laplace_transform_method(transition_state, kinetics, e_list, j_list, dens_states, T)
+    # The temperature is only used to handle negative activation energies and nonzero temperature exponents
+    key_T = 0.0 if kinetics.Ea.value_si >= 0 and kinetics.n.value_si == 0 else T
+    key = microcanonical_rate_cache.get_key('ilt', transition_state.conformer.E0.value_si, kinetics, key_T,
+                                            e_list[0], e_list[1] - e_list[0], tuple(j_list.tolist()))
+    k = microcanonical_rate_cache.get(key, e_list, dens_states)
+    if k is None:
+        k = apply_inverse_laplace_transform_method(transition_state, kinetics, e_list, j_list, dens_states, T)
+        microcanonical_rate_cache.put(key, e_list, dens_states, k)
+    return k
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def apply_rrkm_theory(transition_state,
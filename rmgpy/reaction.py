@@ -582,21 +582,47 @@ class Reaction:
         Return the enthalpies of reaction in J/mol evaluated at temperatures
         `Tlist` in K.
         """
-        return np.array([self.get_enthalpy_of_reaction(T) for T in Tlist], np.float64)
+        cython.declare(dHrxn=np.ndarray, reactant=Species, product=Species)
+        dHrxn = np.zeros(len(Tlist), np.float64)
+        for reactant in self.reactants:
+            dHrxn -= _get_species_thermo(reactant, 'H', Tlist)
+        for product in self.products:
+            dHrxn += _get_species_thermo(product, 'H', Tlist)
+        return dHrxn
 
     def get_entropies_of_reaction(self, Tlist):
         """
         Return the entropies of reaction in J/mol*K evaluated at temperatures
         `Tlist` in K.
         """
-        return np.array([self.get_entropy_of_reaction(T) for T in Tlist], np.float64)
+        cython.declare(dSrxn=np.ndarray, reactant=Species, product=Species)
+        dSrxn = np.zeros(len(Tlist), np.float64)
+        for reactant in self.reactants:
+            dSrxn -= _get_species_thermo(reactant, 'S', Tlist)
+        for product in self.products:
+            dSrxn += _get_species_thermo(product, 'S', Tlist)
+        return dSrxn
 
     def get_free_energies_of_reaction(self, Tlist):
         """
         Return the Gibbs free energies of reaction in J/mol evaluated at
         temperatures `Tlist` in K.
         """
-        return np.array([self.get_free_energy_of_reaction(T) for T in Tlist], np.float64)
+        cython.declare(dGrxn=np.ndarray, reactant=Species, product=Species)
+        dGrxn = np.zeros(len(Tlist), np.float64)
+        for reactant in self.reactants:
+            try:
+                dGrxn -= _get_species_thermo(reactant, 'G', Tlist)
+            except Exception:
+                logging.error("Problem with reactant {!r} in reaction {!s}".format(reactant, self))
+                raise
+        for product in self.products:
+            try:
+                dGrxn += _get_species_thermo(product, 'G', Tlist)
+            except Exception:
+                logging.error("Problem with product {!r} in reaction {!s}".format(product, self))
+                raise
+        return dGrxn
 
     def get_equilibrium_constants(self, Tlist, type='Kc'):
         """
@@ -606,7 +632,24 @@ class Reaction:
         ``Kc`` for concentrations (default), or ``Kp`` for pressures. Note that
         this function currently assumes an ideal gas mixture.
         """
-        return np.array([self.get_equilibrium_constant(T, type) for T in Tlist], np.float64)
+        cython.declare(dGrxn=np.ndarray, K=np.ndarray, P0=cython.double)
+        # Use free energy of reaction to calculate Ka
+        dGrxn = self.get_free_energies_of_reaction(Tlist)
+        K = np.exp(-dGrxn / constants.R / Tlist)
+        # Convert Ka to Kc or Kp if specified
+        P0 = 1e5
+        if type == 'Kc':
+            # Convert from Ka to Kc; C0 is the reference concentration
+            K *= (P0 / constants.R / Tlist) ** (len(self.products) - len(self.reactants))
+        elif type == 'Kp':
+            # Convert from Ka to Kp; P0 is the reference pressure
+            K *= P0 ** (len(self.products) - len(self.reactants))
+        elif type != 'Ka' and type != '':
+            raise ReactionError('Invalid type "{0}" passed to Reaction.get_equilibrium_constants(); '
+                                'should be "Ka", "Kc", or "Kp".'.format(type))
+        if np.any(K == 0):
+            raise ReactionError('Got equilibrium constant of 0')
+        return K
 
     def get_stoichiometric_coefficient(self, spec):
         """
@@ -773,7 +816,7 @@ class Reaction:
         The equilibrium constant is evaluated from the current reaction instance (self).
         """
         cython.declare(kf=Arrhenius, kr=Arrhenius)
-        cython.declare(Tlist=np.ndarray, klist=np.ndarray, i=cython.int)
+        cython.declare(Tlist=np.ndarray, klist=np.ndarray)
         kf = k_forward
         assert isinstance(kf, Arrhenius), "Only reverses Arrhenius rates"
         if Tmin is not None and Tmax is not None:
@@ -781,9 +824,7 @@ class Reaction:
         else:
             Tlist = 1.0 / np.arange(0.0005, 0.0034, 0.0001)
         # Determine the values of the reverse rate coefficient k_r(T) at each temperature
-        klist = np.zeros_like(Tlist)
-        for i in range(len(Tlist)):
-            klist[i] = kf.get_rate_coefficient(Tlist[i]) / self.get_equilibrium_constant(Tlist[i])
+        klist = kf.get_rate_coefficients(Tlist) / self.get_equilibrium_constants(Tlist)
         kr = Arrhenius()
         kr.fit_to_data(Tlist, klist, reverse_units, kf.T0.value_si)
         return kr
@@ -795,7 +836,7 @@ class Reaction:
         The equilibrium constant is evaluated from the current reaction instance (self).
         """
         cython.declare(kf=SurfaceArrhenius, kr=SurfaceArrhenius)
-        cython.declare(Tlist=np.ndarray, klist=np.ndarray, i=cython.int)
+        cython.declare(Tlist=np.ndarray, klist=np.ndarray)
         kf = k_forward
         if not isinstance(kf, SurfaceArrhenius): # Only reverse SurfaceArrhenius rates
             raise TypeError(f'Expected a SurfaceArrhenius object for k_forward but received {kf}')
@@ -804,9 +845,7 @@ class Reaction:
         else:
             Tlist = 1.0 / np.arange(0.0005, 0.0034, 0.0001)
         # Determine the values of the reverse rate coefficient k_r(T) at each temperature
-        klist = np.zeros_like(Tlist)
-        for i in range(len(Tlist)):
-            klist[i] = kf.get_rate_coefficient(Tlist[i]) / self.get_equilibrium_constant(Tlist[i])
+        klist = kf.get_rate_coefficients(Tlist) / self.get_equilibrium_constants(Tlist)
         kr = SurfaceArrhenius()
         kr.fit_to_data(Tlist, klist, reverse_units, kf.T0.value_si)
         return kr
@@ -817,9 +856,8 @@ class Reaction:
         Currently this only works if the `kinetics` attribute is one of several
         (but not necessarily all) kinetics types.
         """
-        cython.declare(Tlist=np.ndarray, Plist=np.ndarray, K=np.ndarray,
-                       rxn=Reaction, klist=np.ndarray, i=cython.size_t,
-                       Tindex=cython.size_t, Pindex=cython.size_t)
+        cython.declare(Tlist=np.ndarray, Plist=np.ndarray, K=np.ndarray, Keq=np.ndarray,
+                       rxn=Reaction, klist=np.ndarray, Pindex=cython.size_t)
 
         supported_types = (
             KineticsData.__name__,
@@ -841,9 +879,7 @@ class Reaction:
         if isinstance(kf, KineticsData):
 
             Tlist = kf.Tdata.value_si
-            klist = np.zeros_like(Tlist)
-            for i in range(len(Tlist)):
-                klist[i] = kf.get_rate_coefficient(Tlist[i]) / self.get_equilibrium_constant(Tlist[i])
+            klist = kf.get_rate_coefficients(Tlist) / self.get_equilibrium_constants(Tlist)
 
             kr = KineticsData(Tdata=(Tlist, "K"), kdata=(klist, kunits), Tmin=(np.min(Tlist), "K"),
                               Tmax=(np.max(Tlist), "K"))
@@ -863,9 +899,9 @@ class Reaction:
             Tlist = 1.0 / np.linspace(1.0 / kf.Tmax.value, 1.0 / kf.Tmin.value, 50)
             Plist = np.linspace(kf.Pmin.value, kf.Pmax.value, 20)
             K = np.zeros((len(Tlist), len(Plist)), np.float64)
-            for Tindex, T in enumerate(Tlist):
-                for Pindex, P in enumerate(Plist):
-                    K[Tindex, Pindex] = kf.get_rate_coefficient(T, P) / self.get_equilibrium_constant(T)
+            Keq = self.get_equilibrium_constants(Tlist)
+            for Pindex, P in enumerate(Plist):
+                K[:, Pindex] = kf.get_rate_coefficients(Tlist, np.full_like(Tlist, P)) / Keq
             kr = Chebyshev()
             kr.fit_to_data(Tlist, Plist, K, kunits, kf.degreeT, kf.degreeP, kf.Tmin.value, kf.Tmax.value, kf.Pmin.value,
                          kf.Pmax.value)
@@ -1349,6 +1385,30 @@ class Reaction:
         raise NotImplementedError("generate_high_p_limit_kinetics is not implemented for all Reaction subclasses.")
 
 
+def _get_species_thermo(species, quantity, Tlist):
+    """
+    Return the enthalpies in J/mol (`quantity` ``'H'``), entropies in J/mol*K
+    (``'S'``) or Gibbs free energies in J/mol (``'G'``) of `species` at the
+    temperatures `Tlist` in K. The array methods of the thermo model are used
+    if the species has one, and otherwise the scalar methods of the species
+    at each temperature, e.g. to use its statmech data.
+    """
+    if species.has_thermo():
+        thermo = species.get_thermo_data()
+        if quantity == 'H':
+            return thermo.get_enthalpies(Tlist)
+        elif quantity == 'S':
+            return thermo.get_entropies(Tlist)
+        else:
+            return thermo.get_free_energies(Tlist)
+    if quantity == 'H':
+        return np.array([species.get_enthalpy(T) for T in Tlist], np.float64)
+    elif quantity == 'S':
+        return np.array([species.get_entropy(T) for T in Tlist], np.float64)
+    else:
+        return np.array([species.get_free_energy(T) for T in Tlist], np.float64)
+
+
 def same_species_lists(list1, list2, check_identical=False, only_check_label=False, generate_initial_map=False,
                        strict=True):
     """
@@ -36,6 +36,7 @@ import numpy as np
 from rmgpy import settings
 from rmgpy.exceptions import InputError
 from rmgpy.molecule import Molecule
+from rmgpy.pdep.cache import microcanonical_rate_cache
 from rmgpy.quantity import Quantity, Energy, RateCoefficient, SurfaceConcentration
 from rmgpy.rmg.model import CoreEdgeReactionModel
 from rmgpy.rmg.settings import ModelSettings, SimulatorSettings
@@ -189,7 +190,9 @@ def simple_reactor(temperature,
                    sensitivityTemperature=None,
                    sensitivityPressure=None,
                    sensitivityMoleFractions=None,
-                   constantSpecies=None):
+                   constantSpecies=None,
+                   vectorizedResidual=False,
+                   sensitivityMethod='forward'):
     logging.debug('Found SimpleReactor reaction system')
 
     for key, value in initialMoleFractions.items():
@@ -286,7 +289,11 @@ def simple_reactor(temperature,
         sens_conditions['T'] = Quantity(sensitivityTemperature).value_si
         sens_conditions['P'] = Quantity(sensitivityPressure).value_si
 
-    system = SimpleReactor(T, P, initialMoleFractions, nSims, termination, sensitive_species, sensitivityThreshold, sens_conditions, constantSpecies)
+    if sensitivityMethod not in ('forward', 'adjoint'):
+        raise InputError("sensitivityMethod must be 'forward' or 'adjoint', not {0!r}.".format(sensitivityMethod))
+
+    system = SimpleReactor(T, P, initialMoleFractions, nSims, termination, sensitive_species, sensitivityThreshold,
+                           sens_conditions, constantSpecies, vectorizedResidual, sensitivityMethod)
     rmg.reaction_systems.append(system)
 
     assert balanceSpecies is None or isinstance(balanceSpecies, str), 'balanceSpecies should be the string corresponding to a single species'
@@ -318,7 +325,9 @@ def liquid_reactor(temperature,
                    sensitivityThreshold=1e-3,
                    sensitivityTemperature=None,
                    sensitivityConcentrations=None,
-                   constantSpecies=None):
+                   constantSpecies=None,
+                   vectorizedResidual=False,
+                   sensitivityMethod='forward'):
     logging.debug('Found LiquidReactor reaction system')
 
     if not isinstance(temperature, list):
@@ -378,8 +387,11 @@ def liquid_reactor(temperature,
         sens_conditions = sensitivityConcentrations
         sens_conditions['T'] = Quantity(sensitivityTemperature).value_si
 
+    if sensitivityMethod not in ('forward', 'adjoint'):
+        raise InputError("sensitivityMethod must be 'forward' or 'adjoint', not {0!r}.".format(sensitivityMethod))
+
     system = LiquidReactor(T, initialConcentrations, nSims, termination, sensitive_species, sensitivityThreshold,
-                           sens_conditions, constantSpecies)
+                           sens_conditions, constantSpecies, vectorizedResidual, sensitivityMethod)
     rmg.reaction_systems.append(system)
 
 
@@ -696,6 +708,7 @@ def pressure_dependence(
         minimumNumberOfGrains=0,
         interpolation=None,
         maximumAtoms=None,
+        microcanonicalRateCacheDirectory=None,
 ):
     from arkane.pdep import PressureDependenceJob
 
@@ -733,6 +746,9 @@ def pressure_dependence(
     # Process maximum atoms
     rmg.pressure_dependence.maximum_atoms = maximumAtoms
 
+    # Process the directory to spill the k(E) values evicted from memory to
+    microcanonical_rate_cache.directory = microcanonicalRateCacheDirectory
+
     rmg.pressure_dependence.active_j_rotor = True
     rmg.pressure_dependence.active_k_rotor = True
     rmg.pressure_dependence.rmgmode = True
@@ -740,7 +756,8 @@ def pressure_dependence(
 
 def options(name='Seed', generateSeedEachIteration=True, saveSeedToDatabase=False, units='si', saveRestartPeriod=None,
             generateOutputHTML=False, generatePlots=False, saveSimulationProfiles=False, verboseComments=False,
-            saveEdgeSpecies=False, keepIrreversible=False, trimolecularProductReversible=True, wallTime='00:00:00:00'):
+            saveEdgeSpecies=False, keepIrreversible=False, trimolecularProductReversible=True, wallTime='00:00:00:00',
+            parallelSimulations=False):
     if saveRestartPeriod:
         logging.warning("`saveRestartPeriod` flag was set in the input file, but this feature has been removed. Please "
                         "remove this line from the input file. This will throw an error after RMG-Py 3.1. For "
@@ -764,6 +781,7 @@ def options(name='Seed', generateSeedEachIteration=True, saveSeedToDatabase=Fals
     rmg.keep_irreversible = keepIrreversible
     rmg.trimolecular_product_reversible = trimolecularProductReversible
     rmg.walltime = wallTime
+    rmg.parallel_simulations = parallelSimulations
 
 
 def generated_species_constraints(**kwargs):
@@ -1100,6 +1118,11 @@ def save_input_file(path, rmg):
                 sensitivity.append(item.label)
             f.write('    sensitivity = {0},\n'.format(sensitivity))
             f.write('    sensitivityThreshold = {0},\n'.format(system.sensitivity_threshold))
+            if system.sensitivity_method != 'forward':
+                f.write('    sensitivityMethod = {0!r},\n'.format(system.sensitivity_method))
+
+        if system.vectorized_residual:
+            f.write('    vectorizedResidual = True,\n')
 
         f.write(')\n\n')
 
@@ -1147,6 +1170,8 @@ def save_input_file(path, rmg):
         ))
         f.write('    interpolation = {0},\n'.format(rmg.pressure_dependence.interpolation_model))
         f.write('    maximumAtoms = {0}, \n'.format(rmg.pressure_dependence.maximum_atoms))
+        if microcanonical_rate_cache.directory is not None:
+            f.write('    microcanonicalRateCacheDirectory = {0!r},\n'.format(microcanonical_rate_cache.directory))
         f.write(')\n\n')
 
     # Quantum Mechanics
@@ -1187,6 +1212,8 @@ def save_input_file(path, rmg):
     f.write('    trimolecularProductReversible = {0},\n'.format(rmg.trimolecular_product_reversible))
     f.write('    verboseComments = {0},\n'.format(rmg.verbose_comments))
     f.write('    wallTime = {0},\n'.format(rmg.walltime))
+    if rmg.parallel_simulations:
+        f.write('    parallelSimulations = True,\n')
     f.write(')\n\n')
 
     f.close()
@@ -35,6 +35,7 @@ Generator (RMG).
 import copy
 import gc
 import logging
+import multiprocessing
 import os
 import resource
 import shutil
@@ -68,6 +69,7 @@ from rmgpy.reaction import Reaction
 from rmgpy.rmg.listener import SimulationProfileWriter, SimulationProfilePlotter
 from rmgpy.rmg.output import OutputHTMLWriter
 from rmgpy.rmg.pdep import PDepReaction
+from rmgpy.rmg.react import ReactionWorkerPool
 from rmgpy.rmg.settings import ModelSettings
 from rmgpy.solver.base import TerminationTime, TerminationConversion
 from rmgpy.solver.simple import SimpleReactor
@@ -89,6 +91,9 @@ solvent = None
 # Maximum number of user defined processors
 maxproc = 1
 
+# The reaction model snapshot and simulations shared with forked processes by RMG.simulate_reaction_systems
+_simulation_state = None
+
 
 class RMG(util.Subject):
     """
@@ -141,6 +146,7 @@ class RMG(util.Subject):
     `ml_settings`                       Settings for ML estimation
     `walltime`                          The maximum amount of CPU time in the form DD:HH:MM:SS to expend on this job; used to stop gracefully so we can still get profiling information
     `kinetics_datastore`                ``True`` if storing details of each kinetic database entry in text file, ``False`` otherwise
+    `parallel_simulations`              ``True`` to simulate the reaction systems at the same time in a pool of processes, ``False`` otherwise
     ----------------------------------- ------------------------------------------------
     `initialization_time`               The time at which the job was initiated, in seconds since the epoch (i.e. from time.time())
     `done`                              Whether the job has completed (there is nothing new to add)
@@ -216,6 +222,7 @@ class RMG(util.Subject):
         self.walltime = '00:00:00:00'
         self.initialization_time = 0
         self.kinetics_datastore = None
+        self.parallel_simulations = False
         self.restart = False
         self.core_seed_path = None
         self.edge_seed_path = None
@@ -481,6 +488,11 @@ class RMG(util.Subject):
             should be an integer and smaller or equal to your available number of 
             processors {1}""".format(maxproc, psutil.cpu_count()))
 
+        if self.parallel_simulations and 'fork' not in multiprocessing.get_all_start_methods():
+            logging.warning('Parallel simulation of the reaction systems requires forking processes, which is not '
+                            'available on this platform. The reaction systems will be simulated one at a time.')
+            self.parallel_simulations = False
+
         # Load databases
         self.load_database()
 
@@ -618,6 +630,15 @@ class RMG(util.Subject):
 
         self.initialize_seed_mech()
 
+        # Start from the reaction generation timings of a previous run in this directory, if any
+        self.reaction_model.reaction_cost_model.load(os.path.join(self.output_directory, 'reaction_costs.yml'))
+
+        # Start the worker processes for reaction generation once, so that the database
+        # is only loaded into them a single time instead of at every enlarge step
+        if maxproc > 1:
+            self.reaction_model.reaction_pool = ReactionWorkerPool(maxproc, database=self.database)
+            self.reaction_model.reaction_pool.start()
+
     def register_listeners(self):
         """
         Attaches listener classes depending on the options 
@@ -761,13 +782,24 @@ class RMG(util.Subject):
                 prunable_species = self.reaction_model.edge.species[:]
                 prunable_networks = self.reaction_model.network_list[:]
 
-                for index, reaction_system in enumerate(self.reaction_systems):
-
+                for reaction_system in self.reaction_systems:
                     reaction_system.prunable_species = prunable_species  # these lines reset pruning for a new cycle
                     reaction_system.prunable_networks = prunable_networks
                     reaction_system.reset_max_edge_species_rate_ratios()
 
-                    for p in range(reaction_system.n_sims):
+                if self.parallel_simulations:
+                    # Simulate the p-th conditions of all reaction systems together
+                    rounds = [[(index, reaction_system) for index, reaction_system in enumerate(self.reaction_systems)
+                               if p < reaction_system.n_sims]
+                              for p in range(max([reaction_system.n_sims for reaction_system in self.reaction_systems]))]
+                else:
+                    rounds = [[(index, reaction_system)] * reaction_system.n_sims
+                              for index, reaction_system in enumerate(self.reaction_systems)]
+
+                for round_tasks in rounds:
+                    simulation_results = None
+
+                    for index, reaction_system in round_tasks:
                         reactor_done = True
                         objects_to_enlarge = []
                         self.reaction_system = reaction_system
@@ -782,19 +814,26 @@ class RMG(util.Subject):
                             prune = False
 
                         try:
-                            terminated, resurrected, obj, new_surface_species, new_surface_reactions, t, x = reaction_system.simulate(
-                                core_species=self.reaction_model.core.species,
-                                core_reactions=self.reaction_model.core.reactions,
-                                edge_species=self.reaction_model.edge.species,
-                                edge_reactions=self.reaction_model.edge.reactions,
-                                surface_species=self.reaction_model.surface.species,
-                                surface_reactions=self.reaction_model.surface.reactions,
-                                pdep_networks=self.reaction_model.network_list,
-                                prune=prune,
-                                model_settings=model_settings,
-                                simulator_settings=simulator_settings,
-                                conditions=self.rmg_memories[index].get_cond()
-                            )
+                            if len(round_tasks) > 1 and self.parallel_simulations:
+                                if simulation_results is None:
+                                    simulation_results = self.simulate_reaction_systems(
+                                        round_tasks, prune, model_settings, simulator_settings)
+                                result = simulation_results[index]
+                            else:
+                                result = reaction_system.simulate(
+                                    core_species=self.reaction_model.core.species,
+                                    core_reactions=self.reaction_model.core.reactions,
+                                    edge_species=self.reaction_model.edge.species,
+                                    edge_reactions=self.reaction_model.edge.reactions,
+                                    surface_species=self.reaction_model.surface.species,
+                                    surface_reactions=self.reaction_model.surface.reactions,
+                                    pdep_networks=self.reaction_model.network_list,
+                                    prune=prune,
+                                    model_settings=model_settings,
+                                    simulator_settings=simulator_settings,
+                                    conditions=self.rmg_memories[index].get_cond()
+                                )
+                            terminated, resurrected, obj, new_surface_species, new_surface_reactions, t, x = result
                         except:
                             logging.error("Model core reactions:")
                             if len(self.reaction_model.core.reactions) > 5:
@@ -820,6 +859,9 @@ class RMG(util.Subject):
                         # the core
                         if obj != [] and not (obj is None):
                             objects_to_enlarge = self.process_to_species_networks(obj)
+                            if simulation_results is not None:
+                                # The simulation used the model as it was at the start of the round
+                                objects_to_enlarge = self.remove_enlarged_objects(objects_to_enlarge)
 
                             reactor_done = False
                         # Enlarge objects identified by the simulation for enlarging
@@ -906,14 +948,14 @@ class RMG(util.Subject):
 
                         self.save_everything()
 
-                        if max_num_spcs_hit:  # breaks the n_sims loop
+                        if max_num_spcs_hit:  # breaks the loop over the simulations of this round
                             # self.done is still True, which will break the while loop
                             break
 
                         if not reactor_done:
                             self.done = False
 
-                    if max_num_spcs_hit:  # breaks the reaction_systems loop
+                    if max_num_spcs_hit:  # breaks the rounds loop
                         break
 
                 if not self.done:  # There is something that needs exploring/enlarging
@@ -945,6 +987,7 @@ class RMG(util.Subject):
                         core_spec, core_reac, edge_spec, edge_reac = self.reaction_model.get_model_size()
                         logging.info('The current model core has %s species and %s reactions' % (core_spec, core_reac))
                         logging.info('The current model edge has %s species and %s reactions' % (edge_spec, edge_reac))
+                        self.shutdown_reaction_pool()
                         return
 
             if max_num_spcs_hit:  # resets maxNumSpcsHit and continues the settings for loop
@@ -1496,6 +1539,78 @@ class RMG(util.Subject):
             raise TypeError("improper call, obj input was incorrect")
         return potential_spcs
 
+    def simulate_reaction_systems(self, tasks, prune, model_settings, simulator_settings):
+        """
+        Simulate the reaction systems in the list of ``(index, reaction_system)``
+        tuples `tasks` at the same time in a pool of forked processes, each of
+        which reads its own copy of the current reaction model. Every reaction
+        system is simulated at the conditions currently chosen by its
+        :class:`RMG_Memory`.
+
+        Returns a dictionary of the results of :meth:`ReactionSystem.simulate`,
+        keyed by the index of each reaction system, in which the species,
+        reactions and networks are those of the reaction model. The state of
+        each reaction system used to enlarge and prune the model is updated as
+        if it had been simulated in this process, including the state of the
+        model saved by :meth:`ReactionSystem.initialize_model`, so that the
+        next simulation still reuses the unchanged rate coefficients. That
+        state refers to the species and reactions by ``id()``, which are the
+        same in the forked processes as in this one.
+
+        The persistent worker pool of the reaction model, if any, keeps
+        running meanwhile. The forked processes only simulate and never use
+        the copy of the worker pool they inherit.
+        """
+        global _simulation_state
+
+        model = self.reaction_model
+        snapshot = (model.core.species[:], model.core.reactions[:], model.edge.species[:], model.edge.reactions[:],
+                    model.network_list[:])
+        tasks = [(index, reaction_system, self.rmg_memories[index].get_cond()) for index, reaction_system in tasks]
+        procnum = min(determine_procnum_from_ram(), len(tasks))
+        logging.info('Simulating {0:d} reaction systems using {1:d} processes...'.format(len(tasks), procnum))
+
+        _simulation_state = (model, snapshot, tasks, prune, model_settings, simulator_settings)
+        try:
+            if procnum > 1:
+                with multiprocessing.get_context('fork').Pool(processes=procnum) as pool:
+                    outputs = pool.map(_simulate_reaction_system, range(len(tasks)), chunksize=1)
+            else:
+                outputs = [_simulate_reaction_system(i) for i in range(len(tasks))]
+        finally:
+            _simulation_state = None
+
+        results = {}
+        for (index, reaction_system, conditions), (result, state) in zip(tasks, outputs):
+            terminated, resurrected, obj, new_surface_species, new_surface_reactions, t, x = result
+            # The forked reaction system started from the state of this one, so its values already
+            # include anything accumulated here and are copied back as they are, as in a serial run
+            for attribute, value in state.items():
+                setattr(reaction_system, attribute, value)
+            results[index] = (terminated, resurrected, [snapshot[i][j] for i, j in obj],
+                              [snapshot[i][j] for i, j in new_surface_species],
+                              [snapshot[i][j] for i, j in new_surface_reactions], t, x)
+        return results
+
+    def remove_enlarged_objects(self, objects_to_enlarge):
+        """
+        Remove the species that are no longer in the edge, and the network
+        isomers that have already been explored, from the list of objects
+        `objects_to_enlarge` returned by :meth:`process_to_species_networks`.
+        This is needed for simulations run on the model as it was before
+        other simulation results were used to enlarge it.
+        """
+        objects = []
+        for obj in objects_to_enlarge:
+            if isinstance(obj, tuple):
+                network, species = obj
+                if network not in self.reaction_model.network_list or species in network.explored:
+                    continue
+            elif not self.reaction_model.edge.has_species(obj):
+                continue
+            objects.append(obj)
+        return objects
+
     def generate_cantera_files(self, chemkin_file, **kwargs):
         """
         Convert a chemkin mechanism chem.inp file to a cantera mechanism file chem.cti
@@ -1584,9 +1699,10 @@ class RMG(util.Subject):
                 # Reorder the core species to match the indices of the restart filter tensors
                 reordered_core_species = []
                 for spc in restart_species_list:
-                    for j, oldCoreSpc in enumerate(self.reaction_model.core.species):
+                    for oldCoreSpc in self.reaction_model.core.species:
                         if oldCoreSpc.is_isomorphic(spc, strict=False):
-                            reordered_core_species.append(self.reaction_model.core.species.pop(j))
+                            reordered_core_species.append(oldCoreSpc)
+                            self.reaction_model.core.remove_species(oldCoreSpc)
                             break
                     else:
                         raise RuntimeError('Species {0} was defined in the restart file, but was not included in the'
@@ -1737,13 +1853,27 @@ class RMG(util.Subject):
 
         self.exec_time.append(time.time() - self.initialization_time)
 
+        # Save the reaction generation timings so that a restarted job can use them for load balancing
+        if len(self.reaction_model.reaction_cost_model) > 0:
+            self.reaction_model.reaction_cost_model.save(os.path.join(self.output_directory, 'reaction_costs.yml'))
+
         # Notify registered listeners:
         self.notify()
 
+    def shutdown_reaction_pool(self):
+        """
+        Stop the worker processes used for reaction generation, if any were started.
+        """
+        if self.reaction_model is not None and self.reaction_model.reaction_pool is not None:
+            self.reaction_model.reaction_pool.shutdown()
+            self.reaction_model.reaction_pool = None
+
     def finish(self):
         """
         Complete the model generation.
         """
+        self.shutdown_reaction_pool()
+
         # Print neural network-generated quote
         import datetime
         import textwrap
@@ -2031,6 +2161,49 @@ def determine_procnum_from_ram():
     return procnum
 
 
+def _simulate_reaction_system(task_index):
+    """
+    Simulate the reaction system of the task with index `task_index` in the
+    state set by :meth:`RMG.simulate_reaction_systems`, which is inherited by
+    forked processes. The objects in the results are replaced by their
+    ``(list, index)`` positions in the model snapshot, so that they can be
+    found in the parent process.
+
+    Returns the results of :meth:`ReactionSystem.simulate` and a dictionary
+    of the attributes of the reaction system updated by the simulation.
+    """
+    model, snapshot, tasks, prune, model_settings, simulator_settings = _simulation_state
+    index, reaction_system, conditions = tasks[task_index]
+
+    terminated, resurrected, obj, new_surface_species, new_surface_reactions, t, x = reaction_system.simulate(
+        core_species=model.core.species,
+        core_reactions=model.core.reactions,
+        edge_species=model.edge.species,
+        edge_reactions=model.edge.reactions,
+        surface_species=model.surface.species,
+        surface_reactions=model.surface.reactions,
+        pdep_networks=model.network_list,
+        prune=prune,
+        model_settings=model_settings,
+        simulator_settings=simulator_settings,
+        conditions=conditions
+    )
+
+    positions = {}
+    for i, objects in enumerate(snapshot):
+        for j, o in enumerate(objects):
+            positions.setdefault(id(o), (i, j))
+    result = (terminated, resurrected, [positions[id(o)] for o in obj],
+              [positions[id(o)] for o in new_surface_species], [positions[id(o)] for o in new_surface_reactions], t, x)
+
+    state = {}
+    for attribute in ['T', 'P', 'unimolecular_threshold', 'bimolecular_threshold', 'trimolecular_threshold',
+                      'max_edge_species_rate_ratios', 'max_network_leak_rate_ratios', 'previous_model']:
+        if hasattr(reaction_system, attribute):
+            state[attribute] = getattr(reaction_system, attribute)
+    return result, state
+
+
 def initialize_log(verbose, log_file_name):
     """
     Set up a logger for RMG to use to print output to stdout. The
@@ -32,14 +32,25 @@ import os
 import shutil
 import unittest
 
+import numpy as np
 from nose.plugins.attrib import attr
 
+import rmgpy.rmg.main
 from rmgpy.rmg.main import RMG, initialize_log
 from rmgpy.rmg.main import RMG_Memory
 from rmgpy import get_path
 from rmgpy import settings
 from rmgpy.data.rmg import RMGDatabase
+from rmgpy.kinetics import Arrhenius
+from rmgpy.molecule import Molecule
+from rmgpy.reaction import Reaction
 from rmgpy.rmg.model import CoreEdgeReactionModel
+from rmgpy.rmg.react import ReactionWorkerPool
+from rmgpy.rmg.settings import ModelSettings, SimulatorSettings
+from rmgpy.solver.base import TerminationTime
+from rmgpy.solver.simple import SimpleReactor
+from rmgpy.species import Species
+from rmgpy.thermo import ThermoData
 
 ###################################################
 
@@ -418,3 +429,119 @@ CH3(4)              2     144.001     3.800     0.000     0.000     0.000    ! G
             # clean up
             os.chdir(originalPath)
             shutil.rmtree(self.dir_name)
+
+
+class TestSimulateReactionSystems(unittest.TestCase):
+    """
+    Contains unit tests for simulating the reaction systems at the same time.
+    """
+
+    def setUp(self):
+        """
+        A function run before each unit test in this class.
+        """
+        def make_species(smiles, cpdata, h298, s298):
+            return Species(label=smiles, molecule=[Molecule().from_smiles(smiles)],
+                           thermo=ThermoData(Tdata=([300, 400, 500, 600, 800, 1000, 1500], 'K'),
+                                             Cpdata=(cpdata, 'cal/(mol*K)'), H298=(h298, 'kcal/mol'),
+                                             S298=(s298, 'cal/(mol*K)')))
+
+        ch4 = make_species('C', [8.615, 9.687, 10.963, 12.301, 14.841, 16.976, 20.528], -17.714, 44.472)
+        ch3 = make_species('[CH3]', [9.397, 10.123, 10.856, 11.571, 12.899, 14.055, 16.195], 9.357, 45.174)
+        c2h6 = make_species('CC', [12.684, 15.506, 18.326, 20.971, 25.500, 29.016, 34.595], -19.521, 54.799)
+        c2h5 = make_species('C[CH2]', [11.635, 13.744, 16.085, 18.246, 21.885, 24.676, 29.107], 29.496, 56.687)
+
+        self.rmg = RMG()
+        self.rmg.reaction_model = CoreEdgeReactionModel()
+        self.rmg.reaction_model.core.species = [c2h6, ch3]
+        self.rmg.reaction_model.edge.species = [ch4, c2h5]
+        self.rmg.reaction_model.edge.reactions = [
+            Reaction(reactants=[c2h6, ch3], products=[c2h5, ch4],
+                     kinetics=Arrhenius(A=(686.375 * 6, 'm^3/(mol*s)'), n=4.40721, Ea=(7.82799, 'kcal/mol'),
+                                        T0=(298.15, 'K'))),
+        ]
+
+        self.rmg.reaction_systems = [self.make_reaction_system(T) for T in [800, 1000, 1200]]
+        self.rmg.rmg_memories = []
+        for reaction_system in self.rmg.reaction_systems:
+            self.rmg.rmg_memories.append(RMG_Memory(reaction_system, None))
+            self.rmg.rmg_memories[-1].generate_cond()
+
+        self.model_settings = ModelSettings(tol_keep_in_edge=0, tol_move_to_core=1e-3, tol_interrupt_simulation=1e-3)
+        self.simulator_settings = SimulatorSettings()
+
+    def make_reaction_system(self, T):
+        """
+        Return a reactor at temperature `T` ready to simulate the reaction model.
+        """
+        core_species = self.rmg.reaction_model.core.species
+        reaction_system = SimpleReactor(T, 1.0e5, initial_mole_fractions={core_species[0]: 0.9, core_species[1]: 0.1},
+                                        n_sims=1, termination=[TerminationTime((1.0, 's'))])
+        reaction_system.prunable_species = self.rmg.reaction_model.edge.species[:]
+        reaction_system.prunable_networks = []
+        reaction_system.reset_max_edge_species_rate_ratios()
+        return reaction_system
+
+    def test_simulate_reaction_systems(self):
+        """
+        Test that the reaction systems simulated at the same time give the same results as one at a time.
+        """
+        model = self.rmg.reaction_model
+        for procnum in [1, 2]:
+            rmgpy.rmg.main.maxproc = procnum
+            try:
+                results = self.rmg.simulate_reaction_systems(list(enumerate(self.rmg.reaction_systems)), False,
+                                                             self.model_settings, self.simulator_settings)
+            finally:
+                rmgpy.rmg.main.maxproc = 1
+
+            for index, reaction_system in enumerate(self.rmg.reaction_systems):
+                expected_system = self.make_reaction_system(reaction_system.T.value_si)
+                expected = expected_system.simulate(model.core.species, model.core.reactions, model.edge.species,
+                                                    model.edge.reactions, [], [], model_settings=self.model_settings,
+                                                    simulator_settings=self.simulator_settings)
+                terminated, resurrected, obj, new_surface_species, new_surface_reactions, t, x = results[index]
+                self.assertEqual((terminated, resurrected), expected[:2])
+                self.assertTrue(len(obj) > 0)
+                self.assertEqual(len(obj), len(expected[2]))
+                for o, expected_o in zip(obj, expected[2]):
+                    self.assertIs(o, expected_o)
+                self.assertAlmostEqual(t, expected[5])
+                self.assertAlmostEqual(x, expected[6])
+                self.assertTrue(np.array_equal(reaction_system.max_edge_species_rate_ratios,
+                                               expected_system.max_edge_species_rate_ratios))
+                self.assertTrue(np.array_equal(reaction_system.max_network_leak_rate_ratios,
+                                               expected_system.max_network_leak_rate_ratios))
+                # The saved model state is copied back, so that the next simulation can reuse the rate coefficients
+                self.assertEqual(reaction_system.previous_model[0], expected_system.previous_model[0])
+                self.assertEqual(reaction_system.previous_model[1], expected_system.previous_model[1])
+                self.assertTrue(np.array_equal(reaction_system.previous_model[6], expected_system.previous_model[6]))
+
+    def test_simulate_reaction_systems_keeps_worker_pool(self):
+        """
+        Test that the worker pool of the reaction model keeps running while the reaction systems are simulated.
+        """
+        model = self.rmg.reaction_model
+        model.reaction_pool = ReactionWorkerPool(2)
+        rmgpy.rmg.main.maxproc = 2
+        try:
+            with model.reaction_pool as pool:
+                workers = pool._pool
+                for _ in range(2):
+                    self.rmg.simulate_reaction_systems(list(enumerate(self.rmg.reaction_systems)), False,
+                                                       self.model_settings, self.simulator_settings)
+                    self.assertTrue(pool.running)
+                    self.assertIs(pool._pool, workers)
+                self.assertEqual(pool.map(abs, [-1, -2, -3]), [1, 2, 3])
+        finally:
+            rmgpy.rmg.main.maxproc = 1
+            model.reaction_pool = None
+
+    def test_remove_enlarged_objects(self):
+        """
+        Test that objects which have already been added to the core are not enlarged again.
+        """
+        ch4, c2h5 = self.rmg.reaction_model.edge.species
+        self.rmg.reaction_model.edge.remove_species(ch4)
+        self.rmg.reaction_model.core.add_species(ch4)
+        self.assertEqual(self.rmg.remove_enlarged_objects([ch4, c2h5]), [c2h5])
@@ -31,43 +31,197 @@
 Contains classes for working with the reaction model generated by RMG.
 """
 
+import copy
 import gc
 import itertools
 import logging
+import math
 import os
 
 import numpy as np
 
 import rmgpy.data.rmg
 from rmgpy import settings
+from rmgpy.chemkin import DuplicateReactionIndex
 from rmgpy.constraints import fails_species_constraints
 from rmgpy.data.kinetics.depository import DepositoryReaction
 from rmgpy.data.kinetics.family import KineticsFamily, TemplateReaction
 from rmgpy.data.kinetics.library import KineticsLibrary, LibraryReaction
 from rmgpy.data.rmg import get_db
 from rmgpy.display import display
-from rmgpy.exceptions import ForbiddenStructureException
+from rmgpy.exceptions import DatabaseError, ForbiddenStructureException
 from rmgpy.kinetics import KineticsData, Arrhenius
+from rmgpy.molecule.util import get_graph_hash
+from rmgpy.pdep.cache import microcanonical_rate_cache
 from rmgpy.quantity import Quantity
 from rmgpy.reaction import Reaction
-from rmgpy.rmg.pdep import PDepReaction, PDepNetwork
+from rmgpy.rmg.pdep import PDepReaction, PDepNetwork, calculate_network_kinetics
 from rmgpy.rmg.react import react_all
+from rmgpy.rmg.scheduler import ReactionCostModel, group_tasks
 from rmgpy.species import Species
 from rmgpy.thermo.thermoengine import submit
 
 
 ################################################################################
 
+class ObjectIndex(object):
+    """
+    An index of the identities of the objects in the list `items`, used to
+    test whether an object is in the list in constant time instead of scanning
+    the whole list. Objects are compared by identity, which matches the
+    equality used by :class:`Species` and :class:`Reaction` objects.
+
+    The index is kept in sync by the owner of the list, which must call
+    :meth:`add` and :meth:`discard` whenever an object is added to or removed
+    from the list, or :meth:`invalidate` after any other modification, in
+    which case the index is rebuilt before it is next used.
+    """
+
+    def __init__(self, items):
+        self.items = items
+        self.rebuild()
+
+    def __contains__(self, item):
+        if self.counts is None:
+            self.rebuild()
+        return id(item) in self.counts
+
+    def rebuild(self):
+        """
+        Rebuild the index from the current contents of the list.
+        """
+        self.counts = {}
+        for item in self.items:
+            self.add(item)
+
+    def invalidate(self):
+        """
+        Record that the list was modified in some other way, so that the
+        index is rebuilt before it is next used.
+        """
+        self.counts = None
+
+    def add(self, item):
+        """
+        Record that `item` was added to the list.
+        """
+        if self.counts is None:
+            return
+        key = id(item)
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def discard(self, item):
+        """
+        Record that `item` was removed from the list.
+        """
+        if self.counts is None:
+            return
+        key = id(item)
+        count = self.counts.get(key, 0)
+        if count > 1:
+            self.counts[key] = count - 1
+        elif count == 1:
+            del self.counts[key]
+
+
 class ReactionModel:
     """
     Represent a generic reaction model. A reaction model consists of `species`,
     a list of species, and `reactions`, a list of reactions.
+
+    Both lists are indexed, so :meth:`has_species` and :meth:`has_reaction`
+    do not need to scan them. Species and reactions must be added and removed
+    using the methods of this class so that the indices stay in sync; code
+    that modifies the lists directly must call :meth:`invalidate_indices`
+    afterwards.
     """
 
     def __init__(self, species=None, reactions=None):
         self.species = species or []
         self.reactions = reactions or []
 
+    @property
+    def species(self):
+        """The list of species in the model."""
+        return self._species
+
+    @species.setter
+    def species(self, species):
+        self._species = species
+        self._species_index = ObjectIndex(species)
+
+    @property
+    def reactions(self):
+        """The list of reactions in the model."""
+        return self._reactions
+
+    @reactions.setter
+    def reactions(self, reactions):
+        self._reactions = reactions
+        self._reaction_index = ObjectIndex(reactions)
+
+    def has_species(self, spec):
+        """
+        Return ``True`` if the species `spec` is in the model.
+        """
+        return spec in self._species_index
+
+    def has_reaction(self, rxn):
+        """
+        Return ``True`` if the reaction `rxn` is in the model.
+        """
+        return rxn in self._reaction_index
+
+    def add_species(self, spec):
+        """
+        Append the species `spec` to the model.
+        """
+        self._species.append(spec)
+        self._species_index.add(spec)
+
+    def remove_species(self, spec):
+        """
+        Remove the species `spec` from the model.
+        """
+        self._species.remove(spec)
+        self._species_index.discard(spec)
+
+    def add_reaction(self, rxn, index=None):
+        """
+        Append the reaction `rxn` to the model, or insert it at position
+        `index` if given.
+        """
+        if index is None:
+            self._reactions.append(rxn)
+        else:
+            self._reactions.insert(index, rxn)
+        self._reaction_index.add(rxn)
+
+    def remove_reaction(self, rxn):
+        """
+        Remove the reaction `rxn` from the model.
+        """
+        self._reactions.remove(rxn)
+        self._reaction_index.discard(rxn)
+
+    def remove_reactions(self, rxns):
+        """
+        Remove all of the reactions in `rxns` from the model using a single
+        pass over the list of reactions.
+        """
+        keys = {id(rxn) for rxn in rxns}
+        if keys:
+            self._reactions[:] = [rxn for rxn in self._reactions if id(rxn) not in keys]
+            self._reaction_index.rebuild()
+
+    def invalidate_indices(self):
+        """
+        Mark the indices of the species and reactions as stale after the lists
+        were modified directly, so that they are rebuilt on the next lookup.
+        """
+        self._species_index.invalidate()
+        self._reaction_index.invalidate()
+
     def __reduce__(self):
         """
         A helper function used when pickling an object.
@@ -86,8 +240,8 @@ class ReactionModel:
         final_model = ReactionModel()
 
         # Put the current model into the merged model as-is
-        final_model.species.extend(self.species)
-        final_model.reactions.extend(self.reactions)
+        final_model.species = self.species[:]
+        final_model.reactions = self.reactions[:]
 
         # Determine which species in other are already in self
         common_species = {}
@@ -118,7 +272,8 @@ class ReactionModel:
                 unique_reactions.append(rxn)
 
         # Add the unique species from other to the final model
-        final_model.species.extend(unique_species)
+        for spec in unique_species:
+            final_model.add_species(spec)
 
         # Make sure unique reactions only refer to species in the final model
         for rxn in unique_reactions:
@@ -142,7 +297,8 @@ class ReactionModel:
                     pass
 
         # Add the unique reactions from other to the final model
-        final_model.reactions.extend(unique_reactions)
+        for rxn in unique_reactions:
+            final_model.add_reaction(rxn)
 
         # Return the merged model
         return final_model
@@ -166,8 +322,14 @@ class CoreEdgeReactionModel:
     `network_list`             A list of pressure-dependent reaction networks (:class:`Network` objects)
     `network_count`            A counter for the number of pressure-dependent networks created
     `index_species_dict`       A dictionary with a unique index pointing to the species objects
+    `species_key_dict`         A dictionary of species indexed by formula, then by molecular graph hash, kept in sync with `species_dict`
+    `species_lookup_stats`     A dictionary counting the species lookup hits, misses, and hash collisions
+    `kinetics_cache_stats`     A dictionary counting the template kinetics cache hits and misses in the worker processes
+    `duplicate_index`          A :class:`DuplicateReactionIndex` of the core and edge reactions
     `solvent_name`             String describing solvent name for liquid reactions. Empty for non-liquid estimation
     `surface_site_density`     The surface site density (a SurfaceConcentration quantity) or None if no heterogeneous catalyst.
+    `reaction_pool`            A persistent :class:`ReactionWorkerPool` used for parallel reaction generation, or None
+    `reaction_cost_model`      A :class:`ReactionCostModel` of measured reaction generation times used for load balancing
     =========================  ==============================================================
 
 
@@ -196,6 +358,10 @@ class CoreEdgeReactionModel:
         self.species_dict = {}
         self.reaction_dict = {}
         self.species_cache = [None for i in range(4)]
+        self.species_key_dict = {}
+        self.species_lookup_stats = {'hits': 0, 'misses': 0, 'collisions': 0}
+        self.kinetics_cache_stats = {'hits': 0, 'misses': 0}
+        self.duplicate_index = DuplicateReactionIndex()
         self.species_counter = 0
         self.reaction_counter = 0
         self.new_species_list = []
@@ -223,6 +389,8 @@ class CoreEdgeReactionModel:
         self.new_surface_rxns_loss = set()
         self.solvent_name = ''
         self.surface_site_density = None
+        self.reaction_pool = None
+        self.reaction_cost_model = ReactionCostModel()
 
     def check_for_existing_species(self, molecule):
         """
@@ -239,24 +407,73 @@ class CoreEdgeReactionModel:
             if spec is not None and spec.is_isomorphic(molecule, strict=False):
                 self.species_cache.pop(i)
                 self.species_cache.insert(0, spec)
+                self.species_lookup_stats['hits'] += 1
                 return spec
 
-        # If not found in cache, check all species with matching formula
+        # If not found in cache, check the species with matching formula and graph hash
         formula = molecule.get_formula()
-        try:
-            species_list = self.species_dict[formula]
-        except KeyError:
-            pass
-        else:
-            for spec in species_list:
+        if formula in self.species_dict:
+            key = get_graph_hash(molecule)
+            for spec in self.get_species_key_index(formula).get(key, []):
                 if spec.is_isomorphic(molecule, strict=False):
                     self.species_cache.pop()
                     self.species_cache.insert(0, spec)
+                    self.species_lookup_stats['hits'] += 1
                     return spec
+                self.species_lookup_stats['collisions'] += 1
 
         # At this point we can conclude that the species is new
+        self.species_lookup_stats['misses'] += 1
         return None
 
+    def get_species_key_index(self, formula):
+        """
+        Return a dictionary of the species in ``species_dict[formula]`` indexed
+        by the graph hash of their first molecule. The index is kept in sync
+        when species are created or removed from the edge, and is rebuilt if it
+        was invalidated by :meth:`invalidate_species_key_index`.
+        """
+        key_index = self.species_key_dict.get(formula)
+        if key_index is None:
+            key_index = {}
+            for spec in self.species_dict.get(formula, []):
+                key_index.setdefault(get_graph_hash(spec.molecule[0]), []).append(spec)
+            self.species_key_dict[formula] = key_index
+        return key_index
+
+    def invalidate_species_key_index(self, formula=None):
+        """
+        Mark the index of the species with `formula`, or of all species if no
+        formula is given, as stale after ``species_dict`` was modified
+        directly, so that it is rebuilt on the next lookup.
+        """
+        if formula is None:
+            self.species_key_dict.clear()
+        else:
+            self.species_key_dict.pop(formula, None)
+
+    def pop_species_lookup_stats(self):
+        """
+        Return a dictionary of the number of species lookup hits, misses, and
+        graph hash collisions since the last call, and reset the counts.
+        """
+        stats = self.species_lookup_stats
+        self.species_lookup_stats = {'hits': 0, 'misses': 0, 'collisions': 0}
+        return stats
+
+    def pop_kinetics_cache_stats(self):
+        """
+        Return a dictionary of the number of template kinetics cache hits and
+        misses of all kinetics families since the last call, including those
+        in the worker processes, and reset the counts.
+        """
+        stats = self.kinetics_cache_stats
+        self.kinetics_cache_stats = {'hits': 0, 'misses': 0}
+        hits, misses = _pop_kinetics_cache_stats()
+        stats['hits'] += hits
+        stats['misses'] += misses
+        return stats
+
     def make_new_species(self, object, label='', reactive=True, check_existing=True, generate_thermo=True):
         """
         Formally create a new species from the specified `object`, which can be
@@ -307,10 +524,8 @@ class CoreEdgeReactionModel:
         logging.debug('Creating new species {0}'.format(spec.label))
 
         formula = molecule.get_formula()
-        if formula in self.species_dict:
-            self.species_dict[formula].append(spec)
-        else:
-            self.species_dict[formula] = [spec]
+        self.get_species_key_index(formula).setdefault(get_graph_hash(molecule), []).append(spec)
+        self.species_dict.setdefault(formula, []).append(spec)
 
         # Since the species is new, add it to the list of new species
         self.new_species_list.append(spec)
@@ -534,7 +749,7 @@ class CoreEdgeReactionModel:
 
                 new_species = new_object
 
-                object_was_in_edge = new_species in self.edge.species
+                object_was_in_edge = self.edge.has_species(new_species)
 
                 if not new_species.reactive:
                     logging.info('NOT generating reactions for unreactive species {0}'.format(new_species))
@@ -592,7 +807,8 @@ class CoreEdgeReactionModel:
             rxn_lists, spcs_tuples = react_all(self.core.species, num_old_core_species,
                                              unimolecular_react, bimolecular_react,
                                              trimolecular_react=trimolecular_react,
-                                             procnum=procnum)
+                                             procnum=procnum, pool=self.reaction_pool,
+                                             cost_model=self.reaction_cost_model)
 
             for rxnList, spcTuple in zip(rxn_lists, spcs_tuples):
                 if rxnList:
@@ -616,11 +832,14 @@ class CoreEdgeReactionModel:
         # Generate kinetics of new reactions
         if self.new_reaction_list:
             logging.info('Generating kinetics for new reactions...')
-        for reaction in self.new_reaction_list:
-            # If the reaction already has kinetics (e.g. from a library),
-            # assume the kinetics are satisfactory
-            if reaction.kinetics is None:
-                self.apply_kinetics_to_reaction(reaction)
+        # If the reaction already has kinetics (e.g. from a library),
+        # assume the kinetics are satisfactory
+        self.apply_kinetics_to_reactions([reaction for reaction in self.new_reaction_list
+                                          if reaction.kinetics is None])
+
+        # Collect the thermo still being estimated by the workers, e.g. of new species without new reactions
+        for spc in self.new_species_list:
+            spc.has_thermo()
 
         # For new reactions, convert ArrheniusEP to Arrhenius, and fix barrier heights.
         # self.new_reaction_list only contains *actually* new reactions, all in the forward direction.
@@ -647,17 +866,17 @@ class CoreEdgeReactionModel:
         # Check new core and edge reactions for Chemkin duplicates
         # The same duplicate reaction gets brought into the core
         # at the same time, so there is no danger in checking all of the edge.
+        # New reactions are only compared to the reactions checked before them
         new_core_reactions = self.core.reactions[num_old_core_reactions:]
         new_edge_reactions = self.edge.reactions[num_old_edge_reactions:]
-        checked_reactions = self.core.reactions[:num_old_core_reactions] + self.edge.reactions[:num_old_edge_reactions]
-        from rmgpy.chemkin import mark_duplicate_reaction
+        unchecked = set([id(rxn) for rxn in new_core_reactions + new_edge_reactions])
         for rxn in new_core_reactions:
-            mark_duplicate_reaction(rxn, checked_reactions)
-            checked_reactions.append(rxn)
+            unchecked.discard(id(rxn))
+            self.duplicate_index.mark_duplicates(rxn, exclude=unchecked)
         if self.save_edge_species:
             for rxn in new_edge_reactions:
-                mark_duplicate_reaction(rxn, checked_reactions)
-                checked_reactions.append(rxn)
+                unchecked.discard(id(rxn))
+                self.duplicate_index.mark_duplicates(rxn, exclude=unchecked)
         self.log_enlarge_summary(
             new_core_species=self.core.species[num_old_core_species:],
             new_core_reactions=self.core.reactions[num_old_core_reactions:],
@@ -750,14 +969,14 @@ class CoreEdgeReactionModel:
                 # Add the reactant and product species to the edge if necessary
                 # At the same time, check if all reactants and products are in the core
                 for spec in rxn.reactants:
-                    if spec not in self.core.species:
+                    if not self.core.has_species(spec):
                         all_species_in_core = False
-                        if spec not in self.edge.species:
+                        if not self.edge.has_species(spec):
                             self.add_species_to_edge(spec)
                 for spec in rxn.products:
-                    if spec not in self.core.species:
+                    if not self.core.has_species(spec):
                         all_species_in_core = False
-                        if spec not in self.edge.species:
+                        if not self.edge.has_species(spec):
                             self.add_species_to_edge(spec)
 
             isomer_atoms = sum([len(spec.molecule[0].atoms) for spec in rxn.reactants])
@@ -800,14 +1019,18 @@ class CoreEdgeReactionModel:
                 if isinstance(rxn, LibraryReaction):
                     # If reaction came from a reaction library, omit it from the core and edge so that it does 
                     # not get double-counted with the pdep network
-                    if rxn in self.core.reactions:
-                        self.core.reactions.remove(rxn)
-                    if rxn in self.edge.reactions:
-                        self.edge.reactions.remove(rxn)
+                    if self.core.has_reaction(rxn):
+                        self.core.remove_reaction(rxn)
+                    if self.edge.has_reaction(rxn):
+                        self.edge.remove_reaction(rxn)
+                    self.duplicate_index.remove(rxn)
 
     def apply_thermo_to_species(self, procnum):
         """
         Generate thermo for species. QM calculations are parallelized if requested.
+
+        If the persistent worker pool is running, the estimates are submitted
+        to it and each ``spc.thermo`` is only resolved when it is first read.
         """
         from rmgpy.rmg.input import get_input
         quantum_mechanics = get_input('quantum_mechanics')
@@ -815,20 +1038,16 @@ class CoreEdgeReactionModel:
         if quantum_mechanics:
             quantum_mechanics.run_jobs(self.new_species_list, procnum=procnum)
 
-        # Serial thermo calculation for other methods
+        pool = self.reaction_pool if self.reaction_pool is not None and self.reaction_pool.running else None
         for spc in self.new_species_list:
-            self.generate_thermo(spc, rename=True)
+            self.generate_thermo(spc, rename=True, pool=pool)
 
-    def generate_thermo(self, spc, rename=False):
+    def generate_thermo(self, spc, rename=False, pool=None):
         """
-        Generate thermo for species.
+        Generate thermo for species, using the worker `pool` if one is given.
         """
-        if not spc.thermo:
-            submit(spc, self.solvent_name)
-
-            if rename and spc.thermo and spc.thermo.label != '':  # check if thermo libraries have a name for it
-                logging.info('Species {0} renamed {1} based on thermo library name'.format(spc.label, spc.thermo.label))
-                spc.label = spc.thermo.label
+        if not spc.has_thermo():
+            submit(spc, self.solvent_name, pool=pool, callback=rename_from_thermo_library if rename else None)
 
         spc.generate_energy_transfer_model()
 
@@ -837,9 +1056,60 @@ class CoreEdgeReactionModel:
         retrieve the best kinetics for the reaction and apply it towards the forward 
         or reverse direction (if reverse, flip the direaction).
         """
-        from rmgpy.data.rmg import get_db
         # Find the reaction kinetics
         kinetics, source, entry, is_forward = self.generate_kinetics(reaction)
+        self.set_reaction_kinetics(reaction, kinetics, is_forward)
+
+    def apply_kinetics_to_reactions(self, reactions):
+        """
+        Retrieve and apply the best kinetics for each of the `reactions`.
+
+        If the persistent worker pool is running, the reactions are grouped by
+        family into batches which are estimated by the workers. Only the
+        structures of the species are sent to the workers, as given by
+        :func:`get_kinetics_task`, so the thermo of the species may still be
+        estimated by the workers when the batches are submitted. The thermo
+        is then collected while the kinetics are estimated, and the direction
+        of the kinetics is chosen here. The results are applied in the order
+        of `reactions`, so that the model is the same as if the kinetics were
+        estimated serially.
+        """
+        pool = self.reaction_pool if self.reaction_pool is not None and self.reaction_pool.running else None
+        if pool is None or len(reactions) <= pool.procnum:
+            for reaction in reactions:
+                self.apply_kinetics_to_reaction(reaction)
+            return
+
+        batch_size = int(math.ceil(len(reactions) / (pool.procnum * pool.tasks_per_worker)))
+        batches = group_tasks([reaction.family for reaction in reactions], batch_size)
+        async_results = [pool.apply_async(_estimate_kinetics_batch,
+                                          ([get_kinetics_task(reactions[i]) for i in batch], self.kinetics_estimator))
+                         for batch in batches]
+
+        # Collect the thermo of the species on this process while the workers estimate the kinetics
+        # It is needed to choose the direction of the kinetics
+        for reaction in reactions:
+            for spc in itertools.chain(reaction.reactants, reaction.products):
+                spc.has_thermo()
+
+        estimates = [None] * len(reactions)
+        for batch, async_result in zip(batches, async_results):
+            batch_results, (hits, misses) = async_result.get()
+            for i, result in zip(batch, batch_results):
+                estimates[i] = result
+            self.kinetics_cache_stats['hits'] += hits
+            self.kinetics_cache_stats['misses'] += misses
+        for reaction, estimate in zip(reactions, estimates):
+            kinetics, source, entry, is_forward = select_kinetics(reaction, *estimate,
+                                                                  verbose_comments=self.verbose_comments)
+            self.set_reaction_kinetics(reaction, kinetics, is_forward)
+
+    def set_reaction_kinetics(self, reaction, kinetics, is_forward):
+        """
+        Set the `kinetics` of the family `reaction`, first flipping the
+        reaction direction if the kinetics are defined in the reverse direction,
+        as indicated by `is_forward`.
+        """
         # Flip the reaction direction if the kinetics are defined in the reverse direction
         if not is_forward:
             family = get_db('kinetics').families[reaction.family]
@@ -858,104 +1128,8 @@ class CoreEdgeReactionModel:
         """
         Generate best possible kinetics for the given `reaction` using the kinetics database.
         """
-        # Only reactions from families should be missing kinetics
-        assert isinstance(reaction, TemplateReaction)
-
-        family = get_family_library_object(reaction.family)
-
-        # Get the kinetics for the reaction
-        kinetics, source, entry, is_forward = family.get_kinetics(reaction, template_labels=reaction.template,
-                                                                  degeneracy=reaction.degeneracy,
-                                                                  estimator=self.kinetics_estimator,
-                                                                  return_all_kinetics=False)
-        # Get the gibbs free energy of reaction at 298 K
-        G298 = reaction.get_free_energy_of_reaction(298)
-        gibbs_is_positive = G298 > -1e-8
-
-        if family.own_reverse and hasattr(reaction, 'reverse'):
-            if reaction.reverse:
-                # The kinetics family is its own reverse, so we could estimate kinetics in either direction
-
-                # First get the kinetics for the other direction
-                rev_kinetics, rev_source, rev_entry, rev_is_forward = family.get_kinetics(reaction.reverse,
-                                                                                          template_labels=reaction.reverse.template,
-                                                                                          degeneracy=reaction.reverse.degeneracy,
-                                                                                          estimator=self.kinetics_estimator,
-                                                                                          return_all_kinetics=False)
-                # Now decide which direction's kinetics to keep
-                keep_reverse = False
-                if entry is not None and rev_entry is None:
-                    # Only the forward has an entry, meaning an exact match in a depository or template
-                    # the reverse must have used an averaged estimated node - so use forward.
-                    reason = "This direction matched an entry in {0}, the other was just an estimate.".format(reaction.family)
-                elif entry is None and rev_entry is not None:
-                    # Only the reverse has an entry (see above) - use reverse.
-                    keep_reverse = True
-                    reason = "This direction matched an entry in {0}, the other was just an estimate.".format(reaction.family)
-                elif entry is not None and rev_entry is not None and entry is rev_entry:
-                    # Both forward and reverse have the same source and entry
-                    # Use the one for which the kinetics is the forward kinetics
-                    keep_reverse = gibbs_is_positive and is_forward and rev_is_forward
-                    reason = "Both directions matched the same entry in {0}, but this direction is exergonic.".format(reaction.family)
-                elif self.kinetics_estimator == 'group additivity' and (kinetics.comment.find("Fitted to 1 rate") > 0
-                                                                       and not rev_kinetics.comment.find("Fitted to 1 rate") > 0):
-                    # forward kinetics were fitted to only 1 rate, but reverse are hopefully better
-                    keep_reverse = True
-                    reason = "Other direction matched a group only fitted to 1 rate."
-                elif self.kinetics_estimator == 'group additivity' and (not kinetics.comment.find("Fitted to 1 rate") > 0
-                                                                       and rev_kinetics.comment.find("Fitted to 1 rate") > 0):
-                    # reverse kinetics were fitted to only 1 rate, but forward are hopefully better
-                    keep_reverse = False
-                    reason = "Other direction matched a group only fitted to 1 rate."
-                elif entry is not None and rev_entry is not None:
-                    # Both directions matched explicit rate rules
-                    # Keep the direction with the lower (but nonzero) rank
-                    if entry.rank < rev_entry.rank and entry.rank != 0:
-                        keep_reverse = False
-                        reason = "Both directions matched explicit rate rules, but this direction has a rule with a lower rank ({0} vs {1}).".format(
-                            entry.rank, rev_entry.rank)
-                    elif rev_entry.rank < entry.rank and rev_entry.rank != 0:
-                        keep_reverse = True
-                        reason = "Both directions matched explicit rate rules, but this direction has a rule with a lower rank ({0} vs {1}).".format(
-                            rev_entry.rank, entry.rank)
-                    # Otherwise keep the direction that is exergonic at 298 K
-                    else:
-                        keep_reverse = gibbs_is_positive and is_forward and rev_is_forward
-                        reason = "Both directions matched explicit rate rules, but this direction is exergonic."
-                else:
-                    # Keep the direction that is exergonic at 298 K
-                    # This must be done after the thermo generation step
-                    keep_reverse = gibbs_is_positive and is_forward and rev_is_forward
-                    reason = "Both directions are estimates, but this direction is exergonic."
-
-                if keep_reverse:
-                    kinetics = rev_kinetics
-                    source = rev_source
-                    entry = rev_entry
-                    is_forward = not rev_is_forward
-                    G298 = -G298
-
-                if self.verbose_comments:
-                    kinetics.comment += "\nKinetics were estimated in this direction instead of the reverse because:\n{0}".format(reason)
-                    kinetics.comment += "\ndGrxn(298 K) = {0:.2f} kJ/mol".format(G298 / 1000.)
-
-        # The comments generated by the database for estimated kinetics can
-        # be quite long, and therefore not very useful
-        # We don't want to waste lots of memory storing these long, 
-        # uninformative strings, so here we replace them with much shorter ones
-        if not self.verbose_comments:
-            # Only keep a short comment (to save memory)
-            if 'Exact' in kinetics.comment:
-                # Exact match of rate rule
-                pass
-            elif 'Matched reaction' in kinetics.comment:
-                # Stems from matching a reaction from a depository
-                pass
-            else:
-                # Estimated (averaged) rate rule
-                kinetics.comment = kinetics.comment[kinetics.comment.find('Estimated'):]
-
-        return kinetics, source, entry, is_forward
+        return generate_kinetics(reaction, kinetics_estimator=self.kinetics_estimator,
+                                 verbose_comments=self.verbose_comments)
 
     def log_enlarge_summary(self, new_core_species, new_core_reactions, new_edge_species, new_edge_reactions,
                             reactions_moved_from_edge=None, react_edge=False):
@@ -1018,7 +1192,7 @@ class CoreEdgeReactionModel:
         If this are any such reactions, they are returned in a list.
         """
 
-        assert spec not in self.core.species, "Tried to add species {0} to core, but it's already there".format(spec.label)
+        assert not self.core.has_species(spec), "Tried to add species {0} to core, but it's already there".format(spec.label)
 
         forbidden_structures = get_db('forbidden')
 
@@ -1026,7 +1200,7 @@ class CoreEdgeReactionModel:
         if not spec.explicitly_allowed and forbidden_structures.is_molecule_forbidden(spec.molecule[0]):
 
             rxn_list = []
-            if spec in self.edge.species:
+            if self.edge.has_species(spec):
                 # remove forbidden species from edge
                 logging.info("Species {0} was Forbidden and not added to Core...Removing from Edge.".format(spec))
                 self.remove_species_from_edge(self.reaction_systems, spec)
@@ -1034,39 +1208,41 @@ class CoreEdgeReactionModel:
                 return []
 
         # Add the species to the core
-        self.core.species.append(spec)
+        self.core.add_species(spec)
 
         rxn_list = []
-        if spec in self.edge.species:
+        if self.edge.has_species(spec):
 
             # If species was in edge, remove it
             logging.debug("Removing species {0} from edge.".format(spec))
-            self.edge.species.remove(spec)
+            self.edge.remove_species(spec)
 
             # Search edge for reactions that now contain only core species;
             # these belong in the model core and will be moved there
             for rxn in self.edge.reactions:
                 all_core = True
                 for reactant in rxn.reactants:
-                    if reactant not in self.core.species:
+                    if not self.core.has_species(reactant):
                         all_core = False
                 for product in rxn.products:
-                    if product not in self.core.species:
+                    if not self.core.has_species(product):
                         all_core = False
                 if all_core:
                     rxn_list.append(rxn)
 
             # Move any identified reactions to the core
             for rxn in rxn_list:
-                self.add_reaction_to_core(rxn)
+                if not self.core.has_reaction(rxn):
+                    self.core.add_reaction(rxn)
                 logging.debug("Moving reaction from edge to core: {0}".format(rxn))
+            self.edge.remove_reactions(rxn_list)
         return rxn_list
 
     def add_species_to_edge(self, spec):
         """
         Add a species `spec` to the reaction model edge.
         """
-        self.edge.species.append(spec)
+        self.edge.add_species(spec)
 
     def set_thermodynamic_filtering_parameters(self, Tmax, thermo_tol_keep_spc_in_edge,
                                                min_core_size_for_prune, maximum_edge_species, reaction_systems):
@@ -1230,7 +1406,7 @@ class CoreEdgeReactionModel:
         prune_due_to_rate_counter = 0
         for index in indices:
             spec = prunable_species[index]
-            if spec in ineligible_species or not spec in self.edge.species:
+            if spec in ineligible_species or not self.edge.has_species(spec):
                 continue
             # Remove the species with rates below the pruning tolerance from the model edge
             if max_edge_species_rate_ratios[index] < tol_keep_in_edge:
@@ -1276,7 +1452,7 @@ class CoreEdgeReactionModel:
         """
 
         # remove the species
-        self.edge.species.remove(spec)
+        self.edge.remove_species(spec)
         self.index_species_dict.pop(spec.index)
 
         # clean up species references in reaction_systems
@@ -1301,8 +1477,9 @@ class CoreEdgeReactionModel:
             if spec in rxn.reactants or spec in rxn.products:
                 rxn_list.append(rxn)
         # remove those reactions
+        self.edge.remove_reactions(rxn_list)
         for rxn in rxn_list:
-            self.edge.reactions.remove(rxn)
+            self.duplicate_index.remove(rxn)
 
         # Remove the species from any unirxn networks it is in
         if self.pressure_dependence:
@@ -1345,6 +1522,7 @@ class CoreEdgeReactionModel:
 
         # remove from the global list of species, to free memory
         formula = spec.molecule[0].get_formula()
+        self.get_species_key_index(formula)[get_graph_hash(spec.molecule[0])].remove(spec)
         self.species_dict[formula].remove(spec)
         if spec in self.species_cache:
             self.species_cache.remove(spec)
@@ -1357,10 +1535,12 @@ class CoreEdgeReactionModel:
         ensure it is supposed to be a core reaction (i.e. all of its reactants
         AND all of its products are in the list of core species).
         """
-        if rxn not in self.core.reactions:
-            self.core.reactions.append(rxn)
-        if rxn in self.edge.reactions:
-            self.edge.reactions.remove(rxn)
+        if not self.core.has_reaction(rxn):
+            self.core.add_reaction(rxn)
+        if self.edge.has_reaction(rxn):
+            self.edge.remove_reaction(rxn)
+        if rxn not in self.duplicate_index:
+            self.duplicate_index.add(rxn)
 
     def add_reaction_to_edge(self, rxn):
         """
@@ -1370,7 +1550,9 @@ class CoreEdgeReactionModel:
         list of core species, and the others are in either the core or the
         edge).
         """
-        self.edge.reactions.append(rxn)
+        self.edge.add_reaction(rxn)
+        if rxn not in self.duplicate_index:
+            self.duplicate_index.add(rxn)
 
     def get_model_size(self):
         """
@@ -1608,12 +1790,11 @@ class CoreEdgeReactionModel:
                 self.add_reaction_to_edge(rxn)
 
         if self.save_edge_species:
-            from rmgpy.chemkin import mark_duplicate_reaction
             new_edge_reactions = self.edge.reactions[num_old_edge_reactions:]
-            checked_reactions = self.core.reactions + self.edge.reactions[:num_old_edge_reactions]
+            unchecked = set([id(rxn) for rxn in new_edge_reactions])
             for rxn in new_edge_reactions:
-                mark_duplicate_reaction(rxn, checked_reactions)
-                checked_reactions.append(rxn)
+                unchecked.discard(id(rxn))
+                self.duplicate_index.mark_duplicates(rxn, exclude=unchecked)
 
         self.log_enlarge_summary(
             new_core_species=[],
@@ -1638,7 +1819,7 @@ class CoreEdgeReactionModel:
                     self.output_reaction_list.append(rxn)
 
                     for species in rxn.reactants + rxn.products:
-                        if species not in self.core.species and species not in self.output_species_list:
+                        if not self.core.has_species(species) and species not in self.output_species_list:
                             self.output_species_list.append(species)
 
     def add_reaction_to_unimolecular_networks(self, newReaction, new_species, network=None):
@@ -1749,11 +1930,14 @@ class CoreEdgeReactionModel:
 
         # Iterate over all the networks, updating the invalid ones as necessary
         # self = reaction_model object
-        updated_networks = []
-        for network in self.network_list:
-            if not network.valid:
-                network.update(self, self.pressure_dependence)
-                updated_networks.append(network)
+        updated_networks = [network for network in self.network_list if not network.valid]
+        pool = self.reaction_pool if self.reaction_pool is not None and self.reaction_pool.running else None
+        if pool is None or count < 2:
+            # A single network is instead split by temperature among the workers
+            for network in updated_networks:
+                network.update(self, self.pressure_dependence, pool)
+        else:
+            self.update_networks_in_parallel(updated_networks, pool)
 
         # PDepReaction objects generated from partial networks are irreversible
         # However, it makes more sense to have reversible reactions in the core
@@ -1791,12 +1975,14 @@ class CoreEdgeReactionModel:
                         keep_first = dGrxn < 0
                         # Delete the PDepReaction that we aren't keeping
                         if keep_first:
-                            self.core.reactions.remove(reaction2)
+                            self.core.remove_reaction(reaction2)
+                            self.duplicate_index.remove(reaction2)
                             reaction.reversible = True
                         else:
-                            self.core.reactions.remove(reaction)
-                            self.core.reactions.remove(reaction2)
-                            self.core.reactions.insert(index, reaction2)
+                            self.core.remove_reaction(reaction)
+                            self.duplicate_index.remove(reaction)
+                            self.core.remove_reaction(reaction2)
+                            self.core.add_reaction(reaction2, index=index)
                             reaction2.reversible = True
                         core_reaction_count -= 1
                         # There should be only one reverse, so we can stop searching once we've found it
@@ -1806,6 +1992,37 @@ class CoreEdgeReactionModel:
             # Move to the next core reaction
             index += 1
 
+    def update_networks_in_parallel(self, networks, pool):
+        """
+        Update the invalid pressure-dependent `networks`, calculating their
+        :math:`k(T,P)` values in the processes of the worker `pool`.
+
+        Each network is first prepared in this process. The workers only
+        receive a snapshot of its configurations and path reactions, with the
+        cached :math:`k(E)` values the network used last time, and return the
+        fitted kinetics of its net reactions, the updated cache of densities
+        of states and the :math:`k(E)` values they looked up and computed.
+        The new :math:`k(E)` values are added to the cache of this process, so
+        that they are not lost if the network is next updated by another
+        worker. The results are applied to the networks in the order of
+        `networks`, so that the model is the same as if the networks were
+        updated one after another.
+        """
+        # The job is copied without the network it was last used for, which is not needed by the workers
+        pdep_settings = copy.copy(self.pressure_dependence)
+        pdep_settings.network = None
+
+        networks = [network for network in networks if network.prepare_update(self, self.pressure_dependence)]
+        results = pool.map(_calculate_network_kinetics,
+                           [(network.get_snapshot(), network.get_source_index(), pdep_settings,
+                             microcanonical_rate_cache.get_entries(network.micro_rates_keys))
+                            for network in networks], chunksize=1)
+        for network, (kinetics, K, dens_states_cache, keys, entries) in zip(networks, results):
+            network.dens_states_cache = dens_states_cache
+            network.micro_rates_keys = keys
+            microcanonical_rate_cache.add_entries(entries)
+            network.apply_update(self, self.pressure_dependence, kinetics, K)
+
     def mark_chemkin_duplicates(self):
         """
         Check that all reactions that will appear the chemkin output have been checked as duplicates.
@@ -1997,3 +2214,241 @@ def are_identical_species_references(rxn1, rxn2):
     identical_collider = rxn1.specific_collider == rxn2.specific_collider
 
     return (identical_same_direction or identical_opposite_directions) and identical_collider
+
+
+def rename_from_thermo_library(spc, thermo):
+    """
+    Rename the species `spc` if its `thermo` came from a thermo library
+    that has a name for it.
+    """
+    if thermo and thermo.label != '':
+        logging.info('Species {0} renamed {1} based on thermo library name'.format(spc.label, thermo.label))
+        spc.label = thermo.label
+
+
+def generate_kinetics(reaction, kinetics_estimator='rate rules', verbose_comments=False):
+    """
+    Generate best possible kinetics for the given `reaction` using the kinetics database
+    and the `kinetics_estimator` ('rate rules' or 'group additivity'). Long comments on
+    estimated kinetics are shortened unless `verbose_comments` is ``True``.
+
+    Returns the kinetics, their source and database entry, and whether they
+    are defined in the forward direction of `reaction`.
+    """
+    # Only reactions from families should be missing kinetics
+    assert isinstance(reaction, TemplateReaction)
+
+    forward, reverse, keep_reverse, reason = estimate_kinetics(reaction, kinetics_estimator=kinetics_estimator)
+    return select_kinetics(reaction, forward, reverse, keep_reverse, reason, verbose_comments=verbose_comments)
+
+
+def estimate_kinetics(reaction, kinetics_estimator='rate rules'):
+    """
+    Estimate the kinetics of the family `reaction` using the kinetics database
+    and the `kinetics_estimator`, and if the family is its own reverse, also
+    the kinetics of the reverse reaction. This only uses the structures of the
+    species, not their thermo, so it can be done before the thermo is known.
+
+    Returns the forward and reverse ``(kinetics, source, entry, is_forward)``
+    estimates, the latter ``None`` if there is no reverse reaction, whether to
+    keep the reverse kinetics, or ``None`` if the direction that is exergonic
+    at 298 K should be kept, and the reason for keeping the chosen direction.
+    These are passed to :func:`select_kinetics` to get the kinetics.
+    """
+    family = get_family_library_object(reaction.family)
+
+    # Get the kinetics for the reaction
+    forward = family.get_kinetics(reaction, template_labels=reaction.template, degeneracy=reaction.degeneracy,
+                                  estimator=kinetics_estimator, return_all_kinetics=False)
+    if not (family.own_reverse and hasattr(reaction, 'reverse') and reaction.reverse):
+        return forward, None, False, ''
+
+    # The kinetics family is its own reverse, so we could estimate kinetics in either direction
+    # First get the kinetics for the other direction
+    reverse = family.get_kinetics(reaction.reverse, template_labels=reaction.reverse.template,
+                                  degeneracy=reaction.reverse.degeneracy, estimator=kinetics_estimator,
+                                  return_all_kinetics=False)
+    kinetics, source, entry, is_forward = forward
+    rev_kinetics, rev_source, rev_entry, rev_is_forward = reverse
+
+    # Now decide which direction's kinetics to keep
+    # A keep_reverse of None keeps the direction that is exergonic at 298 K, which needs the thermo
+    keep_reverse = False
+    if entry is not None and rev_entry is None:
+        # Only the forward has an entry, meaning an exact match in a depository or template
+        # the reverse must have used an averaged estimated node - so use forward.
+        reason = "This direction matched an entry in {0}, the other was just an estimate.".format(reaction.family)
+    elif entry is None and rev_entry is not None:
+        # Only the reverse has an entry (see above) - use reverse.
+        keep_reverse = True
+        reason = "This direction matched an entry in {0}, the other was just an estimate.".format(reaction.family)
+    elif entry is not None and rev_entry is not None and entry is rev_entry:
+        # Both forward and reverse have the same source and entry
+        # Use the one for which the kinetics is the forward kinetics
+        keep_reverse = None
+        reason = "Both directions matched the same entry in {0}, but this direction is exergonic.".format(reaction.family)
+    elif kinetics_estimator == 'group additivity' and (kinetics.comment.find("Fitted to 1 rate") > 0
+                                                       and not rev_kinetics.comment.find("Fitted to 1 rate") > 0):
+        # forward kinetics were fitted to only 1 rate, but reverse are hopefully better
+        keep_reverse = True
+        reason = "Other direction matched a group only fitted to 1 rate."
+    elif kinetics_estimator == 'group additivity' and (not kinetics.comment.find("Fitted to 1 rate") > 0
+                                                       and rev_kinetics.comment.find("Fitted to 1 rate") > 0):
+        # reverse kinetics were fitted to only 1 rate, but forward are hopefully better
+        keep_reverse = False
+        reason = "Other direction matched a group only fitted to 1 rate."
+    elif entry is not None and rev_entry is not None:
+        # Both directions matched explicit rate rules
+        # Keep the direction with the lower (but nonzero) rank
+        if entry.rank < rev_entry.rank and entry.rank != 0:
+            keep_reverse = False
+            reason = "Both directions matched explicit rate rules, but this direction has a rule with a lower rank ({0} vs {1}).".format(
+                entry.rank, rev_entry.rank)
+        elif rev_entry.rank < entry.rank and rev_entry.rank != 0:
+            keep_reverse = True
+            reason = "Both directions matched explicit rate rules, but this direction has a rule with a lower rank ({0} vs {1}).".format(
+                rev_entry.rank, entry.rank)
+        # Otherwise keep the direction that is exergonic at 298 K
+        else:
+            keep_reverse = None
+            reason = "Both directions matched explicit rate rules, but this direction is exergonic."
+    else:
+        # Keep the direction that is exergonic at 298 K
+        keep_reverse = None
+        reason = "Both directions are estimates, but this direction is exergonic."
+
+    return forward, reverse, keep_reverse, reason
+
+
+def select_kinetics(reaction, forward, reverse, keep_reverse, reason, verbose_comments=False):
+    """
+    Choose the kinetics of the family `reaction` from the estimates returned
+    by :func:`estimate_kinetics`. Long comments on estimated kinetics are
+    shortened unless `verbose_comments` is ``True``.
+
+    Returns the kinetics, their source and database entry, and whether they
+    are defined in the forward direction of `reaction`.
+    """
+    kinetics, source, entry, is_forward = forward
+
+    if reverse is not None:
+        rev_kinetics, rev_source, rev_entry, rev_is_forward = reverse
+        # Get the gibbs free energy of reaction at 298 K
+        # This must be done after the thermo generation step
+        G298 = reaction.get_free_energy_of_reaction(298)
+        if keep_reverse is None:
+            gibbs_is_positive = G298 > -1e-8
+            keep_reverse = gibbs_is_positive and is_forward and rev_is_forward
+
+        if keep_reverse:
+            kinetics = rev_kinetics
+            source = rev_source
+            entry = rev_entry
+            is_forward = not rev_is_forward
+            G298 = -G298
+
+        if verbose_comments:
+            kinetics.comment += "\nKinetics were estimated in this direction instead of the reverse because:\n{0}".format(reason)
+            kinetics.comment += "\ndGrxn(298 K) = {0:.2f} kJ/mol".format(G298 / 1000.)
+
+    # The comments generated by the database for estimated kinetics can
+    # be quite long, and therefore not very useful
+    # We don't want to waste lots of memory storing these long, 
+    # uninformative strings, so here we replace them with much shorter ones
+    if not verbose_comments:
+        # Only keep a short comment (to save memory)
+        if 'Exact' in kinetics.comment:
+            # Exact match of rate rule
+            pass
+        elif 'Matched reaction' in kinetics.comment:
+            # Stems from matching a reaction from a depository
+            pass
+        else:
+            # Estimated (averaged) rate rule
+            kinetics.comment = kinetics.comment[kinetics.comment.find('Estimated'):]
+
+    return kinetics, source, entry, is_forward
+
+
+def get_kinetics_task(reaction):
+    """
+    Return the data needed to estimate the kinetics of the family `reaction`
+    with :func:`estimate_kinetics` in a worker process: the family label, the
+    resonance structures of the reactants and products, and the template and
+    degeneracy of the reaction and its reverse. Unlike the reaction itself,
+    this does not hold the species, so sending it to a worker does not read
+    their thermo, which may still be estimated by another worker.
+    """
+    reverse = reaction.reverse if hasattr(reaction, 'reverse') and reaction.reverse else None
+    return (reaction.family,
+            [list(spc.molecule) for spc in reaction.reactants],
+            [list(spc.molecule) for spc in reaction.products],
+            reaction.template, reaction.degeneracy,
+            (reverse.template, reverse.degeneracy) if reverse is not None else None)
+
+
+def _estimate_kinetics_batch(args):
+    """
+    Module-level function passed to the workers by
+    :meth:`CoreEdgeReactionModel.apply_kinetics_to_reactions`. Rebuilds the
+    reactions from a batch of tasks given by :func:`get_kinetics_task` and
+    returns a list of their estimates, as given by :func:`estimate_kinetics`
+    but without the sources and entries, and the ``(hits, misses)`` of the
+    worker's template kinetics caches for the batch.
+    """
+    tasks, kinetics_estimator = args
+    results = []
+    for family, reactants, products, template, degeneracy, reverse in tasks:
+        reaction = TemplateReaction(reactants=[Species(molecule=molecules) for molecules in reactants],
+                                    products=[Species(molecule=molecules) for molecules in products],
+                                    family=family, template=template, degeneracy=degeneracy)
+        if reverse is not None:
+            reaction.reverse = TemplateReaction(reactants=reaction.products, products=reaction.reactants,
+                                                family=family, template=reverse[0], degeneracy=reverse[1])
+        forward, reverse, keep_reverse, reason = estimate_kinetics(reaction, kinetics_estimator=kinetics_estimator)
+        # The sources and entries are not needed to apply the kinetics and are expensive to send back
+        forward = (forward[0], None, None, forward[3])
+        if reverse is not None:
+            reverse = (reverse[0], None, None, reverse[3])
+        results.append((forward, reverse, keep_reverse, reason))
+    return results, _pop_kinetics_cache_stats()
+
+
+def _calculate_network_kinetics(args):
+    """
+    Module-level function passed to the workers by
+    :meth:`CoreEdgeReactionModel.update_networks_in_parallel`. Returns the
+    fitted net reaction kinetics and the :math:`k(T,P)` values out of the
+    source of a network snapshot, as given by
+    :func:`rmgpy.rmg.pdep.calculate_network_kinetics`, the cache of
+    densities of states of the snapshot, and the keys looked up in and the
+    entries added to the worker's
+    :data:`rmgpy.pdep.cache.microcanonical_rate_cache`, after adding the
+    cached entries sent with the task.
+    """
+    network, source, pdep_settings, entries = args
+    microcanonical_rate_cache.add_entries(entries)
+    microcanonical_rate_cache.start_recording()
+    try:
+        kinetics, K = calculate_network_kinetics(network, source, pdep_settings)
+    finally:
+        keys, new_entries = microcanonical_rate_cache.stop_recording()
+    return kinetics, K, network.dens_states_cache, keys, new_entries
+
+
+def _pop_kinetics_cache_stats():
+    """
+    Return the total ``(hits, misses)`` of the template kinetics caches of the
+    kinetics families in this process since the last call, and reset them.
+    """
+    hits = misses = 0
+    try:
+        families = get_db('kinetics').families
+    except (DatabaseError, AttributeError):
+        # The kinetics database has not been loaded
+        return hits, misses
+    for family in families.values():
+        family_hits, family_misses = family.pop_kinetics_cache_stats()
+        hits += family_hits
+        misses += family_misses
+    return hits, misses
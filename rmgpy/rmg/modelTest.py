@@ -29,7 +29,9 @@
 
 import itertools
 import os
+import threading
 import unittest
+from unittest import mock
 
 import numpy as np
 from nose.plugins.attrib import attr
@@ -40,10 +42,13 @@ from rmgpy.data.kinetics.family import TemplateReaction
 from rmgpy.data.rmg import RMGDatabase
 from rmgpy.data.thermo import NASA, NASAPolynomial
 from rmgpy.molecule import Molecule
+from rmgpy.pdep.network import Network
 from rmgpy.rmg.main import RMG
-from rmgpy.rmg.model import CoreEdgeReactionModel
-from rmgpy.rmg.react import react
+from rmgpy.reaction import Reaction
+from rmgpy.rmg.model import CoreEdgeReactionModel, ReactionModel
+from rmgpy.rmg.react import ReactionWorkerPool, react
 from rmgpy.species import Species
+from rmgpy.thermo.thermoengine import ThermoFuture
 
 
 ###################################################
@@ -95,6 +100,79 @@ class TestSpecies(unittest.TestCase):
         rmgpy.data.rmg.database = None
 
 
+class TestReactionModel(unittest.TestCase):
+    """
+    Contains unit tests of the ReactionModel class.
+    """
+
+    def setUp(self):
+        """
+        A method that is run before each unit test in this class.
+        """
+        self.spcs = [Species(label='A'), Species(label='B'), Species(label='C')]
+        self.rxns = [Reaction(reactants=[self.spcs[0]], products=[self.spcs[1]]),
+                     Reaction(reactants=[self.spcs[1]], products=[self.spcs[2]])]
+        self.model = ReactionModel(species=self.spcs[:2], reactions=self.rxns[:1])
+
+    def test_membership(self):
+        """
+        Test that species and reactions are found in the model by identity
+        """
+        self.assertTrue(self.model.has_species(self.spcs[0]))
+        self.assertFalse(self.model.has_species(self.spcs[2]))
+        self.assertFalse(self.model.has_species(Species(label='A')))
+        self.assertTrue(self.model.has_reaction(self.rxns[0]))
+        self.assertFalse(self.model.has_reaction(self.rxns[1]))
+
+    def test_add_and_remove(self):
+        """
+        Test that the indices stay in sync with the lists when adding and removing
+        """
+        self.model.add_species(self.spcs[2])
+        self.model.add_reaction(self.rxns[1], index=0)
+        self.assertTrue(self.model.has_species(self.spcs[2]))
+        self.assertEqual(self.model.reactions, [self.rxns[1], self.rxns[0]])
+
+        self.model.remove_species(self.spcs[0])
+        self.model.remove_reaction(self.rxns[1])
+        self.assertFalse(self.model.has_species(self.spcs[0]))
+        self.assertFalse(self.model.has_reaction(self.rxns[1]))
+        self.assertEqual(self.model.species, self.spcs[1:])
+
+        self.model.remove_reactions([self.rxns[0]])
+        self.assertEqual(self.model.reactions, [])
+        self.assertFalse(self.model.has_reaction(self.rxns[0]))
+
+    def test_list_api(self):
+        """
+        Test that the species and reactions are still plain lists which can be reassigned or modified directly
+        """
+        self.assertIs(type(self.model.species), list)
+        self.model.species = [self.spcs[2]]
+        self.assertTrue(self.model.has_species(self.spcs[2]))
+        self.assertFalse(self.model.has_species(self.spcs[0]))
+
+        # Replacing one species by another directly keeps the length of the list
+        self.model.species[0] = self.spcs[0]
+        self.model.invalidate_indices()
+        self.assertTrue(self.model.has_species(self.spcs[0]))
+        self.assertFalse(self.model.has_species(self.spcs[2]))
+
+    def test_remove_then_add(self):
+        """
+        Test that the indices are correct after removing one object and adding another of the same kind
+        """
+        self.model.remove_species(self.spcs[0])
+        self.model.add_species(self.spcs[2])
+        self.assertFalse(self.model.has_species(self.spcs[0]))
+        self.assertTrue(self.model.has_species(self.spcs[2]))
+
+        self.model.remove_reaction(self.rxns[0])
+        self.model.add_reaction(self.rxns[1])
+        self.assertFalse(self.model.has_reaction(self.rxns[0]))
+        self.assertTrue(self.model.has_reaction(self.rxns[1]))
+
+
 class TestCoreEdgeReactionModel(unittest.TestCase):
     """
     Contains unit tests of the CoreEdgeReactionModel class.
@@ -222,6 +300,50 @@ class TestCoreEdgeReactionModel(unittest.TestCase):
         self.assertEquals(len(cerm.species_dict), len(spcs) - 1)
         self.assertEquals(len(cerm.index_species_dict), len(spcs) - 1)
 
+    def test_check_for_existing_species(self):
+        """
+        Test that CoreEdgeReactionModel.check_for_existing_species finds species by graph hash
+        and counts the lookups.
+        """
+        cerm = CoreEdgeReactionModel()
+
+        spcs = [Species().from_smiles('CCC[CH2]'),
+                Species().from_smiles('C[CH]CC'),
+                Species().from_smiles('CC(C)[CH2]')]
+
+        for spc in spcs:
+            cerm.make_new_species(spc)
+        cerm.species_cache = [None for i in range(4)]
+        cerm.pop_species_lookup_stats()
+
+        self.assertEqual(len(cerm.species_dict['C4H9']), 3)
+        for i, spc in enumerate(spcs):
+            self.assertIs(cerm.check_for_existing_species(spc.molecule[0]), cerm.species_dict['C4H9'][i])
+        self.assertIsNone(cerm.check_for_existing_species(Molecule().from_smiles('C[C](C)C')))
+
+        stats = cerm.pop_species_lookup_stats()
+        self.assertEqual(stats['hits'], 3)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(cerm.species_lookup_stats['hits'], 0)
+
+        # a species removed from the edge is no longer found, while a new one of the same formula is,
+        # even though the number of species with that formula is unchanged
+        removed = cerm.species_dict['C4H9'][0]
+        cerm.add_species_to_edge(removed)
+        cerm.remove_species_from_edge([], removed)
+        self.assertIsNone(cerm.check_for_existing_species(Molecule().from_smiles('CCC[CH2]')))
+        spc, is_new = cerm.make_new_species(Molecule().from_smiles('C[C](C)C'))
+        self.assertTrue(is_new)
+        self.assertEqual(len(cerm.species_dict['C4H9']), 3)
+        self.assertIs(cerm.check_for_existing_species(Molecule().from_smiles('C[C](C)C')), spc)
+        self.assertIsNone(cerm.check_for_existing_species(Molecule().from_smiles('CCC[CH2]')))
+
+        # species put directly in the formula list are found once the index is invalidated
+        spc = Species().from_smiles('CCC[CH2]')
+        cerm.species_dict['C4H9'][0] = spc
+        cerm.invalidate_species_key_index('C4H9')
+        self.assertIs(cerm.check_for_existing_species(Molecule().from_smiles('CCC[CH2]')), spc)
+
     def test_append_unreactive_structure(self):
         """
         Test that CERM.make_new_species correctly recognizes a non-representative resonance structure
@@ -650,6 +772,177 @@ class TestCoreEdgeReactionModel(unittest.TestCase):
 
 
 @attr('functional')
+class TestApplyKineticsToReactions(unittest.TestCase):
+    """
+    Contains unit tests for CoreEdgeReactionModel.apply_kinetics_to_reactions.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        A method that is run ONCE before all unit tests in this class.
+        """
+        cls.database = RMGDatabase()
+        cls.database.load(
+            path=settings['database.directory'],
+            thermo_libraries=['primaryThermoLibrary'],
+            kinetics_families=['H_Abstraction'],
+            reaction_libraries=[],
+        )
+
+    def generate_reactions(self):
+        """
+        Return a new list of H abstraction reactions without kinetics.
+        """
+        spc_a = Species().from_smiles('[OH]')
+        spcs = [Species().from_smiles(smiles) for smiles in ['CC', '[CH3]', 'CCO', 'C=CC']]
+        for spc in [spc_a] + spcs:
+            spc.generate_resonance_structures()
+            spc.thermo = self.database.thermo.get_thermo_data(spc)
+        spc_tuples = [((spc_a, spc), ['H_Abstraction']) for spc in spcs]
+        return list(itertools.chain.from_iterable(react(spc_tuples, 1)))
+
+    def test_pool_matches_serial(self):
+        """
+        Test that estimating kinetics with the worker pool gives the same reactions, in the same order
+        and direction and with the same kinetics, as estimating them serially
+        """
+        serial_reactions = self.generate_reactions()
+        cerm = CoreEdgeReactionModel()
+        self.assertIsNone(cerm.reaction_pool)
+        cerm.apply_kinetics_to_reactions(serial_reactions)
+
+        pool_reactions = self.generate_reactions()
+        cerm = CoreEdgeReactionModel()
+        cerm.reaction_pool = ReactionWorkerPool(2, database=self.database)
+        with cerm.reaction_pool:
+            self.assertTrue(cerm.reaction_pool.running)
+            # Make sure that the reactions are not estimated serially because there are too few
+            self.assertGreater(len(pool_reactions), cerm.reaction_pool.procnum)
+            cerm.apply_kinetics_to_reactions(pool_reactions)
+
+        self.assertEqual(len(pool_reactions), len(serial_reactions))
+        for serial_rxn, pool_rxn in zip(serial_reactions, pool_reactions):
+            self.assertEqual([spc.smiles for spc in pool_rxn.reactants], [spc.smiles for spc in serial_rxn.reactants])
+            self.assertEqual([spc.smiles for spc in pool_rxn.products], [spc.smiles for spc in serial_rxn.products])
+            self.assertEqual(pool_rxn.degeneracy, serial_rxn.degeneracy)
+            self.assertEqual(pool_rxn.template, serial_rxn.template)
+            self.assertTrue(pool_rxn.kinetics.is_identical_to(serial_rxn.kinetics))
+            self.assertEqual(pool_rxn.kinetics.comment, serial_rxn.kinetics.comment)
+
+    def test_pool_with_pending_thermo(self):
+        """
+        Test that the kinetics can be estimated with the worker pool while the thermo of the species is still
+        being estimated by the workers, and that the thermo is then collected on the main thread
+        """
+        def get_species(reactions):
+            species = {}
+            for rxn in reactions:
+                for spc in rxn.reactants + rxn.products:
+                    species[id(spc)] = spc
+            return list(species.values())
+
+        serial_reactions = self.generate_reactions()
+        cerm = CoreEdgeReactionModel()
+        for spc in get_species(serial_reactions):
+            spc.thermo = None
+            cerm.generate_thermo(spc)
+        cerm.apply_kinetics_to_reactions(serial_reactions)
+
+        threads = []
+        result = ThermoFuture.result
+
+        def record_result(future):
+            threads.append(threading.current_thread())
+            return result(future)
+
+        pool_reactions = self.generate_reactions()
+        pool_species = get_species(pool_reactions)
+        cerm = CoreEdgeReactionModel()
+        cerm.reaction_pool = ReactionWorkerPool(2, database=self.database)
+        with cerm.reaction_pool, mock.patch.object(ThermoFuture, 'result', record_result):
+            for spc in pool_species:
+                spc.thermo = None
+                cerm.generate_thermo(spc, pool=cerm.reaction_pool)
+            for spc in pool_species:
+                self.assertIsInstance(spc._thermo, ThermoFuture)
+            cerm.apply_kinetics_to_reactions(pool_reactions)
+
+        self.assertEqual(len(threads), len(pool_species))
+        for thread in threads:
+            self.assertIs(thread, threading.main_thread())
+        for serial_rxn, pool_rxn in zip(serial_reactions, pool_reactions):
+            self.assertEqual([spc.smiles for spc in pool_rxn.reactants], [spc.smiles for spc in serial_rxn.reactants])
+            self.assertEqual([spc.smiles for spc in pool_rxn.products], [spc.smiles for spc in serial_rxn.products])
+            self.assertTrue(pool_rxn.kinetics.is_identical_to(serial_rxn.kinetics))
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        A method that is run ONCE after all unit tests in this class.
+
+        Clear global variables.
+        """
+        import rmgpy.data.rmg
+        rmgpy.data.rmg.database = None
+
+
+class TestGenerateThermo(unittest.TestCase):
+    """
+    Contains unit tests for CoreEdgeReactionModel.generate_thermo.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        A method that is run ONCE before all unit tests in this class.
+        """
+        cls.database = RMGDatabase()
+        cls.database.load(
+            path=settings['database.directory'],
+            thermo_libraries=['primaryThermoLibrary'],
+            kinetics_families='none',
+            reaction_libraries=[],
+        )
+
+    def test_pool_matches_serial(self):
+        """
+        Test that estimating thermo with the worker pool gives the same thermo and leaves the same
+        resonance structures, in the same order, as estimating it serially
+        """
+        smiles = ['[CH2]C=C', 'C=CC=C[CH2]', '[O]C=C', 'Cc1ccccc1', 'C=C[CH]C(=O)C']
+        serial_species = [Species().from_smiles(smi) for smi in smiles]
+        cerm = CoreEdgeReactionModel()
+        for spc in serial_species:
+            cerm.generate_thermo(spc)
+
+        pool_species = [Species().from_smiles(smi) for smi in smiles]
+        cerm = CoreEdgeReactionModel()
+        cerm.reaction_pool = ReactionWorkerPool(2, database=self.database)
+        with cerm.reaction_pool:
+            for spc in pool_species:
+                cerm.generate_thermo(spc, pool=cerm.reaction_pool)
+            for spc in pool_species:
+                self.assertIsInstance(spc._thermo, ThermoFuture)
+                spc.get_thermo_data()
+
+        for serial_spc, pool_spc in zip(serial_species, pool_species):
+            self.assertEqual([mol.to_adjacency_list() for mol in pool_spc.molecule],
+                             [mol.to_adjacency_list() for mol in serial_spc.molecule])
+            self.assertAlmostEqual(pool_spc.get_enthalpy(298), serial_spc.get_enthalpy(298), 6)
+            self.assertEqual(pool_spc.conformer.E0.value_si, serial_spc.conformer.E0.value_si)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        A method that is run ONCE after all unit tests in this class.
+
+        Clear global variables.
+        """
+        import rmgpy.data.rmg
+        rmgpy.data.rmg.database = None
+
+
 class TestEnlarge(unittest.TestCase):
     """
     Contains unit tests for CoreEdgeReactionModel.enlarge.
@@ -751,6 +1044,25 @@ class TestEnlarge(unittest.TestCase):
         self.assertEqual(len(list(self.rmg.reaction_model.network_dict.keys())[0]), 1)
         self.assertEqual(list(self.rmg.reaction_model.network_dict.keys())[0][0].label, 'C2H4')
 
+    def test_enlarge_5_update_network_with_pool(self):
+        """Test that updating a single pdep network uses the worker pool without restarting it"""
+        reaction_model = self.rmg.reaction_model
+        network = reaction_model.network_list[0]
+        network.valid = False
+        reaction_model.reaction_pool = ReactionWorkerPool(2, database=self.rmg.database)
+        try:
+            with reaction_model.reaction_pool as pool:
+                workers = pool._pool
+                with mock.patch.object(Network, 'calculate_rate_coefficients', autospec=True,
+                                       side_effect=Network.calculate_rate_coefficients) as calculate:
+                    reaction_model.update_unimolecular_reaction_networks()
+                self.assertTrue(network.valid)
+                self.assertIs(calculate.call_args[1]['pool'], pool)
+                self.assertTrue(pool.running)
+                self.assertIs(pool._pool, workers)
+        finally:
+            reaction_model.reaction_pool = None
+
     @classmethod
     def tearDownClass(cls):
         """
@@ -162,6 +162,10 @@ class PDepNetwork(rmgpy.pdep.network.Network):
         self.dens_states = None
         self.coll_freq = None
         self.Mcoll = None
+        self.Pcoll = None
+        self.phi_coll = None
+        # The collision model state refers to the arrays above, which would otherwise be kept alive
+        self._collision_model_state = None
         self.Kij = None
         self.Fim = None
         self.Gnj = None
@@ -643,6 +647,9 @@ class PDepNetwork(rmgpy.pdep.network.Network):
             if not found:
                 self.net_reactions.append(reaction)
 
+        # Keep sending the k(E) values used by either network to the workers
+        self.micro_rates_keys.update(other.micro_rates_keys)
+
         # Mark this network as invalid
         self.valid = False
 
@@ -682,7 +689,7 @@ class PDepNetwork(rmgpy.pdep.network.Network):
                 products.append(rxn.reactants)
             elif len(rxn.reactants) > 1 and rxn.reactants not in reactants and rxn.reactants not in products:
                 # We've encountered bimolecular reactants that are not classified
-                if all([reactant in reaction_model.core.species for reactant in rxn.reactants]):
+                if all([reaction_model.core.has_species(reactant) for reactant in rxn.reactants]):
                     # Both reactants are in the core, so treat as reactant channel
                     reactants.append(rxn.reactants)
                 else:
@@ -695,7 +702,7 @@ class PDepNetwork(rmgpy.pdep.network.Network):
                 products.append(rxn.products)
             elif len(rxn.products) > 1 and rxn.products not in reactants and rxn.products not in products:
                 # We've encountered bimolecular products that are not classified
-                if all([product in reaction_model.core.species for product in rxn.products]):
+                if all([reaction_model.core.has_species(product) for product in rxn.products]):
                     # Both products are in the core, so treat as reactant channel
                     reactants.append(rxn.products)
                 else:
@@ -715,10 +722,24 @@ class PDepNetwork(rmgpy.pdep.network.Network):
         for product in products:
             self.products.append(Configuration(*product))
 
-    def update(self, reaction_model, pdep_settings):
+    def update(self, reaction_model, pdep_settings, pool=None):
         """
         Regenerate the :math:`k(T,P)` values for this partial network if the
-        network is marked as invalid.
+        network is marked as invalid, using the worker processes of `pool`,
+        if given, to compute the values at different temperatures.
+        """
+        if not self.prepare_update(reaction_model, pdep_settings):
+            return
+        kinetics, K = calculate_network_kinetics(self, self.get_source_index(), pdep_settings, pool)
+        self.apply_update(reaction_model, pdep_settings, kinetics, K)
+
+    def prepare_update(self, reaction_model, pdep_settings):
+        """
+        Prepare this partial network for a :math:`k(T,P)` calculation by
+        updating its configurations and generating the statmech data and
+        transition state energies of the path reactions. Returns ``True`` if
+        the network is invalid and has explored wells, i.e. if its
+        :math:`k(T,P)` values must be recalculated.
         """
         from rmgpy.kinetics import Arrhenius, KineticsData, MultiArrhenius
 
@@ -729,17 +750,6 @@ class PDepNetwork(rmgpy.pdep.network.Network):
 
         Tmin = job.Tmin.value_si
         Tmax = job.Tmax.value_si
-        Pmin = job.Pmin.value_si
-        Pmax = job.Pmax.value_si
-        Tlist = job.Tlist.value_si
-        Plist = job.Plist.value_si
-        maximum_grain_size = job.maximum_grain_size.value_si if job.maximum_grain_size is not None else 0.0
-        minimum_grain_count = job.minimum_grain_count
-        method = job.method
-        interpolation_model = job.interpolation_model
-        active_j_rotor = job.active_j_rotor
-        active_k_rotor = job.active_k_rotor
-        rmgmode = job.rmgmode
 
         # Figure out which configurations are isomers, reactant channels, and product channels
         self.update_configurations(reaction_model)
@@ -755,10 +765,10 @@ class PDepNetwork(rmgpy.pdep.network.Network):
 
         # Do nothing if the network is already valid
         if self.valid:
-            return
+            return False
         # Do nothing if there are no explored wells
         if len(self.explored) == 0 and len(self.source) > 1:
-            return
+            return False
         # Log the network being updated
         logging.info("Updating {0!s}".format(self))
 
@@ -835,12 +845,41 @@ class PDepNetwork(rmgpy.pdep.network.Network):
                 os.path.join(output_directory, 'pdep', 'network{0:d}_{1:d}.py'.format(self.index, len(self.isomers))))
 
         self.log_summary(level=logging.INFO)
+        return True
 
-        # Calculate the rate coefficients
-        self.initialize(Tmin, Tmax, Pmin, Pmax, maximum_grain_size, minimum_grain_count, active_j_rotor, active_k_rotor,
-                        rmgmode)
-        K = self.calculate_rate_coefficients(Tlist, Plist, method)
+    def get_source_index(self):
+        """
+        Return the index of the source configuration in the list of isomers,
+        reactant channels and product channels of the network.
+        """
+        configurations = []
+        configurations.extend([isom.species[:] for isom in self.isomers])
+        configurations.extend([reactant.species[:] for reactant in self.reactants])
+        configurations.extend([product.species[:] for product in self.products])
+        return configurations.index(self.source)
+
+    def get_snapshot(self):
+        """
+        Return a :class:`rmgpy.pdep.network.Network` holding only the
+        configurations, path reactions and bath gas of this network, which is
+        all that :func:`calculate_network_kinetics` needs. The snapshot does not
+        refer to the explored species or the net reactions, so it can be sent
+        to a worker process without pickling the rest of the reaction model.
+        The snapshot shares the cached densities of states of this network.
+        """
+        snapshot = rmgpy.pdep.network.Network(label=self.label, isomers=self.isomers, reactants=self.reactants,
+                                              products=self.products, path_reactions=self.path_reactions,
+                                              bath_gas=self.bath_gas)
+        snapshot.dens_states_cache = self.dens_states_cache
+        return snapshot
 
+    def apply_update(self, reaction_model, pdep_settings, kinetics, K):
+        """
+        Set the fitted `kinetics` of the net reactions out of the source
+        configuration, as returned with the :math:`k(T,P)` values `K` by
+        :func:`calculate_network_kinetics`, adding any new net reactions to
+        the core or edge of the `reaction_model`, and mark the network as valid.
+        """
         # Generate PDepReaction objects
         configurations = []
         configurations.extend([isom.species[:] for isom in self.isomers])
@@ -848,7 +887,9 @@ class PDepNetwork(rmgpy.pdep.network.Network):
         configurations.extend([product.species[:] for product in self.products])
         j = configurations.index(self.source)
 
-        for i in range(K.shape[2]):
+        Tlist = pdep_settings.Tlist.value_si
+        Plist = pdep_settings.Plist.value_si
+        for i in range(len(kinetics)):
             if i != j:
                 # Find the path reaction
                 net_reaction = None
@@ -868,8 +909,8 @@ class PDepNetwork(rmgpy.pdep.network.Network):
 
                     # Place the net reaction in the core or edge if necessary
                     # Note that leak reactions are not placed in the edge
-                    if all([s in reaction_model.core.species for s in net_reaction.reactants]) \
-                            and all([s in reaction_model.core.species for s in net_reaction.products]):
+                    if all([reaction_model.core.has_species(s) for s in net_reaction.reactants]) \
+                            and all([reaction_model.core.has_species(s) for s in net_reaction.products]):
                         # Check whether netReaction already exists in the core as a LibraryReaction
                         for rxn in reaction_model.core.reactions:
                             if isinstance(rxn, LibraryReaction) \
@@ -894,12 +935,8 @@ class PDepNetwork(rmgpy.pdep.network.Network):
                         else:
                             reaction_model.add_reaction_to_edge(net_reaction)
 
-                # Set/update the net reaction kinetics using interpolation model
-                kdata = K[:, :, i, j].copy()
-                order = len(net_reaction.reactants)
-                kdata *= 1e6 ** (order - 1)
-                kunits = {1: 's^-1', 2: 'cm^3/(mol*s)', 3: 'cm^6/(mol^2*s)'}[order]
-                net_reaction.kinetics = job.fit_interpolation_model(Tlist, Plist, kdata, kunits)
+                # Set/update the net reaction kinetics fitted to the interpolation model
+                net_reaction.kinetics = kinetics[i]
 
                 # Check: For each net reaction that has a path reaction, make
                 # sure the k(T,P) values for the net reaction do not exceed
@@ -923,10 +960,10 @@ class PDepNetwork(rmgpy.pdep.network.Network):
                             kinf = pathReaction.network_kinetics.get_rate_coefficient(Tlist[t])
                         else:
                             kinf = pathReaction.kinetics.get_rate_coefficient(Tlist[t])
-                        if K[t, p, i, j] > 2 * kinf:  # To allow for a small discretization error
+                        if K[t, p, i] > 2 * kinf:  # To allow for a small discretization error
                             logging.warning('k(T,P) for net reaction {0} exceeds high-P k(T) by {1:g} at {2:g} K, '
-                                            '{3:g} bar'.format(net_reaction, K[t, p, i, j] / kinf, Tlist[t], Plist[p] / 1e5))
-                            logging.info('    k(T,P) = {0:9.2e}    k(T) = {1:9.2e}'.format(K[t, p, i, j], kinf))
+                                            '{3:g} bar'.format(net_reaction, K[t, p, i] / kinf, Tlist[t], Plist[p] / 1e5))
+                            logging.info('    k(T,P) = {0:9.2e}    k(T) = {1:9.2e}'.format(K[t, p, i], kinf))
                         break
                     elif pathReaction.products == net_reaction.reactants and pathReaction.reactants == net_reaction.products:
                         if pathReaction.network_kinetics is not None:
@@ -935,10 +972,10 @@ class PDepNetwork(rmgpy.pdep.network.Network):
                         else:
                             kinf = pathReaction.kinetics.get_rate_coefficient(
                                 Tlist[t]) / pathReaction.get_equilibrium_constant(Tlist[t])
-                        if K[t, p, i, j] > 2 * kinf:  # To allow for a small discretization error
+                        if K[t, p, i] > 2 * kinf:  # To allow for a small discretization error
                             logging.warning('k(T,P) for net reaction {0} exceeds high-P k(T) by {1:g} at {2:g} K, '
-                                            '{3:g} bar'.format(net_reaction, K[t, p, i, j] / kinf, Tlist[t], Plist[p] / 1e5))
-                            logging.info('    k(T,P) = {0:9.2e}    k(T) = {1:9.2e}'.format(K[t, p, i, j], kinf))
+                                            '{3:g} bar'.format(net_reaction, K[t, p, i] / kinf, Tlist[t], Plist[p] / 1e5))
+                            logging.info('    k(T,P) = {0:9.2e}    k(T) = {1:9.2e}'.format(K[t, p, i], kinf))
                         break
 
         # Delete intermediate arrays to conserve memory
@@ -946,3 +983,40 @@ class PDepNetwork(rmgpy.pdep.network.Network):
 
         # We're done processing this network, so mark it as valid
         self.valid = True
+
+
+def calculate_network_kinetics(network, source, pdep_settings, pool=None):
+    """
+    Calculate the :math:`k(T,P)` values of the prepared `network` on the
+    temperature and pressure grid of the `pdep_settings` job, and fit the
+    interpolation model of the job to those of each net reaction out of the
+    configuration with index `source`. Returns a list of the fitted kinetics
+    for each configuration, with ``None`` for the source, and an array of the
+    :math:`k(T,P)` values out of the source indexed by temperature, pressure
+    and configuration. The values at different temperatures are computed
+    by the worker processes of `pool`, if given.
+
+    Only the `network` is modified, so this can be called with a snapshot
+    from :meth:`PDepNetwork.get_snapshot` in a worker process.
+    """
+    job = pdep_settings
+    maximum_grain_size = job.maximum_grain_size.value_si if job.maximum_grain_size is not None else 0.0
+    Tlist = job.Tlist.value_si
+    Plist = job.Plist.value_si
+
+    network.initialize(job.Tmin.value_si, job.Tmax.value_si, job.Pmin.value_si, job.Pmax.value_si,
+                       maximum_grain_size, job.minimum_grain_count, job.active_j_rotor, job.active_k_rotor,
+                       job.rmgmode)
+    K = network.calculate_rate_coefficients(Tlist, Plist, job.method, pool=pool)
+
+    configurations = network.isomers + network.reactants + network.products
+    order = len(configurations[source].species)
+    kunits = {1: 's^-1', 2: 'cm^3/(mol*s)', 3: 'cm^6/(mol^2*s)'}[order]
+    kinetics = []
+    for i in range(K.shape[2]):
+        if i == source:
+            kinetics.append(None)
+        else:
+            kdata = K[:, :, i, source] * 1e6 ** (order - 1)
+            kinetics.append(job.fit_interpolation_model(Tlist, Plist, kdata, kunits))
+    return kinetics, K[:, :, :, source].copy()
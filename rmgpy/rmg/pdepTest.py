@@ -28,15 +28,19 @@
 ###############################################################################
 
 import logging
+import pickle
 import unittest
 from copy import deepcopy
 
+import numpy as np
+
+from arkane.pdep import PressureDependenceJob
 from rmgpy.kinetics.arrhenius import Arrhenius
 from rmgpy.pdep.collision import SingleExponentialDown
 from rmgpy.pdep.configuration import Configuration
 from rmgpy.pdep.network import Network
 from rmgpy.reaction import Reaction
-from rmgpy.rmg.pdep import PDepNetwork
+from rmgpy.rmg.pdep import PDepNetwork, calculate_network_kinetics
 from rmgpy.species import Species, TransitionState
 from rmgpy.statmech.conformer import Conformer
 from rmgpy.statmech.rotation import NonlinearRotor
@@ -194,6 +198,30 @@ class TestPdep(unittest.TestCase):
         prods = self.pdepnetwork.get_rate_filtered_products(1000.0, 100000.0, 1.0)
         self.assertEquals(len(prods), 0)
 
+    def test_calculate_network_kinetics_from_snapshot(self):
+        """
+        Test that the k(T,P) values calculated from a pickled network snapshot,
+        as done by the worker processes, match those of the network itself.
+        """
+        job = PressureDependenceJob(network=None, Tmin=(300, 'K'), Tmax=(2000, 'K'), Tcount=4,
+                                    Pmin=(0.01, 'bar'), Pmax=(100, 'bar'), Pcount=3,
+                                    maximumGrainSize=(0.5, 'kcal/mol'), minimumGrainCount=250,
+                                    method='modified strong collision', interpolationModel=('chebyshev', 3, 3))
+        source = self.pdepnetwork.get_source_index()
+        self.assertEqual(source, 0)
+
+        snapshot = pickle.loads(pickle.dumps(self.pdepnetwork.get_snapshot(), -1))
+        self.assertNotIsInstance(snapshot, PDepNetwork)
+        snapshot_kinetics, snapshot_K = calculate_network_kinetics(snapshot, source, job)
+        kinetics, K = calculate_network_kinetics(self.pdepnetwork, source, job)
+
+        self.assertEqual(K.shape, (4, 3, 2))
+        self.assertTrue(np.allclose(snapshot_K, K, rtol=1e-10, atol=0))
+        self.assertIsNone(kinetics[0])
+        self.assertIsNone(snapshot_kinetics[0])
+        self.assertAlmostEqual(snapshot_kinetics[1].get_rate_coefficient(1000, 1e5) /
+                               kinetics[1].get_rate_coefficient(1000, 1e5), 1.0, places=8)
+
 
 if __name__ == '__main__':
     unittest.main()
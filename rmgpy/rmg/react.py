@@ -31,15 +31,121 @@
 Contains functions for generating reactions.
 """
 import logging
+import math
 from multiprocessing import Pool
 
+import rmgpy.data.rmg
 from rmgpy.data.rmg import get_db
+from rmgpy.rmg.scheduler import ReactionCostModel, get_task_key, pack_tasks
 
 
 ################################################################################
 
 
-def react(spc_fam_tuples, procnum=1):
+class ReactionWorkerPool(object):
+    """
+    A long-lived pool of worker processes used for reaction generation and
+    thermo estimation.
+
+    The RMG database is handed to each worker exactly once, when the worker
+    is started, so that it does not have to be re-pickled or re-forked every
+    time :func:`react` is called. The pool is meant to be owned by the
+    :class:`~rmgpy.rmg.main.RMG` job, kept alive across iterations, and shut
+    down when the job finishes. The attributes are:
+
+    =================== ========================================================
+    Attribute           Description
+    =================== ========================================================
+    `procnum`           The number of worker processes
+    `tasks_per_worker`  The approximate number of chunks each worker receives per map call
+    =================== ========================================================
+
+    """
+
+    def __init__(self, procnum, database=None, tasks_per_worker=4):
+        self.procnum = procnum
+        self.tasks_per_worker = tasks_per_worker
+        self._database = database
+        self._pool = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    @property
+    def running(self):
+        """``True`` if the worker processes have been started and not yet shut down."""
+        return self._pool is not None
+
+    def start(self):
+        """
+        Start the worker processes if they are not running already.
+        """
+        if self._pool is None:
+            database = self._database if self._database is not None else rmgpy.data.rmg.database
+            logging.info('Starting {0} worker processes for reaction generation.'.format(self.procnum))
+            self._pool = Pool(processes=self.procnum, initializer=_initialize_worker, initargs=(database,))
+
+    def map(self, func, iterable, chunksize=None):
+        """
+        Apply `func` to every item of `iterable` using the worker processes and
+        return the list of results in the same order as `iterable`.
+
+        The work is split into many small chunks which are handed out to
+        whichever worker becomes idle first, so that a few expensive items
+        do not leave the other workers waiting on a single blocking map.
+        If `chunksize` is not given, each worker receives roughly
+        `tasks_per_worker` chunks.
+        """
+        self.start()
+        items = list(iterable)
+        if chunksize is None:
+            chunksize = get_chunk_size(len(items), self.procnum, self.tasks_per_worker)
+        return list(self._pool.imap(func, items, chunksize=chunksize))
+
+    def apply_async(self, func, args=()):
+        """
+        Submit a single call of `func` with the arguments `args` to the worker
+        processes, returning a :class:`multiprocessing.pool.AsyncResult`.
+        """
+        self.start()
+        return self._pool.apply_async(func, args)
+
+    def shutdown(self):
+        """
+        Stop the worker processes and wait for them to exit.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+
+def _initialize_worker(database):
+    """
+    Store the RMG database in the module namespace of a new worker process,
+    discarding any generation times inherited from the parent process so that
+    they are not reported twice.
+    """
+    if database is not None:
+        rmgpy.data.rmg.database = database
+    if rmgpy.data.rmg.database is not None and rmgpy.data.rmg.database.kinetics is not None:
+        for family in rmgpy.data.rmg.database.kinetics.families.values():
+            family.generation_times = {}
+
+
+def get_chunk_size(num_tasks, procnum, tasks_per_worker=4):
+    """
+    Return the number of tasks to submit to a worker at once, so that each of
+    the `procnum` workers receives roughly `tasks_per_worker` chunks.
+    """
+    return max(1, num_tasks // (procnum * tasks_per_worker))
+
+
+def react(spc_fam_tuples, procnum=1, pool=None, costs=None, cost_model=None):
     """
     Generate reactions between the species in the list of species-family tuples
     for the optionally specified reaction families.
@@ -51,25 +157,59 @@ def react(spc_fam_tuples, procnum=1):
 
     If no family list is provided, all of the loaded families are considered.
 
+    For parallel processing, the tuples are packed into batches of similar
+    predicted cost, which are submitted to the workers from the most to the
+    least expensive.
+
     Args:
         spc_fam_tuples (list): list of tuples for reaction generation
         procnum (int, optional): number of processors used for reaction generation
+        pool (ReactionWorkerPool, optional): persistent worker pool to use if `procnum` is greater than one
+        costs (list, optional): predicted cost of each tuple, used to balance the batches
+        cost_model (ReactionCostModel, optional): cost model updated with the measured generation times
 
     Returns:
         list of lists of reactions generated from each species tuple (note: empty lists are possible)
     """
-    # Execute multiprocessing map. It blocks until the result is ready.
-    # This method chops the iterable into a number of chunks which it
-    # submits to the process pool as separate tasks.
     if procnum == 1:
         logging.info('For reaction generation {0} process is used.'.format(procnum))
         reactions = list(map(_react_species_star, spc_fam_tuples))
+        if cost_model is not None:
+            cost_model.collect(get_db('kinetics').families)
+        return reactions
+
+    if costs is None:
+        costs = [1.0] * len(spc_fam_tuples)
+
+    # Take the generation times recorded so far in this process before dispatching, since the
+    # workers report the times recorded on their own copies of the families
+    families = get_db('kinetics').families
+    if cost_model is not None:
+        cost_model.collect(families)
+    else:
+        for family in families.values():
+            family.generation_times = {}
+
+    if pool is not None:
+        logging.info('For reaction generation {0} processes are used.'.format(pool.procnum))
+        batches = pack_tasks(costs, pool.procnum * pool.tasks_per_worker)
+        results = pool.map(_react_batch, [[spc_fam_tuples[i] for i in batch] for batch in batches], chunksize=1)
     else:
+        # No persistent pool was provided, so use a temporary one for this call only
         logging.info('For reaction generation {0} processes are used.'.format(procnum))
-        p = Pool(processes=procnum)
-        reactions = p.map(_react_species_star, spc_fam_tuples)
-        p.close()
-        p.join()
+        with ReactionWorkerPool(procnum) as temp_pool:
+            batches = pack_tasks(costs, temp_pool.procnum * temp_pool.tasks_per_worker)
+            results = temp_pool.map(_react_batch, [[spc_fam_tuples[i] for i in batch] for batch in batches],
+                                    chunksize=1)
+
+    # Put the reactions back in the order of the input tuples
+    reactions = [None] * len(spc_fam_tuples)
+    for batch, (batch_reactions, timings) in zip(batches, results):
+        for index, rxn_list in zip(batch, batch_reactions):
+            reactions[index] = rxn_list
+        if cost_model is not None:
+            for label, family_timings in timings.items():
+                cost_model.update(label, family_timings)
 
     return reactions
 
@@ -79,6 +219,21 @@ def _react_species_star(args):
     return react_species(*args)
 
 
+def _react_batch(batch):
+    """
+    React each of the species-family tuples in `batch` in a worker process.
+    Returns the list of reaction lists together with the generation times
+    recorded by each family while doing so.
+    """
+    reactions = [_react_species_star(args) for args in batch]
+    timings = {}
+    for label, family in get_db('kinetics').families.items():
+        if family.generation_times:
+            timings[label] = family.generation_times
+            family.generation_times = {}
+    return reactions, timings
+
+
 def react_species(species_tuple, only_families=None):
     """
     Given a tuple of Species objects, generates all possible reactions
@@ -96,12 +251,15 @@ def react_species(species_tuple, only_families=None):
     return reactions
 
 
-def react_all(core_spc_list, num_old_core_species, unimolecular_react, bimolecular_react, trimolecular_react=None, procnum=1):
+def react_all(core_spc_list, num_old_core_species, unimolecular_react, bimolecular_react, trimolecular_react=None,
+              procnum=1, pool=None, cost_model=None):
     """
     Reacts the core species list via uni-, bi-, and trimolecular reactions.
 
-    For parallel processing, reaction families are split per task for improved
-    load balancing. This is currently hard-coded using reaction family labels.
+    For parallel processing, the cost of reacting each species tuple with each
+    reaction family is predicted from the generation times measured so far.
+    Tuples which are predicted to take much longer than an average batch have
+    their reaction families split over several tasks for improved load balancing.
 
     Args:
         core_spc_list (list): list of all core species
@@ -110,6 +268,8 @@ def react_all(core_spc_list, num_old_core_species, unimolecular_react, bimolecul
         bimolecular_react (np.ndarray): reaction filter flags indicating which species to react bimolecularly
         trimolecular_react (np.ndarray, optional): reaction filter flags indicating which species to react trimolecularly
         procnum (int, optional): number of processors used for reaction generation
+        pool (ReactionWorkerPool, optional): persistent worker pool used for parallel reaction generation
+        cost_model (ReactionCostModel, optional): measured generation times used to balance parallel tasks
 
     Returns:
         a list of lists of reactions generated from each species tuple
@@ -136,37 +296,112 @@ def react_all(core_spc_list, num_old_core_species, unimolecular_react, bimolecul
                         if core_spc_list[i].reactive and core_spc_list[j].reactive and core_spc_list[k].reactive:
                             spc_tuples.append((core_spc_list[i], core_spc_list[j], core_spc_list[k]))
 
+    if cost_model is None:
+        cost_model = ReactionCostModel()
+
     if procnum == 1:
         # React all families like normal (provide empty argument for only_families)
         spc_fam_tuples = list(zip(spc_tuples))
+        costs = None
     else:
-        # Identify and split families that are prone to generate many reactions into sublists.
-        family_list = list(get_db('kinetics').families.keys())
-        major_families = [
-            'H_Abstraction', 'R_Recombination', 'Intra_Disproportionation', 'Intra_RH_Add_Endocyclic',
-            'Singlet_Carbene_Intra_Disproportionation', 'Intra_ene_reaction', 'Disproportionation',
-            '1,4_Linear_birad_scission', 'R_Addition_MultipleBond', '2+2_cycloaddition_Cd', 'Diels_alder_addition',
-            'Intra_RH_Add_Exocyclic', 'Intra_Retro_Diels_alder_bicyclic', 'Intra_2+2_cycloaddition_Cd',
-            'Birad_recombination', 'Intra_Diels_alder_monocyclic', '1,4_Cyclic_birad_scission', '1,2_Insertion_carbene',
-        ]
-
-        split_list = []
-        leftovers = []
-        for fam in family_list:
-            if fam in major_families:
-                split_list.append([fam])
-            else:
-                leftovers.append(fam)
-        split_list.append(leftovers)
-
-        # Only employ family splitting for reactants that have a larger number than min_atoms
-        min_atoms = 10
-        spc_fam_tuples = []
-        for i, spc_tuple in enumerate(spc_tuples):
-            if any([len(spc.molecule[0].atoms) > min_atoms for spc in spc_tuple]):
-                for item in split_list:
-                    spc_fam_tuples.append((spc_tuple, item))
-            else:
-                spc_fam_tuples.append((spc_tuple,))
-
-    return react(spc_fam_tuples, procnum), [fam_tuple[0] for fam_tuple in spc_fam_tuples]
+        spc_fam_tuples, costs = split_tasks(spc_tuples, procnum, cost_model,
+                                            tasks_per_worker=pool.tasks_per_worker if pool is not None else 4)
+
+    return (react(spc_fam_tuples, procnum, pool=pool, costs=costs, cost_model=cost_model),
+            [fam_tuple[0] for fam_tuple in spc_fam_tuples])
+
+
+def split_tasks(spc_tuples, procnum, cost_model, tasks_per_worker=4):
+    """
+    Turn the list of species tuples into species-family tuples for parallel
+    reaction generation, using the `cost_model` to predict the cost of each.
+
+    Any species tuple whose predicted cost exceeds the average cost of one of the
+    ``procnum * tasks_per_worker`` batches has its reaction families divided
+    into several groups of similar cost, each of which becomes a separate task.
+    All other species tuples are reacted with every family in a single task.
+    Until any generation times have been measured, the families that are
+    known to generate many reactions are split off instead for species tuples
+    with more than ten atoms in a species.
+
+    Returns:
+        a list of species-family tuples
+        a list of the predicted cost of each species-family tuple
+    """
+    family_labels = list(get_db('kinetics').families.keys())
+
+    if len(cost_model) == 0:
+        return _split_major_families(spc_tuples, family_labels)
+
+    # Predict the cost of each family for each species tuple. Tuples of the same
+    # size share their predictions, so only compute them once per size.
+    predictions = {}
+    family_costs = []
+    for spc_tuple in spc_tuples:
+        task_key = get_task_key(spc_tuple)
+        try:
+            family_costs.append(predictions[task_key])
+        except KeyError:
+            predictions[task_key] = cost_model.estimate_families(task_key, family_labels)
+            family_costs.append(predictions[task_key])
+    tuple_costs = [sum(costs) for costs in family_costs]
+    max_task_cost = sum(tuple_costs) / (procnum * tasks_per_worker)
+
+    spc_fam_tuples = []
+    costs = []
+    for spc_tuple, fam_costs, tuple_cost in zip(spc_tuples, family_costs, tuple_costs):
+        if tuple_cost > max_task_cost and len(family_labels) > 1:
+            num_groups = min(len(family_labels), int(math.ceil(tuple_cost / max_task_cost)))
+            for group in pack_tasks(fam_costs, num_groups):
+                spc_fam_tuples.append((spc_tuple, [family_labels[i] for i in sorted(group)]))
+                costs.append(sum([fam_costs[i] for i in group]))
+        else:
+            spc_fam_tuples.append((spc_tuple,))
+            costs.append(tuple_cost)
+
+    return spc_fam_tuples, costs
+
+
+def _split_major_families(spc_tuples, family_labels):
+    """
+    Turn the list of species tuples into species-family tuples for parallel
+    reaction generation without any measured generation times, reacting each
+    family that is prone to generate many reactions in a separate task for
+    species tuples with more than ten atoms in a species.
+
+    Returns:
+        a list of species-family tuples
+        a list of the predicted cost of each species-family tuple
+    """
+    major_families = [
+        'H_Abstraction', 'R_Recombination', 'Intra_Disproportionation', 'Intra_RH_Add_Endocyclic',
+        'Singlet_Carbene_Intra_Disproportionation', 'Intra_ene_reaction', 'Disproportionation',
+        '1,4_Linear_birad_scission', 'R_Addition_MultipleBond', '2+2_cycloaddition_Cd', 'Diels_alder_addition',
+        'Intra_RH_Add_Exocyclic', 'Intra_Retro_Diels_alder_bicyclic', 'Intra_2+2_cycloaddition_Cd',
+        'Birad_recombination', 'Intra_Diels_alder_monocyclic', '1,4_Cyclic_birad_scission', '1,2_Insertion_carbene',
+    ]
+
+    split_list = []
+    leftovers = []
+    for fam in family_labels:
+        if fam in major_families:
+            split_list.append([fam])
+        else:
+            leftovers.append(fam)
+    split_list.append(leftovers)
+
+    # Only employ family splitting for reactants that have a larger number than min_atoms
+    min_atoms = 10
+    spc_fam_tuples = []
+    costs = []
+    for spc_tuple in spc_tuples:
+        num_atoms = sum([len(spc.molecule[0].atoms) for spc in spc_tuple])
+        if any([len(spc.molecule[0].atoms) > min_atoms for spc in spc_tuple]):
+            for item in split_list:
+                spc_fam_tuples.append((spc_tuple, item))
+                costs.append(float(num_atoms * len(item)) / len(family_labels))
+        else:
+            spc_fam_tuples.append((spc_tuple,))
+            costs.append(float(num_atoms))
+
+    return spc_fam_tuples, costs
@@ -37,7 +37,8 @@ from rmgpy import settings
 from rmgpy.data.kinetics import TemplateReaction
 from rmgpy.data.rmg import RMGDatabase
 from rmgpy.rmg.main import RMG
-from rmgpy.rmg.react import react, react_all
+from rmgpy.rmg.react import ReactionWorkerPool, get_chunk_size, react, react_all, split_tasks
+from rmgpy.rmg.scheduler import ReactionCostModel
 from rmgpy.species import Species
 
 ###################################################
@@ -152,6 +153,92 @@ class TestReact(unittest.TestCase):
         # Reset module level maxproc back to default
         rmgpy.rmg.main.maxproc = 1
 
+    def test_react_persistent_pool(self):
+        """
+        Test that a ``ReactionWorkerPool`` can be reused across several calls to ``react``
+        """
+        procnum = 2
+
+        spc_a = Species().from_smiles('[OH]')
+        spcs = [Species().from_smiles('CC'), Species().from_smiles('[CH3]')]
+        spc_tuples = [((spc_a, spc), ['H_Abstraction']) for spc in spcs]
+
+        pool = ReactionWorkerPool(procnum, database=self.rmg.database)
+        pool.start()
+        self.assertTrue(pool.running)
+        try:
+            for _ in range(2):
+                reaction_list = list(itertools.chain.from_iterable(react(spc_tuples, procnum, pool=pool)))
+                self.assertEqual(len(reaction_list), 3)
+                self.assertTrue(all([isinstance(rxn, TemplateReaction) for rxn in reaction_list]))
+        finally:
+            pool.shutdown()
+        self.assertFalse(pool.running)
+
+    def test_react_all_records_costs(self):
+        """
+        Test that ``react_all`` records reaction generation times in the cost model
+        """
+        procnum = 1
+
+        spcs = [
+            Species().from_smiles('C=C'),
+            Species().from_smiles('[CH3]'),
+        ]
+        n = len(spcs)
+        cost_model = ReactionCostModel()
+        react_all(spcs, n, np.ones(n), np.ones([n, n]), None, procnum, cost_model=cost_model)
+
+        self.assertEqual(set(cost_model.timings.keys()), set(TESTFAMILIES))
+        for family in self.rmg.database.kinetics.families.values():
+            self.assertEqual(family.generation_times, {})
+
+    def test_react_parallel_records_costs_once(self):
+        """
+        Test that generation times recorded before a parallel ``react`` call are only counted once
+        """
+        procnum = 2
+
+        spc_a = Species().from_smiles('[OH]')
+        spcs = [Species().from_smiles('CC'), Species().from_smiles('[CH3]')]
+        spc_tuples = [((spc_a, spc), ['H_Abstraction']) for spc in spcs]
+
+        family = self.rmg.database.kinetics.families['H_Abstraction']
+        family.generation_times = {(99, 0): [1, 5.0]}
+        cost_model = ReactionCostModel()
+        react(spc_tuples, procnum, cost_model=cost_model)
+
+        self.assertEqual(cost_model.timings['H_Abstraction'][(99, 0)], [1, 5.0])
+        self.assertEqual(family.generation_times, {})
+
+    def test_split_tasks(self):
+        """
+        Test that ``split_tasks`` splits the families of an expensive species tuple over several tasks
+        """
+        spcs = [
+            Species().from_smiles('[CH3]'),
+            Species().from_smiles('CCCCCCCCCCC'),
+        ]
+        cost_model = ReactionCostModel()
+        for label in TESTFAMILIES:
+            cost_model.update(label, {(1, 0): [1, 1e-3], (11, 0): [1, 1.0]})
+
+        spc_fam_tuples, costs = split_tasks([(spc,) for spc in spcs], 2, cost_model, tasks_per_worker=1)
+        self.assertEqual(len(spc_fam_tuples), len(costs))
+        self.assertEqual(spc_fam_tuples[0], ((spcs[0],),))
+        split = [fam_tuple for fam_tuple in spc_fam_tuples if fam_tuple[0][0] is spcs[1]]
+        self.assertGreater(len(split), 1)
+        self.assertEqual(sorted([label for fam_tuple in split for label in fam_tuple[1]]), sorted(TESTFAMILIES))
+
+    def test_get_chunk_size(self):
+        """
+        Test that tasks are split into several chunks per worker
+        """
+        self.assertEqual(get_chunk_size(0, 4), 1)
+        self.assertEqual(get_chunk_size(10, 4), 1)
+        self.assertEqual(get_chunk_size(160, 4), 10)
+        self.assertEqual(get_chunk_size(160, 4, tasks_per_worker=1), 40)
+
     def tearDown(self):
         """
         Reset the loaded database
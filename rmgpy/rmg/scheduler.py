@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+Contains a cost model and scheduling helpers used to balance parallel
+reaction generation.
+"""
+
+import heapq
+import logging
+import os
+
+import yaml
+
+from rmgpy.data.kinetics.common import get_reactant_size_key
+
+
+################################################################################
+
+
+class ReactionCostModel(object):
+    """
+    A table of measured reaction generation times, used to predict how long a
+    reaction family takes to react a given set of species. Timings are stored
+    per reaction family and indexed by the number of heavy atoms and rings of
+    the reactants, as recorded by
+    :meth:`rmgpy.data.kinetics.family.KineticsFamily.record_generation_time`.
+    The attributes are:
+
+    =================== ========================================================
+    Attribute           Description
+    =================== ========================================================
+    `timings`           A dict of ``{family label: {(heavy atoms, rings): [count, seconds]}}``
+    `default_cost`      The estimated time in seconds per heavy atom used when nothing has been measured
+    =================== ========================================================
+
+    """
+
+    def __init__(self, default_cost=1e-3):
+        self.timings = {}
+        self.default_cost = default_cost
+
+    def __len__(self):
+        return sum([len(family_timings) for family_timings in self.timings.values()])
+
+    def update(self, family_label, timings):
+        """
+        Merge the `timings` dictionary measured for the family `family_label` into the table.
+        """
+        family_timings = self.timings.setdefault(family_label, {})
+        for key, (count, seconds) in timings.items():
+            try:
+                timing = family_timings[key]
+            except KeyError:
+                family_timings[key] = [count, seconds]
+            else:
+                timing[0] += count
+                timing[1] += seconds
+
+    def collect(self, families):
+        """
+        Move the generation times recorded on each of the :class:`KineticsFamily`
+        objects in the `families` dictionary into the table.
+        """
+        for label, family in families.items():
+            if family.generation_times:
+                self.update(label, family.generation_times)
+                family.generation_times = {}
+
+    def estimate(self, family_label, key):
+        """
+        Return the predicted time in seconds for the family `family_label` to
+        react one combination of reactants described by `key`, a
+        ``(heavy atoms, rings)`` tuple. If that exact combination has not been
+        measured, the closest measured one is scaled by the number of heavy atoms.
+        """
+        heavy_atoms, rings = key
+        family_timings = self.timings.get(family_label)
+        if not family_timings:
+            return self.default_cost * (heavy_atoms + 1)
+        try:
+            count, seconds = family_timings[key]
+        except KeyError:
+            nearest = min(family_timings, key=lambda k: (abs(k[0] - heavy_atoms) + 2 * abs(k[1] - rings), k))
+            count, seconds = family_timings[nearest]
+            return seconds / count * (heavy_atoms + 1) / (nearest[0] + 1)
+        return seconds / count
+
+    def estimate_families(self, task_key, family_labels):
+        """
+        Return a list of the predicted times in seconds for each family in
+        `family_labels` to react a species tuple described by `task_key`, as
+        returned by :func:`get_task_key`.
+        """
+        key, num_combos = task_key
+        return [num_combos * self.estimate(label, key) for label in family_labels]
+
+    def save(self, path):
+        """
+        Save the table to a YAML file at `path`.
+        """
+        data = {}
+        for label, family_timings in self.timings.items():
+            data[label] = [[key[0], key[1], timing[0], timing[1]]
+                           for key, timing in sorted(family_timings.items())]
+        with open(path, 'w') as f:
+            yaml.safe_dump(data, stream=f)
+
+    def load(self, path):
+        """
+        Load a table previously saved at `path` and merge it into this one.
+        Nothing is done if the file does not exist.
+        """
+        if not os.path.exists(path):
+            return
+        with open(path, 'r') as f:
+            data = yaml.safe_load(stream=f) or {}
+        for label, family_timings in data.items():
+            self.update(label, {(heavy_atoms, rings): [count, seconds]
+                                for heavy_atoms, rings, count, seconds in family_timings})
+        logging.info('Loaded reaction generation timings for {0:d} families from {1}'.format(len(data), path))
+
+
+def get_task_key(spc_tuple):
+    """
+    Return a ``((heavy atoms, rings), combinations)`` tuple describing the
+    cost of reacting the species in `spc_tuple`, where `combinations` is the
+    number of combinations of their resonance structures.
+    """
+    key = get_reactant_size_key([spc.molecule[0] for spc in spc_tuple])
+    num_combos = 1
+    for spc in spc_tuple:
+        num_combos *= len(spc.molecule)
+    return key, num_combos
+
+
+def pack_tasks(costs, num_batches):
+    """
+    Distribute tasks with the predicted `costs` into at most `num_batches`
+    batches of similar total cost, using the longest-processing-time-first
+    rule: tasks are taken in order of decreasing cost and each is placed in
+    the batch with the lowest total cost so far.
+
+    Returns a list of batches, each a list of task indices, ordered from the
+    most to the least expensive batch. Empty batches are omitted.
+    """
+    num_batches = max(1, min(num_batches, len(costs)))
+    heap = [(0.0, i) for i in range(num_batches)]
+    batches = [[] for _ in range(num_batches)]
+    loads = [0.0] * num_batches
+    for index in sorted(range(len(costs)), key=lambda i: costs[i], reverse=True):
+        load, batch = heapq.heappop(heap)
+        batches[batch].append(index)
+        loads[batch] = load + costs[index]
+        heapq.heappush(heap, (loads[batch], batch))
+    order = sorted(range(num_batches), key=lambda i: loads[i], reverse=True)
+    return [batches[i] for i in order if batches[i]]
+
+
+def group_tasks(keys, batch_size):
+    """
+    Group the indices of tasks with the same key, given by the list `keys`,
+    into batches of at most `batch_size` tasks, so that tasks which share
+    data (e.g. reactions of the same family) are handled by the same worker.
+
+    Returns a list of batches, each a list of task indices in increasing
+    order, ordered from the largest to the smallest batch.
+    """
+    groups = {}
+    for index, key in enumerate(keys):
+        groups.setdefault(key, []).append(index)
+    batches = []
+    for group in groups.values():
+        batches.extend([group[i:i + batch_size] for i in range(0, len(group), batch_size)])
+    batches.sort(key=len, reverse=True)
+    return batches
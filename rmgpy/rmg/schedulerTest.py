@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+This script contains unit tests of the :mod:`rmgpy.rmg.scheduler` module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from rmgpy.rmg.scheduler import ReactionCostModel, get_task_key, group_tasks, pack_tasks
+from rmgpy.species import Species
+
+
+################################################################################
+
+class TestReactionCostModel(unittest.TestCase):
+    """
+    Contains unit tests of the ReactionCostModel class.
+    """
+
+    def setUp(self):
+        """
+        A method that is run before each unit test in this class.
+        """
+        self.cost_model = ReactionCostModel(default_cost=1e-3)
+        self.cost_model.update('H_Abstraction', {(2, 0): [2, 0.2], (6, 1): [1, 1.0]})
+
+    def test_update(self):
+        """
+        Test that timings are accumulated when merged into the table
+        """
+        self.cost_model.update('H_Abstraction', {(2, 0): [1, 0.1]})
+        self.assertEqual(self.cost_model.timings['H_Abstraction'][(2, 0)], [3, 0.3])
+        self.assertEqual(len(self.cost_model), 2)
+
+    def test_estimate(self):
+        """
+        Test that costs are predicted from the measured timings
+        """
+        # Measured
+        self.assertAlmostEqual(self.cost_model.estimate('H_Abstraction', (2, 0)), 0.1)
+        # Scaled from the closest measurement
+        self.assertAlmostEqual(self.cost_model.estimate('H_Abstraction', (5, 0)), 0.1 * 6 / 3)
+        # Not measured for this family
+        self.assertAlmostEqual(self.cost_model.estimate('R_Recombination', (5, 0)), 6e-3)
+
+    def test_estimate_families(self):
+        """
+        Test that costs of a species tuple account for all resonance structure combinations
+        """
+        spc = Species().from_smiles('C=CC=C[CH2]')
+        spc.generate_resonance_structures()
+        task_key = get_task_key((spc,))
+        self.assertEqual(task_key, ((5, 0), len(spc.molecule)))
+        costs = self.cost_model.estimate_families(task_key, ['H_Abstraction', 'R_Recombination'])
+        self.assertEqual(len(costs), 2)
+        self.assertAlmostEqual(costs[1], len(spc.molecule) * 6e-3)
+
+    def test_save_and_load(self):
+        """
+        Test that the table can be saved and loaded again
+        """
+        folder = tempfile.mkdtemp()
+        try:
+            path = os.path.join(folder, 'reaction_costs.yml')
+            self.cost_model.save(path)
+            cost_model = ReactionCostModel()
+            cost_model.load(path)
+            self.assertEqual(cost_model.timings, self.cost_model.timings)
+        finally:
+            shutil.rmtree(folder)
+
+    def test_load_missing_file(self):
+        """
+        Test that loading a file which does not exist leaves the table empty
+        """
+        cost_model = ReactionCostModel()
+        cost_model.load('nonexistent_reaction_costs.yml')
+        self.assertEqual(len(cost_model), 0)
+
+
+class TestPackTasks(unittest.TestCase):
+    """
+    Contains unit tests of the pack_tasks function.
+    """
+
+    def test_pack_tasks(self):
+        """
+        Test that tasks are packed longest first into balanced batches
+        """
+        batches = pack_tasks([5.0, 1.0, 4.0, 3.0, 3.0, 2.0], 2)
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(sorted([i for batch in batches for i in batch]), list(range(6)))
+        self.assertEqual(batches[0][0], 0)
+        loads = [sum([[5.0, 1.0, 4.0, 3.0, 3.0, 2.0][i] for i in batch]) for batch in batches]
+        self.assertEqual(loads, [9.0, 9.0])
+
+    def test_pack_tasks_fewer_tasks_than_batches(self):
+        """
+        Test that no empty batches are returned
+        """
+        self.assertEqual(pack_tasks([1.0, 2.0], 8), [[1], [0]])
+        self.assertEqual(pack_tasks([], 8), [])
+
+
+class TestGroupTasks(unittest.TestCase):
+    """
+    Contains unit tests of the group_tasks function.
+    """
+
+    def test_group_tasks(self):
+        """
+        Test that tasks are grouped by key into batches of limited size
+        """
+        keys = ['a', 'b', 'a', 'a', 'c', 'b', 'a']
+        batches = group_tasks(keys, 3)
+        self.assertEqual(batches, [[0, 2, 3], [1, 5], [6], [4]])
+        for batch in batches:
+            self.assertEqual(len(set([keys[i] for i in batch])), 1)
+        self.assertEqual(group_tasks([], 3), [])
+
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
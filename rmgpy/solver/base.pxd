@@ -56,13 +56,23 @@ cdef class ReactionSystem(DASx):
     cdef public np.ndarray reactant_indices
     cdef public np.ndarray product_indices
     cdef public np.ndarray network_indices
+    cdef public tuple previous_model
+    cdef public np.ndarray reaction_map
 
     # matrices that cache kinetic and rate data
     cdef public np.ndarray kf  # forward rate coefficients
     cdef public np.ndarray kb  # reverse rate coefficients
     cdef public np.ndarray Keq  # equilibrium constants
+    cdef public tuple kinetics_table
     cdef public np.ndarray network_leak_coefficients
     cdef public np.ndarray jacobian_matrix
+    cdef public np.ndarray iteration_matrix
+    cdef public tuple jacobian_pattern
+    cdef public tuple sparse_jacobian
+
+    # matrices and work arrays for the vectorized residual
+    cdef public bint vectorized_residual
+    cdef public tuple rate_matrices
 
     cdef public np.ndarray core_species_concentrations
     
@@ -81,6 +91,9 @@ cdef class ReactionSystem(DASx):
 
     cdef public np.ndarray network_leak_rates    
 
+    # whether the residual computes the edge rates
+    cdef public bint compute_edge_rates
+
     # variables that cache maximum rate (ratio) data
     cdef public np.ndarray max_edge_species_rate_ratios
     cdef public np.ndarray max_network_leak_rate_ratios
@@ -96,6 +109,7 @@ cdef class ReactionSystem(DASx):
     cdef public np.ndarray sensitivity_coefficients
     cdef public list sensitive_species
     cdef public double sensitivity_threshold
+    cdef public str sensitivity_method
     # cdef public np.ndarray senpar
 
     # tolerance settings
@@ -40,6 +40,8 @@ import logging
 import cython
 import numpy as np
 cimport numpy as np
+import scipy.integrate
+import scipy.sparse
 from cpython cimport bool
 
 include "settings.pxi"
@@ -53,9 +55,14 @@ else:
 import rmgpy.constants as constants
 cimport rmgpy.constants as constants
 from rmgpy.chemkin import get_species_identifier
+from rmgpy.exceptions import ReactionError
+from rmgpy.kinetics.arrhenius import Arrhenius
+from rmgpy.kinetics.chebyshev import Chebyshev
+from rmgpy.kinetics.diffusionLimited import diffusion_limiter
 from rmgpy.reaction import Reaction
 from rmgpy.quantity import Quantity
 from rmgpy.species import Species
+from rmgpy.thermo.nasa import NASA
 
 ################################################################################
 
@@ -119,12 +126,53 @@ cdef class ReactionSystem(DASx):
 
         self.network_indices = None
 
+        """
+        The index arrays, packed kinetic and thermodynamic parameters, and rate
+        coefficients of the model at the last call to :meth:`initialize_model`,
+        stored by :meth:`save_model_state`, and the previous index of each
+        reaction of the current model (or -1 for new reactions). Only the new
+        species and reactions are indexed when the model is updated, and only
+        the rate coefficients of the reactions whose parameters changed are
+        recomputed. The species and reactions of the
+        previous model are identified by ``id()`` and are not kept alive. Set
+        `previous_model` to None to rebuild everything from scratch.
+        """
+        self.previous_model = None
+        self.reaction_map = None
+
         # matrices that cache kinetic and rate data
         self.kf = None  # forward rate coefficients
         self.kb = None  # reverse rate coefficients
         self.Keq = None  # equilibrium constants
         self.network_leak_coefficients = None
+
+        """
+        The kinetic and thermodynamic parameters of the model packed into
+        arrays by :meth:`generate_kinetics_table`, from which
+        :meth:`evaluate_kinetics_table` computes the rate coefficients. When
+        the model is updated, they are compared with those of the previous
+        model by :meth:`reuse_rate_coefficients`.
+        """
+        self.kinetics_table = None
         self.jacobian_matrix = None
+        self.iteration_matrix = None
+
+        """
+        The sparsity pattern of the analytical Jacobian of the core species,
+        generated by :meth:`generate_jacobian_pattern` whenever the core
+        changes, and the most recent Jacobian assembled with it by
+        :meth:`compute_sparse_jacobian`.
+        """
+        self.jacobian_pattern = None
+        self.sparse_jacobian = None
+
+        """
+        If `vectorized_residual` is set, the residual computes the reaction
+        and species rates with the matrices generated by
+        :meth:`generate_rate_matrices` instead of looping over the reactions.
+        """
+        self.vectorized_residual = False
+        self.rate_matrices = None
 
         self.core_species_concentrations = None
 
@@ -138,6 +186,14 @@ cdef class ReactionSystem(DASx):
 
         self.network_leak_rates = None
 
+        """
+        If `compute_edge_rates` is not set, the residual only computes the
+        rates of the core, which are all that the solver needs. This is done
+        while integrating in :meth:`simulate`, and the edge rates are then
+        computed by :meth:`compute_step_rates` after every successful step.
+        """
+        self.compute_edge_rates = True
+
         #surface indices
         self.surface_species_indices = None
         self.surface_reaction_indices = None
@@ -160,6 +216,14 @@ cdef class ReactionSystem(DASx):
         self.sensitivity_threshold = sensitivity_threshold
         self.senpar = None
 
+        """
+        The `sensitivity_method` is ``'forward'`` to integrate the sensitivity
+        equations of every parameter with DASPK, or ``'adjoint'`` to integrate
+        one adjoint system per sensitive species backwards in time instead,
+        see :meth:`compute_adjoint_sensitivities`.
+        """
+        self.sensitivity_method = 'forward'
+
         # tolerance settings
 
         """
@@ -240,9 +304,9 @@ cdef class ReactionSystem(DASx):
         self.kb = np.zeros_like(self.kf)
         self.Keq = np.zeros_like(self.kf)
 
-        self.generate_species_indices(core_species, edge_species)
-        self.generate_reaction_indices(core_reactions, edge_reactions)
-        self.generate_reactant_product_indices(core_reactions, edge_reactions)
+        self.update_model_indices(core_species, core_reactions, edge_species, edge_reactions)
+        self.generate_jacobian_pattern()
+        self.generate_rate_matrices()
 
         self.core_species_concentrations = np.zeros((self.num_core_species), np.float64)
         self.core_species_production_rates = np.zeros((self.num_core_species), np.float64)
@@ -252,6 +316,7 @@ cdef class ReactionSystem(DASx):
         self.core_species_rates = np.zeros((self.num_core_species), np.float64)
         self.edge_species_rates = np.zeros((self.num_edge_species), np.float64)
         self.network_leak_rates = np.zeros((self.num_pdep_networks), np.float64)
+        self.compute_edge_rates = True
         self.max_network_leak_rate_ratios = np.zeros((len(self.prunable_networks)), np.float64)
         self.sensitivity_coefficients = np.zeros((self.num_core_species, self.num_core_reactions), np.float64)
         self.unimolecular_threshold = np.zeros((self.num_core_species), bool)
@@ -385,6 +450,7 @@ cdef class ReactionSystem(DASx):
             self.senpar = np.zeros(self.num_core_reactions + self.num_core_species, np.float64)
 
         else:
+            self.sensitivity = False
             self.neq = self.num_core_species
 
             self.atol_array = np.ones(self.neq, np.float64) * atol
@@ -416,6 +482,624 @@ cdef class ReactionSystem(DASx):
                 i = self.get_species_index(spec)
                 self.product_indices[j, l] = i
 
+    def generate_jacobian_pattern(self):
+        """
+        Precompute the sparsity pattern of the analytical Jacobian of the core
+        species, so that :meth:`compute_sparse_jacobian` only has to fill in
+        the nonzero values. This must be called whenever the core changes.
+
+        In each direction of a core reaction, the derivative of the rate with
+        respect to the amount of one of its reactants is a term equal to the
+        rate coefficient times the concentrations of the other reactants. Each
+        term is added to the rows of the species whose net stoichiometric
+        coefficient in the reaction is nonzero. If the volume depends on the
+        number of moles, reactions with more than one reactant also contribute
+        a correction that is the same for every column of a row, which is kept
+        separately to preserve the sparsity of the rest of the Jacobian.
+        """
+        cdef np.ndarray[np.int_t, ndim=2] ir, ip
+        cdef int j
+
+        ir = self.reactant_indices
+        ip = self.product_indices
+
+        terms = []  # [reaction, reverse, other reactant, other reactant]
+        entries = []  # [term, position in the sparse matrix]
+        coefficients = []
+        corrections = []  # [reaction, reverse, row, reactant, reactant, reactant]
+        correction_coefficients = []
+        positions = {}
+        for j in range(self.num_core_reactions):
+            stoichiometry = {}
+            for i in ir[j]:
+                if i != -1:
+                    stoichiometry[i] = stoichiometry.get(i, 0) - 1
+            for i in ip[j]:
+                if i != -1:
+                    stoichiometry[i] = stoichiometry.get(i, 0) + 1
+            rows = [(row, nu) for row, nu in sorted(stoichiometry.items()) if nu != 0]
+
+            for reverse, indices in enumerate((ir[j], ip[j])):
+                reactants = [i for i in indices if i != -1]
+                sign = -1 if reverse else 1
+                for l, column in enumerate(reactants):
+                    others = reactants[:l] + reactants[l + 1:]
+                    terms.append([j, reverse] + others + [-1] * (2 - len(others)))
+                    for row, nu in rows:
+                        entries.append([len(terms) - 1, positions.setdefault((row, column), len(positions))])
+                        coefficients.append(sign * nu)
+                if len(reactants) > 1:
+                    for row, nu in rows:
+                        corrections.append([j, reverse, row] + reactants + [-1] * (3 - len(reactants)))
+                        correction_coefficients.append(-sign * nu * (len(reactants) - 1))
+
+        # Number the nonzero elements row by row, as required by the CSR format
+        keys = sorted(positions)
+        order = np.empty(len(keys), np.int)
+        for l, key in enumerate(keys):
+            order[positions[key]] = l
+        entries = np.array(entries, np.int).reshape((-1, 2))
+        entries[:, 1] = order[entries[:, 1]]
+        indices = np.array([column for row, column in keys], np.int)
+        indptr = np.zeros(self.num_core_species + 1, np.int)
+        indptr[1:] = np.cumsum(np.bincount(np.array([row for row, column in keys], np.int),
+                                           minlength=self.num_core_species))
+
+        self.jacobian_pattern = (np.array(terms, np.int).reshape((-1, 4)), entries,
+                                 np.array(coefficients, np.float64),
+                                 np.array(corrections, np.int).reshape((-1, 6)),
+                                 np.array(correction_coefficients, np.float64),
+                                 indices, indptr)
+        self.jacobian_matrix = None
+        self.iteration_matrix = None
+        self.sparse_jacobian = None
+
+    @cython.boundscheck(False)
+    def compute_sparse_jacobian(self, np.ndarray[np.float64_t, ndim=1] C, double dVdN=0.0):
+        """
+        Return the analytical Jacobian of the core species given their
+        concentrations `C` in mol/m^3 and the derivative `dVdN` of the volume
+        with respect to the number of moles in m^3/mol. The Jacobian is
+        returned as a ``(matrix, correction)`` tuple of a sparse CSR matrix
+        and a vector to be added to every column of it, and is also stored
+        as :attr:`sparse_jacobian`.
+        """
+        cdef np.ndarray[np.int_t, ndim=2] terms, entries, corrections
+        cdef np.ndarray[np.int_t, ndim=1] indices, indptr
+        cdef np.ndarray[np.float64_t, ndim=1] kf, kr, coefficients, correction_coefficients
+        cdef np.ndarray[np.float64_t, ndim=1] values, data, correction
+        cdef int num_core_species, l
+        cdef double k
+
+        terms, entries, coefficients, corrections, correction_coefficients, indices, indptr = self.jacobian_pattern
+        kf = self.kf
+        kr = self.kb
+        num_core_species = indptr.shape[0] - 1
+
+        values = np.empty(terms.shape[0], np.float64)
+        for l in range(terms.shape[0]):
+            k = kr[terms[l, 0]] if terms[l, 1] else kf[terms[l, 0]]
+            if terms[l, 2] != -1:
+                k *= C[terms[l, 2]]
+                if terms[l, 3] != -1:
+                    k *= C[terms[l, 3]]
+            values[l] = k
+
+        data = np.zeros(indices.shape[0], np.float64)
+        for l in range(entries.shape[0]):
+            data[entries[l, 1]] += coefficients[l] * values[entries[l, 0]]
+
+        correction = np.zeros(num_core_species, np.float64)
+        if dVdN != 0:
+            for l in range(corrections.shape[0]):
+                k = kr[corrections[l, 0]] if corrections[l, 1] else kf[corrections[l, 0]]
+                k *= C[corrections[l, 3]] * C[corrections[l, 4]]
+                if corrections[l, 5] != -1:
+                    k *= C[corrections[l, 5]]
+                correction[corrections[l, 2]] += correction_coefficients[l] * k * dVdN
+
+        self.sparse_jacobian = (scipy.sparse.csr_matrix((data, indices, indptr),
+                                                        shape=(num_core_species, num_core_species)),
+                                correction)
+        return self.sparse_jacobian
+
+    def get_dense_jacobian(self, double cj):
+        """
+        Return the most recent Jacobian from :meth:`compute_sparse_jacobian`
+        as the dense iteration matrix ``J - cj * I`` required by DASSL and
+        DASPK, and store ``J`` as :attr:`jacobian_matrix`. Both are written
+        into arrays allocated once per core, so the returned array is
+        overwritten by the next call.
+        """
+        matrix, correction = self.sparse_jacobian
+        jacobian = self.jacobian_matrix
+        if jacobian is None or self.iteration_matrix is None or jacobian.shape[0] != matrix.shape[0]:
+            jacobian = self.jacobian_matrix = np.empty(matrix.shape, np.float64)
+            self.iteration_matrix = np.empty(matrix.shape, np.float64)
+        # The sparse matrix is added to the output array
+        jacobian.fill(0.0)
+        matrix.toarray(out=jacobian)
+        jacobian += correction[:, np.newaxis]
+        pd = self.iteration_matrix
+        np.copyto(pd, jacobian)
+        pd[np.diag_indices_from(pd)] -= cj
+        return pd
+
+    def compute_sensitivity_residual(self, np.ndarray[np.float64_t, ndim=1] y, np.ndarray[np.float64_t, ndim=2] dgdk):
+        """
+        Return the right-hand side of the sensitivity equations, ``J s_j +
+        df/dk_j`` for each parameter `j`, where the sensitivities ``s_j`` are
+        stored after the core species amounts in `y` and the derivatives
+        ``df/dk_j`` are the columns of `dgdk`. The most recent Jacobian from
+        :meth:`compute_sparse_jacobian` is used.
+        """
+        cdef int num_core_species
+        matrix, correction = self.sparse_jacobian
+        num_core_species = matrix.shape[0]
+        sens = y[num_core_species:].reshape((-1, num_core_species))
+        rhs = matrix.dot(sens.T).T + np.outer(sens.sum(axis=1), correction) + dgdk.T
+        return rhs.ravel()
+
+    def generate_rate_matrices(self):
+        """
+        Precompute the matrices used by :meth:`evaluate_rates` to compute the
+        rates of all core and edge reactions at once. These are sparse
+        matrices with the number of times each core species is a reactant and
+        a product of each core reaction, the net stoichiometric coefficients
+        of the core species in the core reactions and of the edge species in
+        the edge reactions, and the work arrays reused on every call. This
+        must be called whenever the core or edge changes.
+        """
+        cdef int num_core_species, num_core_reactions, num_species, num_reactions
+
+        num_core_species = self.num_core_species
+        num_core_reactions = self.num_core_reactions
+        num_species = num_core_species + self.num_edge_species
+        num_reactions = num_core_reactions + self.num_edge_reactions
+
+        matrices = []
+        for indices in (self.reactant_indices, self.product_indices):
+            reactions, slots = np.nonzero(indices != -1)
+            matrices.append(scipy.sparse.csr_matrix((np.ones(reactions.shape[0], np.float64),
+                                                     (indices[reactions, slots], reactions)),
+                                                    shape=(num_species, num_reactions)))
+        reactant_matrix, product_matrix = matrices
+        stoichiometry = (product_matrix - reactant_matrix).tocsr()
+        stoichiometry.eliminate_zeros()
+
+        # The concentrations of the edge species are kept at zero, so that
+        # only edge reactions between core species have nonzero rates. The
+        # last element is one, so that missing reactants (with index -1) do
+        # not contribute to the rates, and the one before it is zero for the
+        # network sources outside the core (with index -2)
+        concentrations = np.zeros(num_species + 2, np.float64)
+        concentrations[-1] = 1.0
+        self.rate_matrices = (reactant_matrix[:num_core_species, :num_core_reactions].tocsr(),
+                              product_matrix[:num_core_species, :num_core_reactions].tocsr(),
+                              stoichiometry[:num_core_species, :num_core_reactions].tocsr(),
+                              stoichiometry[num_core_species:, num_core_reactions:].tocsr(),
+                              concentrations,
+                              np.empty((num_reactions, 3), np.float64),
+                              np.empty(num_reactions, np.float64),
+                              np.empty(num_reactions, np.float64))
+
+    def evaluate_rates(self, np.ndarray[np.float64_t, ndim=1] C):
+        """
+        Return the rates of the core and edge reactions and species given the
+        concentrations `C` of the core species in mol/m^3, using the matrices
+        from :meth:`generate_rate_matrices`. The rates are returned as a
+        tuple of the core species rates, consumption rates and production
+        rates, the core reaction rates, the edge species and reaction rates
+        and the network leak rates, all in mol/m^3*s.
+        """
+        cdef int num_core_species, num_core_reactions, num_reactions
+
+        (reactant_matrix, product_matrix, core_stoichiometry, edge_stoichiometry,
+         concentrations, factors, forward_rates, reverse_rates) = self.rate_matrices
+        num_core_species = C.shape[0]
+        num_core_reactions = self.num_core_reactions
+        num_reactions = forward_rates.shape[0] if self.compute_edge_rates else num_core_reactions
+
+        concentrations[:num_core_species] = C
+        np.take(concentrations, self.reactant_indices[:num_reactions], out=factors[:num_reactions])
+        np.prod(factors[:num_reactions], axis=1, out=forward_rates[:num_reactions])
+        forward_rates[:num_reactions] *= self.kf[:num_reactions]
+        np.take(concentrations, self.product_indices[:num_reactions], out=factors[:num_reactions])
+        np.prod(factors[:num_reactions], axis=1, out=reverse_rates[:num_reactions])
+        reverse_rates[:num_reactions] *= self.kb[:num_reactions]
+
+        core_forward_rates = forward_rates[:num_core_reactions]
+        core_reverse_rates = reverse_rates[:num_core_reactions]
+        core_reaction_rates = core_forward_rates - core_reverse_rates
+
+        if self.compute_edge_rates:
+            edge_reaction_rates = forward_rates[num_core_reactions:] - reverse_rates[num_core_reactions:]
+            edge_species_rates = edge_stoichiometry.dot(edge_reaction_rates)
+            network_leak_rates = self.network_leak_coefficients * np.prod(concentrations[self.network_indices], axis=1)
+        else:
+            edge_reaction_rates = np.zeros(forward_rates.shape[0] - num_core_reactions, np.float64)
+            edge_species_rates = np.zeros(edge_stoichiometry.shape[0], np.float64)
+            network_leak_rates = np.zeros(self.network_indices.shape[0], np.float64)
+
+        return (core_stoichiometry.dot(core_reaction_rates),
+                reactant_matrix.dot(core_forward_rates) + product_matrix.dot(core_reverse_rates),
+                product_matrix.dot(core_forward_rates) + reactant_matrix.dot(core_reverse_rates),
+                core_reaction_rates,
+                edge_species_rates,
+                edge_reaction_rates,
+                network_leak_rates)
+
+    def generate_kinetics_table(self, list core_reactions, list edge_reactions):
+        """
+        Pack the kinetics of the core and edge reactions, and the
+        thermodynamics of the species taking part in reversible reactions,
+        into arrays, so that :meth:`evaluate_kinetics_table` can compute the
+        rate coefficients and equilibrium constants of the whole model in a
+        few vectorized passes. The reactions with :class:`Arrhenius` kinetics,
+        those with :class:`Chebyshev` kinetics of each size and no collider
+        efficiencies, and the species with :class:`NASA` thermo each form a
+        group evaluated at once. The other reactions and species are
+        evaluated one at a time.
+        """
+        cdef int i, j
+        cdef list arrhenius, generic_reactions, reversible, nasa_species, generic_species
+        cdef dict chebyshev
+
+        arrhenius = []
+        chebyshev = {}
+        generic_reactions = []
+        reversible = []
+        for rxn in itertools.chain(core_reactions, edge_reactions):
+            j = self.reaction_index[rxn]
+            kinetics = rxn.kinetics
+            if rxn.reversible:
+                reversible.append(j)
+            if diffusion_limiter.enabled:
+                # The rate coefficients are corrected for diffusion one reaction at a time
+                generic_reactions.append((j, rxn))
+            elif type(kinetics) is Arrhenius:
+                arrhenius.append((j, kinetics.A.value_si, kinetics.n.value_si, kinetics.Ea.value_si,
+                                  kinetics.T0.value_si))
+            elif type(kinetics) is Chebyshev and not kinetics.efficiencies and rxn.specific_collider is None:
+                chebyshev.setdefault(kinetics.coeffs.value_si.shape, []).append(
+                    (j, kinetics.coeffs.value_si, kinetics.Tmin.value_si, kinetics.Tmax.value_si,
+                     kinetics.Pmin.value_si, kinetics.Pmax.value_si))
+            else:
+                generic_reactions.append((j, rxn))
+
+        arrhenius_table = (np.array([row[0] for row in arrhenius], np.int),
+                           np.array([row[1:] for row in arrhenius], np.float64).reshape(-1, 4).T.copy())
+        chebyshev_table = []
+        for rows in chebyshev.values():
+            chebyshev_table.append((np.array([row[0] for row in rows], np.int),
+                                    np.array([row[1] for row in rows], np.float64),
+                                    np.array([row[2:] for row in rows], np.float64).T.copy()))
+
+        reversible_indices = np.array(reversible, np.int)
+        reactant_indices = self.reactant_indices[reversible_indices]
+        product_indices = self.product_indices[reversible_indices]
+        delta_n = np.sum(product_indices != -1, axis=1) - np.sum(reactant_indices != -1, axis=1)
+
+        # The species are numbered as in the species index, with an extra
+        # free energy of zero at the end for the missing reactants (with
+        # index -1)
+        species = {}
+        for rxn in itertools.chain(core_reactions, edge_reactions):
+            if rxn.reversible:
+                for spc in itertools.chain(rxn.reactants, rxn.products):
+                    species[self.species_index[spc]] = spc
+        nasa_species = []
+        generic_species = []
+        for i, spc in sorted(species.items()):
+            thermo = spc.get_thermo_data() if spc.has_thermo() else None
+            if isinstance(thermo, NASA):
+                nasa_species.append((i, spc, [thermo.poly1, thermo.poly2, thermo.poly3]))
+            else:
+                generic_species.append((i, spc))
+
+        nasa_coeffs = np.zeros((len(nasa_species), 3, 9), np.float64)
+        nasa_tmin = np.full((len(nasa_species), 3), np.inf)
+        nasa_tmax = np.full((len(nasa_species), 3), np.inf)
+        for i, (index, spc, polys) in enumerate(nasa_species):
+            for j, poly in enumerate(polys):
+                if poly is None:
+                    continue
+                nasa_coeffs[i, j] = [poly.cm2, poly.cm1, poly.c0, poly.c1, poly.c2, poly.c3, poly.c4, poly.c5, poly.c6]
+                nasa_tmin[i, j] = poly.Tmin.value_si if poly.Tmin is not None else -np.inf
+                nasa_tmax[i, j] = poly.Tmax.value_si if poly.Tmax is not None else np.inf
+        nasa_table = (np.array([row[0] for row in nasa_species], np.int), [row[1] for row in nasa_species],
+                      nasa_coeffs, nasa_tmin, nasa_tmax)
+
+        self.kinetics_table = (arrhenius_table, chebyshev_table, generic_reactions,
+                               (reversible_indices, reactant_indices, product_indices, delta_n),
+                               nasa_table, generic_species,
+                               np.zeros(self.num_core_species + self.num_edge_species + 1, np.float64))
+
+    @staticmethod
+    def get_chebyshev_polynomials(np.ndarray[np.float64_t, ndim=1] x, int n):
+        """
+        Return an array of the first `n` Chebyshev polynomials of the first
+        kind evaluated at each of the reduced values `x`, with one row per
+        value.
+        """
+        cdef int i
+        phi = np.empty((x.shape[0], n), np.float64)
+        phi[:, 0] = 1.0
+        if n > 1:
+            phi[:, 1] = x
+        for i in range(2, n):
+            phi[:, i] = 2.0 * x * phi[:, i - 1] - phi[:, i - 2]
+        return phi
+
+    def evaluate_kinetics_table(self, double T, double P, effective_pressure=None, np.ndarray reactions=None):
+        """
+        Compute the forward rate coefficients `kf`, the equilibrium constants
+        `Keq` and the reverse rate coefficients `kb` of the core and edge
+        reactions at temperature `T` in K and pressure `P` in Pa, using the
+        arrays generated by :meth:`generate_kinetics_table`. The reactions
+        which are not part of a group are evaluated at the pressure returned
+        by the function `effective_pressure` for each reaction, if given.
+        If `reactions` is given, only the reactions for which this boolean
+        array is ``True`` are evaluated, and the others are left unchanged.
+        """
+        cdef double RT = constants.R * T
+
+        (arrhenius_table, chebyshev_table, generic_reactions, reversible_table,
+         nasa_table, generic_species, free_energies) = self.kinetics_table
+        kf = self.kf
+        if reactions is None:
+            reactions = np.ones(kf.shape[0], bool)
+
+        indices, (A, n, Ea, T0) = arrhenius_table
+        selected = reactions[indices]
+        kf[indices[selected]] = A[selected] * (T / T0[selected]) ** n[selected] * np.exp(-Ea[selected] / RT)
+
+        for indices, coeffs, limits in chebyshev_table:
+            selected = reactions[indices]
+            if not np.any(selected):
+                continue
+            if P == 0:
+                raise ValueError('No pressure specified to pressure-dependent Chebyshev.get_rate_coefficient().')
+            coeffs = coeffs[selected]
+            Tmin, Tmax, Pmin, Pmax = limits[:, selected]
+            Tred = (2.0 / T - 1.0 / Tmin - 1.0 / Tmax) / (1.0 / Tmax - 1.0 / Tmin)
+            Pred = (2.0 * np.log10(P) - np.log10(Pmin) - np.log10(Pmax)) / (np.log10(Pmax) - np.log10(Pmin))
+            kf[indices[selected]] = 10.0 ** np.einsum('rtp,rt,rp->r', coeffs,
+                                                      self.get_chebyshev_polynomials(Tred, coeffs.shape[1]),
+                                                      self.get_chebyshev_polynomials(Pred, coeffs.shape[2]))
+
+        for j, rxn in generic_reactions:
+            if reactions[j]:
+                kf[j] = rxn.get_rate_coefficient(T, effective_pressure(rxn) if effective_pressure is not None else P)
+
+        reversible_indices, reactant_indices, product_indices, delta_n = reversible_table
+        selected = reactions[reversible_indices]
+        if not np.any(selected):
+            return
+        reversible_indices = reversible_indices[selected]
+        reactant_indices = reactant_indices[selected]
+        product_indices = product_indices[selected]
+        delta_n = delta_n[selected]
+
+        # Only the free energies of the species of the selected reactions are needed
+        needed = np.zeros(free_energies.shape[0], bool)
+        needed[reactant_indices] = True
+        needed[product_indices] = True
+
+        indices, nasa_species, coeffs, Tmin, Tmax = nasa_table
+        selected = needed[indices]
+        if np.any(selected):
+            indices = indices[selected]
+            valid = (Tmin[selected] <= T) & (T <= Tmax[selected])
+            for i in np.flatnonzero(~np.any(valid, axis=1)):
+                # Raise the same error as the NASA object
+                nasa_species[np.flatnonzero(selected)[i]].get_free_energy(T)
+            coeffs = coeffs[selected][np.arange(indices.shape[0]), np.argmax(valid, axis=1)]
+            # The enthalpy minus the entropy of each NASA polynomial, divided by R
+            basis = np.array([-0.5 / T ** 2, (np.log(T) + 1.0) / T, 1.0 - np.log(T), -T / 2.0, -T ** 2 / 6.0,
+                              -T ** 3 / 12.0, -T ** 4 / 20.0, 1.0 / T, -1.0])
+            free_energies[indices] = coeffs.dot(basis) * RT
+        for i, spc in generic_species:
+            if needed[i]:
+                free_energies[i] = spc.get_free_energy(T)
+
+        delta_g = (np.sum(free_energies[product_indices], axis=1) - np.sum(free_energies[reactant_indices], axis=1))
+        Keq = np.exp(-delta_g / RT) * (1e5 / RT) ** delta_n
+        if np.any(Keq == 0):
+            raise ReactionError('Got equilibrium constant of 0')
+        self.Keq[reversible_indices] = Keq
+        self.kb[reversible_indices] = kf[reversible_indices] / Keq
+
+    def compute_step_rates(self):
+        """
+        Compute the rates of the core and edge reactions and species, and the
+        network leak rates, at the current time and state of the solver.
+
+        While integrating in :meth:`simulate`, the residual only computes the
+        core rates, since the solver evaluates it many times per step and the
+        edge can be much larger than the core. This is called after every
+        successful step instead, to get the rates used to enlarge and prune
+        the model at the accepted state.
+        """
+        cdef bint compute_edge_rates, sensitivity
+
+        compute_edge_rates = self.compute_edge_rates
+        sensitivity = self.sensitivity
+        self.compute_edge_rates = True
+        self.sensitivity = False
+        try:
+            y = self.y[:self.num_core_species]
+            self.residual(self.t, y, np.zeros_like(y), self.senpar)
+        finally:
+            self.compute_edge_rates = compute_edge_rates
+            self.sensitivity = sensitivity
+
+    def update_model_indices(self, list core_species, list core_reactions, list edge_species, list edge_reactions):
+        """
+        Generate the species and reaction indices and the reactant and product
+        index arrays of the model. The rows of the reactions which were
+        already in the previous model are copied from its index arrays, with
+        the species renumbered, so that only the new reactions have to be
+        indexed one species at a time. This also sets `reaction_map`.
+
+        As the previous model is only known by the ``id()`` of its species and
+        reactions, a reaction is only matched if its reactants and products
+        are still the same objects, in the same order, in case the ``id()`` of
+        a discarded reaction was reused.
+        """
+        cdef np.ndarray[np.int_t, ndim=1] species_map, reaction_map
+        cdef dict old_species_index, old_reaction_index
+        cdef list old_reaction_keys
+        cdef int i, j, l
+
+        self.species_index = {}
+        self.reaction_index = {}
+        self.generate_species_indices(core_species, edge_species)
+        self.generate_reaction_indices(core_reactions, edge_reactions)
+
+        if self.previous_model is None:
+            self.generate_reactant_product_indices(core_reactions, edge_reactions)
+            self.reaction_map = -np.ones(self.num_core_reactions + self.num_edge_reactions, np.int)
+            return
+
+        (old_species_index, old_reaction_index, old_reactant_indices, old_product_indices,
+         old_reaction_keys) = self.previous_model[:5]
+
+        # The new index of each species of the previous model, with an extra
+        # -1 at the end for the missing reactants and products
+        species_map = -np.ones(len(old_species_index) + 1, np.int)
+        for spc, j in self.species_index.items():
+            i = old_species_index.get(id(spc), -1)
+            if i >= 0:
+                species_map[i] = j
+
+        reactions = core_reactions + edge_reactions
+        reaction_map = -np.ones(len(reactions), np.int)
+        for j, rxn in enumerate(reactions):
+            i = old_reaction_index.get(id(rxn), -1)
+            if i >= 0 and old_reaction_keys[i] == get_reaction_species_key(rxn):
+                reaction_map[j] = i
+        old = reaction_map >= 0
+
+        self.reactant_indices = -np.ones((len(reactions), 3), np.int)
+        self.product_indices = -np.ones_like(self.reactant_indices)
+        self.reactant_indices[old] = species_map[old_reactant_indices[reaction_map[old]]]
+        self.product_indices[old] = species_map[old_product_indices[reaction_map[old]]]
+        for j in np.flatnonzero(~old):
+            rxn = reactions[j]
+            for l, spec in enumerate(rxn.reactants):
+                self.reactant_indices[j, l] = self.species_index[spec]
+            for l, spec in enumerate(rxn.products):
+                self.product_indices[j, l] = self.species_index[spec]
+
+        self.reaction_map = reaction_map
+
+    def reuse_rate_coefficients(self, list core_reactions, list edge_reactions):
+        """
+        Copy the rate coefficients and equilibrium constants of the reactions
+        of the previous model whose packed kinetic parameters, reversibility
+        and species thermo are identical in the kinetics table generated by
+        :meth:`generate_kinetics_table`, if the temperature and pressure are
+        also unchanged. As the parameters are compared by value, kinetics or
+        thermo modified in place, e.g. by :meth:`Reaction.fix_barrier_height`
+        or by setting the degeneracy of a reaction, are recomputed. Reactions
+        and species which are not part of a group of the table, including the
+        reactions evaluated at an effective pressure, are never reused.
+        Returns the lists of the core and edge reactions whose rate
+        coefficients still have to be computed.
+        """
+        cdef np.ndarray[np.int_t, ndim=1] reaction_map, species_map
+        cdef np.ndarray reused, reversible, changed_species
+        cdef dict old_species_index
+        cdef int j, num_core_reactions
+
+        if self.previous_model is None:
+            return core_reactions, edge_reactions
+        (old_species_index, _, _, _, _, old_tables, kf, kb, Keq, T, P) = self.previous_model
+        if T != self.T.value_si or P != self.P.value_si:
+            return core_reactions, edge_reactions
+        old_arrhenius_table, old_chebyshev_table, old_reversible, old_nasa_table = old_tables
+        arrhenius_table, chebyshev_table = self.kinetics_table[:2]
+        reversible_indices = self.kinetics_table[3][0]
+        nasa_table = self.kinetics_table[4]
+
+        reaction_map = self.reaction_map
+        reused = np.zeros(reaction_map.shape[0], bool)
+        indices, parameters = arrhenius_table
+        old_indices, old_parameters = old_arrhenius_table
+        reused[indices] = get_unchanged_rows(indices, parameters.T, old_indices, old_parameters.T, reaction_map,
+                                             kf.shape[0])
+        for indices, coeffs, limits in chebyshev_table:
+            if coeffs.shape[1:] not in old_chebyshev_table:
+                continue
+            old_indices, old_coeffs, old_limits = old_chebyshev_table[coeffs.shape[1:]]
+            reused[indices] = get_unchanged_rows(
+                indices, np.hstack([coeffs.reshape(indices.shape[0], -1), limits.T]),
+                old_indices, np.hstack([old_coeffs.reshape(old_indices.shape[0], -1), old_limits.T]),
+                reaction_map, kf.shape[0])
+
+        reversible = np.zeros(reaction_map.shape[0], bool)
+        reversible[reversible_indices] = True
+        reused &= reversible == old_reversible[reaction_map]
+
+        # The previous index of each species, and whether its thermo changed,
+        # with an extra unchanged entry at the end for the missing reactants
+        # and products (with index -1)
+        species_map = -np.ones(len(self.species_index), np.int)
+        for spc, j in self.species_index.items():
+            species_map[j] = old_species_index.get(id(spc), -1)
+        changed_species = np.ones(species_map.shape[0] + 1, bool)
+        changed_species[-1] = False
+        indices, _, coeffs, Tmin, Tmax = nasa_table
+        old_indices, old_coeffs, old_Tmin, old_Tmax = old_nasa_table
+        changed_species[indices] = ~get_unchanged_rows(
+            indices, np.hstack([coeffs.reshape(-1, 27), Tmin, Tmax]),
+            old_indices, np.hstack([old_coeffs.reshape(-1, 27), old_Tmin, old_Tmax]),
+            species_map, len(old_species_index))
+        reused &= ~(reversible & (np.any(changed_species[self.reactant_indices], axis=1)
+                                  | np.any(changed_species[self.product_indices], axis=1)))
+
+        self.kf[reused] = kf[reaction_map[reused]]
+        self.kb[reused] = kb[reaction_map[reused]]
+        self.Keq[reused] = Keq[reaction_map[reused]]
+
+        num_core_reactions = len(core_reactions)
+        return ([rxn for j, rxn in enumerate(core_reactions) if not reused[j]],
+                [rxn for j, rxn in enumerate(edge_reactions) if not reused[num_core_reactions + j]])
+
+    def save_model_state(self, list core_reactions, list edge_reactions):
+        """
+        Store the index arrays, the parameter arrays of the kinetics table and
+        the rate coefficients of the current model in `previous_model`, to be
+        reused by the next call to :meth:`initialize_model`. The species and
+        reactions themselves are not stored, only their ``id()``.
+        """
+        cdef np.ndarray reversible
+        arrhenius_table, chebyshev_table = self.kinetics_table[:2]
+        reversible_indices = self.kinetics_table[3][0]
+        nasa_indices, _, nasa_coeffs, nasa_tmin, nasa_tmax = self.kinetics_table[4]
+        reversible = np.zeros(self.kf.shape[0] + 1, bool)
+        reversible[reversible_indices] = True
+        old_tables = (arrhenius_table, {coeffs.shape[1:]: (indices, coeffs, limits)
+                                        for indices, coeffs, limits in chebyshev_table},
+                      reversible, (nasa_indices, nasa_coeffs, nasa_tmin, nasa_tmax))
+        self.previous_model = ({id(spc): i for spc, i in self.species_index.items()},
+                               {id(rxn): j for rxn, j in self.reaction_index.items()},
+                               self.reactant_indices, self.product_indices,
+                               [get_reaction_species_key(rxn) for rxn in itertools.chain(core_reactions, edge_reactions)],
+                               old_tables, self.kf.copy(), self.kb.copy(), self.Keq.copy(),
+                               self.T.value_si, self.P.value_si)
+
+    def get_reaction_mask(self, list core_reactions, list edge_reactions):
+        """
+        Return a boolean array over all reactions of the model which is
+        ``True`` at the index of each of the given core and edge reactions.
+        """
+        mask = np.zeros(self.num_core_reactions + self.num_edge_reactions, bool)
+        mask[np.array([self.reaction_index[rxn] for rxn in itertools.chain(core_reactions, edge_reactions)],
+                      np.int)] = True
+        return mask
+
     def generate_species_indices(self, core_species, edge_species):
         """
         Assign an index to each species (core first, then edge) and 
@@ -615,6 +1299,7 @@ cdef class ReactionSystem(DASx):
         cdef np.ndarray[np.int_t, ndim=1] sens_species_indices, reactant_side, product_side
         cdef np.ndarray[np.float64_t, ndim=1] mole_sens, dVdk, norm_sens
         cdef list time_array, norm_sens_array, new_surface_reactions, new_surface_reaction_inds, new_objects, new_object_inds
+        cdef bint adjoint
 
         zero_production = False
         zero_consumption = False
@@ -665,13 +1350,20 @@ cdef class ReactionSystem(DASx):
         for index, spec in enumerate(core_species):
             species_index[spec] = index
 
+        # The adjoint sensitivities are computed after the simulation, so
+        # DASPK only integrates the species amounts
+        adjoint = sensitivity and self.sensitivity_method == 'adjoint'
+
         self.initialize_model(core_species, core_reactions,
                               edge_species, edge_reactions,
                               surface_species, surface_reactions,
-                              pdep_networks, atol, rtol, sensitivity,
+                              pdep_networks, atol, rtol, sensitivity and not adjoint,
                               sens_atol, sens_rtol,
                               filter_reactions, conditions)
 
+        # Only compute the edge rates at the accepted steps, see compute_step_rates
+        self.compute_edge_rates = False
+
         prunable_species_indices = self.prunable_species_indices
         prunable_network_indices = self.prunable_network_indices
 
@@ -706,6 +1398,9 @@ cdef class ReactionSystem(DASx):
 
         # Copy the initial conditions to use in evaluating conversions
         y0 = self.y.copy()
+        # The adjoint equations are integrated back to the initial state
+        initial_snapshot = [self.t, self.V]
+        initial_snapshot.extend(y0[:num_core_species])
 
         # a list with the time, Volume, number of moles of core species
         self.snapshots = []
@@ -780,9 +1475,11 @@ cdef class ReactionSystem(DASx):
                         logging.error("Network leak rates: {!r}".format(self.network_leak_rates))
                         raise ValueError('invalid_objects could not be filled during resurrection process')
 
+            self.compute_step_rates()
+
             y_core_species = self.y[:num_core_species]
             total_moles = np.sum(y_core_species)
-            if sensitivity:
+            if sensitivity and not adjoint:
                 time_array.append(self.t)
                 mole_sens = self.y[num_core_species:]
                 volume = self.V
@@ -1254,6 +1951,13 @@ cdef class ReactionSystem(DASx):
         # notify reaction system listeners
         self.notify()
 
+        if adjoint:
+            output_times, adjoint_sens = self.compute_adjoint_sensitivities(
+                np.array([initial_snapshot] + self.snapshots, np.float64), sens_species_indices,
+                atol=sens_atol, rtol=sens_rtol)
+            time_array = list(output_times)
+            norm_sens_array = list(adjoint_sens)
+
         if sensitivity:
             for i in range(len(self.sensitive_species)):
                 with open(sens_worksheet[i], 'w') as outfile:
@@ -1399,9 +2103,165 @@ cdef class ReactionSystem(DASx):
 
         return rate_deriv
 
+    def compute_adjoint_sensitivities(self, np.ndarray snapshots, np.ndarray sens_species_indices, num_times=None,
+                                      double atol=1e-6, double rtol=1e-4):
+        """
+        Return the normalized sensitivities of the concentrations of the core
+        species with indices `sens_species_indices` to the rate coefficients
+        of the core reactions and the free energies of the core species,
+        computed by the adjoint method from the trajectory in `snapshots`,
+        the rows of time, volume and core species amounts at the start and at
+        each step of :meth:`simulate`.
+
+        For each sensitive species and output time :math:`t_f`, the adjoint
+        equations :math:`d\lambda/dt = -J^T \lambda` are integrated from
+        :math:`t_f` back to the start with the analytical Jacobian, and the
+        sensitivities to all parameters are the integral of
+        :math:`\lambda^T \partial f/\partial p`. The cost thus scales with
+        the number of sensitive species instead of the number of parameters.
+        The trajectory is interpolated linearly between the snapshots, and
+        the integral is evaluated with the trapezoidal rule on the snapshot
+        times.
+
+        The sensitivities are computed at every snapshot time but the first,
+        i.e. at the same solver steps as by the forward method, or if
+        `num_times` is given, at up to that many snapshot times evenly spaced
+        in the snapshots and including the last one, since each output time
+        requires its own backward integration. Returns these times and an
+        array of the sensitivities with one row per sensitive species and
+        output time, normalized as in :meth:`simulate`.
+        """
+        cdef int num_core_species, num_core_reactions, num_snapshots, i, k, m, index, spc_index
+        cdef double RT, RTP, c, V
+        cdef bint compute_edge_rates
+
+        num_core_species = self.num_core_species
+        num_core_reactions = self.num_core_reactions
+        num_snapshots = snapshots.shape[0]
+        RT = constants.R * self.T.value_si
+        RTP = RT / self.P.value_si
+        stoichiometry = self.rate_matrices[2]
+        ir = self.reactant_indices[:num_core_reactions]
+        ip = self.product_indices[:num_core_reactions]
+        kf = self.kf[:num_core_reactions].copy()
+
+        times = snapshots[:, 0]
+        volumes = snapshots[:, 1]
+        moles = snapshots[:, 2:]
+        if num_times is None:
+            output_indices = np.arange(1, num_snapshots)
+        else:
+            output_indices = np.unique(np.round(np.linspace(0, num_snapshots - 1, num_times + 1)[1:]).astype(np.int))
+        sensitivities = np.zeros((sens_species_indices.shape[0], output_indices.shape[0],
+                                  num_core_reactions + num_core_species), np.float64)
+
+        def set_state(t):
+            # Evaluate the residual and the sparse Jacobian at the amounts
+            # interpolated at time t
+            n = min(max(np.searchsorted(times, t, side='right') - 1, 0), num_snapshots - 2)
+            dt = times[n + 1] - times[n]
+            w = (t - times[n]) / dt if dt > 0 else 0.0
+            y = (1.0 - w) * moles[n] + w * moles[n + 1]
+            self.residual(t, y, np.zeros_like(y), self.senpar)
+            return self.compute_sparse_jacobian(self.core_species_concentrations,
+                                                0.0 if self.constant_volume else self.V / np.sum(y))
+
+        def adjoint_residual(t, adjoint):
+            matrix, correction = set_state(t)
+            return -(matrix.T.dot(adjoint) + correction.dot(adjoint))
+
+        def adjoint_jacobian(t, adjoint):
+            set_state(t)
+            return -self.get_dense_jacobian(0.0).T
+
+        def parameter_derivative(adjoint):
+            # The product of the adjoint with the derivatives of the species
+            # rates with respect to the parameters at the current state, see
+            # compute_rate_derivative
+            C = np.append(self.core_species_concentrations, 1.0)
+            forward = np.prod(C[ir], axis=1)
+            reverse = self.kb[:num_core_reactions] / self.kf[:num_core_reactions] * np.prod(C[ip], axis=1)
+            flux = stoichiometry.T.dot(adjoint)
+            return self.V * np.concatenate((flux * (forward - reverse),
+                                            -stoichiometry.dot(flux * reverse * self.kf[:num_core_reactions] / RT)))
+
+        if num_snapshots < 2:
+            return times[output_indices], sensitivities
+
+        compute_edge_rates = self.compute_edge_rates
+        self.compute_edge_rates = False
+        try:
+            for k, index in enumerate(output_indices):
+                V = volumes[index]
+                for i, spc_index in enumerate(sens_species_indices):
+                    c = moles[index, spc_index] / V
+                    if c == 0:
+                        continue
+                    # Start from the gradient of n_i - c V with respect to the
+                    # amounts, since the sensitivity of the concentration is
+                    # that of n_i - c V divided by V, and the volume is
+                    # proportional to the total amount unless it is constant
+                    adjoint = np.zeros(num_core_species, np.float64)
+                    if not self.constant_volume:
+                        adjoint -= c * RTP
+                    adjoint[spc_index] += 1.0
+
+                    ode = scipy.integrate.ode(adjoint_residual, adjoint_jacobian).set_integrator(
+                        'vode', method='bdf', with_jacobian=True, atol=atol, rtol=rtol)
+                    ode.set_initial_value(adjoint, times[index])
+
+                    set_state(times[index])
+                    previous = parameter_derivative(adjoint)
+                    total = np.zeros_like(previous)
+                    for m in range(index - 1, -1, -1):
+                        ode.integrate(times[m])
+                        if not ode.successful():
+                            raise ValueError('Integration of the adjoint of species {0:d} from {1:g} s failed at '
+                                             '{2:g} s.'.format(spc_index, times[index], ode.t))
+                        set_state(times[m])
+                        current = parameter_derivative(ode.y)
+                        total += 0.5 * (times[m + 1] - times[m]) * (current + previous)
+                        previous = current
+
+                    sensitivities[i, k, :num_core_reactions] = total[:num_core_reactions] * kf / (V * c)
+                    # no normalization against dG, conversion to kcal/mol units
+                    sensitivities[i, k, num_core_reactions:] = total[num_core_reactions:] * 4184 / (V * c)
+        finally:
+            self.compute_edge_rates = compute_edge_rates
+
+        return times[output_indices], sensitivities
+
 
 ################################################################################
 
+def get_reaction_species_key(rxn):
+    """
+    Return a key identifying the reactant and product objects of `rxn`, in
+    order, which is used to check that a reaction of a previous model is the
+    same as `rxn`.
+    """
+    return tuple([id(spc) for spc in rxn.reactants]), tuple([id(spc) for spc in rxn.products])
+
+
+def get_unchanged_rows(np.ndarray indices, np.ndarray values, np.ndarray old_indices, np.ndarray old_values,
+                       np.ndarray index_map, int num_old):
+    """
+    Return a boolean array which is ``True`` for each row of the 2D array
+    `values`, belonging to the item of the model at the corresponding index
+    in `indices`, if that item was the item ``index_map[i]`` of the previous
+    model, which had `num_old` items, and had the same row in `old_values`,
+    belonging to the items `old_indices`.
+    """
+    # The row of each item of the previous model, with an extra -1 at the
+    # end for the items which were not in the previous model (with index -1)
+    old_rows = -np.ones(num_old + 1, np.int)
+    old_rows[old_indices] = np.arange(old_indices.shape[0])
+    rows = old_rows[index_map[indices]]
+    unchanged = rows >= 0
+    unchanged[unchanged] = np.all(old_values[rows[unchanged]] == values[unchanged], axis=1)
+    return unchanged
+
+
 class TerminationTime:
     """
     Represent a time at which the simulation should be terminated. This class
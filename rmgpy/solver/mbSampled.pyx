@@ -303,6 +303,7 @@ cdef class MBSampledReactor(ReactionSystem):
         cdef np.ndarray[np.int_t, ndim=2] ir, ip, inet
         cdef np.ndarray[np.float64_t, ndim=1] res, kf, kr, knet, delta, equilibrium_constants
         cdef int num_core_species, num_core_reactions, num_edge_species, num_edge_reactions, num_pdep_networks
+        cdef int num_reactions, num_networks
         cdef int i, j, z, first, second, third, real_species_index
         cdef double k, V, reaction_rate, rev_reaction_rate, T, P, Peff, core_species_rate
         cdef np.ndarray[np.float64_t, ndim=1] core_species_concentrations, core_species_rates, core_reaction_rates
@@ -357,6 +358,15 @@ cdef class MBSampledReactor(ReactionSystem):
         inet = self.network_indices
         knet = self.network_leak_coefficients
 
+        # While integrating, the edge rates are only computed after each
+        # successful step, see ReactionSystem.compute_step_rates
+        if self.compute_edge_rates:
+            num_reactions = ir.shape[0]
+            num_networks = inet.shape[0]
+        else:
+            num_reactions = num_core_reactions
+            num_networks = 0
+
         res = np.zeros(num_core_species, np.float64)
 
         core_species_concentrations = np.zeros_like(self.core_species_concentrations)
@@ -378,7 +388,7 @@ cdef class MBSampledReactor(ReactionSystem):
             C[j] = y[j] / V
             core_species_concentrations[j] = C[j]
 
-        for j in range(ir.shape[0]):
+        for j in range(num_reactions):
             k = kf[j]
             if ir[j, 0] >= num_core_species or ir[j, 1] >= num_core_species or ir[j, 2] >= num_core_species:
                 f_reaction_rate = 0.0
@@ -462,7 +472,7 @@ cdef class MBSampledReactor(ReactionSystem):
                     if third != -1:
                         if third >= num_core_species: edge_species_rates[third - num_core_species] += reaction_rate
 
-        for j in range(inet.shape[0]):
+        for j in range(num_networks):
             k = knet[j]
             if inet[j, 1] == -1:  # only one reactant
                 reaction_rate = k * C[inet[j, 0]]
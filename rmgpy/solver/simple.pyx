@@ -112,7 +112,8 @@ cdef class SimpleReactor(ReactionSystem):
     cdef public int n_sims
 
     def __init__(self, T, P, initial_mole_fractions, n_sims=1, termination=None, sensitive_species=None,
-                 sensitivity_threshold=1e-3, sens_conditions=None, const_spc_names=None):
+                 sensitivity_threshold=1e-3, sens_conditions=None, const_spc_names=None, vectorized_residual=False,
+                 sensitivity_method='forward'):
         ReactionSystem.__init__(self, termination, sensitive_species, sensitivity_threshold)
 
         if type(T) != list:
@@ -142,6 +143,8 @@ cdef class SimpleReactor(ReactionSystem):
         self.specific_collider_species = None
         self.sens_conditions = sens_conditions
         self.n_sims = n_sims
+        self.vectorized_residual = vectorized_residual
+        self.sensitivity_method = sensitivity_method
 
     def __reduce__(self):
         """
@@ -214,8 +217,11 @@ cdef class SimpleReactor(ReactionSystem):
 
         ReactionSystem.compute_network_variables(self, pdep_networks)
 
-        # Generate forward and reverse rate coefficients k(T,P)
-        self.generate_rate_coefficients(core_reactions, edge_reactions)
+        # Generate forward and reverse rate coefficients k(T,P), reusing those
+        # of the reactions whose parameters did not change since the previous model
+        self.generate_kinetics_table(core_reactions, edge_reactions)
+        self.generate_rate_coefficients(*self.reuse_rate_coefficients(core_reactions, edge_reactions))
+        self.save_model_state(core_reactions, edge_reactions)
 
         ReactionSystem.set_initial_derivative(self)
         # Initialize the model
@@ -256,18 +262,13 @@ cdef class SimpleReactor(ReactionSystem):
     def generate_rate_coefficients(self, core_reactions, edge_reactions):
         """
         Populates the forward rate coefficients (kf), reverse rate coefficients (kb)
-        and equilibrium constants (Keq) arrays with the values computed at the temperature
-        and (effective) pressure of the reaction system.
+        and equilibrium constants (Keq) arrays of the given core and edge reactions
+        with the values computed at the temperature and (effective) pressure of the
+        reaction system. The entries of the other reactions are left unchanged.
         """
 
-        for rxn in itertools.chain(core_reactions, edge_reactions):
-            j = self.reaction_index[rxn]
-            Peff = self.calculate_effective_pressure(rxn)
-            self.kf[j] = rxn.get_rate_coefficient(self.T.value_si, Peff)
-
-            if rxn.reversible:
-                self.Keq[j] = rxn.get_equilibrium_constant(self.T.value_si)
-                self.kb[j] = self.kf[j] / self.Keq[j]
+        self.evaluate_kinetics_table(self.T.value_si, self.P.value_si, self.calculate_effective_pressure,
+                                     self.get_reaction_mask(core_reactions, edge_reactions))
 
     def get_threshold_rate_constants(self, model_settings):
         """
@@ -352,13 +353,14 @@ cdef class SimpleReactor(ReactionSystem):
         cdef np.ndarray[np.int_t, ndim=2] ir, ip, inet
         cdef np.ndarray[np.float64_t, ndim=1] res, kf, kr, knet, delta, equilibrium_constants
         cdef int num_core_species, num_core_reactions, num_edge_species, num_edge_reactions, num_pdep_networks
-        cdef int i, j, z, first, second, third
+        cdef int num_reactions, num_networks
+        cdef int i, j, first, second, third
         cdef double k, V, reaction_rate, rev_reaction_rate, T, P, Peff
         cdef np.ndarray[np.float64_t, ndim=1] core_species_concentrations, core_species_rates, core_reaction_rates
         cdef np.ndarray[np.float64_t, ndim=1] edge_species_rates, edge_reaction_rates, network_leak_rates
         cdef np.ndarray[np.float64_t, ndim=1] core_species_consumption_rates, core_species_production_rates
         cdef np.ndarray[np.float64_t, ndim=1] C, y_core_species
-        cdef np.ndarray[np.float64_t, ndim=2] jacobian, dgdk, collider_efficiencies
+        cdef np.ndarray[np.float64_t, ndim=2] dgdk, collider_efficiencies
         cdef np.ndarray[np.int_t, ndim=1] pdep_collider_reaction_indices, pdep_specific_collider_reaction_indices
         cdef list pdep_collider_kinetics, pdep_specific_collider_kinetics
 
@@ -406,120 +408,135 @@ cdef class SimpleReactor(ReactionSystem):
         inet = self.network_indices
         knet = self.network_leak_coefficients
 
-        res = np.zeros(num_core_species, np.float64)
-
-        core_species_concentrations = np.zeros_like(self.core_species_concentrations)
-        core_species_rates = np.zeros_like(self.core_species_rates)
-        core_reaction_rates = np.zeros_like(self.core_reaction_rates)
-        core_species_consumption_rates = np.zeros_like(self.core_species_consumption_rates)
-        core_species_production_rates = np.zeros_like(self.core_species_production_rates)
-        edge_species_rates = np.zeros_like(self.edge_species_rates)
-        edge_reaction_rates = np.zeros_like(self.edge_reaction_rates)
-        network_leak_rates = np.zeros_like(self.network_leak_rates)
+        # While integrating, the edge rates are only computed after each
+        # successful step, see ReactionSystem.compute_step_rates
+        if self.compute_edge_rates:
+            num_reactions = ir.shape[0]
+            num_networks = inet.shape[0]
+        else:
+            num_reactions = num_core_reactions
+            num_networks = 0
 
-        C = np.zeros_like(self.core_species_concentrations)
+        res = np.zeros(num_core_species, np.float64)
 
         # Use ideal gas law to compute volume
         V = constants.R * self.T.value_si * np.sum(y_core_species) / self.P.value_si
         self.V = V
 
-        for j in range(num_core_species):
-            C[j] = y[j] / V
-            core_species_concentrations[j] = C[j]
-
-        for j in range(ir.shape[0]):
-            k = kf[j]
-            if ir[j, 0] >= num_core_species or ir[j, 1] >= num_core_species or ir[j, 2] >= num_core_species:
-                f_reaction_rate = 0.0
-            elif ir[j, 1] == -1:  # only one reactant
-                f_reaction_rate = k * C[ir[j, 0]]
-            elif ir[j, 2] == -1:  # only two reactants
-                f_reaction_rate = k * C[ir[j, 0]] * C[ir[j, 1]]
-            else:  # three reactants
-                f_reaction_rate = k * C[ir[j, 0]] * C[ir[j, 1]] * C[ir[j, 2]]
-            k = kr[j]
-            if ip[j, 0] >= num_core_species or ip[j, 1] >= num_core_species or ip[j, 2] >= num_core_species:
-                rev_reaction_rate = 0.0
-            elif ip[j, 1] == -1:  # only one reactant
-                rev_reaction_rate = k * C[ip[j, 0]]
-            elif ip[j, 2] == -1:  # only two reactants
-                rev_reaction_rate = k * C[ip[j, 0]] * C[ip[j, 1]]
-            else:  # three reactants
-                rev_reaction_rate = k * C[ip[j, 0]] * C[ip[j, 1]] * C[ip[j, 2]]
-
-            reaction_rate = f_reaction_rate - rev_reaction_rate
-
-            # Set the reaction and species rates
-            if j < num_core_reactions:
-                # The reaction is a core reaction
-                core_reaction_rates[j] = reaction_rate
-
-                # Add/substract the total reaction rate from each species rate
-                # Since it's a core reaction we know that all of its reactants
-                # and products are core species
-                first = ir[j, 0]
-                core_species_rates[first] -= reaction_rate
-                core_species_consumption_rates[first] += f_reaction_rate
-                core_species_production_rates[first] += rev_reaction_rate
-                second = ir[j, 1]
-                if second != -1:
-                    core_species_rates[second] -= reaction_rate
-                    core_species_consumption_rates[second] += f_reaction_rate
-                    core_species_production_rates[second] += rev_reaction_rate
-                    third = ir[j, 2]
-                    if third != -1:
-                        core_species_rates[third] -= reaction_rate
-                        core_species_consumption_rates[third] += f_reaction_rate
-                        core_species_production_rates[third] += rev_reaction_rate
-                first = ip[j, 0]
-                core_species_rates[first] += reaction_rate
-                core_species_production_rates[first] += f_reaction_rate
-                core_species_consumption_rates[first] += rev_reaction_rate
-                second = ip[j, 1]
-                if second != -1:
-                    core_species_rates[second] += reaction_rate
-                    core_species_production_rates[second] += f_reaction_rate
-                    core_species_consumption_rates[second] += rev_reaction_rate
-                    third = ip[j, 2]
-                    if third != -1:
-                        core_species_rates[third] += reaction_rate
-                        core_species_production_rates[third] += f_reaction_rate
-                        core_species_consumption_rates[third] += rev_reaction_rate
-
-            else:
-                # The reaction is an edge reaction
-                edge_reaction_rates[j - num_core_reactions] = reaction_rate
-
-                # Add/substract the total reaction rate from each species rate
-                # Since it's an edge reaction its reactants and products could
-                # be either core or edge species
-                # We're only interested in the edge species
-                first = ir[j, 0]
-                if first >= num_core_species: edge_species_rates[first - num_core_species] -= reaction_rate
-                second = ir[j, 1]
-                if second != -1:
-                    if second >= num_core_species: edge_species_rates[second - num_core_species] -= reaction_rate
-                    third = ir[j, 2]
-                    if third != -1:
-                        if third >= num_core_species: edge_species_rates[third - num_core_species] -= reaction_rate
-                first = ip[j, 0]
-                if first >= num_core_species: edge_species_rates[first - num_core_species] += reaction_rate
-                second = ip[j, 1]
-                if second != -1:
-                    if second >= num_core_species: edge_species_rates[second - num_core_species] += reaction_rate
-                    third = ip[j, 2]
-                    if third != -1:
-                        if third >= num_core_species: edge_species_rates[third - num_core_species] += reaction_rate
-
-        for j in range(inet.shape[0]):
-            k = knet[j]
-            if inet[j, 1] == -1:  # only one reactant
-                reaction_rate = k * C[inet[j, 0]]
-            elif inet[j, 2] == -1:  # only two reactants
-                reaction_rate = k * C[inet[j, 0]] * C[inet[j, 1]]
-            else:  # three reactants
-                reaction_rate = k * C[inet[j, 0]] * C[inet[j, 1]] * C[inet[j, 2]]
-            network_leak_rates[j] = reaction_rate
+        if self.vectorized_residual:
+            C = y[:num_core_species] / V
+            core_species_concentrations = C
+            (core_species_rates, core_species_consumption_rates, core_species_production_rates, core_reaction_rates,
+             edge_species_rates, edge_reaction_rates, network_leak_rates) = self.evaluate_rates(C)
+        else:
+            core_species_concentrations = np.zeros_like(self.core_species_concentrations)
+            core_species_rates = np.zeros_like(self.core_species_rates)
+            core_reaction_rates = np.zeros_like(self.core_reaction_rates)
+            core_species_consumption_rates = np.zeros_like(self.core_species_consumption_rates)
+            core_species_production_rates = np.zeros_like(self.core_species_production_rates)
+            edge_species_rates = np.zeros_like(self.edge_species_rates)
+            edge_reaction_rates = np.zeros_like(self.edge_reaction_rates)
+            network_leak_rates = np.zeros_like(self.network_leak_rates)
+
+            C = np.zeros_like(self.core_species_concentrations)
+
+            for j in range(num_core_species):
+                C[j] = y[j] / V
+                core_species_concentrations[j] = C[j]
+
+            for j in range(num_reactions):
+                k = kf[j]
+                if ir[j, 0] >= num_core_species or ir[j, 1] >= num_core_species or ir[j, 2] >= num_core_species:
+                    f_reaction_rate = 0.0
+                elif ir[j, 1] == -1:  # only one reactant
+                    f_reaction_rate = k * C[ir[j, 0]]
+                elif ir[j, 2] == -1:  # only two reactants
+                    f_reaction_rate = k * C[ir[j, 0]] * C[ir[j, 1]]
+                else:  # three reactants
+                    f_reaction_rate = k * C[ir[j, 0]] * C[ir[j, 1]] * C[ir[j, 2]]
+                k = kr[j]
+                if ip[j, 0] >= num_core_species or ip[j, 1] >= num_core_species or ip[j, 2] >= num_core_species:
+                    rev_reaction_rate = 0.0
+                elif ip[j, 1] == -1:  # only one reactant
+                    rev_reaction_rate = k * C[ip[j, 0]]
+                elif ip[j, 2] == -1:  # only two reactants
+                    rev_reaction_rate = k * C[ip[j, 0]] * C[ip[j, 1]]
+                else:  # three reactants
+                    rev_reaction_rate = k * C[ip[j, 0]] * C[ip[j, 1]] * C[ip[j, 2]]
+
+                reaction_rate = f_reaction_rate - rev_reaction_rate
+
+                # Set the reaction and species rates
+                if j < num_core_reactions:
+                    # The reaction is a core reaction
+                    core_reaction_rates[j] = reaction_rate
+
+                    # Add/substract the total reaction rate from each species rate
+                    # Since it's a core reaction we know that all of its reactants
+                    # and products are core species
+                    first = ir[j, 0]
+                    core_species_rates[first] -= reaction_rate
+                    core_species_consumption_rates[first] += f_reaction_rate
+                    core_species_production_rates[first] += rev_reaction_rate
+                    second = ir[j, 1]
+                    if second != -1:
+                        core_species_rates[second] -= reaction_rate
+                        core_species_consumption_rates[second] += f_reaction_rate
+                        core_species_production_rates[second] += rev_reaction_rate
+                        third = ir[j, 2]
+                        if third != -1:
+                            core_species_rates[third] -= reaction_rate
+                            core_species_consumption_rates[third] += f_reaction_rate
+                            core_species_production_rates[third] += rev_reaction_rate
+                    first = ip[j, 0]
+                    core_species_rates[first] += reaction_rate
+                    core_species_production_rates[first] += f_reaction_rate
+                    core_species_consumption_rates[first] += rev_reaction_rate
+                    second = ip[j, 1]
+                    if second != -1:
+                        core_species_rates[second] += reaction_rate
+                        core_species_production_rates[second] += f_reaction_rate
+                        core_species_consumption_rates[second] += rev_reaction_rate
+                        third = ip[j, 2]
+                        if third != -1:
+                            core_species_rates[third] += reaction_rate
+                            core_species_production_rates[third] += f_reaction_rate
+                            core_species_consumption_rates[third] += rev_reaction_rate
+
+                else:
+                    # The reaction is an edge reaction
+                    edge_reaction_rates[j - num_core_reactions] = reaction_rate
+
+                    # Add/substract the total reaction rate from each species rate
+                    # Since it's an edge reaction its reactants and products could
+                    # be either core or edge species
+                    # We're only interested in the edge species
+                    first = ir[j, 0]
+                    if first >= num_core_species: edge_species_rates[first - num_core_species] -= reaction_rate
+                    second = ir[j, 1]
+                    if second != -1:
+                        if second >= num_core_species: edge_species_rates[second - num_core_species] -= reaction_rate
+                        third = ir[j, 2]
+                        if third != -1:
+                            if third >= num_core_species: edge_species_rates[third - num_core_species] -= reaction_rate
+                    first = ip[j, 0]
+                    if first >= num_core_species: edge_species_rates[first - num_core_species] += reaction_rate
+                    second = ip[j, 1]
+                    if second != -1:
+                        if second >= num_core_species: edge_species_rates[second - num_core_species] += reaction_rate
+                        third = ip[j, 2]
+                        if third != -1:
+                            if third >= num_core_species: edge_species_rates[third - num_core_species] += reaction_rate
+
+            for j in range(num_networks):
+                k = knet[j]
+                if inet[j, 1] == -1:  # only one reactant
+                    reaction_rate = k * C[inet[j, 0]]
+                elif inet[j, 2] == -1:  # only two reactants
+                    reaction_rate = k * C[inet[j, 0]] * C[inet[j, 1]]
+                else:  # three reactants
+                    reaction_rate = k * C[inet[j, 0]] * C[inet[j, 1]] * C[inet[j, 2]]
+                network_leak_rates[j] = reaction_rate
 
         if self.const_spc_indices is not None:
             for spc_index in self.const_spc_indices:
@@ -539,16 +556,10 @@ cdef class SimpleReactor(ReactionSystem):
         if self.sensitivity:
             delta = np.zeros(len(y), np.float64)
             delta[:num_core_species] = res
-            if self.jacobian_matrix is None:
-                jacobian = self.jacobian(t, y, dydt, 0, senpar)
-            else:
-                jacobian = self.jacobian_matrix
+            if self.sparse_jacobian is None:
+                self.jacobian(t, y, dydt, 0, senpar)
             dgdk = ReactionSystem.compute_rate_derivative(self)
-            for j in range(num_core_reactions + num_core_species):
-                for i in range(num_core_species):
-                    for z in range(num_core_species):
-                        delta[(j + 1) * num_core_species + i] += jacobian[i, z] * y[(j + 1) * num_core_species + z]
-                    delta[(j + 1) * num_core_species + i] += dgdk[i, j]
+            delta[num_core_species:] = self.compute_sensitivity_residual(y, dgdk)
 
         else:
             delta = res
@@ -563,485 +574,18 @@ cdef class SimpleReactor(ReactionSystem):
         """
         Return the analytical Jacobian for the reaction system.
         """
-        cdef np.ndarray[np.int_t, ndim=2] ir, ip
-        cdef np.ndarray[np.float64_t, ndim=1] kf, kr, C
-        cdef np.ndarray[np.float64_t, ndim=2] pd
-        cdef int num_core_reactions, num_core_species, i, j
-        cdef double k, V, Ctot, deriv, corr
-
-        ir = self.reactant_indices
-        ip = self.product_indices
+        cdef np.ndarray[np.float64_t, ndim=1] C
+        cdef int num_core_species
+        cdef double V, Ctot
 
-        kf = self.kf
-        kr = self.kb
-        num_core_reactions = len(self.core_reaction_rates)
         num_core_species = len(self.core_species_concentrations)
 
-        pd = -cj * np.identity(num_core_species, np.float64)
-
         V = constants.R * self.T.value_si * np.sum(y[:num_core_species]) / self.P.value_si
 
         Ctot = self.P.value_si / (constants.R * self.T.value_si)
 
-        C = np.zeros_like(self.core_species_concentrations)
-        for j in range(num_core_species):
-            C[j] = y[j] / V
-
-        for j in range(num_core_reactions):
-
-            k = kf[j]
-            if ir[j, 1] == -1:  # only one reactant
-                deriv = k
-                pd[ir[j, 0], ir[j, 0]] -= deriv
-
-                pd[ip[j, 0], ir[j, 0]] += deriv
-                if ip[j, 1] != -1:
-                    pd[ip[j, 1], ir[j, 0]] += deriv
-                    if ip[j, 2] != -1:
-                        pd[ip[j, 2], ir[j, 0]] += deriv
-
-
-            elif ir[j, 2] == -1:  # only two reactants
-                corr = - k * C[ir[j, 0]] * C[ir[j, 1]] / Ctot
-                if ir[j, 0] == ir[j, 1]:  # reactants are the same
-                    deriv = 2 * k * C[ir[j, 0]]
-                    pd[ir[j, 0], ir[j, 0]] -= 2 * deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] -= 2 * corr
-
-                    pd[ip[j, 0], ir[j, 0]] += deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] += corr
-                    if ip[j, 1] != -1:
-                        pd[ip[j, 1], ir[j, 0]] += deriv
-                        for i in range(num_core_species):
-                            pd[ip[j, 1], i] += corr
-                        if ip[j, 2] != -1:
-                            pd[ip[j, 2], ir[j, 0]] += deriv
-                            for i in range(num_core_species):
-                                pd[ip[j, 2], i] += corr
-
-                else:
-                    # Derivative with respect to reactant 1
-                    deriv = k * C[ir[j, 1]]
-                    pd[ir[j, 0], ir[j, 0]] -= deriv
-                    pd[ir[j, 1], ir[j, 0]] -= deriv
-
-                    pd[ip[j, 0], ir[j, 0]] += deriv
-                    if ip[j, 1] != -1:
-                        pd[ip[j, 1], ir[j, 0]] += deriv
-                        if ip[j, 2] != -1:
-                            pd[ip[j, 2], ir[j, 0]] += deriv
-
-                    # Derivative with respect to reactant 2
-                    deriv = k * C[ir[j, 0]]
-                    pd[ir[j, 0], ir[j, 1]] -= deriv
-                    pd[ir[j, 1], ir[j, 1]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] -= corr
-                        pd[ir[j, 1], i] -= corr
-
-                    pd[ip[j, 0], ir[j, 1]] += deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] += corr
-                    if ip[j, 1] != -1:
-                        pd[ip[j, 1], ir[j, 1]] += deriv
-                        for i in range(num_core_species):
-                            pd[ip[j, 1], i] += corr
-                        if ip[j, 2] != -1:
-                            pd[ip[j, 2], ir[j, 1]] += deriv
-                            for i in range(num_core_species):
-                                pd[ip[j, 2], i] += corr
-
-
-            else:  # three reactants
-                corr = - 2 * k * C[ir[j, 0]] * C[ir[j, 1]] * C[ir[j, 2]] / Ctot
-                if (ir[j, 0] == ir[j, 1] & ir[j, 0] == ir[j, 2]):
-                    deriv = 3 * k * C[ir[j, 0]] * C[ir[j, 0]]
-                    pd[ir[j, 0], ir[j, 0]] -= 3 * deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] -= 3 * corr
-
-                    pd[ip[j, 0], ir[j, 0]] += deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] += corr
-                    if ip[j, 1] != -1:
-                        pd[ip[j, 1], ir[j, 0]] += deriv
-                        for i in range(num_core_species):
-                            pd[ip[j, 1], i] += corr
-                        if ip[j, 2] != -1:
-                            pd[ip[j, 2], ir[j, 0]] += deriv
-                            for i in range(num_core_species):
-                                pd[ip[j, 2], i] += corr
-
-                elif ir[j, 0] == ir[j, 1]:
-                    # derivative with respect to reactant 1
-                    deriv = 2 * k * C[ir[j, 0]] * C[ir[j, 2]]
-                    pd[ir[j, 0], ir[j, 0]] -= 2 * deriv
-                    pd[ir[j, 2], ir[j, 0]] -= deriv
-
-                    pd[ip[j, 0], ir[j, 0]] += deriv
-                    if ip[j, 1] != -1:
-                        pd[ip[j, 1], ir[j, 0]] += deriv
-                        if ip[j, 2] != -1:
-                            pd[ip[j, 2], ir[j, 0]] += deriv
-
-                    # derivative with respect to reactant 3
-                    deriv = k * C[ir[j, 0]] * C[ir[j, 0]]
-                    pd[ir[j, 0], ir[j, 2]] -= 2 * deriv
-                    pd[ir[j, 2], ir[j, 2]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] -= 2 * corr
-                        pd[ir[j, 2], i] -= corr
-
-                    pd[ip[j, 0], ir[j, 2]] += deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] += corr
-                    if ip[j, 1] != -1:
-                        pd[ip[j, 1], ir[j, 2]] += deriv
-                        for i in range(num_core_species):
-                            pd[ip[j, 1], i] += corr
-                        if ip[j, 2] != -1:
-                            pd[ip[j, 2], ir[j, 2]] += deriv
-                            for i in range(num_core_species):
-                                pd[ip[j, 2], i] += corr
-
-
-                elif ir[j, 1] == ir[j, 2]:
-                    # derivative with respect to reactant 1
-                    deriv = k * C[ir[j, 1]] * C[ir[j, 1]]
-                    pd[ir[j, 0], ir[j, 0]] -= deriv
-                    pd[ir[j, 1], ir[j, 0]] -= 2 * deriv
-
-                    pd[ip[j, 0], ir[j, 0]] += deriv
-                    if ip[j, 1] != -1:
-                        pd[ip[j, 1], ir[j, 0]] += deriv
-                        if ip[j, 2] != -1:
-                            pd[ip[j, 2], ir[j, 0]] += deriv
-                            # derivative with respect to reactant 2
-                    deriv = 2 * k * C[ir[j, 0]] * C[ir[j, 1]]
-                    pd[ir[j, 0], ir[j, 1]] -= deriv
-                    pd[ir[j, 1], ir[j, 1]] -= 2 * deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] -= corr
-                        pd[ir[j, 1], i] -= 2 * corr
-
-                    pd[ip[j, 0], ir[j, 1]] += deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] += corr
-                    if ip[j, 1] != -1:
-                        pd[ip[j, 1], ir[j, 1]] += deriv
-                        for i in range(num_core_species):
-                            pd[ip[j, 1], i] += corr
-                        if ip[j, 2] != -1:
-                            pd[ip[j, 2], ir[j, 1]] += deriv
-                            for i in range(num_core_species):
-                                pd[ip[j, 2], i] += corr
-
-                elif ir[j, 0] == ir[j, 2]:
-                    # derivative with respect to reactant 1
-                    deriv = 2 * k * C[ir[j, 0]] * C[ir[j, 1]]
-                    pd[ir[j, 0], ir[j, 0]] -= 2 * deriv
-                    pd[ir[j, 1], ir[j, 0]] -= deriv
-
-                    pd[ip[j, 0], ir[j, 0]] += deriv
-                    if ip[j, 1] != -1:
-                        pd[ip[j, 1], ir[j, 0]] += deriv
-                        if ip[j, 2] != -1:
-                            pd[ip[j, 2], ir[j, 0]] += deriv
-                    # derivative with respect to reactant 2
-                    deriv = k * C[ir[j, 0]] * C[ir[j, 0]]
-                    pd[ir[j, 0], ir[j, 1]] -= 2 * deriv
-                    pd[ir[j, 1], ir[j, 1]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] -= 2 * corr
-                        pd[ir[j, 1], i] -= corr
-
-                    pd[ip[j, 0], ir[j, 1]] += deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] += corr
-                    if ip[j, 1] != -1:
-                        pd[ip[j, 1], ir[j, 1]] += deriv
-                        for i in range(num_core_species):
-                            pd[ip[j, 1], i] += corr
-                        if ip[j, 2] != -1:
-                            pd[ip[j, 2], ir[j, 1]] += deriv
-                            for i in range(num_core_species):
-                                pd[ip[j, 2], i] += corr
+        C = y[:num_core_species] / V
 
-                else:
-                    # derivative with respect to reactant 1
-                    deriv = k * C[ir[j, 1]] * C[ir[j, 2]]
-                    pd[ir[j, 0], ir[j, 0]] -= deriv
-                    pd[ir[j, 1], ir[j, 0]] -= deriv
-                    pd[ir[j, 2], ir[j, 0]] -= deriv
-
-                    pd[ip[j, 0], ir[j, 0]] += deriv
-                    if ip[j, 1] != -1:
-                        pd[ip[j, 1], ir[j, 0]] += deriv
-                        if ip[j, 2] != -1:
-                            pd[ip[j, 2], ir[j, 0]] += deriv
-
-                            # derivative with respect to reactant 2
-                    deriv = k * C[ir[j, 0]] * C[ir[j, 2]]
-                    pd[ir[j, 0], ir[j, 1]] -= deriv
-                    pd[ir[j, 1], ir[j, 1]] -= deriv
-                    pd[ir[j, 2], ir[j, 1]] -= deriv
-
-                    pd[ip[j, 0], ir[j, 1]] += deriv
-                    if ip[j, 1] != -1:
-                        pd[ip[j, 1], ir[j, 1]] += deriv
-                        if ip[j, 2] != -1:
-                            pd[ip[j, 2], ir[j, 1]] += deriv
-
-                            # derivative with respect to reactant 3
-                    deriv = k * C[ir[j, 0]] * C[ir[j, 1]]
-                    pd[ir[j, 0], ir[j, 2]] -= deriv
-                    pd[ir[j, 1], ir[j, 2]] -= deriv
-                    pd[ir[j, 2], ir[j, 2]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] -= corr
-                        pd[ir[j, 1], i] -= corr
-                        pd[ir[j, 2], i] -= corr
-
-                    pd[ip[j, 0], ir[j, 2]] += deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] += corr
-                    if ip[j, 1] != -1:
-                        pd[ip[j, 1], ir[j, 2]] += deriv
-                        for i in range(num_core_species):
-                            pd[ip[j, 1], i] += corr
-                        if ip[j, 2] != -1:
-                            pd[ip[j, 2], ir[j, 2]] += deriv
-                            for i in range(num_core_species):
-                                pd[ip[j, 2], i] += corr
-
-            k = kr[j]
-            if ip[j, 1] == -1:  # only one reactant
-                deriv = k
-                pd[ip[j, 0], ip[j, 0]] -= deriv
-
-                pd[ir[j, 0], ip[j, 0]] += deriv
-                if ir[j, 1] != -1:
-                    pd[ir[j, 1], ip[j, 0]] += deriv
-                    if ir[j, 2] != -1:
-                        pd[ir[j, 2], ip[j, 0]] += deriv
-
-
-            elif ip[j, 2] == -1:  # only two reactants
-                corr = -k * C[ip[j, 0]] * C[ip[j, 1]] / Ctot
-                if ip[j, 0] == ip[j, 1]:
-                    deriv = 2 * k * C[ip[j, 0]]
-                    pd[ip[j, 0], ip[j, 0]] -= 2 * deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] -= 2 * corr
-
-                    pd[ir[j, 0], ip[j, 0]] += deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] += corr
-                    if ir[j, 1] != -1:
-                        pd[ir[j, 1], ip[j, 0]] += deriv
-                        for i in range(num_core_species):
-                            pd[ir[j, 1], i] += corr
-                        if ir[j, 2] != -1:
-                            pd[ir[j, 2], ip[j, 0]] += deriv
-                            for i in range(num_core_species):
-                                pd[ir[j, 2], i] += corr
-
-                else:
-                    # Derivative with respect to reactant 1
-                    deriv = k * C[ip[j, 1]]
-                    pd[ip[j, 0], ip[j, 0]] -= deriv
-                    pd[ip[j, 1], ip[j, 0]] -= deriv
-
-                    pd[ir[j, 0], ip[j, 0]] += deriv
-                    if ir[j, 1] != -1:
-                        pd[ir[j, 1], ip[j, 0]] += deriv
-                        if ir[j, 2] != -1:
-                            pd[ir[j, 2], ip[j, 0]] += deriv
-
-                    # Derivative with respect to reactant 2
-                    deriv = k * C[ip[j, 0]]
-                    pd[ip[j, 0], ip[j, 1]] -= deriv
-                    pd[ip[j, 1], ip[j, 1]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] -= corr
-                        pd[ip[j, 1], i] -= corr
-
-                    pd[ir[j, 0], ip[j, 1]] += deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] += corr
-                    if ir[j, 1] != -1:
-                        pd[ir[j, 1], ip[j, 1]] += deriv
-                        for i in range(num_core_species):
-                            pd[ir[j, 1], i] += corr
-                        if ir[j, 2] != -1:
-                            pd[ir[j, 2], ip[j, 1]] += deriv
-                            for i in range(num_core_species):
-                                pd[ir[j, 2], i] += corr
-
-
-            else:  # three reactants
-                corr = - 2 * k * C[ip[j, 0]] * C[ip[j, 1]] * C[ip[j, 2]] / Ctot
-                if (ip[j, 0] == ip[j, 1] & ip[j, 0] == ip[j, 2]):
-                    deriv = 3 * k * C[ip[j, 0]] * C[ip[j, 0]]
-                    pd[ip[j, 0], ip[j, 0]] -= 3 * deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] -= 3 * corr
-
-                    pd[ir[j, 0], ip[j, 0]] += deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] += corr
-                    if ir[j, 1] != -1:
-                        pd[ir[j, 1], ip[j, 0]] += deriv
-                        for i in range(num_core_species):
-                            pd[ir[j, 1], i] += corr
-                        if ir[j, 2] != -1:
-                            pd[ir[j, 2], ip[j, 0]] += deriv
-                            for i in range(num_core_species):
-                                pd[ir[j, 2], i] += corr
-
-                elif ip[j, 0] == ip[j, 1]:
-                    # derivative with respect to reactant 1
-                    deriv = 2 * k * C[ip[j, 0]] * C[ip[j, 2]]
-                    pd[ip[j, 0], ip[j, 0]] -= 2 * deriv
-                    pd[ip[j, 2], ip[j, 0]] -= deriv
-
-                    pd[ir[j, 0], ip[j, 0]] += deriv
-                    if ir[j, 1] != -1:
-                        pd[ir[j, 1], ip[j, 0]] += deriv
-                        if ir[j, 2] != -1:
-                            pd[ir[j, 2], ip[j, 0]] += deriv
-                    # derivative with respect to reactant 3
-                    deriv = k * C[ip[j, 0]] * C[ip[j, 0]]
-                    pd[ip[j, 0], ip[j, 2]] -= 2 * deriv
-                    pd[ip[j, 2], ip[j, 2]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] -= 2 * corr
-                        pd[ip[j, 2], i] -= corr
-
-                    pd[ir[j, 0], ip[j, 2]] += deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] += corr
-                    if ir[j, 1] != -1:
-                        pd[ir[j, 1], ip[j, 2]] += deriv
-                        for i in range(num_core_species):
-                            pd[ir[j, 1], i] += corr
-                        if ir[j, 2] != -1:
-                            pd[ir[j, 2], ip[j, 2]] += deriv
-                            for i in range(num_core_species):
-                                pd[ir[j, 2], i] += corr
-
-
-                elif ip[j, 1] == ip[j, 2]:
-                    # derivative with respect to reactant 1
-                    deriv = k * C[ip[j, 1]] * C[ip[j, 1]]
-                    pd[ip[j, 0], ip[j, 0]] -= deriv
-                    pd[ip[j, 1], ip[j, 0]] -= 2 * deriv
-
-                    pd[ir[j, 0], ip[j, 0]] += deriv
-                    if ir[j, 1] != -1:
-                        pd[ir[j, 1], ip[j, 0]] += deriv
-                        if ir[j, 2] != -1:
-                            pd[ir[j, 2], ip[j, 0]] += deriv
-
-                            # derivative with respect to reactant 2
-                    deriv = 2 * k * C[ip[j, 0]] * C[ip[j, 1]]
-                    pd[ip[j, 0], ip[j, 1]] -= deriv
-                    pd[ip[j, 1], ip[j, 1]] -= 2 * deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] -= corr
-                        pd[ip[j, 1], i] -= 2 * corr
-
-                    pd[ir[j, 0], ip[j, 1]] += deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] += corr
-                    if ir[j, 1] != -1:
-                        pd[ir[j, 1], ip[j, 1]] += deriv
-                        for i in range(num_core_species):
-                            pd[ir[j, 1], i] += corr
-                        if ir[j, 2] != -1:
-                            pd[ir[j, 2], ip[j, 1]] += deriv
-                            for i in range(num_core_species):
-                                pd[ir[j, 2], i] += corr
-
-                elif ip[j, 0] == ip[j, 2]:
-                    # derivative with respect to reactant 1
-                    deriv = 2 * k * C[ip[j, 0]] * C[ip[j, 1]]
-                    pd[ip[j, 0], ip[j, 0]] -= 2 * deriv
-                    pd[ip[j, 1], ip[j, 0]] -= deriv
-
-                    pd[ir[j, 0], ip[j, 0]] += deriv
-                    if ir[j, 1] != -1:
-                        pd[ir[j, 1], ip[j, 0]] += deriv
-                        if ir[j, 2] != -1:
-                            pd[ir[j, 2], ip[j, 0]] += deriv
-                    # derivative with respect to reactant 2
-                    deriv = k * C[ip[j, 0]] * C[ip[j, 0]]
-                    pd[ip[j, 0], ip[j, 1]] -= 2 * deriv
-                    pd[ip[j, 1], ip[j, 1]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] -= 2 * corr
-                        pd[ip[j, 1], i] -= corr
-
-                    pd[ir[j, 0], ip[j, 1]] += deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] += corr
-                    if ir[j, 1] != -1:
-                        pd[ir[j, 1], ip[j, 1]] += deriv
-                        for i in range(num_core_species):
-                            pd[ir[j, 1], i] += corr
-                        if ir[j, 2] != -1:
-                            pd[ir[j, 2], ip[j, 1]] += deriv
-                            for i in range(num_core_species):
-                                pd[ir[j, 2], i] += corr
-
-                else:
-                    # derivative with respect to reactant 1
-                    deriv = k * C[ip[j, 1]] * C[ip[j, 2]]
-                    pd[ip[j, 0], ip[j, 0]] -= deriv
-                    pd[ip[j, 1], ip[j, 0]] -= deriv
-                    pd[ip[j, 2], ip[j, 0]] -= deriv
-
-                    pd[ir[j, 0], ip[j, 0]] += deriv
-                    if ir[j, 1] != -1:
-                        pd[ir[j, 1], ip[j, 0]] += deriv
-                        if ir[j, 2] != -1:
-                            pd[ir[j, 2], ip[j, 0]] += deriv
-
-                            # derivative with respect to reactant 2
-                    deriv = k * C[ip[j, 0]] * C[ip[j, 2]]
-                    pd[ip[j, 0], ip[j, 1]] -= deriv
-                    pd[ip[j, 1], ip[j, 1]] -= deriv
-                    pd[ip[j, 2], ip[j, 1]] -= deriv
-
-                    pd[ir[j, 0], ip[j, 1]] += deriv
-                    if ir[j, 1] != -1:
-                        pd[ir[j, 1], ip[j, 1]] += deriv
-                        if ir[j, 2] != -1:
-                            pd[ir[j, 2], ip[j, 1]] += deriv
-
-                            # derivative with respect to reactant 3
-                    deriv = k * C[ip[j, 0]] * C[ip[j, 1]]
-                    pd[ip[j, 0], ip[j, 2]] -= deriv
-                    pd[ip[j, 1], ip[j, 2]] -= deriv
-                    pd[ip[j, 2], ip[j, 2]] -= deriv
-                    for i in range(num_core_species):
-                        pd[ip[j, 0], i] -= corr
-                        pd[ip[j, 1], i] -= corr
-                        pd[ip[j, 2], i] -= corr
-
-                    pd[ir[j, 0], ip[j, 2]] += deriv
-                    for i in range(num_core_species):
-                        pd[ir[j, 0], i] += corr
-                    if ir[j, 1] != -1:
-                        pd[ir[j, 1], ip[j, 2]] += deriv
-                        for i in range(num_core_species):
-                            pd[ir[j, 1], i] += corr
-                        if ir[j, 2] != -1:
-                            pd[ir[j, 2], ip[j, 2]] += deriv
-                            for i in range(num_core_species):
-                                pd[ir[j, 2], i] += corr
-
-        self.jacobian_matrix = pd + cj * np.identity(num_core_species, np.float64)
-        return pd
+        # The volume is proportional to the total number of moles, so dV/dN = 1/Ctot
+        self.compute_sparse_jacobian(C, 1.0 / Ctot)
+        return self.get_dense_jacobian(cj)
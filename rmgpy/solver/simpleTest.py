@@ -27,16 +27,19 @@
 #                                                                             #
 ###############################################################################
 
+import csv
 import os
+import tempfile
 import unittest
 
 import numpy as np
 
 import rmgpy.constants as constants
 from rmgpy.chemkin import load_chemkin_file
-from rmgpy.kinetics import Arrhenius
+from rmgpy.kinetics import Arrhenius, Chebyshev
 from rmgpy.molecule import Molecule
 from rmgpy.reaction import Reaction
+from rmgpy.quantity import Quantity
 from rmgpy.rmg.settings import ModelSettings, SimulatorSettings
 from rmgpy.solver.base import TerminationTime
 from rmgpy.solver.simple import SimpleReactor
@@ -46,6 +49,17 @@ from rmgpy.thermo import ThermoData
 
 ################################################################################
 
+class RecordingSimpleReactor(SimpleReactor):
+    """
+    A simple reactor which records the reactions whose rate coefficients were
+    generated by the last call to :meth:`generate_rate_coefficients`.
+    """
+
+    def generate_rate_coefficients(self, core_reactions, edge_reactions):
+        self.computed_reactions = core_reactions + edge_reactions
+        SimpleReactor.generate_rate_coefficients(self, core_reactions, edge_reactions)
+
+
 class SimpleReactorCheck(unittest.TestCase):
 
     def test_solve(self):
@@ -191,8 +205,8 @@ class SimpleReactorCheck(unittest.TestCase):
                 dydt.append(rxn_system0.residual(0.0, rxn_system0.y, np.zeros(rxn_system0.y.shape))[0])
                 rxn_system0.y[i] -= dN  # reset y to original y0
 
-            # Let the solver compute the jacobian       
-            solver_jacobian = rxn_system0.jacobian(0.0, rxn_system0.y, dydt0, 0.0)
+            # Let the solver compute the jacobian, copying it since the array is reused by the next call
+            solver_jacobian = rxn_system0.jacobian(0.0, rxn_system0.y, dydt0, 0.0).copy()
             # Compute the jacobian using finite differences
             jacobian = np.zeros((num_core_species, num_core_species))
             for i in range(num_core_species):
@@ -200,6 +214,19 @@ class SimpleReactorCheck(unittest.TestCase):
                     jacobian[i, j] = (dydt[j][i] - dydt0[i]) / dN
                     self.assertAlmostEqual(jacobian[i, j], solver_jacobian[i, j], delta=abs(1e-4 * jacobian[i, j]))
 
+            # The sparse Jacobian only stores the derivatives for species that take part in the same reaction
+            matrix, correction = rxn_system0.sparse_jacobian
+            self.assertTrue(np.allclose(matrix.toarray() + correction[:, np.newaxis], solver_jacobian))
+            iteration_matrix = rxn_system0.jacobian(0.0, rxn_system0.y, dydt0, 1.0)
+            self.assertTrue(np.allclose(iteration_matrix, solver_jacobian - np.identity(num_core_species)))
+            self.assertTrue(np.allclose(rxn_system0.jacobian_matrix, solver_jacobian))
+            # The dense arrays are reused by later calls
+            jacobian_matrix = rxn_system0.jacobian_matrix
+            self.assertIs(rxn_system0.jacobian(0.0, rxn_system0.y, dydt0, 2.0), iteration_matrix)
+            self.assertIs(rxn_system0.jacobian_matrix, jacobian_matrix)
+            self.assertTrue(np.allclose(iteration_matrix, solver_jacobian - 2.0 * np.identity(num_core_species)))
+            self.assertLess(matrix.nnz, num_core_species ** 2)
+
         # print 'Solver jacobian'
         # print solver_jacobian
         # print 'Numerical jacobian'
@@ -424,3 +451,262 @@ class SimpleReactorCheck(unittest.TestCase):
         # order: Ar, N2, O2, H, CH3, CH4
         for i in range(len(simulated_mole_fracs)):
             self.assertAlmostEqual(simulated_mole_fracs[i], expected_mole_fracs[i], 6)
+
+    def split_collider_model(self, num_core_species=None):
+        """
+        Return the core species, core reactions, edge species and edge reactions of the collider model
+        mechanism, with its first `num_core_species` species in the core, or half of them by default. The
+        mechanism is only loaded once per test, so the same objects are returned by every call.
+        """
+        if not hasattr(self, 'collider_model'):
+            chem_file = os.path.join(os.path.dirname(__file__), 'files', 'collider_model', 'chem.inp')
+            dictionary_file = os.path.join(os.path.dirname(__file__), 'files', 'collider_model',
+                                           'species_dictionary.txt')
+            self.collider_model = load_chemkin_file(chem_file, dictionary_file)
+        species_list, reaction_list = self.collider_model
+        if num_core_species is None:
+            num_core_species = len(species_list) // 2
+        core_species = species_list[:num_core_species]
+        core_reactions = [rxn for rxn in reaction_list
+                          if all(spc in core_species for spc in rxn.reactants + rxn.products)]
+        edge_reactions = [rxn for rxn in reaction_list if rxn not in core_reactions]
+        return core_species, core_reactions, species_list[num_core_species:], edge_reactions
+
+    def test_vectorized_residual(self):
+        """
+        Test that the vectorized residual gives the same rates as the loop over the reactions.
+        """
+        # Use half of the species as the core to get edge reactions with and without edge reactants
+        core_species, core_reactions, edge_species, edge_reactions = self.split_collider_model()
+        initial_mole_fractions = dict((spc, 1.0 + i) for i, spc in enumerate(core_species))
+
+        results = []
+        for vectorized_residual in [False, True]:
+            rxn_system = SimpleReactor(1000, 1000, initial_mole_fractions=initial_mole_fractions, n_sims=1,
+                                       termination=None, vectorized_residual=vectorized_residual)
+            rxn_system.initialize_model(core_species, core_reactions, edge_species, edge_reactions)
+            res = rxn_system.residual(0.0, rxn_system.y, np.zeros(rxn_system.y.shape))[0]
+            results.append([res, rxn_system.core_species_rates, rxn_system.core_species_consumption_rates,
+                            rxn_system.core_species_production_rates, rxn_system.core_reaction_rates,
+                            rxn_system.edge_species_rates, rxn_system.edge_reaction_rates])
+
+        for expected, rates in zip(*results):
+            self.assertEqual(expected.shape, rates.shape)
+            self.assertTrue(np.allclose(expected, rates, rtol=1e-12, atol=0))
+
+    def test_compute_step_rates(self):
+        """
+        Test that the edge rates skipped by the residual are computed at the accepted steps.
+        """
+        core_species, core_reactions, edge_species, edge_reactions = self.split_collider_model()
+        initial_mole_fractions = dict((spc, 1.0 + i) for i, spc in enumerate(core_species))
+
+        for vectorized_residual in [False, True]:
+            rxn_system = SimpleReactor(1000, 1000, initial_mole_fractions=initial_mole_fractions, n_sims=1,
+                                       termination=None, vectorized_residual=vectorized_residual)
+            rxn_system.initialize_model(core_species, core_reactions, edge_species, edge_reactions)
+            rxn_system.advance(1e-6)
+            rxn_system.residual(rxn_system.t, rxn_system.y, np.zeros(rxn_system.y.shape))
+            core_species_rates = rxn_system.core_species_rates
+            edge_reaction_rates = rxn_system.edge_reaction_rates
+            self.assertTrue(np.any(edge_reaction_rates))
+
+            rxn_system.compute_edge_rates = False
+            res = rxn_system.residual(rxn_system.t, rxn_system.y, np.zeros(rxn_system.y.shape))[0]
+            self.assertTrue(np.allclose(rxn_system.core_species_rates, core_species_rates, rtol=1e-12, atol=0))
+            self.assertFalse(np.any(rxn_system.edge_reaction_rates))
+            self.assertFalse(np.any(rxn_system.edge_species_rates))
+
+            rxn_system.compute_step_rates()
+            self.assertFalse(rxn_system.compute_edge_rates)
+            self.assertTrue(np.allclose(rxn_system.edge_reaction_rates, edge_reaction_rates, rtol=1e-12, atol=0))
+
+    def test_kinetics_table(self):
+        """
+        Test that the kinetics table gives the same rate coefficients as evaluating each reaction.
+        """
+        core_species, core_reactions, edge_species, edge_reactions = self.split_collider_model()
+        edge_reactions.append(Reaction(reactants=[core_species[0], edge_species[0]], products=[edge_species[1]],
+                                       kinetics=Chebyshev(coeffs=[[11.67, 0.3134, -0.0399], [-1.1, 0.4, 0.03],
+                                                                  [0.3, -0.1, 0.01], [-0.05, 0.02, -0.001]],
+                                                          kunits='cm^3/(mol*s)', Tmin=(300, 'K'), Tmax=(2000, 'K'),
+                                                          Pmin=(0.01, 'bar'), Pmax=(100, 'bar'))))
+        initial_mole_fractions = dict((spc, 1.0 + i) for i, spc in enumerate(core_species))
+
+        for T in [500, 1000, 1800]:
+            rxn_system = SimpleReactor(T, 1e5, initial_mole_fractions=initial_mole_fractions, n_sims=1,
+                                       termination=None)
+            rxn_system.initialize_model(core_species, core_reactions, edge_species, edge_reactions)
+
+            arrhenius_table, chebyshev_table, generic_reactions = rxn_system.kinetics_table[:3]
+            nasa_table = rxn_system.kinetics_table[4]
+            self.assertTrue(arrhenius_table[0].shape[0] > 0)
+            self.assertEqual(len(chebyshev_table), 1)
+            self.assertTrue(nasa_table[0].shape[0] > 0)
+
+            for rxn in core_reactions + edge_reactions:
+                j = rxn_system.reaction_index[rxn]
+                kf = rxn.get_rate_coefficient(T, rxn_system.calculate_effective_pressure(rxn))
+                self.assertAlmostEqual(rxn_system.kf[j] / kf, 1.0, places=10)
+                if rxn.reversible:
+                    Keq = rxn.get_equilibrium_constant(T)
+                    self.assertAlmostEqual(rxn_system.Keq[j] / Keq, 1.0, places=8)
+                    self.assertAlmostEqual(rxn_system.kb[j] / (kf / Keq), 1.0, places=8)
+                else:
+                    self.assertEqual(rxn_system.kb[j], 0.0)
+
+    def test_update_model(self):
+        """
+        Test that updating the model of a reactor gives the same indices and rate coefficients as a new reactor.
+        """
+        core_species = self.split_collider_model()[0]
+        species_list, reaction_list = self.collider_model
+        initial_mole_fractions = dict((spc, 1.0 + i) for i, spc in enumerate(core_species))
+
+        rxn_system = RecordingSimpleReactor(1000, 1e5, initial_mole_fractions=initial_mole_fractions, n_sims=1,
+                                            termination=None)
+        rxn_system.initialize_model(*self.split_collider_model())
+        num_reactions = len(reaction_list)
+        self.assertTrue(np.all(rxn_system.reaction_map == -1))
+        self.assertEqual(len(rxn_system.computed_reactions), num_reactions)
+
+        for num_core_species in [len(species_list) // 2, len(species_list) // 2 + 1, len(species_list) // 2 + 3]:
+            model = self.split_collider_model(num_core_species)
+            rxn_system.initialize_model(*model)
+            self.assertTrue(np.all(rxn_system.reaction_map >= 0))
+
+            new_system = SimpleReactor(1000, 1e5, initial_mole_fractions=initial_mole_fractions, n_sims=1,
+                                       termination=None)
+            new_system.initialize_model(*model)
+            self.assertEqual(rxn_system.species_index, new_system.species_index)
+            self.assertEqual(rxn_system.reaction_index, new_system.reaction_index)
+            self.assertTrue(np.array_equal(rxn_system.reactant_indices, new_system.reactant_indices))
+            self.assertTrue(np.array_equal(rxn_system.product_indices, new_system.product_indices))
+            self.assertTrue(np.allclose(rxn_system.kf, new_system.kf, rtol=1e-12, atol=0))
+            self.assertTrue(np.allclose(rxn_system.kb, new_system.kb, rtol=1e-12, atol=0))
+            self.assertTrue(np.allclose(rxn_system.Keq, new_system.Keq, rtol=1e-12, atol=0))
+
+            # Only the reactions evaluated at an effective pressure are recomputed
+            generic_reactions = [rxn for _, rxn in rxn_system.kinetics_table[2]]
+            self.assertTrue(0 < len(rxn_system.computed_reactions) < num_reactions)
+            self.assertTrue(all(rxn in generic_reactions for rxn in rxn_system.computed_reactions))
+
+        # Changing the temperature recomputes all of the rate coefficients
+        rxn_system.T = Quantity(1200, 'K')
+        rxn_system.initialize_model(*self.split_collider_model())
+        new_system = SimpleReactor(1200, 1e5, initial_mole_fractions=initial_mole_fractions, n_sims=1,
+                                   termination=None)
+        new_system.initialize_model(*self.split_collider_model())
+        self.assertTrue(np.allclose(rxn_system.kf, new_system.kf, rtol=1e-12, atol=0))
+        self.assertTrue(np.allclose(rxn_system.kb, new_system.kb, rtol=1e-12, atol=0))
+
+        # The previous model is only known by the ids of its species and reactions
+        self.assertFalse(any(isinstance(key, Species) for key in rxn_system.previous_model[0]))
+        self.assertFalse(any(isinstance(key, Reaction) for key in rxn_system.previous_model[1]))
+
+        # Kinetics modified in place, here by changing the degeneracy, are recomputed
+        rxn = [rxn for rxn in reaction_list if isinstance(rxn.kinetics, Arrhenius)][0]
+        j = rxn_system.reaction_index[rxn]
+        kf = rxn_system.kf[j]
+        rxn.degeneracy = 2 * rxn.degeneracy
+        rxn_system.initialize_model(*self.split_collider_model())
+        self.assertTrue(np.all(rxn_system.reaction_map >= 0))
+        self.assertAlmostEqual(rxn_system.kf[j] / kf, 2.0, places=10)
+        new_system = SimpleReactor(1200, 1e5, initial_mole_fractions=initial_mole_fractions, n_sims=1,
+                                   termination=None)
+        new_system.initialize_model(*self.split_collider_model())
+        self.assertTrue(np.allclose(rxn_system.kf, new_system.kf, rtol=1e-12, atol=0))
+        self.assertTrue(np.allclose(rxn_system.kb, new_system.kb, rtol=1e-12, atol=0))
+
+        # Only the rate coefficients of the given reactions are generated
+        model = self.split_collider_model(len(species_list) // 2 + 3)
+        core_reactions, edge_reactions = model[1], model[3]
+        self.assertTrue(core_reactions and edge_reactions)
+        rxn_system.initialize_model(*model)
+        new_system.initialize_model(*model)
+        rxn_system.kf[:] = 0.0
+        rxn_system.kb[:] = 0.0
+        rxn_system.generate_rate_coefficients(core_reactions[:1], edge_reactions[:1])
+        indices = [rxn_system.reaction_index[rxn] for rxn in core_reactions[:1] + edge_reactions[:1]]
+        self.assertTrue(np.allclose(rxn_system.kf[indices], new_system.kf[indices], rtol=1e-12, atol=0))
+        self.assertTrue(np.allclose(rxn_system.kb[indices], new_system.kb[indices], rtol=1e-12, atol=0))
+        self.assertTrue(np.all(rxn_system.kf[indices] > 0))
+        self.assertFalse(np.any(np.delete(rxn_system.kf, indices)))
+
+    def test_adjoint_sensitivity(self):
+        """
+        Test that the adjoint sensitivities agree with the forward sensitivities
+        over the whole simulation.
+        """
+        ch4 = Species(
+            label='CH4',
+            molecule=[Molecule().from_smiles("C")],
+            thermo=ThermoData(Tdata=([300, 400, 500, 600, 800, 1000, 1500], "K"),
+                              Cpdata=([8.615, 9.687, 10.963, 12.301, 14.841, 16.976, 20.528], "cal/(mol*K)"),
+                              H298=(-17.714, "kcal/mol"), S298=(44.472, "cal/(mol*K)"))
+        )
+        ch3 = Species(
+            label='CH3',
+            molecule=[Molecule().from_smiles("[CH3]")],
+            thermo=ThermoData(Tdata=([300, 400, 500, 600, 800, 1000, 1500], "K"),
+                              Cpdata=([9.397, 10.123, 10.856, 11.571, 12.899, 14.055, 16.195], "cal/(mol*K)"),
+                              H298=(9.357, "kcal/mol"), S298=(45.174, "cal/(mol*K)"))
+        )
+        c2h6 = Species(
+            label='C2H6',
+            molecule=[Molecule().from_smiles("CC")],
+            thermo=ThermoData(Tdata=([300, 400, 500, 600, 800, 1000, 1500], "K"),
+                              Cpdata=([12.684, 15.506, 18.326, 20.971, 25.500, 29.016, 34.595], "cal/(mol*K)"),
+                              H298=(-19.521, "kcal/mol"), S298=(54.799, "cal/(mol*K)"))
+        )
+        c2h5 = Species(
+            label='C2H5',
+            molecule=[Molecule().from_smiles("C[CH2]")],
+            thermo=ThermoData(Tdata=([300, 400, 500, 600, 800, 1000, 1500], "K"),
+                              Cpdata=([11.635, 13.744, 16.085, 18.246, 21.885, 24.676, 29.107], "cal/(mol*K)"),
+                              H298=(29.496, "kcal/mol"), S298=(56.687, "cal/(mol*K)"))
+        )
+
+        rxn1 = Reaction(reactants=[c2h6, ch3], products=[c2h5, ch4],
+                        kinetics=Arrhenius(A=(686.375 * 6, 'm^3/(mol*s)'), n=4.40721, Ea=(7.82799, 'kcal/mol'),
+                                           T0=(298.15, 'K')))
+        rxn2 = Reaction(reactants=[c2h6], products=[ch3, ch3],
+                        kinetics=Arrhenius(A=(2.0e16, 's^-1'), n=0, Ea=(88.0, 'kcal/mol'), T0=(1, 'K')))
+
+        core_species = [ch4, ch3, c2h6, c2h5]
+        core_reactions = [rxn1, rxn2]
+        initial_mole_fractions = {ch3: 0.01, ch4: 0.49, c2h6: 0.5}
+
+        results = []
+        for method in ['forward', 'adjoint']:
+            rxn_system = SimpleReactor(1000, 1e5, initial_mole_fractions=initial_mole_fractions, n_sims=1,
+                                       termination=[TerminationTime(Quantity(1e-3, 's'))],
+                                       sensitive_species=[c2h6], sensitivity_threshold=1e-6,
+                                       sensitivity_method=method)
+            rxn_system.initialize_model(core_species, core_reactions, [], [])
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'sensitivity.csv')
+                rxn_system.simulate(core_species, core_reactions, [], [], [], [], sensitivity=True,
+                                    sens_worksheet=[path],
+                                    model_settings=ModelSettings(tol_move_to_core=1e8, tol_interrupt_simulation=1e8),
+                                    simulator_settings=SimulatorSettings())
+                with open(path, 'r') as f:
+                    rows = list(csv.reader(f))
+            results.append((rows[0], np.array(rows[1:], np.float64), len(rxn_system.snapshots)))
+
+        (forward_headers, forward, forward_steps), (adjoint_headers, adjoint, adjoint_steps) = results
+        # The sensitivities are written at every solver step by both methods
+        self.assertEqual(forward.shape[0], forward_steps)
+        self.assertEqual(adjoint.shape[0], adjoint_steps)
+        self.assertAlmostEqual(forward[-1, 0], adjoint[-1, 0], delta=1e-9)
+
+        # The solver steps may differ, so the forward sensitivities are interpolated to the adjoint times
+        times = adjoint[:, 0]
+        late = times >= 1e-1 * times[-1]
+        self.assertTrue(np.count_nonzero(late) > 1)
+        scale = np.max(np.abs(forward[:, 1:]))
+        for j, header in enumerate(forward_headers[1:], 1):
+            expected = np.interp(times[late], forward[:, 0], forward[:, j])
+            if np.max(np.abs(expected)) > 1e-2 * scale:
+                actual = adjoint[late, adjoint_headers.index(header)]
+                self.assertTrue(np.all(np.abs(actual - expected) <= 0.05 * np.abs(expected) + 1e-3 * scale))
@@ -346,6 +346,7 @@ cdef class SurfaceReactor(ReactionSystem):
         cdef np.ndarray[np.int_t, ndim=1] reactions_on_surface, species_on_surface
         cdef np.ndarray[np.float64_t, ndim=1] res, kf, kr, knet, delta, equilibrium_constants
         cdef int num_core_species, num_core_reactions, num_edge_species, num_edge_reactions, num_pdep_networks
+        cdef int num_reactions, num_networks
         cdef int i, j, z, first, second, third
         cdef double k, V, reaction_rate, surface_volume_ratio_si
         cdef np.ndarray[np.float64_t, ndim=1] core_species_concentrations, core_species_rates, core_reaction_rates
@@ -369,6 +370,15 @@ cdef class SurfaceReactor(ReactionSystem):
         num_edge_reactions = len(self.edge_reaction_rates)
         num_pdep_networks = len(self.network_leak_rates)
 
+        # While integrating, the edge rates are only computed after each
+        # successful step, see ReactionSystem.compute_step_rates
+        if self.compute_edge_rates:
+            num_reactions = ir.shape[0]
+            num_networks = inet.shape[0]
+        else:
+            num_reactions = num_core_reactions
+            num_networks = 0
+
         res = np.zeros(num_core_species, np.float64)
 
         core_species_concentrations = np.zeros_like(self.core_species_concentrations)
@@ -393,7 +403,7 @@ cdef class SurfaceReactor(ReactionSystem):
             #: surface species are in mol/m2, gas phase are in mol/m3
             core_species_concentrations[j] = C[j]
 
-        for j in range(ir.shape[0]):
+        for j in range(num_reactions):
             k = kf[j]
             if ir[j, 0] >= num_core_species or ir[j, 1] >= num_core_species or ir[j, 2] >= num_core_species:
                 reaction_rate = 0.0
@@ -464,7 +474,7 @@ cdef class SurfaceReactor(ReactionSystem):
                     if third != -1:
                         if third >= num_core_species: edge_species_rates[third - num_core_species] += reaction_rate
 
-        for j in range(inet.shape[0]):
+        for j in range(num_networks):
             k = knet[j]
             if inet[j, 1] == -1:  # only one reactant
                 reaction_rate = k * C[inet[j, 0]]
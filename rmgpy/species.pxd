@@ -40,7 +40,7 @@ cdef class Species:
     
     cdef public int index
     cdef public str label
-    cdef public object thermo
+    cdef public object _thermo
     cdef public Conformer conformer
     cdef public object transport_data
     cdef public list molecule
@@ -177,8 +177,15 @@ class Species(object):
     def __reduce__(self):
         """
         A helper function used when pickling an object.
+
+        If the thermo is still being estimated in a worker process, the copy
+        receives the estimate, but nothing is copied onto this species, which
+        only happens when its thermo is read.
         """
-        return (Species, (self.index, self.label, self.thermo, self.conformer, self.molecule, self.transport_data,
+        thermo = self._thermo
+        if thermo is not None and hasattr(thermo, 'wait'):
+            thermo = thermo.wait()
+        return (Species, (self.index, self.label, thermo, self.conformer, self.molecule, self.transport_data,
                           self.molecular_weight, self.energy_transfer_model, self.reactive, self.props))
 
     def __hash__(self):
@@ -216,6 +223,20 @@ class Species(object):
         """Returns a sorting key for comparing Species objects. Read-only"""
         return self.fingerprint, self.label, self.index
 
+    @property
+    def thermo(self):
+        """
+        The heat capacity model of the species. If the thermo is still being
+        estimated in a worker process, reading it waits for the result.
+        """
+        if self._thermo is not None and hasattr(self._thermo, 'result'):
+            self._thermo = self._thermo.result()
+        return self._thermo
+
+    @thermo.setter
+    def thermo(self, value):
+        self._thermo = value
+
     @property
     def fingerprint(self):
         """Fingerprint of this species, taken from molecule attribute. Read-only."""
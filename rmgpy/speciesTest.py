@@ -32,6 +32,7 @@ This module contains unit tests of the rmgpy.species module.
 """
 
 import unittest
+from concurrent.futures import Future
 
 from rmgpy.species import Species
 from rmgpy.transport import TransportData
@@ -414,6 +415,17 @@ Thermo library: primaryThermoLibrary
         """Test that the fingerprint property works"""
         self.assertEqual(self.species2.fingerprint, 'C06H06N00O00S00')
 
+    def test_thermo_future(self):
+        """Test that pending thermo is resolved when the thermo property is first read"""
+        thermo = self.species.thermo
+        future = Future()
+        future.set_result(thermo)
+        spc = Species(label='C2H4', thermo=future)
+        self.assertIs(spc._thermo, future)
+        self.assertIs(spc.thermo, thermo)
+        self.assertIs(spc._thermo, thermo)
+        self.assertTrue(spc.has_thermo())
+
     def test_inchi_property(self):
         """Test that the InChI property works"""
         self.assertEqual(self.species2.inchi, 'InChI=1S/C6H6/c1-2-4-6-5-3-1/h1-6H')
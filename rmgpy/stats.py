@@ -78,6 +78,8 @@ class ExecutionStatsWriter(object):
         self.edgeSpeciesCount = []
         self.edgeReactionCount = []
         self.memoryUse = []
+        self.speciesLookupStats = []
+        self.kineticsCacheStats = []
 
     def update(self, rmg):
         self.update_execution(rmg)
@@ -108,6 +110,23 @@ class ExecutionStatsWriter(object):
             logging.info('    Memory used: memory usage was unable to be logged')
             self.memoryUse.append(0.0)
 
+        lookup_stats = rmg.reaction_model.pop_species_lookup_stats()
+        self.speciesLookupStats.append(lookup_stats)
+        lookups = lookup_stats['hits'] + lookup_stats['misses']
+        if lookups:
+            logging.info('    Species lookups: {0:d} ({1:.1%} hits, {2:.1%} misses, '
+                         '{3:d} hash collisions)'.format(lookups, lookup_stats['hits'] / lookups,
+                                                         lookup_stats['misses'] / lookups,
+                                                         lookup_stats['collisions']))
+
+        cache_stats = rmg.reaction_model.pop_kinetics_cache_stats()
+        self.kineticsCacheStats.append(cache_stats)
+        lookups = cache_stats['hits'] + cache_stats['misses']
+        if lookups:
+            logging.info('    Template kinetics lookups: {0:d} ({1:.1%} cache hits, '
+                         '{2:.1%} misses)'.format(lookups, cache_stats['hits'] / lookups,
+                                                  cache_stats['misses'] / lookups))
+
         self.save_execution_statistics(rmg)
         if rmg.generate_plots:
             self.generate_execution_plots(rmg)
@@ -162,6 +181,18 @@ class ExecutionStatsWriter(object):
         for i, memory in enumerate(self.memoryUse):
             sheet.write(i + 1, 5, memory)
 
+        # Remaining columns are species lookup statistics
+        for j, key in enumerate(['hits', 'misses', 'collisions']):
+            sheet.write(0, 6 + j, 'Species lookup {0}'.format(key))
+            for i, stats in enumerate(self.speciesLookupStats):
+                sheet.write(i + 1, 6 + j, stats[key])
+
+        # Followed by template kinetics cache statistics
+        for j, key in enumerate(['hits', 'misses']):
+            sheet.write(0, 9 + j, 'Kinetics cache {0}'.format(key))
+            for i, stats in enumerate(self.kineticsCacheStats):
+                sheet.write(i + 1, 9 + j, stats[key])
+
         # Save workbook to file
         fstr = os.path.join(rmg.output_directory, 'statistics.xls')
         workbook.save(fstr)
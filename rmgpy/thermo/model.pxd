@@ -25,6 +25,8 @@
 #                                                                             #
 ###############################################################################
 
+cimport numpy as np
+
 from rmgpy.quantity cimport ScalarQuantity, ArrayQuantity
 from rmgpy.rmgobject cimport RMGObject
 
@@ -42,6 +44,14 @@ cdef class HeatCapacityModel(RMGObject):
     cpdef double get_entropy(self, double T) except -1000000000
 
     cpdef double get_free_energy(self, double T) except 1000000000
+
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_free_energies(self, np.ndarray Tlist)
     
     cpdef bint is_similar_to(self, HeatCapacityModel other) except -2
 
@@ -27,6 +27,9 @@
 #                                                                             #
 ###############################################################################
 
+import numpy as np
+cimport numpy as np
+
 import rmgpy.quantity as quantity
 from rmgpy.rmgobject cimport RMGObject
 
@@ -152,6 +155,70 @@ cdef class HeatCapacityModel(RMGObject):
         """
         raise NotImplementedError('Unexpected call to HeatCapacityModel.get_free_energy(); you should be using a class derived from HeatCapacityModel.')
 
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist):
+        """
+        Return an array of the constant-pressure heat capacities in J/mol*K at
+        each of the temperatures `Tlist` in K. Derived classes may overload
+        this method with a faster version.
+        """
+        cdef double[:] T, values
+        cdef np.ndarray result
+        cdef Py_ssize_t i
+        T = np.ascontiguousarray(Tlist, np.float64).ravel()
+        result = np.empty(T.shape[0], np.float64)
+        values = result
+        for i in range(T.shape[0]):
+            values[i] = self.get_heat_capacity(T[i])
+        return result
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist):
+        """
+        Return an array of the enthalpies in J/mol at each of the temperatures
+        `Tlist` in K. Derived classes may overload this method with a faster
+        version.
+        """
+        cdef double[:] T, values
+        cdef np.ndarray result
+        cdef Py_ssize_t i
+        T = np.ascontiguousarray(Tlist, np.float64).ravel()
+        result = np.empty(T.shape[0], np.float64)
+        values = result
+        for i in range(T.shape[0]):
+            values[i] = self.get_enthalpy(T[i])
+        return result
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist):
+        """
+        Return an array of the entropies in J/mol*K at each of the
+        temperatures `Tlist` in K. Derived classes may overload this method
+        with a faster version.
+        """
+        cdef double[:] T, values
+        cdef np.ndarray result
+        cdef Py_ssize_t i
+        T = np.ascontiguousarray(Tlist, np.float64).ravel()
+        result = np.empty(T.shape[0], np.float64)
+        values = result
+        for i in range(T.shape[0]):
+            values[i] = self.get_entropy(T[i])
+        return result
+
+    cpdef np.ndarray get_free_energies(self, np.ndarray Tlist):
+        """
+        Return an array of the Gibbs free energies in J/mol at each of the
+        temperatures `Tlist` in K. Derived classes may overload this method
+        with a faster version.
+        """
+        cdef double[:] T, values
+        cdef np.ndarray result
+        cdef Py_ssize_t i
+        T = np.ascontiguousarray(Tlist, np.float64).ravel()
+        result = np.empty(T.shape[0], np.float64)
+        values = result
+        for i in range(T.shape[0]):
+            values[i] = self.get_free_energy(T[i])
+        return result
+
     cpdef bint is_similar_to(self, HeatCapacityModel other) except -2:
         """
         Returns ``True`` if `self` and `other` report similar thermo values
@@ -25,6 +25,8 @@
 #                                                                             #
 ###############################################################################
 
+cimport numpy as np
+
 from rmgpy.thermo.model cimport HeatCapacityModel
 from rmgpy.thermo.thermodata cimport ThermoData
 from rmgpy.thermo.wilhoit cimport Wilhoit
@@ -44,6 +46,16 @@ cdef class NASAPolynomial(HeatCapacityModel):
     cpdef double get_entropy(self, double T) except -1000000000
 
     cpdef double get_free_energy(self, double T) except 1000000000    
+
+    cdef np.ndarray evaluate(self, np.ndarray Tlist, int quantity)
+
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_free_energies(self, np.ndarray Tlist)
     
     cpdef change_base_enthalpy(self, double deltaH)
 
@@ -69,6 +81,16 @@ cdef class NASA(HeatCapacityModel):
 
     cpdef double get_free_energy(self, double T) except 1000000000
 
+    cdef np.ndarray evaluate(self, np.ndarray Tlist, int quantity)
+
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_free_energies(self, np.ndarray Tlist)
+
     cpdef ThermoData to_thermo_data(self)
 
     cpdef Wilhoit to_wilhoit(self)
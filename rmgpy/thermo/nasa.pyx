@@ -137,6 +137,70 @@ cdef class NASAPolynomial(HeatCapacityModel):
         in K.
         """
         return self.get_enthalpy(T) - T * self.get_entropy(T)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef np.ndarray evaluate(self, np.ndarray Tlist, int quantity):
+        """
+        Return an array of the heat capacities (`quantity` = 0), enthalpies
+        (1), entropies (2) or Gibbs free energies (3) in SI units at each of
+        the temperatures `Tlist` in K.
+        """
+        cdef double[:] T, values
+        cdef np.ndarray result
+        cdef double cm2 = self.cm2, cm1 = self.cm1, c0 = self.c0, c1 = self.c1, c2 = self.c2
+        cdef double c3 = self.c3, c4 = self.c4, c5 = self.c5, c6 = self.c6
+        cdef double R = constants.R, t, T2, T4, logT, H, S
+        cdef Py_ssize_t i
+        T = np.ascontiguousarray(Tlist, np.float64).ravel()
+        result = np.empty(T.shape[0], np.float64)
+        values = result
+        with nogil:
+            for i in range(T.shape[0]):
+                t = T[i]
+                if quantity == 0:
+                    values[i] = ((cm2 / t + cm1) / t + c0 + t * (c1 + t * (c2 + t * (c3 + c4 * t)))) * R
+                    continue
+                T2 = t * t
+                T4 = T2 * T2
+                logT = log(t)
+                H = ((-cm2 / t + cm1 * logT) / t + c0 + c1 * t / 2. + c2 * T2 / 3. + c3 * T2 * t / 4. + c4 * T4 / 5. + c5 / t) * R * t
+                S = ((-cm2 / t / 2. - cm1) / t + c0 * logT + c1 * t + c2 * T2 / 2. + c3 * T2 * t / 3. + c4 * T4 / 4. + c6) * R
+                if quantity == 1:
+                    values[i] = H
+                elif quantity == 2:
+                    values[i] = S
+                else:
+                    values[i] = H - t * S
+        return result
+
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist):
+        """
+        Return an array of the constant-pressure heat capacities in J/mol*K at
+        each of the temperatures `Tlist` in K.
+        """
+        return self.evaluate(Tlist, 0)
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist):
+        """
+        Return an array of the enthalpies in J/mol at each of the temperatures
+        `Tlist` in K.
+        """
+        return self.evaluate(Tlist, 1)
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist):
+        """
+        Return an array of the entropies in J/mol*K at each of the
+        temperatures `Tlist` in K.
+        """
+        return self.evaluate(Tlist, 2)
+
+    cpdef np.ndarray get_free_energies(self, np.ndarray Tlist):
+        """
+        Return an array of the Gibbs free energies in J/mol at each of the
+        temperatures `Tlist` in K.
+        """
+        return self.evaluate(Tlist, 3)
     
     cpdef change_base_enthalpy(self, double deltaH):
         """
@@ -328,6 +392,62 @@ cdef class NASA(HeatCapacityModel):
         """
         return self.select_polynomial(T).get_free_energy(T)
 
+    cdef np.ndarray evaluate(self, np.ndarray Tlist, int quantity):
+        """
+        Return an array of the heat capacities (`quantity` = 0), enthalpies
+        (1), entropies (2) or Gibbs free energies (3) in SI units at each of
+        the temperatures `Tlist` in K. Each temperature is evaluated with the
+        first polynomial valid at that temperature, as in
+        :meth:`select_polynomial`.
+        """
+        cdef NASAPolynomial poly
+        cdef np.ndarray T, result, remaining, mask
+        T = np.ascontiguousarray(Tlist, np.float64).ravel()
+        result = np.empty(T.shape[0], np.float64)
+        remaining = np.ones(T.shape[0], bool)
+        for poly in (self.poly1, self.poly2, self.poly3):
+            if poly is None:
+                continue
+            mask = remaining.copy()
+            if poly._Tmin is not None:
+                mask &= poly._Tmin.value_si <= T
+            if poly._Tmax is not None:
+                mask &= T <= poly._Tmax.value_si
+            if mask.any():
+                result[mask] = poly.evaluate(T[mask], quantity)
+                remaining &= ~mask
+        if remaining.any():
+            raise ValueError('No valid NASA polynomial at temperature {0:g} K.'.format(T[remaining][0]))
+        return result
+
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist):
+        """
+        Return an array of the constant-pressure heat capacities in J/mol*K at
+        each of the temperatures `Tlist` in K.
+        """
+        return self.evaluate(Tlist, 0)
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist):
+        """
+        Return an array of the enthalpies in J/mol at each of the temperatures
+        `Tlist` in K.
+        """
+        return self.evaluate(Tlist, 1)
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist):
+        """
+        Return an array of the entropies in J/mol*K at each of the
+        temperatures `Tlist` in K.
+        """
+        return self.evaluate(Tlist, 2)
+
+    cpdef np.ndarray get_free_energies(self, np.ndarray Tlist):
+        """
+        Return an array of the Gibbs free energies in J/mol at each of the
+        temperatures `Tlist` in K.
+        """
+        return self.evaluate(Tlist, 3)
+
     cpdef ThermoData to_thermo_data(self):
         """
         Convert the NASAPolynomial model to a :class:`ThermoData` object.
@@ -337,7 +457,7 @@ cdef class NASA(HeatCapacityModel):
         from rmgpy.thermo.thermodata import ThermoData
         
         Tdata = [300,400,500,600,800,1000,1500]
-        Cpdata = [self.get_heat_capacity(T) for T in Tdata]
+        Cpdata = self.get_heat_capacities(np.array(Tdata, np.float64))
         
         return ThermoData(
             Tdata = (Tdata,"K"),
@@ -178,6 +178,21 @@ class TestNASA(unittest.TestCase):
             g_act = self.nasa.get_free_energy(T)
             self.assertAlmostEqual(g_exp / g_act, 1.0, 4, '{0} != {1}'.format(g_exp, g_act))
 
+    def test_array_evaluation(self):
+        """
+        Test that the array methods of NASA match the scalar ones on both
+        sides of the intermediate temperature.
+        """
+        Tlist = np.array([300, 400, 600, 650.73, 800, 1000, 1500, 2000, 3000])
+        for array_method, scalar_method in [(self.nasa.get_heat_capacities, self.nasa.get_heat_capacity),
+                                            (self.nasa.get_enthalpies, self.nasa.get_enthalpy),
+                                            (self.nasa.get_entropies, self.nasa.get_entropy),
+                                            (self.nasa.get_free_energies, self.nasa.get_free_energy)]:
+            values = array_method(Tlist)
+            for T, value in zip(Tlist, values):
+                self.assertAlmostEqual(value / scalar_method(T), 1.0, 10)
+        self.assertRaises(ValueError, self.nasa.get_heat_capacities, np.array([500, 4000.]))
+
     def test_pickle(self):
         """
         Test that a NASA object can be pickled and unpickled with no loss of
@@ -161,14 +161,81 @@ def evaluator(spc, solvent_name=''):
     return thermo
 
 
-def submit(spc, solvent_name=''):
+def _evaluate_in_worker(spc, solvent_name=''):
     """
-    Submits a request to calculate chemical data for the Species object.
+    Module-level function passed to worker processes by :func:`submit`.
+
+    Returns the generated thermo together with the conformer of the species,
+    whose E0 is set by :func:`process_thermo_data` on the worker's copy, and
+    the resonance structures, which the estimate generates and reorders on
+    the worker's copy.
+    """
+    thermo = evaluator(spc, solvent_name=solvent_name)
+    return thermo, spc.conformer, spc.molecule
+
+
+class ThermoFuture(object):
+    """
+    The pending result of a thermo estimate submitted to a worker process.
+
+    A :class:`ThermoFuture` is stored as the `thermo` attribute of a species
+    until that attribute is first read, at which point :meth:`result` is
+    called to wait for the estimate and copy the E0 and the resonance
+    structures computed by the worker onto the species. The attributes are:
+
+    =================== ========================================================
+    Attribute           Description
+    =================== ========================================================
+    `species`           The species whose thermo is being estimated
+    `async_result`      The :class:`multiprocessing.pool.AsyncResult` of the worker task
+    `callback`          An optional function called with the species and thermo once the result is available
+    =================== ========================================================
+
+    """
+
+    def __init__(self, species, async_result, callback=None):
+        self.species = species
+        self.async_result = async_result
+        self.callback = callback
+
+    def wait(self):
+        """
+        Wait for the estimate and return the thermo, without copying anything
+        onto the species.
+        """
+        return self.async_result.get()[0]
+
+    def result(self):
+        """
+        Wait for the estimate, copy the results onto the species, and return
+        the thermo.
+        """
+        thermo, conformer, molecules = self.async_result.get()
+        # Use the resonance structures in the order left by the estimate, as in a serial run
+        self.species.molecule = molecules
+        if conformer is not None:
+            if self.species.conformer is None:
+                self.species.conformer = conformer
+            else:
+                self.species.conformer.E0 = conformer.E0
+        if self.callback is not None:
+            self.callback(self.species, thermo)
+        return thermo
 
-    In a parallel run, the thermo attribute will
-    store the future object, until the get method
-    is called, which replaces the future object with 
-    the result.
 
+def submit(spc, solvent_name='', pool=None, callback=None):
     """
-    spc.thermo = evaluator(spc, solvent_name=solvent_name)
+    Submits a request to calculate chemical data for the Species object.
+
+    In a parallel run, i.e. if a running :class:`ReactionWorkerPool` is given
+    as `pool`, the thermo attribute will store a :class:`ThermoFuture` until
+    it is first read, which replaces the future object with the result.
+    The optional `callback` is then called with the species and its thermo.
+    """
+    if pool is not None and pool.running:
+        async_result = pool.apply_async(_evaluate_in_worker, (spc, solvent_name))
+        spc.thermo = ThermoFuture(spc, async_result, callback=callback)
+    else:
+        spc.thermo = evaluator(spc, solvent_name=solvent_name)
+        if callback is not None:
+            callback(spc, spc.thermo)
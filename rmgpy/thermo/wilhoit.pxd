@@ -50,6 +50,16 @@ cdef class Wilhoit(HeatCapacityModel):
     cpdef double get_entropy(self, double T) except -1000000000
 
     cpdef double get_free_energy(self, double T) except 1000000000
+
+    cdef np.ndarray evaluate(self, np.ndarray Tlist, int quantity)
+
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist)
+
+    cpdef np.ndarray get_free_energies(self, np.ndarray Tlist)
     
     cpdef Wilhoit copy(self)
     
@@ -187,6 +187,80 @@ cdef class Wilhoit(HeatCapacityModel):
         """
         return self.get_enthalpy(T) - T * self.get_entropy(T)
     
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef np.ndarray evaluate(self, np.ndarray Tlist, int quantity):
+        """
+        Return an array of the heat capacities (`quantity` = 0), enthalpies
+        (1), entropies (2) or Gibbs free energies (3) in SI units at each of
+        the temperatures `Tlist` in K.
+        """
+        cdef double[:] T, values
+        cdef np.ndarray result
+        cdef double Cp0, CpInf, B, a0, a1, a2, a3, H0, S0
+        cdef double t, y, H, S
+        cdef Py_ssize_t i
+        Cp0, CpInf, B, a0, a1, a2, a3 = self._Cp0.value_si, self._CpInf.value_si, self._B.value_si, self.a0, self.a1, self.a2, self.a3
+        H0 = self._H0.value_si if quantity == 1 or quantity == 3 else 0.0
+        S0 = self._S0.value_si if quantity == 2 or quantity == 3 else 0.0
+        T = np.ascontiguousarray(Tlist, np.float64).ravel()
+        result = np.empty(T.shape[0], np.float64)
+        values = result
+        with nogil:
+            for i in range(T.shape[0]):
+                t = T[i]
+                y = t / (t + B)
+                if quantity == 0:
+                    values[i] = Cp0 + (CpInf - Cp0) * y * y * (
+                        1 + (y - 1) * (a0 + y * (a1 + y * (a2 + y * a3)))
+                    )
+                    continue
+                H = H0 + Cp0 * t - (CpInf - Cp0) * t * (
+                    y * y * ((3 * a0 + a1 + a2 + a3) / 6. +
+                             (4 * a1 + a2 + a3) * y / 12. +
+                             (5 * a2 + a3) * y * y / 20. +
+                             a3 * y * y * y / 5.) +
+                    (2 + a0 + a1 + a2 + a3) * (y / 2. - 1 + (1.0 / y - 1.) * log(B + t))
+                )
+                S = S0 + CpInf * log(t) - (CpInf - Cp0) * (
+                    log(y) + y * (1 + y * (a0 / 2. + y * (a1 / 3. + y * (a2 / 4. + y * a3 / 5.))))
+                )
+                if quantity == 1:
+                    values[i] = H
+                elif quantity == 2:
+                    values[i] = S
+                else:
+                    values[i] = H - t * S
+        return result
+
+    cpdef np.ndarray get_heat_capacities(self, np.ndarray Tlist):
+        """
+        Return an array of the constant-pressure heat capacities in J/mol*K at
+        each of the temperatures `Tlist` in K.
+        """
+        return self.evaluate(Tlist, 0)
+
+    cpdef np.ndarray get_enthalpies(self, np.ndarray Tlist):
+        """
+        Return an array of the enthalpies in J/mol at each of the temperatures
+        `Tlist` in K.
+        """
+        return self.evaluate(Tlist, 1)
+
+    cpdef np.ndarray get_entropies(self, np.ndarray Tlist):
+        """
+        Return an array of the entropies in J/mol*K at each of the
+        temperatures `Tlist` in K.
+        """
+        return self.evaluate(Tlist, 2)
+
+    cpdef np.ndarray get_free_energies(self, np.ndarray Tlist):
+        """
+        Return an array of the Gibbs free energies in J/mol at each of the
+        temperatures `Tlist` in K.
+        """
+        return self.evaluate(Tlist, 3)
+
     cpdef Wilhoit copy(self):
         """
         Return a copy of the Wilhoit object.
@@ -468,7 +542,7 @@ cdef class Wilhoit(HeatCapacityModel):
         from rmgpy.thermo.thermodata import ThermoData
         
         Tdata = [300,400,500,600,800,1000,1500]
-        Cpdata = [self.get_heat_capacity(T) for T in Tdata]
+        Cpdata = self.get_heat_capacities(np.array(Tdata, np.float64))
         
         return ThermoData(
             Tdata = (Tdata,"K"),
@@ -217,6 +217,22 @@ class TestWilhoit(unittest.TestCase):
             g_act = self.wilhoit.get_free_energy(T)
             self.assertAlmostEqual(g_exp / g_act, 1.0, 4, '{0} != {1}'.format(g_exp, g_act))
 
+    def test_array_evaluation(self):
+        """
+        Test that the array methods of the Wilhoit class match the scalar
+        methods at each temperature.
+        """
+        Tlist = np.array([200, 298.15, 400, 600, 800, 1000, 1200, 1400, 1600, 1800, 2000])
+        for scalar_method, array_method in [(self.wilhoit.get_heat_capacity, self.wilhoit.get_heat_capacities),
+                                            (self.wilhoit.get_enthalpy, self.wilhoit.get_enthalpies),
+                                            (self.wilhoit.get_entropy, self.wilhoit.get_entropies),
+                                            (self.wilhoit.get_free_energy, self.wilhoit.get_free_energies)]:
+            values = array_method(Tlist)
+            self.assertEqual(values.shape, Tlist.shape)
+            for T, value in zip(Tlist, values):
+                expected = scalar_method(T)
+                self.assertAlmostEqual(value, expected, delta=1e-10 * abs(expected))
+
     def test_pickle(self):
         """
         Test that a Wilhoit object can be pickled and unpickled with no loss
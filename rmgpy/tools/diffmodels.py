@@ -77,7 +77,7 @@ def compare_model_kinetics(model1, model2):
         for rxn2 in model2.reactions:
             if rxn1.is_isomorphic(rxn2):
                 common_reactions[rxn1] = rxn2
-                model2.reactions.remove(rxn2)
+                model2.remove_reaction(rxn2)
                 break
     unique_reactions1 = [rxn for rxn in model1.reactions if rxn not in list(common_reactions.keys())]
     unique_reactions2 = model2.reactions
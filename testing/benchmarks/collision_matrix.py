@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+Benchmark of :meth:`SingleExponentialDown.generate_collision_matrix` for a
+model isomer with a classical density of states, on energy grids with
+increasing numbers of grains, with and without active J-rotors. Run it on two
+commits to compare implementations; the checksum of the matrix should agree.
+
+Usage::
+
+    python testing/benchmarks/collision_matrix.py [--grains 300 1000 2000] [--temperatures 300 1000 2000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from rmgpy.pdep.collision import SingleExponentialDown
+
+
+def build_density_of_states(n_grains, n_j, grain_size, oscillators=20):
+    """
+    Return the energy grains in J/mol, J values and density of states of a
+    model isomer with `oscillators` classical harmonic oscillators, on
+    `n_grains` energy grains of `grain_size` J/mol and `n_j` J values.
+    """
+    e_list = np.arange(n_grains) * grain_size
+    j_list = np.arange(n_j, dtype=np.int_)
+    dens_states = np.zeros((n_grains, n_j))
+    for j in j_list:
+        dens_states[1:, j] = (e_list[1:] / 1000.) ** (oscillators - 1) * np.exp(-0.01 * j)
+    return e_list, j_list, dens_states
+
+
+def time_collision_matrix(model, e_list, j_list, dens_states, temperatures):
+    """
+    Return the mean time in seconds to generate the collision matrix at each
+    of the `temperatures`, and the sum of the absolute values of the matrices.
+    """
+    checksum = 0.0
+    start = time.time()
+    for T in temperatures:
+        p = model.generate_collision_matrix(T, dens_states, e_list, j_list if len(j_list) > 1 else None)
+        checksum += np.sum(np.abs(p))
+    return (time.time() - start) / len(temperatures), checksum
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--grains', type=int, nargs='+', default=[300, 1000, 2000], help='numbers of energy grains')
+    parser.add_argument('--grain-size', type=float, default=1000.0, help='energy grain size in J/mol')
+    parser.add_argument('--j-values', type=int, nargs='+', default=[1, 10], help='numbers of J values')
+    parser.add_argument('--temperatures', type=float, nargs='+', default=[300.0, 1000.0, 2000.0],
+                        help='temperatures in K')
+    args = parser.parse_args()
+
+    model = SingleExponentialDown(alpha0=(3.5, 'kJ/mol'), T0=(300, 'K'), n=0.85)
+    print('{0:>10} {1:>10} {2:>12} {3:>14}'.format('grains', 'J values', 'time (ms)', 'checksum'))
+    for n_grains in args.grains:
+        for n_j in args.j_values:
+            e_list, j_list, dens_states = build_density_of_states(n_grains, n_j, args.grain_size)
+            elapsed, checksum = time_collision_matrix(model, e_list, j_list, dens_states, args.temperatures)
+            print('{0:10d} {1:10d} {2:12.3f} {3:14.6e}'.format(n_grains, n_j, elapsed * 1000, checksum))
+
+
+if __name__ == '__main__':
+    main()
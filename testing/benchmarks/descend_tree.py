@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+Benchmark of :meth:`rmgpy.data.base.Database.descend_tree` on the thermo
+``group``, ``radical`` and ``ring`` trees, with and without the child
+pre-filter. The descent cache is disabled so that every descent is timed,
+and the nodes found in both cases are checked to be identical.
+
+Usage::
+
+    python testing/benchmarks/descend_tree.py [--repeat 5]
+"""
+
+import argparse
+import logging
+import os
+import time
+
+from rmgpy import settings
+from rmgpy.data.thermo import ThermoDatabase
+from rmgpy.molecule import Molecule
+
+SMILES = [
+    'CCCCCCCC', 'CC(C)(C)CC(C)C', 'C=CC=CC=C', 'C#CC=CC', 'CCO', 'CC(=O)OC', 'OCC(O)CO', 'CC(=O)C(C)=O',
+    'CCOCCOCC', 'CCN', 'CC#N', 'CSC', 'CCS', 'O=CC=O', 'OO', 'COOC', 'c1ccccc1', 'Cc1ccccc1O', 'c1ccc2ccccc2c1',
+    'C1CC1', 'C1CCC1', 'C1CCCCC1', 'C1=CCCC1', 'O1CCOCC1', 'C1CC2CCC1C2', 'C1CCC2CCCCC2C1',
+    '[CH2]CCC', 'C[CH]C', 'C[C](C)C', '[CH2]C=C', 'C[O]', 'CC[O]', 'CC(=O)[O]', 'C[CH]C=O', '[CH]1CCCC1',
+    'CCO[O]', '[c]1ccccc1', 'C=C[CH2]', 'CC(C)O[O]', '[CH2]C1CCCCC1',
+]
+
+
+def get_descents(thermo_database, molecules):
+    """
+    Return a list of ``(tree, molecule, atom)`` tuples of the descents made by
+    group additivity: every heavy atom in the ``group`` tree, every radical
+    center in the ``radical`` tree, and every ring atom in the ``ring`` tree.
+    """
+    descents = []
+    for molecule in molecules:
+        saturated = molecule.copy(deep=True)
+        saturated.saturate_radicals()
+        for atom in saturated.atoms:
+            if atom.is_non_hydrogen():
+                descents.append((thermo_database.groups['group'], saturated, atom))
+                if saturated.is_atom_in_cycle(atom):
+                    descents.append((thermo_database.groups['ring'], saturated, atom))
+        for atom in molecule.atoms:
+            if atom.radical_electrons > 0:
+                descents.append((thermo_database.groups['radical'], molecule, atom))
+    return descents
+
+
+def time_descents(descents, use_filter, repeat):
+    """
+    Descend the trees for each of the `descents`, returning the mean time per
+    descent in seconds and the list of nodes found.
+    """
+    for tree, molecule, atom in descents:
+        tree.use_descent_cache = False
+        tree.use_descent_filter = use_filter
+    start = time.time()
+    for _ in range(repeat):
+        nodes = [tree.descend_tree(molecule, {'*': atom}) for tree, molecule, atom in descents]
+    return (time.time() - start) / (repeat * len(descents)), nodes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='number of times to repeat each descent')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    thermo_database = ThermoDatabase()
+    thermo_database.load_groups(os.path.join(settings['database.directory'], 'thermo', 'groups'))
+
+    molecules = [Molecule().from_smiles(smiles) for smiles in SMILES]
+    print('{0:>10} {1:>10} {2:>18} {3:>18}'.format('tree', 'descents', 'filtered (us)', 'unfiltered (us)'))
+    for label in ['group', 'radical', 'ring']:
+        descents = [d for d in get_descents(thermo_database, molecules) if d[0] is thermo_database.groups[label]]
+        filtered_time, filtered_nodes = time_descents(descents, True, args.repeat)
+        unfiltered_time, unfiltered_nodes = time_descents(descents, False, args.repeat)
+        if filtered_nodes != unfiltered_nodes:
+            raise AssertionError('Different nodes found in the {0} tree with the pre-filter.'.format(label))
+        print('{0:>10} {1:10d} {2:18.1f} {3:18.1f}'.format(label, len(descents), filtered_time * 1e6,
+                                                            unfiltered_time * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+Benchmark of :meth:`CoreEdgeReactionModel.enlarge` on a synthetic model with
+a large edge. Each step moves one edge species to the core, which requires
+scanning every edge reaction for reactions that have become core reactions.
+
+Usage::
+
+    python testing/benchmarks/model_enlarge.py [--reactions 200000] [--steps 20]
+"""
+
+import argparse
+import logging
+import time
+
+from rmgpy.data.base import ForbiddenStructures
+from rmgpy.data.rmg import RMGDatabase
+from rmgpy.reaction import Reaction
+from rmgpy.rmg.model import CoreEdgeReactionModel
+from rmgpy.species import Species
+
+
+def build_model(num_reactions, num_core_species=50, reactions_per_species=10):
+    """
+    Return a :class:`CoreEdgeReactionModel` with `num_core_species` core
+    species and an edge of `num_reactions` reactions of the form
+    ``core + edge <=> edge``.
+    """
+    num_edge_species = max(2, num_reactions // reactions_per_species)
+    core = [Species(index=i + 1, label='C{0:d}'.format(i), explicitly_allowed=True)
+            for i in range(num_core_species)]
+    edge = [Species(index=num_core_species + i + 1, label='E{0:d}'.format(i), explicitly_allowed=True)
+            for i in range(num_edge_species)]
+    reactions = []
+    for i in range(num_reactions):
+        reactant = edge[i % num_edge_species]
+        product = edge[(i * 7 + 1) % num_edge_species]
+        reactions.append(Reaction(index=i + 1, reactants=[core[i % num_core_species], reactant],
+                                  products=[product]))
+
+    model = CoreEdgeReactionModel()
+    model.core.species = core
+    model.edge.species = edge
+    model.edge.reactions = reactions
+    return model
+
+
+def time_enlarge(model, steps):
+    """
+    Move `steps` edge species to the core one at a time, returning the mean
+    time per :meth:`enlarge` call in seconds.
+    """
+    start = time.time()
+    for spc in model.edge.species[:steps]:
+        model.enlarge(spc)
+    return (time.time() - start) / steps
+
+
+def time_list_scan(model, steps):
+    """
+    Return the mean time in seconds of the edge scan performed by one
+    :meth:`enlarge` call when core membership is tested by searching the
+    core species list, for comparison.
+    """
+    core_species = model.core.species
+    start = time.time()
+    for _ in range(steps):
+        for rxn in model.edge.reactions:
+            all(spc in core_species for spc in rxn.reactants + rxn.products)
+    return (time.time() - start) / steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reactions', type=int, default=200000, help='largest number of edge reactions')
+    parser.add_argument('--steps', type=int, default=20, help='number of enlarge steps per size')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    database = RMGDatabase()
+    database.forbidden_structures = ForbiddenStructures()
+
+    sizes = sorted({max(1, args.reactions // 8), max(1, args.reactions // 4), max(1, args.reactions // 2),
+                    args.reactions})
+    print('{0:>12} {1:>18} {2:>18}'.format('reactions', 'enlarge (ms)', 'list scan (ms)'))
+    for size in sizes:
+        model = build_model(size)
+        enlarge_time = time_enlarge(model, args.steps)
+        scan_time = time_list_scan(model, max(1, args.steps // 10))
+        print('{0:12d} {1:18.2f} {2:18.2f}'.format(size, enlarge_time * 1000, scan_time * 1000))
+
+
+if __name__ == '__main__':
+    main()
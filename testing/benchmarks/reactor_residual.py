@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+Benchmark of the residual function of :class:`SimpleReactor` on synthetic
+models, comparing the loop over the reactions with the vectorized evaluation
+selected by ``vectorized_residual``. Each model has unimolecular, bimolecular
+and termolecular core reactions and an edge of reactions between core and
+edge species.
+
+Usage::
+
+    python testing/benchmarks/reactor_residual.py [--species 100 1000 10000] [--calls 100]
+"""
+
+import argparse
+import logging
+import random
+import time
+
+import numpy as np
+
+from rmgpy.kinetics import Arrhenius
+from rmgpy.reaction import Reaction
+from rmgpy.solver.simple import SimpleReactor
+from rmgpy.species import Species
+from rmgpy.thermo import ThermoData
+
+
+def build_model(num_core_species, reactions_per_species=5, edge_ratio=2, seed=0):
+    """
+    Return the core species, core reactions, edge species and edge reactions
+    of a random model with `num_core_species` core species, `reactions_per_species`
+    core reactions per core species and `edge_ratio` edge species and reactions
+    per core species and reaction.
+    """
+    rng = random.Random(seed)
+
+    def make_species(label):
+        return Species(label=label, thermo=ThermoData(
+            Tdata=([300, 400, 500, 600, 800, 1000, 1500], 'K'), Cpdata=([10.0] * 7, 'cal/(mol*K)'),
+            H298=(rng.uniform(-50, 50), 'kcal/mol'), S298=(rng.uniform(40, 80), 'cal/(mol*K)')))
+
+    def make_reaction(reactants, products):
+        units = {1: 's^-1', 2: 'm^3/(mol*s)', 3: 'm^6/(mol^2*s)'}[len(reactants)]
+        return Reaction(reactants=reactants, products=products,
+                        kinetics=Arrhenius(A=(10 ** rng.uniform(3, 10), units), n=0, Ea=(rng.uniform(0, 30), 'kcal/mol'),
+                                           T0=(1, 'K')))
+
+    core_species = [make_species('C{0:d}'.format(i)) for i in range(num_core_species)]
+    edge_species = [make_species('E{0:d}'.format(i)) for i in range(num_core_species * edge_ratio)]
+
+    core_reactions = []
+    for i in range(num_core_species * reactions_per_species):
+        num_reactants = rng.choice([1, 2, 2, 2, 3])
+        num_products = rng.choice([1, 2, 2, 3]) if num_reactants == 1 else rng.choice([1, 2, 2])
+        core_reactions.append(make_reaction(rng.sample(core_species, num_reactants),
+                                            rng.sample(core_species, num_products)))
+
+    edge_reactions = []
+    for i in range(len(core_reactions) * edge_ratio):
+        reactants = [rng.choice(core_species), rng.choice(core_species + edge_species)]
+        edge_reactions.append(make_reaction(reactants, [rng.choice(edge_species)]))
+
+    return core_species, core_reactions, edge_species, edge_reactions
+
+
+def time_residual(model, vectorized_residual, calls):
+    """
+    Return the mean time in seconds of a call to the residual function, and
+    the residual itself.
+    """
+    core_species = model[0]
+    initial_mole_fractions = dict((spc, 1.0) for spc in core_species)
+    rxn_system = SimpleReactor(1000, 1e5, initial_mole_fractions=initial_mole_fractions, n_sims=1, termination=[],
+                               vectorized_residual=vectorized_residual)
+    rxn_system.initialize_model(*model)
+    y = rxn_system.y.copy()
+    dydt = np.zeros(y.shape)
+    start = time.time()
+    for _ in range(calls):
+        res = rxn_system.residual(0.0, y, dydt)[0]
+    return (time.time() - start) / calls, res
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--species', type=int, nargs='+', default=[100, 1000, 10000], help='numbers of core species')
+    parser.add_argument('--reactions-per-species', type=int, default=5, help='core reactions per core species')
+    parser.add_argument('--edge-ratio', type=int, default=2, help='edge species and reactions per core one')
+    parser.add_argument('--calls', type=int, default=100, help='number of residual calls per size')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    print('{0:>10} {1:>12} {2:>12} {3:>12} {4:>12} {5:>10}'.format(
+        'species', 'core rxns', 'edge rxns', 'loop (ms)', 'vector (ms)', 'max diff'))
+    for size in args.species:
+        model = build_model(size, args.reactions_per_species, args.edge_ratio)
+        loop_time, loop_res = time_residual(model, False, args.calls)
+        vector_time, vector_res = time_residual(model, True, args.calls)
+        diff = np.max(np.abs(vector_res - loop_res) / np.maximum(np.abs(loop_res), 1e-300))
+        print('{0:10d} {1:12d} {2:12d} {3:12.3f} {4:12.3f} {5:10.1e}'.format(
+            size, len(model[1]), len(model[3]), loop_time * 1000, vector_time * 1000, diff))
+
+
+if __name__ == '__main__':
+    main()